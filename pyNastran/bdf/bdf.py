@@ -12,6 +12,7 @@ import os
 import sys
 import io
 import traceback
+import multiprocessing
 from codecs import open as codec_open
 from collections import defaultdict
 
@@ -25,6 +26,11 @@ import numpy as np  # type: ignore
 from pyNastran.utils import object_attributes, print_bad_path, _filename
 from pyNastran.utils.log import get_logger2
 from pyNastran.bdf.bdf_interface.include_file import get_include_filename
+from pyNastran.bdf.bdf_interface.bulk_tokenizer import (
+    FAST_CARD_BUILDERS, build_fast_cards, build_cards)
+from pyNastran.bdf.bdf_interface.include_tracker import IncludeTracker, get_cards_with_refs
+from pyNastran.bdf.bdf_interface.model_cache import (
+    get_cache_filename, get_file_stamps, write_model_cache, read_model_cache)
 from pyNastran.bdf.utils import (
     _parse_pynastran_header, to_fields, parse_executive_control_deck, parse_patran_syntax)
 
@@ -79,7 +85,7 @@ from pyNastran.bdf.cards.constraints import (SPC, SPCADD, SPCAX, SPC1, SPCOFF, S
                                              GMSPC)
 from pyNastran.bdf.cards.coordinate_systems import (CORD1R, CORD1C, CORD1S,
                                                     CORD2R, CORD2C, CORD2S, #CORD3G,
-                                                    GMCORD)
+                                                    GMCORD, Coord)
 from pyNastran.bdf.cards.deqatn import DEQATN
 from pyNastran.bdf.cards.dynamic import (
     DELAY, DPHASE, FREQ, FREQ1, FREQ2, FREQ3, FREQ4, FREQ5,
@@ -148,7 +154,8 @@ from pyNastran.bdf.errors import (CrossReferenceError, DuplicateIDsError,
 
 def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
              skip_cards=None, read_cards=None,
-             encoding=None, log=None, debug=True, mode='msc'):
+             encoding=None, log=None, debug=True, mode='msc', fast_tokenizer=False,
+             cache_dir=None, nworkers=1):
     # type: (Union[str, None], bool, bool, bool, Union[List[str], None], Union[str, None], Union[SimpleLogger, None], Optional[bool], str) -> BDF
     """
     Creates the BDF object
@@ -167,8 +174,11 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
         settings the logging object has
     validate : bool; default=True
         runs various checks on the BDF
-    xref :  bool; default=True
+    xref :  bool / str; default=True
         should the bdf be cross referenced
+        'lazy' : the nodes, elements, properties, masses, materials,
+                 and loads are cross referenced the first time one
+                 of their ``*_ref`` attributes is accessed
     punch : bool; default=False
         indicates whether the file is a punch file
     skip_cards : List[str]; default=None
@@ -182,6 +192,16 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    fast_tokenizer : bool; default=False
+        splits and converts the simple GRID, CQUAD4, CTRIA3, CHEXA,
+        CTETRA, CBAR, CBUSH, and RBE2 cards in bulk
+        (see ``BDF.read_bdf``)
+    cache_dir : str; default=None
+        the directory for the binary model cache
+        (see ``BDF.read_bdf``)
+    nworkers : int; default=1
+        the number of processes that create the card objects
+        (see ``BDF.read_bdf``)
 
     Returns
     -------
@@ -217,7 +237,9 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
     elif read_cards:
         model.set_cards(read_cards)
     model.read_bdf(bdf_filename=bdf_filename, validate=validate,
-                   xref=xref, punch=punch, read_includes=True, encoding=encoding)
+                   xref=xref, punch=punch, read_includes=True, encoding=encoding,
+                   fast_tokenizer=fast_tokenizer, cache_dir=cache_dir,
+                   nworkers=nworkers)
 
     #if 0:
         ### TODO: remove all the extra methods
@@ -274,6 +296,21 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
     return model
 
 
+#: the attributes that aren't stored in the model cache because they
+#: can't be pickled or are the settings of the current model
+CACHE_KEYS_TO_SKIP = [
+    'log', '_card_parser', '_card_parser_b', '_card_parser_prepare',
+    'case_control_deck', 'debug', '_fast_tokenizer', '_nworkers',
+    '_nparse_errors', '_stop_on_parsing_error',
+    '_nxref_errors', '_stop_on_xref_error', '_stop_on_duplicate_error',
+    '_node_store', '_coord_cache', '_bulk_xref', '_lazy_xref',
+]
+
+
+#: the minimum number of cards that it's worth starting a worker for
+MIN_CARDS_PER_WORKER = 1000
+
+
 class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
     """
     Base class for the BDF Reader/Writer/Editor class.
@@ -343,6 +380,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         # flag that allows for OpenMDAO-style optimization syntax to be used
         self._is_dynamic_syntax = False
 
+        # flag that builds the simple high-volume cards (e.g., GRID, CQUAD4)
+        # with the bulk tokenizer
+        self._fast_tokenizer = False
+
+        # the number of processes that parse the cards
+        self._nworkers = 1
+
         # lines that were rejected b/c they were for a card that isnt supported
         self.reject_lines = []  # type: List[List[str]]
 
@@ -628,6 +672,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             del state['_card_parser_b']
         if hasattr(self, '_card_parser_prepare'):
             del state['_card_parser_prepare']
+        if '_node_store' in state:
+            del state['_node_store']
+        if '_coord_cache' in state:
+            del state['_coord_cache']
+        state['_lazy_xref'] = None
         return state
 
     def saves(self, unxref=True):
@@ -675,7 +724,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             'nmaterials', 'ncaeros', 'nid_map',
             'is_bdf_vectorized',
 
-            'point_ids', 'subcases',
+            'point_ids', 'subcases', 'node_store', '_node_store', '_lazy_xref',
+            'coord_cache', '_coord_cache',
             '_card_parser', '_card_parser_b', '_card_parser_prepare',
         ]
         for key in object_attributes(self, mode="all", keys_to_skip=keys_to_skip):
@@ -705,9 +755,17 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         .. todo:: only does a subset of cards.
         .. note:: loads/spcs (not supported) are tricky because you
                   can't replace cards one-to-one...not sure what to do
+        .. note:: for a lazily cross referenced model, the replaced cards
+                  are cross referenced on first access (along with the
+                  cards that reference them); the coordinate systems,
+                  constraints, aero, set, and optimization cards are
+                  cross referenced again
         """
         for nid, node in iteritems(replace_model.nodes):
             self.nodes[nid] = node
+        node_store = getattr(self, '_node_store', None)
+        if node_store is not None:
+            node_store.version += 1
         for eid, elem in iteritems(replace_model.elements):
             self.elements[eid] = elem
         for eid, elem in iteritems(replace_model.rigid_elements):
@@ -726,6 +784,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         for dvid, dvgrid in iteritems(replace_model.dvgrids):
             self.dvgrids[dvid] = dvgrid
 
+        if self._lazy_xref is not None:
+            lazy_cards = []
+            for cards in (replace_model.nodes, replace_model.elements,
+                          replace_model.rigid_elements, replace_model.properties,
+                          replace_model.materials):
+                lazy_cards.extend(itervalues(cards))
+            self._lazy_xref.add_cards(lazy_cards)
+            self._lazy_xref.invalidate()
+
     def disable_cards(self, cards):
         # type : (Sequence[str]) -> None
         """
@@ -1123,7 +1190,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         return all_lines
 
     def read_bdf(self, bdf_filename=None,
-                 validate=True, xref=True, punch=False, read_includes=True, encoding=None):
+                 validate=True, xref=True, punch=False, read_includes=True, encoding=None,
+                 fast_tokenizer=False, cache_dir=None, nworkers=1):
         """
         Read method for the bdf files
 
@@ -1133,14 +1201,29 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             the input bdf (default=None; popup a dialog)
         validate : bool; default=True
             runs various checks on the BDF
-        xref :  bool; default=True
+        xref :  bool / str; default=True
             should the bdf be cross referenced
+            'lazy' : the nodes, elements, properties, masses, materials,
+                     and loads are cross referenced the first time one
+                     of their ``*_ref`` attributes is accessed
         punch : bool; default=False
             indicates whether the file is a punch file
         read_includes : bool; default=True
             indicates whether INCLUDE files should be read
         encoding : str; default=None -> system default
             the unicode encoding
+        fast_tokenizer : bool; default=False
+            splits and converts the simple GRID, CQUAD4, CTRIA3, CHEXA,
+            CTETRA, CBAR, CBUSH, and RBE2 cards in bulk instead of one
+            field at a time; the cards are the same as the standard reader
+        cache_dir : str; default=None
+            the directory for the binary model cache; the parsed model is
+            stored and reused until the main file or an INCLUDE file changes
+            None : don't cache the model
+        nworkers : int; default=1
+            the number of processes that create the card objects; the
+            cards are still added to the model in order, so the duplicate
+            card checks and card_count are the same as nworkers=1
 
         .. code-block:: python
 
@@ -1159,9 +1242,31 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
           etc.
         """
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
+        self._fast_tokenizer = fast_tokenizer
+        self._nworkers = nworkers
         self.log.debug('---starting BDF.read_bdf of %s---' % self.bdf_filename)
+
+        cache_filename = self._get_cache_filename(cache_dir)
+        if cache_filename is None or not self._read_model_cache(cache_filename):
+            self._read_bdf_cards(bdf_filename)
+            if cache_filename is not None:
+                self._write_model_cache(cache_filename)
+
+        if validate:
+            self.validate()
+
+        self.cross_reference(xref=xref)
+        self._xref = xref
+
+        self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
+        self.pop_xref_errors()
+
+    def _read_bdf_cards(self, bdf_filename):
+        """reads the decks and parses the cards (see ``read_bdf``)"""
         self._parse_primary_file_header(bdf_filename)
-        out = self._get_lines(bdf_filename)
+        self._include_tracker = IncludeTracker()
+        bulk_data_line_ifiles = []
+        out = self._get_lines(bdf_filename, bulk_data_line_ifiles=bulk_data_line_ifiles)
         system_lines, executive_control_lines, case_control_lines, bulk_data_lines = out
 
         self.system_command_lines = system_lines
@@ -1187,11 +1292,20 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                             ##bdf_file_obj.write(comment + '\n')
                             #bdf_file_obj.write('\n'.join(cardlines) + '\n')
                         #bdf_file_obj.write('\n')
+            card_ifiles = None
+            tracker = self._include_tracker
+            tracker.untracked_ifiles.update(range(len(tracker.filenames)))
         else:
-            cards, card_count = self.get_bdf_cards(bulk_data_lines)
+            card_ilines = [] if self._include_tracker.filenames else None
+            cards, card_count = self.get_bdf_cards(bulk_data_lines, card_ilines=card_ilines)
             #for card in cards:
                 #print(card)
-        self._parse_cards(cards, card_count)
+
+            card_ifiles = None
+            if card_ilines is not None:
+                card_ifiles = [bulk_data_line_ifiles[iline] for iline in card_ilines]
+        del bulk_data_line_ifiles
+        self._parse_cards(cards, card_count, card_ifiles=card_ifiles)
 
         if self.values_to_skip:
             for key, values in iteritems(self.values_to_skip):
@@ -1205,15 +1319,183 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
 
         self.pop_parse_errors()
         self.fill_dmigs()
+        self._include_tracker.set_file_stamps()
 
-        if validate:
-            self.validate()
+    def reload_changed_includes(self):
+        """
+        Rereads the INCLUDE files that changed since ``read_bdf``
 
-        self.cross_reference(xref=xref)
-        self._xref = xref
+        The cards of a changed file (and the files that it includes) are
+        removed and the file is parsed again.  If the model was cross
+        referenced, only the new cards and the cards that referenced the
+        removed cards are cross referenced.
 
-        self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
-        self.pop_xref_errors()
+        Returns
+        -------
+        reloaded_filenames : List[str]
+            the INCLUDE files that were reread
+
+        .. note:: only the bulk data cards of the INCLUDE files are
+                  reloaded; use ``read_bdf`` if the main file changed
+        .. code-block:: python
+
+          >>> model = read_bdf(bdf_filename)
+          # edit the properties INCLUDE file
+          >>> model.reload_changed_includes()
+          ['/path/to/properties.inc']
+        """
+        tracker = self._include_tracker
+        if tracker is None:
+            return []
+        ifiles, all_ifiles = tracker.get_changed_files()
+        if not ifiles:
+            return []
+
+        untracked_filenames = [tracker.filenames[ifile] for ifile in all_ifiles
+                               if ifile in tracker.untracked_ifiles]
+        if untracked_filenames:
+            msg = ('the INCLUDE files have cards that can\'t be reloaded '
+                   '(e.g., GRDSET, DMIG columns, or case control); use read_bdf\n'
+                   'filenames=%s' % untracked_filenames)
+            raise RuntimeError(msg)
+
+        reloaded_filenames = [tracker.filenames[ifile] for ifile in ifiles]
+        reloaded_files = [(tracker.filenames[ifile], tracker.include_names[ifile],
+                           tracker.parents[ifile]) for ifile in ifiles]
+        abs_filenames = set([os.path.abspath(tracker.filenames[ifile])
+                             for ifile in all_ifiles])
+        self.active_filenames = [filename for filename in self.active_filenames
+                                 if os.path.abspath(filename) not in abs_filenames]
+
+        # the GRIDs may be removed, so check GRID.elements_ref first
+        is_elements_ref = False
+        if self._xref and self._lazy_xref is None and self.nodes:
+            is_elements_ref = next(itervalues(self.nodes)).elements_ref is not None
+        old_cards, list_positions = tracker.remove_cards(self, all_ifiles)
+
+        nfiles = len(tracker.filenames)
+        for filename, include_name, iparent in reloaded_files:
+            self.log.debug('reloading %r' % filename)
+            with self._open_file(filename, basename=False) as bdf_file:
+                lines = bdf_file.readlines()
+            ifile = tracker.add_file(self.active_filenames[-1], iparent, include_name)
+
+            # the comment from _lines_to_deck_lines
+            lines = ['\n$ INCLUDE processed:  %s\n' % include_name] + lines
+            line_ifiles = [iparent] + [ifile] * (len(lines) - 1)
+            lines = self._lines_to_deck_lines(lines, punch=True, line_ifiles=line_ifiles)
+            bulk_data_lines = [line.rstrip() for line in lines]
+
+            card_ilines = []
+            cards, card_count = self.get_bdf_cards(bulk_data_lines, card_ilines=card_ilines)
+            card_ifiles = [line_ifiles[iline] for iline in card_ilines]
+            self._parse_cards(cards, card_count, card_ifiles=card_ifiles)
+        self.pop_parse_errors()
+        self.fill_dmigs()
+        tracker.set_file_stamps()
+
+        new_ifiles = list(range(nfiles, len(tracker.filenames)))
+        tracker.move_list_cards(self, new_ifiles, list_positions)
+        if self._xref:
+            new_cards = tracker.get_cards(self, new_ifiles)
+            self._cross_reference_reloaded_cards(old_cards, new_cards, is_elements_ref)
+            self.pop_xref_errors()
+        return reloaded_filenames
+
+    def _cross_reference_reloaded_cards(self, old_cards, new_cards, is_elements_ref=False):
+        """
+        Cross references the cards from ``reload_changed_includes`` and
+        the cards that referenced the removed cards
+
+        Parameters
+        ----------
+        old_cards : List[BaseCard]
+            the removed cards
+        new_cards : List[BaseCard]
+            the cards from the reloaded files
+        is_elements_ref : bool; default=False
+            was GRID.elements_ref built before the cards were removed
+        """
+        cards_to_skip = set([])
+        if self._lazy_xref is not None:
+            # the add methods put the new cards in the lazy state
+            self._lazy_xref.invalidate()
+            cards_to_skip = self._lazy_xref.card_ids
+        cards = get_cards_with_refs(self, old_cards, cards_to_skip=cards_to_skip)
+        new_card_ids = set([id(card) for card in new_cards])
+        cards.extend([card for card in new_cards if id(card) not in cards_to_skip])
+
+        coords = [card for card in old_cards + cards if isinstance(card, Coord)]
+        if coords:
+            for cid, coord in iteritems(self.coords):
+                if cid != 0 and id(coord) not in new_card_ids:
+                    coord.uncross_reference()
+            self._cross_reference_coordinates()
+
+        for card in cards:
+            if isinstance(card, Coord):
+                continue
+            try:
+                if id(card) not in new_card_ids and hasattr(card, 'uncross_reference'):
+                    card.uncross_reference()
+                if card.type == 'GRID':
+                    card.cross_reference(self, self.grdset)
+                else:
+                    card.cross_reference(self)
+            except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
+                self._ixref_errors += 1
+                var = traceback.format_exception_only(type(error), error)
+                self._stored_xref_errors.append((card, var))
+
+        if is_elements_ref and self.nodes:
+            rslot_map = self.get_rslot_map()
+            slots = set([rslot_map.get(card.type) for card in old_cards + new_cards])
+            if is_elements_ref and slots.intersection(['nodes', 'elements']):
+                self._cross_reference_nodes_with_elements()
+
+    def _get_cache_filename(self, cache_dir):
+        """gets the model cache filename (see ``read_bdf``)"""
+        if cache_dir is None or not isinstance(self.bdf_filename, string_types):
+            return None
+        settings = [
+            ('punch', self.punch),
+            ('read_includes', self.read_includes),
+            ('encoding', self._encoding),
+            ('mode', self._nastran_format),
+            ('cards_to_read', sorted(self.cards_to_read)),
+            ('dict_of_vars', sorted(iteritems(self.dict_of_vars))
+             if self._is_dynamic_syntax else None),
+        ]
+        return get_cache_filename(cache_dir, self.bdf_filename, settings)
+
+    def _read_model_cache(self, cache_filename):
+        """
+        Loads the parsed model from the model cache
+
+        Returns
+        -------
+        is_loaded : bool
+            False : the cache doesn't exist or a file has changed
+        """
+        state = read_model_cache(cache_filename)
+        if state is None:
+            return False
+        self.__dict__.update(state)
+        self.case_control_deck = CaseControlDeck(self.case_control_lines, self.log)
+        self.case_control_deck.solmap_to_value = self._solmap_to_value
+        self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
+        self.log.debug('loaded the model cache %r' % cache_filename)
+        return True
+
+    def _write_model_cache(self, cache_filename):
+        """Saves the parsed model to the model cache"""
+        state = self.__dict__.copy()
+        for key in CACHE_KEYS_TO_SKIP:
+            if key in state:
+                del state[key]
+        file_stamps = get_file_stamps(self.active_filenames)
+        write_model_cache(cache_filename, file_stamps, state)
+        self.log.debug('wrote the model cache %r' % cache_filename)
 
     def _read_bdf_helper(self, bdf_filename, encoding, punch, read_includes):
         """creates the file loading if bdf_filename is None"""
@@ -1401,8 +1683,17 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                 if is_error and self._stop_on_xref_error:
                     raise CrossReferenceError(msg.rstrip())
 
-    def get_bdf_cards(self, bulk_data_lines):
-        """Parses the BDF lines into a list of card_lines"""
+    def get_bdf_cards(self, bulk_data_lines, card_ilines=None):
+        """
+        Parses the BDF lines into a list of card_lines
+
+        Parameters
+        ----------
+        bulk_data_lines : List[str]
+            the bulk data lines
+        card_ilines : List[int]; default=None
+            filled with the index of the first line of each card
+        """
         cards = []
         #cards = defaultdict(list)
         card_count = defaultdict(int)
@@ -1411,6 +1702,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         old_card_name = None
         backup_comment = ''
         nlines = len(bulk_data_lines)
+        iline_card = 0
 
         for i, line in enumerate(bulk_data_lines):
             #print('    backup=%r' % backup_comment)
@@ -1431,6 +1723,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                     #if full_comment:
                         #print('full_comment = ', full_comment)
                     cards.append([old_card_name, _prep_comment(full_comment), card_lines])
+                    if card_ilines is not None:
+                        card_ilines.append(iline_card)
 
                     card_count[old_card_name] += 1
                     card_lines = []
@@ -1441,6 +1735,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                     elif old_card_name == 'ECHOOFF':
                         self.echo = False
                 old_card_name = card_name.rstrip(' *')
+                iline_card = i
                 if old_card_name == 'ENDDATA':
                     self.card_count['ENDDATA'] = 1
                     if nlines - i > 1:
@@ -1481,6 +1776,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             #if backup_comment + full_comment:
                 #print('backup_comment + full_comment = ', backup_comment + full_comment)
             cards.append([old_card_name, _prep_comment(backup_comment + full_comment), card_lines])
+            if card_ilines is not None:
+                card_ilines.append(iline_card)
             card_count[old_card_name] += 1
         self.echo = False
         return cards, card_count
@@ -2769,48 +3066,30 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
 
     def get_xyz_in_coord_no_xref(self, cid=0, fdtype='float64', sort_ids=True):
         """see get_xyz_in_coord"""
-        npoints, nids, all_nodes = self._get_npoints_nids_allnids()
-
-        xyz_cid0 = np.zeros((npoints, 3), dtype=fdtype)
-        if cid == 0:
-            for i, nid in enumerate(nids):
-                node = self.nodes[nid]
-                xyz = node.get_position_no_xref(self)
-                xyz_cid0[i, :] = xyz
-        else:
-            for i, nid in enumerate(nids):
-                node = self.nodes[nid]
-                xyz = node.get_position_wrt_no_xref(self, cid)
-                xyz_cid0[i, :] = xyz
-        if sort_ids:
-            isort = np.argsort(all_nodes)
-            xyz_cid0 = xyz_cid0[isort, :]
-        return xyz_cid0
+        return self._get_xyz_in_coord(cid, fdtype, sort_ids, xref=False)
 
     def _get_npoints_nids_allnids(self):
         """helper method for get_xyz_in_coord"""
-        nnodes = len(self.nodes)
-        nspoints = 0
-        nepoints = 0
-        nids = list(self.node_ids)
-        all_nodes = list(self.node_ids)
-        if self.spoints:
-            spoints = list(self.spoints)
-            nspoints = len(spoints)
-            all_nodes += spoints
-        if self.epoints:
-            epoints = list(self.epoints)
-            nepoints = len(epoints)
-            all_nodes += epoints
-        #self.log.debug('all_nodes = %s' % all_nodes)
-
+        nids = self.node_store.nid
+        nnodes = len(nids)
+        nspoints = len(self.spoints)
+        nepoints = len(self.epoints)
         npoints = nnodes + nspoints + nepoints
-        if len(all_nodes) != npoints:
-            msg = 'len(unique(all_nodes))=%s npoints=%s\n' % (len(np.unique(all_nodes)), npoints)
-            msg += 'npoints = nnodes+nspoints+nepoints = %s + %s + %s\n' % (
-                nnodes, nspoints, nepoints)
-            msg += 'all_nodes=%s' % (all_nodes)
-            raise RuntimeError(msg)
+
+        all_nodes = nids
+        if nspoints or nepoints:
+            all_nodes = np.hstack([
+                nids,
+                np.array(list(self.spoints), dtype='int32'),
+                np.array(list(self.epoints), dtype='int32'),
+            ])
+            nunique = len(np.unique(all_nodes))
+            if nunique != npoints:
+                msg = 'len(unique(all_nodes))=%s npoints=%s\n' % (nunique, npoints)
+                msg += 'npoints = nnodes+nspoints+nepoints = %s + %s + %s\n' % (
+                    nnodes, nspoints, nepoints)
+                msg += 'all_nodes=%s' % (all_nodes)
+                raise RuntimeError(msg)
         if npoints == 0:
             msg = 'nnodes=%s nspoints=%s nepoints=%s' % (nnodes, nspoints, nepoints)
             raise ValueError(msg)
@@ -2835,21 +3114,23 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             the xyz points in the cid coordinate frame
         """
         #return self.get_displacement_index_xyz_cp_cd(cid=cid, fdtype=dtype)[2]
+        return self._get_xyz_in_coord(cid, fdtype, sort_ids, xref=True)
+
+    def _get_xyz_in_coord(self, cid, fdtype, sort_ids, xref):
+        """helper method for get_xyz_in_coord"""
         npoints, nids, all_nodes = self._get_npoints_nids_allnids()
+        nnodes = len(nids)
         xyz_cid0 = np.zeros((npoints, 3), dtype=fdtype)
-        if cid == 0:
-            for i, nid in enumerate(nids):
-                node = self.nodes[nid]
-                xyz = node.get_position()
-                xyz_cid0[i, :] = xyz
-        else:
-            for i, nid in enumerate(nids):
-                node = self.nodes[nid]
-                xyz = node.get_position_wrt(self, cid)
-                xyz_cid0[i, :] = xyz
+        xyz_cid0[:nnodes, :] = self.node_store.get_xyz_in_coord(cid=cid, xref=xref)
         if sort_ids:
-            isort = np.argsort(all_nodes)
-            xyz_cid0 = xyz_cid0[isort, :]
+            # the GRIDs are sorted, but the SPOINTs/EPOINTs might not be
+            if nnodes != npoints:
+                isort = np.argsort(all_nodes)
+                xyz_cid0 = xyz_cid0[isort, :]
+        else:
+            # the GRIDs are in the order of model.nodes
+            inode = self.node_store.get_node_index(list(self.node_ids))
+            xyz_cid0[:nnodes, :] = xyz_cid0[inode, :]
         return xyz_cid0
 
     def _add_card_helper(self, card_obj, card, card_name, comment=''):
@@ -3233,10 +3514,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         >>> icd_transform[50]
         [2]
         """
-        nids_cd_transform = defaultdict(list)  # type: Dict[int, np.ndarray]
-        nids_cp_transform = defaultdict(list)  # type: Dict[int, np.ndarray]
-
-        nnodes = len(self.nodes)
+        node_store = self.node_store
+        nnodes = node_store.nnodes
         nspoints = 0
         nepoints = 0
         spoints = None
@@ -3254,49 +3533,43 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                 nnodes, nspoints, nepoints, nrings)
             raise ValueError(msg)
 
-        i = 0
         xyz_cp = np.zeros((nnodes + nspoints + nepoints, 3), dtype=fdtype)
         nid_cp_cd = np.zeros((nnodes + nspoints + nepoints, 3), dtype=idtype)
-        for nid, node in sorted(iteritems(self.nodes)):
-            cd = node.Cd()
-            cp = node.Cp()
-            nids_cp_transform[cp].append(nid)
-            nids_cd_transform[cd].append(nid)
-            nid_cp_cd[i, :] = [nid, cp, cd]
-            xyz_cp[i, :] = node.xyz
-            i += 1
+        xyz_cp[:nnodes, :] = node_store.xyz
+        nid_cp_cd[:nnodes, 0] = node_store.nid
+        nid_cp_cd[:nnodes, 1] = node_store.cp
+        nid_cp_cd[:nnodes, 2] = node_store.cd
+        is_node = np.zeros(nnodes + nspoints + nepoints, dtype='bool')
+        is_node[:nnodes] = True
+        i = nnodes
         if nspoints:
-            for nid in sorted(spoints):
-                nid_cp_cd[i, 0] = nid
-                i += 1
+            nid_cp_cd[i:i+nspoints, 0] = sorted(spoints)
+            i += nspoints
         if nepoints:
-            for nid in sorted(epoints):
-                nid_cp_cd[i, 0] = nid
-                i += 1
+            nid_cp_cd[i:i+nepoints, 0] = sorted(epoints)
+            i += nepoints
 
-        if sort_ids:
+        if sort_ids and (nspoints or nepoints):
             nids = nid_cp_cd[:, 0]
             isort = nids.argsort()
             nid_cp_cd = nid_cp_cd[isort, :]
             xyz_cp = xyz_cp[isort, :]
+            is_node = is_node[isort]
 
         icp_transform = {}
         icd_transform = {}
-        nids_all = nid_cp_cd[:, 0]
 
         # get the indicies of the xyz array where the nodes that
         # need to be transformed are
-        for cd, nids in sorted(iteritems(nids_cd_transform)):
+        for cd in np.unique(node_store.cd):
             if cd in [0, -1]:
                 continue
-            nids = np.array(nids)
-            icd_transform[cd] = np.where(np.in1d(nids_all, nids))[0]
+            icd_transform[int(cd)] = np.where((nid_cp_cd[:, 2] == cd) & is_node)[0]
 
-        for cp, nids in sorted(iteritems(nids_cp_transform)):
+        for cp in np.unique(node_store.cp):
             if cp in [-1]:
                 continue
-            nids = np.array(nids)
-            icp_transform[cp] = np.where(np.in1d(nids_all, nids))[0]
+            icp_transform[int(cp)] = np.where((nid_cp_cd[:, 1] == cp) & is_node)[0]
         return icd_transform, icp_transform, xyz_cp, nid_cp_cd
 
     def transform_xyzcp_to_xyz_cid(self, xyz_cp, nids, icp_transform,
@@ -3462,7 +3735,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         #is_beta = np.diagonal(beta2).min() != 1.
         #is_origin = np.abs(coord2.origin).max() != 0.
         #if is_beta and is_origin:
-        xyz_cid = coord2.transform_node_to_local_array(xyz_cid0)
+        xyz_cid = self.coord_cache.transform_node_to_local(xyz_cid0, cid)
         #xyz_cid = coord2.xyz_to_coord_array(np.dot(xyz_cid0 - coord2.origin, beta2.T))
         #elif is_beta:
             #xyz_cid = coord2.xyz_to_coord_array(np.dot(xyz_cid0, beta2.T))
@@ -3524,13 +3797,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                 #print("  cp=%s not used in a transform (%s)...done" % (cp, coord.type))
                 continue
 
-            beta = coord.beta()
             inode = icp_transform[cp]
             nids_checked.append(nids[inode])
             #print('***nids_checked=%s' % nids[inode])
-            xyzi = coord.coord_to_xyz_array(xyz_cp[inode, :])
             #try:
-            new = np.dot(xyzi, beta) + origin
+            new = self.coord_cache.transform_node_to_global(xyz_cp[inode, :], cp)
             #except TypeError:
                 #msg = 'Bad Math...\n'
                 #msg += '%s\n' % coord.rstrip()
@@ -3665,10 +3936,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         if len(self.coords) == 1:  # was ncoords > 2; changed b/c seems dangerous
             return icd_transform
 
-        for nid, node in sorted(iteritems(self.nodes)):
-            cid_d = node.Cd()
+        node_store = self.node_store
+        for cid_d in np.unique(node_store.cd):
             if cid_d:
-                nids_transform[cid_d].append(nid)
+                nids_transform[int(cid_d)] = node_store.nid[node_store.cd == cid_d].tolist()
 
         nids_all = np.array(sorted(self.point_ids))
         for cid in sorted(iterkeys(nids_transform)):
@@ -3718,7 +3989,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             raise CardParseSyntaxError(msg)
         return card_name.upper()
 
-    def _get_lines(self, bdf_filename):
+    def _get_lines(self, bdf_filename, bulk_data_line_ifiles=None):
         """
         Opens the bdf and extracts the lines by group
 
@@ -3726,10 +3997,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         ----------
         bdf_filename : str
             the main bdf_filename
-        punch : bool; default=False
-            is this a punch file
-            True : no executive/case control decks
-            False : executive/case control decks exist
+        bulk_data_line_ifiles : List[int]; default=None
+            filled with the file of each bulk data line (-1 : the main
+            file; see ``_lines_to_deck_lines``)
+            None : don't track the INCLUDE files
 
         Returns
         -------
@@ -3743,9 +4014,24 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             the bulk data lines (stores geometry, boundary conditions, loads, etc.)
         """
         main_lines = self._get_main_lines(bdf_filename, self.punch)
-        all_lines = self._lines_to_deck_lines(main_lines, punch=self.punch)
+        line_ifiles = None
+        if bulk_data_line_ifiles is not None:
+            line_ifiles = [-1] * len(main_lines)
+        all_lines = self._lines_to_deck_lines(main_lines, punch=self.punch,
+                                              line_ifiles=line_ifiles)
+        nlines = len(all_lines)
         out = _lines_to_decks(all_lines, self.punch)
         system_lines, executive_control_lines, case_control_lines, bulk_data_lines = out
+
+        if line_ifiles is not None:
+            # the bulk data deck is the end of the lines
+            ibulk = nlines - len(bulk_data_lines)
+            bulk_data_line_ifiles[:] = line_ifiles[ibulk:]
+
+            # the INCLUDE files in the executive/case control decks
+            # can't be reloaded
+            self._include_tracker.untracked_ifiles.update(
+                ifile for ifile in set(line_ifiles[:ibulk]) if ifile != -1)
         return system_lines, executive_control_lines, case_control_lines, bulk_data_lines
 
     def _get_main_lines(self, bdf_filename, punch=False):
@@ -3786,8 +4072,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                 _show_bad_file(self, bdf_filename, encoding=self._encoding)
         return lines
 
-    def _lines_to_deck_lines(self, lines, punch=False):
-        # type: (List[str], bool) -> List[str], int
+    def _lines_to_deck_lines(self, lines, punch=False, line_ifiles=None):
+        # type: (List[str], bool, Optional[List[int]]) -> List[str], int
         """
         Merges the includes into the main deck.
 
@@ -3799,6 +4085,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             is this a punch file
             True : no executive/case control decks
             False : executive/case control decks exist
+        line_ifiles : List[int]; default=None
+            the file of each line (-1 : the main file); the INCLUDE files
+            are added to ``self._include_tracker`` and the list is
+            updated in place, so it matches the active lines
+            None : don't track the INCLUDE files
 
         Returns
         -------
@@ -3857,8 +4148,16 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                     lines = lines[:i] + [include_comment] + lines2 + lines[j:]
                     #for line in lines:
                         #print("  *%s" % line.rstrip())
+                    if line_ifiles is not None:
+                        iparent = line_ifiles[i]
+                        ifile2 = self._include_tracker.add_file(
+                            self.active_filenames[-1], iparent, bdf_filename2)
+                        line_ifiles[:] = (line_ifiles[:i] + [iparent] +
+                                          [ifile2] * len(lines2) + line_ifiles[j:])
                 else:
                     lines = lines[:i] + lines[j:]
+                    if line_ifiles is not None:
+                        line_ifiles[:] = line_ifiles[:i] + line_ifiles[j:]
                     self.reject_lines.append(include_lines)
                     #self.reject_lines.append(write_include(bdf_filename2))
             i += 1
@@ -4062,8 +4361,20 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             elif not os.path.isfile(_filename(bdf_filename)):
                 raise IOError('Not a file: bdf_filename=%r' % bdf_filename)
 
-    def _parse_cards(self, cards, card_count):
-        """creates card objects and adds the parsed cards to the deck"""
+    def _parse_cards(self, cards, card_count, card_ifiles=None):
+        """
+        creates card objects and adds the parsed cards to the deck
+
+        Parameters
+        ----------
+        cards : List[[card_name, comment, card_lines]]
+            the cards from ``get_bdf_cards``
+        card_count : Dict[card_name] = int
+            the number of each card
+        card_ifiles : List[int]; default=None
+            the file of each card (-1 : the main file), which is used to
+            track the cards of the INCLUDE files
+        """
         #print('card_count = %s' % card_count)
 
         self.echo = False
@@ -4080,17 +4391,148 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                                       is_list=False, has_none=False)
         else:
             # this is the block that actually runs
-            for card in cards:
-                card_name, comment, card_lines = card
-                if card_name is None:
-                    msg = 'card_name = %r\n' % card_name
-                    msg += 'card_lines = %s' % card_lines
-                    raise RuntimeError(msg)
-                if self.is_reject(card_name):
-                    self.reject_card_lines(card_name, card_lines, comment)
-                else:
-                    self.add_card(card_lines, card_name, comment=comment,
-                                  is_list=False, has_none=False)
+            parsed_cards = self._build_fast_cards(cards)
+            if self._nworkers > 1:
+                self._build_cards_parallel(cards, parsed_cards)
+
+            tracker = self._include_tracker
+            runs = [(-1, 0, len(cards))]
+            if card_ifiles is not None and tracker is not None:
+                runs = tracker.get_card_runs(card_ifiles)
+
+            for ifile, icard0, icard1 in runs:
+                run0 = None if ifile == -1 else tracker.start_run(self)
+                for icard in range(icard0, icard1):
+                    card_name, comment, card_lines = cards[icard]
+                    if card_name is None:
+                        msg = 'card_name = %r\n' % card_name
+                        msg += 'card_lines = %s' % card_lines
+                        raise RuntimeError(msg)
+                    if self.is_reject(card_name):
+                        self.reject_card_lines(card_name, card_lines, comment)
+                    elif icard in parsed_cards:
+                        self._add_parsed_card(parsed_cards[icard], card_name, card_lines)
+                    else:
+                        self.add_card(card_lines, card_name, comment=comment,
+                                      is_list=False, has_none=False)
+                if run0 is not None:
+                    tracker.end_run(self, ifile, cards[icard0:icard1], run0)
+
+    def _build_fast_cards(self, cards):
+        """
+        Builds the simple high-volume cards with the bulk tokenizer
+
+        Returns
+        -------
+        fast_cards : dict[icard] = card_obj
+            the cards that don't need to go through ``add_card``
+        """
+        if not self._fast_tokenizer or self._is_dynamic_syntax:
+            return {}
+        card_names = set([card[0] for card in cards])
+        if 'ECHOON' in card_names:
+            # the echoed cards are printed by add_card
+            return {}
+        return build_fast_cards(cards, self._get_fast_card_names(card_names))
+
+    def _get_fast_card_names(self, card_names):
+        """gets the cards in the deck that have a FAST_CARD_BUILDER"""
+        fast_card_names = [card_name for card_name in FAST_CARD_BUILDERS
+                           if card_name in card_names and (
+                               card_name in self._card_parser or
+                               card_name in self._card_parser_prepare)]
+        return fast_card_names
+
+    def _build_cards_parallel(self, cards, parsed_cards):
+        """
+        Builds the cards using a process pool (``read_bdf(..., nworkers=N)``)
+
+        The card list is split into contiguous chunks (so an INCLUDE
+        file tends to stay in one chunk).  Each worker creates the card
+        objects for its chunk.  The cards are added to the model by the
+        main process in the original order, so the duplicate card checks,
+        card_count and the parse errors are the same as a serial read.
+
+        Parameters
+        ----------
+        cards : List[[card_name, comment, card_lines]]
+            the cards from ``get_bdf_cards``
+        parsed_cards : dict[icard] = card_obj
+            the cards that have already been built; updated in place
+        """
+        if self._is_dynamic_syntax:
+            return
+        card_names = set([card[0] for card in cards])
+        if 'ECHOON' in card_names:
+            # the echoed cards are printed by add_card
+            return
+
+        card_classes = {}
+        for card_name in card_names:
+            if card_name not in self._card_parser or card_name not in self.cards_to_read:
+                continue
+            if card_name in ['DEQATN', 'PBRSECT', 'PBMSECT']:
+                # these cards aren't split into fields
+                continue
+            card_class = self._card_parser[card_name][0]
+            if _is_picklable_class(card_class):
+                card_classes[card_name] = card_class
+        fast_card_names = self._get_fast_card_names(card_names)
+
+        icards = [icard for icard, card in enumerate(cards)
+                  if icard not in parsed_cards and (
+                      card[0] in card_classes or card[0] in fast_card_names)]
+        nworkers = min(self._nworkers, len(icards) // MIN_CARDS_PER_WORKER)
+        if nworkers < 2:
+            return
+
+        nchunks = 4 * nworkers
+        chunk_size = len(icards) // nchunks + 1
+        args = []
+        for ichunk in range(nchunks):
+            icards_chunk = icards[ichunk * chunk_size:(ichunk + 1) * chunk_size]
+            if icards_chunk:
+                cards_chunk = [cards[icard] for icard in icards_chunk]
+                args.append((icards_chunk, cards_chunk, card_classes, fast_card_names))
+        self.log.debug('building %s cards with nworkers=%s' % (len(icards), nworkers))
+
+        pool = multiprocessing.Pool(nworkers)
+        try:
+            worker_results = pool.map(_build_cards_worker, args)
+        finally:
+            pool.close()
+            pool.join()
+        for card_objs in worker_results:
+            parsed_cards.update(card_objs)
+
+    def _add_parsed_card(self, card_obj, card_name, card_lines):
+        """
+        adds a card from the bulk tokenizer or a worker
+        (see ``_add_card_helper``)
+        """
+        self.increase_card_count(card_name)
+        is_card_parser = card_name in self._card_parser
+        if is_card_parser:
+            add_card_function = self._card_parser[card_name][1]
+        else:
+            # CHEXA, CTETRA
+            add_card_function = self._add_element_object
+
+        try:
+            add_card_function(card_obj)
+        except TypeError:
+            if not is_card_parser:
+                raise
+        except (SyntaxError, AssertionError, KeyError, ValueError) as exception:
+            # WARNING: Don't catch RuntimeErrors or a massive memory leak can occur
+            self._iparse_errors += 1
+            card = wipe_empty_fields(to_fields(list(card_lines), card_name))
+            if not is_card_parser:
+                self.log.error(BDFCard(card, has_none=False))
+            var = traceback.format_exception_only(type(exception), exception)
+            self._stored_parse_errors.append((card, var))
+            if self._iparse_errors > self._nparse_errors:
+                self.pop_parse_errors()
 
     def _parse_dynamic_syntax(self, key):
         """
@@ -4632,6 +5074,38 @@ def _show_bad_file(self, bdf_filename, encoding, nlines_previous=10):
             iline += 1
             lines.append(line)
 
+def _is_picklable_class(card_class):
+    """can the class be sent to a worker (e.g., not a class in a function)"""
+    module = sys.modules.get(card_class.__module__)
+    return getattr(module, card_class.__name__, None) is card_class
+
+
+def _build_cards_worker(args):
+    """
+    Builds a chunk of the cards for ``read_bdf(..., nworkers=N)``
+
+    Parameters
+    ----------
+    args : (icards, cards, card_classes, fast_card_names)
+        icards : List[int]
+            the index of the cards in the deck
+        cards : List[[card_name, comment, card_lines]]
+            the cards
+        card_classes : dict[card_name] = card_class
+            the classes with an ``add_card(card_obj, comment)`` method
+        fast_card_names : List[str]
+            the cards that are built by the bulk tokenizer
+
+    Returns
+    -------
+    card_objs : dict[icard] = card_obj
+        the card objects that were built
+    """
+    icards, cards, card_classes, fast_card_names = args
+    card_objs = build_cards(cards, card_classes, fast_card_names)
+    return {icards[i] : card_obj for i, card_obj in iteritems(card_objs)}
+
+
 def main():  # pragma: no cover
     """
     shows off how unicode works becausee it's overly complicated
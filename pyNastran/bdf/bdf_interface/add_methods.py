@@ -82,8 +82,16 @@ class AddMethods(BDFAttributes):
                 pass
         else:
             assert key > 0, 'nid=%s node=%s' % (key, node)
-            self.nodes[key] = node
+            if self._lazy_xref is not None:
+                old_node = self.nodes.get(key)
+                self.nodes[key] = node
+                self._lazy_xref.add_card(node, old_node, update_elements_ref=True)
+            else:
+                self.nodes[key] = node
             self._type_to_id_map[node.type].append(key)
+            node_store = getattr(self, '_node_store', None)
+            if node_store is not None:
+                node_store.version += 1
 
     def _add_ringax_object(self, ringax, allow_overwrites=False):
         # type: (Any, bool) -> None
@@ -159,7 +167,12 @@ class AddMethods(BDFAttributes):
             elif key in self.plotels:
                 if not elem == self.plotels[key]:
                     assert elem.eid not in self.plotels, 'eid=%s\nold_element=\n%snew_element=\n%s' % (elem.eid, self.plotels[elem.eid], elem)
-        self.plotels[key] = elem
+        if self._lazy_xref is not None:
+            old_elem = self.plotels.get(key)
+            self.plotels[key] = elem
+            self._lazy_xref.add_card(elem, old_elem)
+        else:
+            self.plotels[key] = elem
         self._type_to_id_map[elem.type].append(key)
 
     def _add_element_object(self, elem, allow_overwrites=False):
@@ -171,7 +184,12 @@ class AddMethods(BDFAttributes):
                 if self._stop_on_duplicate_error:
                     self.pop_parse_errors()
         else:
-            self.elements[key] = elem
+            if self._lazy_xref is not None:
+                old_elem = self.elements.get(key)
+                self.elements[key] = elem
+                self._lazy_xref.add_card(elem, old_elem, update_elements_ref=True)
+            else:
+                self.elements[key] = elem
             self._type_to_id_map[elem.type].append(key)
 
     def _add_ao_object(self, elem_flag, allow_overwrites=False):
@@ -210,7 +228,12 @@ class AddMethods(BDFAttributes):
             if not mass == self.masses[key]:
                 self._duplicate_masses.append(mass)
         else:
-            self.masses[key] = mass
+            if self._lazy_xref is not None:
+                old_mass = self.masses.get(key)
+                self.masses[key] = mass
+                self._lazy_xref.add_card(mass, old_mass)
+            else:
+                self.masses[key] = mass
             self._type_to_id_map[mass.type].append(key)
 
     def _add_damper_object(self, elem, allow_overwrites=False):
@@ -222,7 +245,12 @@ class AddMethods(BDFAttributes):
         assert key > 0, 'eid=%s elem=%s' % (key, elem)
         if key in self.rigid_elements and not allow_overwrites:
             assert elem.eid not in self.rigid_elements, 'eid=%s\noldElement=\n%snewElement=\n%s' % (elem.eid, self.rigid_elements[elem.eid], elem)
-        self.rigid_elements[key] = elem
+        if self._lazy_xref is not None:
+            old_elem = self.rigid_elements.get(key)
+            self.rigid_elements[key] = elem
+            self._lazy_xref.add_card(elem, old_elem)
+        else:
+            self.rigid_elements[key] = elem
         self._type_to_id_map[elem.type].append(key)
 
     def _add_thermal_element_object(self, elem):
@@ -260,7 +288,12 @@ class AddMethods(BDFAttributes):
                 if self._stop_on_duplicate_error:
                     self.pop_parse_errors()
         else:
-            self.properties[key] = prop
+            if self._lazy_xref is not None:
+                old_prop = self.properties.get(key)
+                self.properties[key] = prop
+                self._lazy_xref.add_card(prop, old_prop)
+            else:
+                self.properties[key] = prop
             self._type_to_id_map[prop.type].append(key)
 
     def _add_property_mass_object(self, prop, allow_overwrites=False):
@@ -272,7 +305,12 @@ class AddMethods(BDFAttributes):
                 assert key not in self.properties_mass, 'pid=%s oldProperty=\n%snewProperty=\n%s' % (key, self.properties_mass[key], prop)
         else:
             assert key > 0, 'pid=%s prop=%s' % (key, prop)
-            self.properties_mass[key] = prop
+            if self._lazy_xref is not None:
+                old_prop = self.properties_mass.get(key)
+                self.properties_mass[key] = prop
+                self._lazy_xref.add_card(prop, old_prop)
+            else:
+                self.properties_mass[key] = prop
             self._type_to_id_map[prop.type].append(key)
 
     def _add_dtable_object(self, dtable, allow_overwrites=False):
@@ -389,7 +427,12 @@ class AddMethods(BDFAttributes):
             if not material == self.materials[key]:
                 self._duplicate_materials.append(material)
         else:
-            self.materials[key] = material
+            if self._lazy_xref is not None:
+                old_material = self.materials.get(key)
+                self.materials[key] = material
+                self._lazy_xref.add_card(material, old_material)
+            else:
+                self.materials[key] = material
             self._type_to_id_map[material.type].append(key)
 
     def _add_thermal_material_object(self, material, allow_overwrites=False):
@@ -447,6 +490,9 @@ class AddMethods(BDFAttributes):
             assert key > 0, 'mid=%s material=\n%s' % (key, material)
             slot[key] = material
             self._type_to_id_map[material.type].append(key)
+            if self._lazy_xref is not None:
+                # the MATx card links to the MATSx/MATTx card
+                self._lazy_xref.invalidate()
 
     def _add_creep_material_object(self, material, allow_overwrites=False):
         # type: (Any, bool) -> None
@@ -486,6 +532,8 @@ class AddMethods(BDFAttributes):
         # type: (Any) -> None
         """adds a load object to a load case"""
         key = load.sid
+        if self._lazy_xref is not None:
+            self._lazy_xref.add_card(load)
         if key in self.load_combinations:
             self.load_combinations[key].append(load)
         else:
@@ -496,6 +544,8 @@ class AddMethods(BDFAttributes):
         # type: (Any) -> None
         """adds a load object to a load case"""
         key = load.sid
+        if self._lazy_xref is not None:
+            self._lazy_xref.add_card(load)
         if key in self.loads:
             self.loads[key].append(load)
         else:
@@ -506,6 +556,8 @@ class AddMethods(BDFAttributes):
         # type: (Any) -> None
         """adds a dload object to a load case"""
         key = load.sid
+        if self._lazy_xref is not None:
+            self._lazy_xref.add_card(load)
         if key in self.dloads:
             self.dloads[key].append(load)
         else:
@@ -516,6 +568,8 @@ class AddMethods(BDFAttributes):
         # type: (Any) -> None
         """adds a sub-dload object to a load case"""
         key = dload.sid
+        if self._lazy_xref is not None:
+            self._lazy_xref.add_card(dload)
         if key in self.dload_entries:
             self.dload_entries[key].append(dload)
         else:
@@ -526,6 +580,8 @@ class AddMethods(BDFAttributes):
         # type: (Any) -> None
         """adds a LSEQ object to a load case"""
         key = load.sid
+        if self._lazy_xref is not None:
+            self._lazy_xref.add_card(load)
         if key in self.load_combinations:
             self.load_combinations[key].append(load)
         else:
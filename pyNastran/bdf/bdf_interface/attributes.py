@@ -8,6 +8,8 @@ from pyNastran.utils import object_attributes, object_methods
 from pyNastran.bdf.utils import deprecated
 #from pyNastran.bdf.case_control_deck import CaseControlDeck
 from pyNastran.bdf.cards.coordinate_systems import CORD2R
+from pyNastran.bdf.bdf_interface.node_store import NodeStore
+from pyNastran.bdf.bdf_interface.coord_cache import CoordCache
 #from pyNastran.bdf.cards.constraints import ConstraintObject
 
 class BDFAttributes(object):
@@ -18,6 +20,12 @@ class BDFAttributes(object):
         self.__init_attributes()
         self._is_cards_dict = False
 
+        #: the LazyCrossReference for read_bdf(..., xref='lazy')
+        self._lazy_xref = None
+
+        #: the IncludeTracker for reload_changed_includes()
+        self._include_tracker = None
+
         self.set_as_msc()
 
         self.units = []  # type: List[str]
@@ -66,7 +74,8 @@ class BDFAttributes(object):
             'nnodes', 'ncoords', 'nelements', 'nproperties',
             'nmaterials', 'ncaeros',
 
-            'point_ids', 'subcases',
+            'point_ids', 'subcases', 'node_store', '_node_store', '_lazy_xref',
+            'coord_cache', '_coord_cache',
             '_card_parser', '_card_parser_b',
             'object_methods', 'object_attributes',
         ]
@@ -838,6 +847,32 @@ class BDFAttributes(object):
         """gets the GRID ids"""
         return self.nodes.keys()
 
+    @property
+    def node_store(self):
+        """
+        gets the GRID data as arrays (see ``NodeStore``), which are
+        rebuilt when the GRIDs change
+        """
+        node_store = getattr(self, '_node_store', None)
+        if node_store is None:
+            node_store = NodeStore(self)
+            self._node_store = node_store
+        node_store.update()
+        return node_store
+
+    @property
+    def coord_cache(self):
+        """
+        gets the (origin, beta) transforms of the coordinate systems
+        (see ``CoordCache``), which are cleared when the coordinate
+        systems change
+        """
+        coord_cache = getattr(self, '_coord_cache', None)
+        if coord_cache is None:
+            coord_cache = CoordCache(self)
+            self._coord_cache = coord_cache
+        return coord_cache
+
     @property
     def point_ids(self):
         """gets the GRID, SPOINT, EPOINT ids"""
@@ -0,0 +1,447 @@
+"""
+Defines a bulk tokenizer for the high-volume bulk data cards:
+ - split_card_fields(card_lines)
+ - build_fast_cards(cards, card_names=None)
+ - build_cards(cards, card_classes, fast_card_names)
+
+The standard reader creates a BDFCard and calls the ``assign_type``
+methods (e.g., ``integer``, ``double_or_blank``) one field at a time.
+For the common cards (e.g., GRID, CQUAD4), the fields are split in one
+pass per card type and the simple values (e.g., ``1``, ``1.0``, blank)
+are converted directly.  Anything that isn't simple (e.g., ``1.-3``,
+``+1``, an invalid card) is left for the standard reader, so the card
+objects and the error messages don't change.
+"""
+from __future__ import print_function
+from collections import defaultdict
+from six import iteritems
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+from pyNastran.bdf.utils import to_fields
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CHEXA8, CHEXA20, CTETRA4, CTETRA10
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.bush import CBUSH
+from pyNastran.bdf.cards.elements.rigid import RBE2
+
+#: the number of fields that the fields are padded to, so the builders
+#: can index past the last field (like BDFCard.field)
+NFIELDS_MAX = 24
+
+BLANK_FIELDS = [''] * (NFIELDS_MAX - 9)
+VALID_COMPONENTS = set('0123456')
+
+
+class FallbackError(ValueError):
+    """the card needs to be read by the standard reader"""
+    pass
+
+
+def split_card_fields(card_lines):
+    """
+    Splits the lines of a small/large field or CSV card into the
+    stripped fields (like ``to_fields`` and ``wipe_empty_fields``)
+
+    Parameters
+    ----------
+    card_lines : List[str]
+        the lines of the card
+
+    Returns
+    -------
+    card : List[str] / None
+        the stripped fields of the card padded to NFIELDS_MAX with
+        blank ('') fields; None if the card needs the standard reader
+    nfields : int
+        the number of fields without the trailing blank fields
+        (i.e., len(BDFCard))
+    """
+    if len(card_lines) == 1:
+        line = card_lines[0]
+        if '=' not in line and '\t' not in line and ',' not in line and '*' not in line:
+            # the common single line small field card
+            card = [line[0:8].strip(), line[8:16].strip(), line[16:24].strip(),
+                    line[24:32].strip(), line[32:40].strip(), line[40:48].strip(),
+                    line[48:56].strip(), line[56:64].strip(), line[64:72].strip()]
+            nfields = 9
+            while nfields > 1 and not card[nfields - 1]:
+                nfields -= 1
+            return card + BLANK_FIELDS, nfields
+
+    fields = []
+    for iline, line in enumerate(card_lines):
+        if '=' in line:
+            return None, 0
+        if '\t' in line:
+            if ',' in line:
+                return None, 0
+            line = line.expandtabs()
+
+        if '*' in line:  # large field
+            if ',' in line:  # csv
+                if iline == 0:
+                    new_fields = line.split(',')[:5]
+                    new_fields += [''] * (5 - len(new_fields))
+                else:
+                    new_fields = line.split(',')[1:5]
+                    new_fields += [''] * (4 - len(new_fields))
+            elif iline == 0:
+                new_fields = [line[0:8], line[8:24], line[24:40], line[40:56],
+                              line[56:72]]
+            else:
+                new_fields = [line[8:24], line[24:40], line[40:56], line[56:72]]
+        else:  # small field
+            if ',' in line:  # csv
+                if iline == 0:
+                    new_fields = line.split(',')[:9]
+                    new_fields += [''] * (9 - len(new_fields))
+                else:
+                    new_fields = line.split(',')[1:9]
+                    new_fields += [''] * (8 - len(new_fields))
+            elif iline == 0:
+                new_fields = [line[0:8], line[8:16], line[16:24], line[24:32],
+                              line[32:40], line[40:48], line[48:56], line[56:64],
+                              line[64:72]]
+            else:
+                new_fields = [line[8:16], line[16:24], line[24:32],
+                              line[32:40], line[40:48], line[48:56],
+                              line[56:64], line[64:72]]
+        fields += new_fields
+
+    card = [field.strip() for field in fields]
+    nfields = len(card)
+    while nfields > 1 and not card[nfields - 1]:
+        nfields -= 1
+    if nfields < NFIELDS_MAX:
+        card += [''] * (NFIELDS_MAX - nfields)
+    return card, nfields
+
+
+def _integer(svalue):
+    """an integer field"""
+    if svalue.isdigit():
+        return int(svalue)
+    raise FallbackError(svalue)
+
+def _integer_or_blank(svalue, default=None):
+    """an integer/blank field"""
+    if not svalue:
+        return default
+    if svalue.isdigit():
+        return int(svalue)
+    raise FallbackError(svalue)
+
+def _double_or_blank(svalue, default=None):
+    """a float/blank field; Nastran exponents (e.g., 1.-3) aren't simple"""
+    if not svalue:
+        return default
+    if svalue.isdigit():
+        raise FallbackError(svalue)
+    return float(svalue)
+
+def _integer_double_or_blank(svalue, default=None):
+    """an integer/float/blank field"""
+    if not svalue:
+        return default
+    if svalue.isdigit():
+        return int(svalue)
+    if '.' in svalue and '-' not in svalue[1:] and '+' not in svalue[1:]:
+        return float(svalue)
+    raise FallbackError(svalue)
+
+def _components_or_blank(svalue, default=None):
+    """a components/blank field (e.g., 123456)"""
+    if not svalue:
+        return default
+    if not svalue.isdigit():
+        raise FallbackError(svalue)
+    value = int(svalue)
+    if value > 0 and '0' in svalue:
+        raise FallbackError(svalue)
+    svalue3 = ''.join(sorted(str(value)))
+    components = set(svalue3)
+    if not components.issubset(VALID_COMPONENTS) or len(components) != len(svalue3):
+        raise FallbackError(svalue)
+    return svalue3
+
+def _blank(svalue):
+    """a blank field"""
+    if svalue:
+        raise FallbackError(svalue)
+
+
+def _build_grid(card, nfields, comment):
+    """see ``GRID.add_card``"""
+    nid = _integer(card[1])
+    cp = _integer_or_blank(card[2], 0)
+    xyz = [
+        _double_or_blank(card[3], 0.),
+        _double_or_blank(card[4], 0.),
+        _double_or_blank(card[5], 0.)]
+    if nfields > 6:
+        if nfields > 9:
+            raise FallbackError(nfields)
+        cd = _integer_or_blank(card[6], 0)
+        ps = _components_or_blank(card[7], '')
+        seid = _integer_or_blank(card[8], 0)
+    else:
+        cd = 0
+        ps = ''
+        seid = 0
+    return GRID(nid, xyz, cp, cd, ps, seid, comment=comment)
+
+def _build_cquad4(card, nfields, comment):
+    """see ``CQUAD4.add_card``"""
+    eid = _integer(card[1])
+    pid = _integer_or_blank(card[2], eid)
+    nids = [_integer(card[3]), _integer(card[4]),
+            _integer(card[5]), _integer(card[6])]
+    if nfields > 6:
+        if nfields > 15:
+            raise FallbackError(nfields)
+        theta_mcid = _integer_double_or_blank(card[7], 0.0)
+        zoffset = _double_or_blank(card[8], 0.0)
+        _blank(card[9])
+        tflag = _integer_or_blank(card[10], 0)
+        T1 = _double_or_blank(card[11])
+        T2 = _double_or_blank(card[12])
+        T3 = _double_or_blank(card[13])
+        T4 = _double_or_blank(card[14])
+    else:
+        theta_mcid = 0.0
+        zoffset = 0.0
+        tflag = 0
+        T1 = T2 = T3 = T4 = 1.0
+    return CQUAD4(eid, pid, nids, theta_mcid, zoffset,
+                  tflag, T1, T2, T3, T4, comment=comment)
+
+def _build_ctria3(card, nfields, comment):
+    """see ``CTRIA3.add_card``"""
+    eid = _integer(card[1])
+    pid = _integer_or_blank(card[2], eid)
+    nids = [_integer(card[3]), _integer(card[4]), _integer(card[5])]
+    if nfields > 5:
+        if nfields > 14:
+            raise FallbackError(nfields)
+        theta_mcid = _integer_double_or_blank(card[6], 0.0)
+        zoffset = _double_or_blank(card[7], 0.0)
+        _blank(card[8])
+        _blank(card[9])
+        tflag = _integer_or_blank(card[10], 0)
+        T1 = _double_or_blank(card[11])
+        T2 = _double_or_blank(card[12])
+        T3 = _double_or_blank(card[13])
+    else:
+        theta_mcid = 0.0
+        zoffset = 0.0
+        tflag = 0
+        T1 = T2 = T3 = 1.0
+    return CTRIA3(eid, pid, nids, zoffset=zoffset, theta_mcid=theta_mcid,
+                  tflag=tflag, T1=T1, T2=T2, T3=T3, comment=comment)
+
+def _build_chexa(card, nfields, comment):
+    """see ``BDF._prepare_chexa``"""
+    eid = _integer(card[1])
+    pid = _integer(card[2])
+    nids = [_integer(svalue) for svalue in card[3:11]]
+    if nfields == 11:
+        return CHEXA8(eid, pid, nids, comment=comment)
+    if nfields > 23:
+        raise FallbackError(nfields)
+    nids += [_integer_or_blank(svalue) for svalue in card[11:23]]
+    return CHEXA20(eid, pid, nids, comment=comment)
+
+def _build_ctetra(card, nfields, comment):
+    """see ``BDF._prepare_ctetra``"""
+    eid = _integer(card[1])
+    pid = _integer(card[2])
+    nids = [_integer(svalue) for svalue in card[3:7]]
+    if nfields == 7:
+        return CTETRA4(eid, pid, nids, comment=comment)
+    if nfields > 13:
+        raise FallbackError(nfields)
+    nids += [_integer_or_blank(svalue) for svalue in card[7:13]]
+    return CTETRA10(eid, pid, nids, comment=comment)
+
+def _build_cbar(card, nfields, comment):
+    """see ``CBAR.add_card``"""
+    if nfields > 17:
+        raise FallbackError(nfields)
+    eid = _integer(card[1])
+    pid = _integer_or_blank(card[2], eid)
+    ga = _integer(card[3])
+    gb = _integer(card[4])
+
+    field5 = _integer_double_or_blank(card[5], 0.0)
+    if isinstance(field5, int):
+        g0 = field5
+        x = None
+    else:
+        g0 = None
+        x = np.array([field5,
+                      _double_or_blank(card[6], 0.0),
+                      _double_or_blank(card[7], 0.0)], dtype='float64')
+        if np.linalg.norm(x) == 0.0:
+            # the standard reader raises the error
+            raise FallbackError(x)
+
+    if card[8]:
+        raise FallbackError(card[8])
+    offt = 'GGG'
+    pa = _integer_or_blank(card[9], 0)
+    pb = _integer_or_blank(card[10], 0)
+    wa = np.array([_double_or_blank(card[11], 0.0),
+                   _double_or_blank(card[12], 0.0),
+                   _double_or_blank(card[13], 0.0)], dtype='float64')
+    wb = np.array([_double_or_blank(card[14], 0.0),
+                   _double_or_blank(card[15], 0.0),
+                   _double_or_blank(card[16], 0.0)], dtype='float64')
+    return CBAR(eid, pid, [ga, gb], x, g0,
+                offt, pa, pb, wa, wb, comment=comment)
+
+def _build_cbush(card, nfields, comment):
+    """see ``CBUSH.add_card``"""
+    if nfields > 14:
+        raise FallbackError(nfields)
+    eid = _integer(card[1])
+    pid = _integer_or_blank(card[2], eid)
+    ga = _integer(card[3])
+    gb = _integer_or_blank(card[4])
+    cid = _integer_or_blank(card[8])
+
+    x1_g0 = _integer_double_or_blank(card[5])
+    if isinstance(x1_g0, int):
+        g0 = x1_g0
+        x = None
+    elif isinstance(x1_g0, float):
+        g0 = None
+        x = [x1_g0,
+             _double_or_blank(card[6], 0.0),
+             _double_or_blank(card[7], 0.0)]
+        if cid is None and max(x) == min(x):
+            raise FallbackError(x)
+    else:
+        g0 = None
+        x = [None, None, None]
+
+    s = _double_or_blank(card[9], 0.5)
+    ocid = _integer_or_blank(card[10], -1)
+    si = [_double_or_blank(card[11]),
+          _double_or_blank(card[12]),
+          _double_or_blank(card[13])]
+    return CBUSH(eid, pid, [ga, gb], x, g0, cid=cid, s=s, ocid=ocid, si=si, comment=comment)
+
+def _build_rbe2(card, nfields, comment):
+    """see ``RBE2.add_card``"""
+    if nfields < 5:
+        raise FallbackError(nfields)
+    eid = _integer(card[1])
+    gn = _integer(card[2])
+    cm = _components_or_blank(card[3])
+
+    svalue = card[nfields - 1]
+    if svalue.isdigit():
+        # the last field is part of Gmi
+        n = 0
+        alpha = 0.0
+    elif '.' in svalue and '-' not in svalue[1:] and '+' not in svalue[1:]:
+        n = 1
+        alpha = float(svalue)
+    else:
+        raise FallbackError(svalue)
+
+    Gmi = [_integer(svalue) for svalue in card[4:nfields - n]]
+    return RBE2(eid, gn, cm, Gmi, alpha, comment=comment)
+
+
+#: builders[card_name] = builder(card, nfields, comment)
+FAST_CARD_BUILDERS = {
+    'GRID' : _build_grid,
+    'CQUAD4' : _build_cquad4,
+    'CTRIA3' : _build_ctria3,
+    'CHEXA' : _build_chexa,
+    'CTETRA' : _build_ctetra,
+    'CBAR' : _build_cbar,
+    'CBUSH' : _build_cbush,
+    'RBE2' : _build_rbe2,
+}
+
+
+def build_fast_cards(cards, card_names=None):
+    """
+    Builds the simple high-volume cards (e.g., GRID, CQUAD4) in one pass
+    per card type
+
+    Parameters
+    ----------
+    cards : List[[card_name, comment, card_lines]]
+        the cards from ``BDF.get_bdf_cards``
+    card_names : List[str]; default=None -> FAST_CARD_BUILDERS
+        the card names to build
+
+    Returns
+    -------
+    card_objs : dict[icard] = card_obj
+        the card objects (e.g., a GRID); a card that isn't in card_objs
+        needs to be read by the standard reader
+    """
+    if card_names is None:
+        card_names = list(FAST_CARD_BUILDERS)
+    card_names = set(card_names)
+
+    icards_by_name = defaultdict(list)
+    for icard, (card_name, unused_comment, unused_card_lines) in enumerate(cards):
+        if card_name in card_names:
+            icards_by_name[card_name].append(icard)
+
+    card_objs = {}
+    for card_name, icards in iteritems(icards_by_name):
+        builder = FAST_CARD_BUILDERS[card_name]
+        for icard in icards:
+            unused_card_name, comment, card_lines = cards[icard]
+            card, nfields = split_card_fields(card_lines)
+            if card is None:
+                continue
+            try:
+                card_objs[icard] = builder(card, nfields, comment)
+            except ValueError:
+                # FallbackError or a float that's not simple (e.g., 1.-3)
+                continue
+    return card_objs
+
+
+def build_cards(cards, card_classes, fast_card_names):
+    """
+    Builds the cards without adding them to a model (e.g., in a worker
+    of ``read_bdf(..., nworkers=N)``)
+
+    Parameters
+    ----------
+    cards : List[[card_name, comment, card_lines]]
+        the cards from ``BDF.get_bdf_cards``
+    card_classes : dict[card_name] = card_class
+        the classes with an ``add_card(card_obj, comment)`` method
+    fast_card_names : List[str]
+        the cards that are built with the FAST_CARD_BUILDERS
+
+    Returns
+    -------
+    card_objs : dict[icard] = card_obj
+        the card objects; a card that isn't in card_objs (e.g., an
+        invalid card) needs to be read by the standard reader, so
+        the error is handled the same way
+    """
+    card_objs = build_fast_cards(cards, fast_card_names)
+    for icard, (card_name, comment, card_lines) in enumerate(cards):
+        if icard in card_objs or card_name not in card_classes:
+            continue
+        try:
+            card = wipe_empty_fields(to_fields(list(card_lines), card_name))
+            card_obj = BDFCard(card, has_none=False)
+            card_objs[icard] = card_classes[card_name].add_card(card_obj, comment=comment)
+        except Exception:
+            continue
+    return card_objs
@@ -0,0 +1,303 @@
+"""
+Defines the coordinate system transform cache that's used by
+``model.coord_cache``:
+ - CoordCache(model)
+   - is_current()
+   - invalidate(cids=None)
+   - get_transform(cid)
+   - transform_node_to_global(xyz, cids)
+   - transform_vector_to_global(vectors, cids)
+   - transform_node_to_local(xyz, cids)
+   - transform_vector_to_local(vectors, cids)
+   - transform_node_to_coord(xyz, cids, cid_to)
+
+The (origin, beta) of a coordinate system is stored per cid the first
+time it's needed.  The origin/axes of a cross referenced Coord are
+already resolved through the whole rid chain, so a point is transformed
+to the global frame with a single:
+
+.. math:: p_{global} = p_{local} [\\beta] + p_{origin}
+
+The transforms are cleared when the origin/axes of any Coord change
+(e.g., ``setup``, ``move_origin``) or a Coord is replaced in
+``model.coords``.  Editing the origin/axes arrays in-place isn't
+detected, so call ``invalidate`` for that.
+"""
+from __future__ import print_function
+from six import integer_types
+import numpy as np
+
+from pyNastran.bdf.cards.coordinate_systems import Coord
+
+
+class CoordCache(object):
+    """
+    The (origin, beta) transforms of the coordinate systems
+
+    Attributes
+    ----------
+    transforms : dict[cid] = (coord, origin, beta)
+        coord : Coord
+            the coordinate system
+        origin : (3, ) float ndarray
+            the origin in the global frame
+        beta : (3, 3) float ndarray
+            the local to global transform (the rows are the ijk axes)
+    """
+    def __init__(self, model):
+        """
+        Creates the CoordCache
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+        """
+        self.model = model
+        self.transforms = {}
+        self._version = Coord._version
+
+    def is_current(self):
+        """have the coordinate systems not changed since the last call?"""
+        return self._version == Coord._version
+
+    def invalidate(self, cids=None):
+        """
+        Clears the transforms
+
+        Parameters
+        ----------
+        cids : List[int]; default=None
+            the coordinate systems to clear, which also clears the
+            coordinate systems that reference them
+            None : all
+        """
+        if cids is None:
+            self.transforms = {}
+            return
+        cids = set(cids)
+        for cid, (coord, unused_origin, unused_beta) in list(self.transforms.items()):
+            if cid in cids or cids.intersection(coord.rid_trace):
+                del self.transforms[cid]
+
+    def get_transform(self, cid):
+        """
+        Gets the transform of a coordinate system
+
+        Parameters
+        ----------
+        cid : int
+            the coordinate system
+
+        Returns
+        -------
+        coord : Coord
+            the coordinate system
+        origin : (3, ) float ndarray
+            the origin in the global frame
+        beta : (3, 3) float ndarray
+            the local to global transform (the rows are the ijk axes)
+        """
+        if not self.is_current():
+            self.transforms = {}
+            self._version = Coord._version
+
+        coord = self.model.Coord(cid)
+        try:
+            transform = self.transforms[cid]
+        except KeyError:
+            pass
+        else:
+            if transform[0] is coord:
+                return transform
+
+        if coord.origin is None:
+            coord.resolve()
+            if not self.is_current():
+                self.transforms = {}
+                self._version = Coord._version
+        if coord.i is None or coord.origin is None:
+            msg = "Local unit vectors haven't been set.\nType=%r cid=%s rid=%s" % (
+                coord.type, coord.cid, coord.rid)
+            raise RuntimeError(msg)
+
+        origin = np.array(coord.origin, dtype='float64')
+        beta = coord.beta()
+        transform = (coord, origin, beta)
+        self.transforms[cid] = transform
+        return transform
+
+    def transform_node_to_global(self, xyz, cids):
+        """
+        Transforms points from their coordinate systems to the global
+        coordinate system
+
+        Parameters
+        ----------
+        xyz : (n, 3) float ndarray
+            the points in the local frames (e.g., R-theta-z)
+        cids : int / (n, ) int ndarray
+            the coordinate system of each point
+
+        Returns
+        -------
+        xyz_global : (n, 3) float ndarray
+            the points in the global frame
+        """
+        return self._transform_to_global(xyz, cids, is_node=True)
+
+    def transform_vector_to_global(self, vectors, cids):
+        """
+        Transforms generalized vectors (e.g., forces) from their
+        coordinate systems to the global coordinate system, which
+        doesn't shift them by the origin.
+
+        Parameters
+        ----------
+        vectors : (n, 3) float ndarray
+            the vectors in the local frames
+        cids : int / (n, ) int ndarray
+            the coordinate system of each vector
+
+        Returns
+        -------
+        vectors_global : (n, 3) float ndarray
+            the vectors in the global frame
+        """
+        return self._transform_to_global(vectors, cids, is_node=False)
+
+    def transform_node_to_local(self, xyz, cids):
+        """
+        Transforms points from the global coordinate system to local
+        coordinate systems
+
+        Parameters
+        ----------
+        xyz : (n, 3) float ndarray
+            the points in the global frame
+        cids : int / (n, ) int ndarray
+            the desired coordinate system of each point
+
+        Returns
+        -------
+        xyz_local : (n, 3) float ndarray
+            the points in the local frames (e.g., R-theta-z)
+        """
+        return self._transform_to_local(xyz, cids, is_node=True)
+
+    def transform_vector_to_local(self, vectors, cids):
+        """
+        Transforms generalized vectors (e.g., forces) from the global
+        coordinate system to local coordinate systems
+
+        Parameters
+        ----------
+        vectors : (n, 3) float ndarray
+            the vectors in the global frame
+        cids : int / (n, ) int ndarray
+            the desired coordinate system of each vector
+
+        Returns
+        -------
+        vectors_local : (n, 3) float ndarray
+            the vectors in the local frames
+        """
+        return self._transform_to_local(vectors, cids, is_node=False)
+
+    def transform_node_to_coord(self, xyz, cids, cid_to):
+        """
+        Transforms points from their coordinate systems to another
+        coordinate system
+
+        Parameters
+        ----------
+        xyz : (n, 3) float ndarray
+            the points in the local frames
+        cids : int / (n, ) int ndarray
+            the coordinate system of each point
+        cid_to : int
+            the desired coordinate system
+
+        Returns
+        -------
+        xyz_cid : (n, 3) float ndarray
+            the points in the cid_to frame
+        """
+        if isinstance(cids, integer_types) and cids == cid_to:
+            return np.array(xyz, dtype='float64')
+        xyz_global = self.transform_node_to_global(xyz, cids)
+        if cid_to == 0:
+            return xyz_global
+        return self.transform_node_to_local(xyz_global, cid_to)
+
+    def _transform_to_global(self, xyz, cids, is_node):
+        """helper for ``transform_node_to_global``"""
+        xyz = np.asarray(xyz, dtype='float64').reshape(-1, 3)
+        xyz_global = xyz.copy()
+        for cid, irows in _group_by_cid(cids, len(xyz)):
+            if cid == 0:
+                continue
+            coord, origin, beta = self.get_transform(cid)
+
+            # the ijk axes arent resolved as R-theta-z, only points
+            xyzi = np.dot(coord.coord_to_xyz_array(xyz[irows, :]), beta)
+            if is_node:
+                xyzi += origin
+            xyz_global[irows, :] = xyzi
+        return xyz_global
+
+    def _transform_to_local(self, xyz, cids, is_node):
+        """helper for ``transform_node_to_local``"""
+        xyz = np.asarray(xyz, dtype='float64').reshape(-1, 3)
+        xyz_local = xyz.copy()
+        for cid, irows in _group_by_cid(cids, len(xyz)):
+            if cid == 0:
+                continue
+            coord, origin, beta = self.get_transform(cid)
+            xyzi = xyz[irows, :]
+            if is_node:
+                xyzi = xyzi - origin
+            xyz_local[irows, :] = coord.xyz_to_coord_array(np.dot(xyzi, beta.T))
+        return xyz_local
+
+    def __repr__(self):
+        msg = 'CoordCache(ntransforms=%s, is_current=%s)' % (
+            len(self.transforms), self.is_current())
+        return msg
+
+
+def _group_by_cid(cids, nrows):
+    """
+    Groups the rows by coordinate system
+
+    Parameters
+    ----------
+    cids : int / (nrows, ) int ndarray
+        the coordinate system of each row
+    nrows : int
+        the number of rows
+
+    Returns
+    -------
+    groups : List[(cid, irows)]
+        cid : int
+            the coordinate system
+        irows : (n, ) int ndarray / slice
+            the rows in the coordinate system
+    """
+    if isinstance(cids, integer_types):
+        return [(cids, slice(None))]
+    cids = np.asarray(cids).ravel()
+    if len(cids) != nrows:
+        msg = 'len(cids)=%s nrows=%s' % (len(cids), nrows)
+        raise RuntimeError(msg)
+    if nrows == 0:
+        return []
+
+    ucids, icids = np.unique(cids, return_inverse=True)
+    if len(ucids) == 1:
+        return [(int(ucids[0]), slice(None))]
+    isort = np.argsort(icids, kind='mergesort')
+    istarts = np.searchsorted(icids[isort], np.arange(len(ucids)))
+    return [(int(cid), irows)
+            for cid, irows in zip(ucids, np.split(isort, istarts[1:]))]
@@ -64,12 +64,20 @@ around the idea of cross-referencing, so it's recommended that you use it.
 
 from __future__ import print_function
 from typing import List, Dict, Any
-from six import iteritems, itervalues
+from six import iteritems, itervalues, integer_types
 from collections import defaultdict
 import traceback
 
-from numpy import zeros, argsort, arange, array_equal
+from numpy import (zeros, argsort, arange, array_equal, array, searchsorted,
+                   hstack, cumsum, bincount, repeat)
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.lazy_cross_reference import LazyCrossReference
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CHEXA8, CPENTA6, CTETRA4
+
+#: the elements that are cross referenced in bulk; they reference
+#: required nodes (no None), a property and optionally a theta_mcid coord
+BULK_XREF_ELEMENTS = {CQUAD4, CTRIA3, CHEXA8, CPENTA6, CTETRA4}
 
 class XrefMesh(BDFAttributes):
     """
@@ -85,6 +93,9 @@ class XrefMesh(BDFAttributes):
         self._stop_on_xref_error = True
         self._stored_xref_errors = []
 
+        #: cross reference the common elements in bulk
+        self._bulk_xref = True
+
     # def geom_check(self):
         # """
         # Performs various geometry checks
@@ -112,8 +123,11 @@ class XrefMesh(BDFAttributes):
 
         Parameters
         ----------
-        xref : bool; default=True
+        xref : bool / str; default=True
            cross references the model
+           'lazy' : the nodes, elements, properties, masses, materials,
+                    and loads are cross referenced the first time one of
+                    their ``*_ref`` attributes is accessed
         xref_nodes : bool; default=True
            set cross referencing of nodes/coords
         xref_element : bool; default=True
@@ -148,6 +162,19 @@ class XrefMesh(BDFAttributes):
         """
         if not xref:
             return
+        if self._lazy_xref is not None:
+            self._lazy_xref.disable()
+            self._lazy_xref = None
+        if xref == 'lazy':
+            self._lazy_cross_reference(
+                xref_nodes=xref_nodes, xref_elements=xref_elements,
+                xref_nodes_with_elements=xref_nodes_with_elements,
+                xref_properties=xref_properties, xref_masses=xref_masses,
+                xref_materials=xref_materials, xref_loads=xref_loads,
+                xref_constraints=xref_constraints, xref_aero=xref_aero,
+                xref_sets=xref_sets, xref_optimization=xref_optimization)
+            return
+
         self.log.debug("Cross Referencing...")
         if xref_nodes:
             self._cross_reference_nodes()
@@ -176,6 +203,72 @@ class XrefMesh(BDFAttributes):
             self._cross_reference_nodes_with_elements()
         #self.case_control_deck.cross_reference(self)
 
+    def _lazy_cross_reference(self,
+                              xref_nodes=True,
+                              xref_elements=True,
+                              xref_nodes_with_elements=True,
+                              xref_properties=True,
+                              xref_masses=True,
+                              xref_materials=True,
+                              xref_loads=True,
+                              xref_constraints=True,
+                              xref_aero=True,
+                              xref_sets=True,
+                              xref_optimization=True):
+        # type: (bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool) -> None
+        """
+        Sets up the lazy cross referencing (see ``cross_reference``).
+
+        The coordinate systems, MATSx/MATTx, aero, constraint, set, and
+        optimization cards are still cross referenced now (and again when
+        a card is replaced).
+        """
+        self.log.debug("Lazy Cross Referencing...")
+
+        # the cards that are still cross referenced now, which are cross
+        # referenced again when a card is replaced
+        eager_xrefs = []
+        if xref_nodes:
+            eager_xrefs.append(('_uncross_reference_coords', '_cross_reference_coordinates'))
+        if xref_materials:
+            # the MATSx/MATTx cards link the material with "mid", not "mid_ref"
+            eager_xrefs.append((None, '_cross_reference_material_dependences'))
+        if xref_aero:
+            eager_xrefs.append(('_uncross_reference_aero', '_cross_reference_aero'))
+        if xref_constraints:
+            eager_xrefs.append(('_uncross_reference_constraints', '_cross_reference_constraints'))
+        if xref_sets:
+            eager_xrefs.append(('_uncross_reference_sets', '_cross_reference_sets'))
+        if xref_optimization:
+            eager_xrefs.append(('_uncross_reference_optimization', '_cross_reference_optimization'))
+
+        lazy_xref = LazyCrossReference(self, eager_xrefs=eager_xrefs)
+        self._lazy_xref = lazy_xref
+        if xref_nodes:
+            lazy_xref.add_cards(itervalues(self.nodes))
+        if xref_elements:
+            for elements in (self.elements, self.rigid_elements, self.plotels):
+                lazy_xref.add_cards(itervalues(elements))
+        if xref_properties:
+            lazy_xref.add_cards(itervalues(self.properties))
+        if xref_masses:
+            lazy_xref.add_cards(itervalues(self.masses))
+            lazy_xref.add_cards(itervalues(self.properties_mass))
+        if xref_materials:
+            lazy_xref.add_cards(itervalues(self.materials))
+        if xref_loads:
+            for loads in (self.load_combinations, self.loads, self.dloads,
+                          self.dload_entries):
+                for load_list in itervalues(loads):
+                    lazy_xref.add_cards(load_list)
+            for loads in (self.dareas, self.tics, self.dphases):
+                lazy_xref.add_cards(itervalues(loads))
+        if xref_nodes_with_elements:
+            lazy_xref.set_elements_ref_lazy()
+
+        for unused_uncross_reference, cross_reference in eager_xrefs:
+            getattr(self, cross_reference)()
+
     def _cross_reference_constraints(self):
         # type: () -> None
         """
@@ -325,7 +418,12 @@ class XrefMesh(BDFAttributes):
         Links the elements to nodes, properties (and materials depending on
         the card).
         """
-        for elem in itervalues(self.elements):
+        if self._bulk_xref:
+            elements = self._cross_reference_elements_bulk()
+        else:
+            elements = itervalues(self.elements)
+
+        for elem in elements:
             try:
                 elem.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as e:
@@ -360,6 +458,10 @@ class XrefMesh(BDFAttributes):
         """
         Links the nodes to all connected elements
         """
+        if self._bulk_xref:
+            self._cross_reference_nodes_with_elements_bulk()
+            return
+
         nodes = defaultdict(list)  # type: Dict[int, List[Any]]
         for element in itervalues(self.elements):
             #if element.type in ['CONM2']:
@@ -377,6 +479,87 @@ class XrefMesh(BDFAttributes):
         for node in itervalues(self.nodes):
             node.elements_ref = nodes[node.nid]
 
+    def _cross_reference_elements_bulk(self):
+        # type: () -> List[Any]
+        """
+        Links the CQUAD4, CTRIA3, CHEXA8, CPENTA6, and CTETRA4 elements to
+        nodes and properties.
+
+        The node/property ids of all the elements of a type are looked up
+        at once against the sorted GRID/property ids.  The elements with
+        a missing id (or an SPOINT, theta_mcid coordinate system, ...) are
+        returned, so they can be cross referenced (and the errors reported)
+        one at a time.
+
+        Returns
+        -------
+        elements : List[Element]
+            the elements that still need to be cross referenced
+        """
+        elements_by_class = defaultdict(list)  # type: Dict[Any, List[Any]]
+        other_elements = []
+        for elem in itervalues(self.elements):
+            if elem.__class__ in BULK_XREF_ELEMENTS:
+                elements_by_class[elem.__class__].append(elem)
+            else:
+                other_elements.append(elem)
+        if not elements_by_class:
+            return other_elements
+
+        all_nids, all_nodes = _get_sorted_ids(self.nodes)
+        all_pids, all_properties = _get_sorted_ids(self.properties)
+        nmissing = 0
+        for elements in itervalues(elements_by_class):
+            try:
+                nids = array([elem.nodes for elem in elements], dtype='int64')
+                pids = array([elem.pid for elem in elements], dtype='int64')
+            except (TypeError, ValueError):
+                # a None/blank node or a property object
+                other_elements.extend(elements)
+                continue
+
+            inode, is_node = _lookup_ids(all_nids, nids)
+            iprop, is_prop = _lookup_ids(all_pids, pids)
+            is_valid = is_node.all(axis=1) & is_prop
+            if elements[0].__class__ in (CQUAD4, CTRIA3):
+                is_valid &= array([not isinstance(elem.theta_mcid, integer_types)
+                                   for elem in elements], dtype='bool')
+
+            # look up all the refs at once and then split them by element
+            ivalid = is_valid.nonzero()[0]
+            nnodes = nids.shape[1]
+            nodes_refs = list(map(all_nodes.__getitem__, inode[ivalid].ravel().tolist()))
+            pid_refs = list(map(all_properties.__getitem__, iprop[ivalid].tolist()))
+            for j, i in enumerate(ivalid.tolist()):
+                elem = elements[i]
+                elem.nodes_ref = nodes_refs[j*nnodes:(j+1)*nnodes]
+                elem.pid_ref = pid_refs[j]
+
+            iinvalid = (~is_valid).nonzero()[0]
+            other_elements.extend(elements[i] for i in iinvalid.tolist())
+            nmissing += (~is_node).sum() + (~is_prop).sum()
+
+        if nmissing:
+            self.log.debug('%i node/property ids were not found by the bulk '
+                           'element cross referencing' % nmissing)
+        return other_elements
+
+    def _cross_reference_nodes_with_elements_bulk(self):
+        # type: () -> None
+        """
+        Links the nodes to all connected elements using a CSR
+        (compressed sparse row) node to element map
+        """
+        nids, nodes = _get_sorted_ids(self.nodes)
+        elements = list(itervalues(self.elements))
+        indptr, indices = _get_node_to_element_csr(nids, elements)
+
+        # the elements sorted by node, so a node gets a slice
+        node_elements = list(map(elements.__getitem__, indices.tolist()))
+        indptr = indptr.tolist()
+        for i, node in enumerate(nodes):
+            node.elements_ref = node_elements[indptr[i]:indptr[i+1]]
+
     def _cross_reference_masses(self):
         # type: () -> None
         """
@@ -433,7 +616,13 @@ class XrefMesh(BDFAttributes):
                 self._stored_xref_errors.append((mat, var))
                 if self._ixref_errors > self._nxref_errors:
                     self.pop_xref_errors()
+        self._cross_reference_material_dependences()
 
+    def _cross_reference_material_dependences(self):
+        # type: () -> None
+        """
+        Links the MATSx/MATTx cards to the materials
+        """
         # CREEP - depends on MAT1
         data = [self.MATS1, self.MATS3, self.MATS8,
                 self.MATT1, self.MATT2, self.MATT3, self.MATT4, self.MATT5,
@@ -637,3 +826,89 @@ class XrefMesh(BDFAttributes):
             # pyram detj <= 0.
             # pyram warp <= 0.707
 
+
+
+def _get_sorted_ids(objects):
+    # type: (Dict[int, Any]) -> Any
+    """
+    Gets the sorted ids and the corresponding objects of a dictionary
+    (e.g., model.nodes)
+    """
+    ids = sorted(objects)
+    return array(ids, dtype='int64'), [objects[idi] for idi in ids]
+
+
+def _lookup_ids(sorted_ids, ids):
+    # type: (Any, Any) -> Any
+    """
+    Finds the location of ``ids`` in ``sorted_ids``
+
+    Parameters
+    ----------
+    sorted_ids : (n, ) int ndarray
+        the sorted ids (e.g., node ids)
+    ids : (...) int ndarray
+        the ids to find
+
+    Returns
+    -------
+    index : (...) int ndarray
+        the index of ids in sorted_ids (0 if it was not found)
+    is_found : (...) bool ndarray
+        was the id found
+    """
+    if len(sorted_ids) == 0:
+        return zeros(ids.shape, dtype='int64'), zeros(ids.shape, dtype='bool')
+    index = searchsorted(sorted_ids, ids)
+    index[index == len(sorted_ids)] = 0
+    is_found = sorted_ids[index] == ids
+    index[~is_found] = 0
+    return index, is_found
+
+
+def _get_node_to_element_csr(nids, elements):
+    # type: (Any, List[Any]) -> Any
+    """
+    Gets the node to element map as a CSR (compressed sparse row) matrix.
+    The elements of node ``nids[i]`` are
+    ``elements[indices[indptr[i]:indptr[i+1]]]`` (in the order of
+    ``elements``).
+
+    Parameters
+    ----------
+    nids : (nnodes, ) int ndarray
+        the sorted node ids
+    elements : List[Element]
+        the elements
+
+    Returns
+    -------
+    indptr : (nnodes + 1, ) int ndarray
+        the pointer into indices
+    indices : (nnodes_per_element * nelements, ) int ndarray
+        the index of the elements
+    """
+    element_nids = []
+    nnodes_per_element = []
+    for element in elements:
+        if element.nodes is None:
+            nnodes_per_element.append(0)
+            continue
+        if element.__class__ in BULK_XREF_ELEMENTS:
+            # skips the slower node_ids property
+            node_ids = element.nodes
+        else:
+            node_ids = [nid for nid in element.node_ids if nid is not None]
+        element_nids.extend(node_ids)
+        nnodes_per_element.append(len(node_ids))
+
+    nnodes = len(nids)
+    ielements = repeat(arange(len(elements), dtype='int64'), nnodes_per_element)
+    inode, is_node = _lookup_ids(nids, array(element_nids, dtype='int64'))
+    inode = inode[is_node]
+    ielements = ielements[is_node]
+
+    # a stable sort keeps the elements of a node in order
+    isort = argsort(inode, kind='mergesort')
+    indptr = hstack([0, cumsum(bincount(inode, minlength=nnodes))])
+    return indptr, ielements[isort]
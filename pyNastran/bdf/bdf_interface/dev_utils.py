@@ -25,8 +25,7 @@ from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.cards.nodes import GRID
 from pyNastran.bdf.cards.elements.shell import CQUAD4
 from pyNastran.bdf.cards.elements.rigid import RBE3
-from pyNastran.bdf.mesh_utils.bdf_equivalence import (
-    _eq_nodes_setup, _eq_nodes_build_tree, _eq_nodes_find_pairs)
+from pyNastran.bdf.mesh_utils.bdf_equivalence import _eq_nodes_setup, _get_tree
 from pyNastran.bdf.mesh_utils.find_closest_nodes import (
     find_closest_nodes, find_closest_nodes_index)
 
@@ -103,13 +102,56 @@ def create_rbe3s_between_close_nodes(bdf_filename, bdf_filename_out, tol,
                     comment='')
         model.rigid_elements[eid] = rbe3
         eid += 1
-    #_eq_nodes_final(nid_pairs, model, tol, node_set=node_set)
 
     if bdf_filename_out is not None:
         model.write_bdf(bdf_filename_out, size=size, is_double=is_double)
     return model
 
 
+def _eq_nodes_build_tree(nodes_xyz, nids, tol, inew=None, node_set=None, neq_max=4, msg=''):
+    """
+    helper function for `create_rbe3s_between_close_nodes`
+
+    Parameters
+    ----------
+    msg : str; default=''
+        custom message used for errors
+    """
+    assert isinstance(tol, float), 'tol=%r' % tol
+    kdt = _get_tree(nodes_xyz, msg=msg)
+
+    # check the closest 10 nodes for equality
+    deq, ieq = kdt.query(nodes_xyz[inew, :], k=neq_max, distance_upper_bound=tol)
+
+    if node_set is not None:
+        assert len(deq) == len(nids)
+    nnodes = len(nids)
+
+    # get the ids of the duplicate nodes
+    slots = np.where(ieq[:, :] < nnodes)
+    return kdt, ieq, slots
+
+
+def _eq_nodes_find_pairs(nids, slots, ieq, node_set=None):
+    """helper function for `create_rbe3s_between_close_nodes`"""
+    irows, icols = slots
+    #replacer = unique(ieq[slots])  ## TODO: turn this back on?
+
+    #skip_nodes = []
+    nid_pairs = []
+    for (irow, icol) in zip(irows, icols):
+        inid2 = ieq[irow, icol]
+        nid1 = nids[irow]
+        nid2 = nids[inid2]
+        if nid1 == nid2:
+            continue
+        if node_set is not None:
+            if nid1 not in node_set and nid2 not in node_set:
+                continue
+        nid_pairs.append((nid1, nid2))
+    return nid_pairs
+
+
 def cut_model(model, axis='-y'):
     """
     Removes the elements on one side of a model.
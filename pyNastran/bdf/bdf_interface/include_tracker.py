@@ -0,0 +1,445 @@
+"""
+Defines the INCLUDE file tracking that's used by
+``BDF.reload_changed_includes()``:
+ - IncludeTracker()
+   - add_file(filename, iparent, include_name)
+   - set_file_stamps()
+   - get_card_runs(card_ifiles)
+   - start_run(model)
+   - end_run(model, ifile, cards, run0)
+   - get_changed_files()
+   - get_cards(model, ifiles)
+   - remove_cards(model, ifiles)
+   - move_list_cards(model, ifiles, list_positions)
+ - get_cards_with_refs(model, old_cards, cards_to_skip=None)
+
+The bulk data cards of an INCLUDE file are found from the ids that are
+added to ``model._type_to_id_map`` and the cards that are appended to the
+card lists (e.g., ``model.loads``) while the cards of the file are
+parsed.  Only the ids are stored (and the card objects for the cards that
+are stored in lists), so tracking the files is cheap.
+A file with a card that doesn't add an id (e.g., GRDSET or a DMIG column)
+or that has lines outside the bulk data deck can't be reloaded.
+"""
+from __future__ import print_function
+from collections import defaultdict, Counter
+from six import iteritems, itervalues
+
+from pyNastran.bdf.cards.base_card import _get_slot_names
+from pyNastran.bdf.bdf_interface.model_cache import get_file_stamps, is_valid_file_stamps
+
+#: the model attributes that store a list of cards for each id
+LIST_SLOTS = [
+    'nsms', 'transfer_functions', 'load_combinations', 'loads', 'dloads',
+    'dload_entries', 'bcs', 'mpcs', 'mpcadds', 'spcs', 'spcadds', 'spcoffs',
+    'aelinks', 'dconstrs', 'dvgrids', 'frequencies', 'usets', 'se_usets',
+]
+
+#: the ``*_ref`` attributes of the ``__slots__`` of a card class
+_SLOT_REF_NAMES = {}
+
+
+class IncludeTracker(object):
+    """
+    Tracks the bulk data cards that were read from each INCLUDE file
+
+    Attributes
+    ----------
+    filenames : List[str]
+        the path to the INCLUDE files (None : the file was reloaded)
+    include_names : List[str]
+        the filenames from the INCLUDE cards
+    parents : List[int]
+        the file that included the file (-1 : the main file)
+    file_stamps : Dict[int] = (abs_filename, mtime, size, sha1)
+        the file stamps from ``get_file_stamps``
+    cards : Dict[int] = List[(card_type, slot_name, ids, cards)]
+        the ids of the cards that were read from a file; the card objects
+        are stored for the cards that are stored in lists (e.g., loads)
+    card_names : Dict[int] = Dict[card_name] = int
+        the number of each card in a file (for ``model.card_count``)
+    untracked_ifiles : Set[int]
+        the files with cards that can't be reloaded
+    """
+    def __init__(self):
+        """creates the IncludeTracker"""
+        self.filenames = []
+        self.include_names = []
+        self.parents = []
+        self.file_stamps = {}
+        self.cards = {}
+        self.card_names = {}
+        self.untracked_ifiles = set([])
+
+    def add_file(self, filename, iparent, include_name):
+        """
+        Adds an INCLUDE file
+
+        Parameters
+        ----------
+        filename : str
+            the path to the INCLUDE file
+        iparent : int
+            the file that included the file (-1 : the main file)
+        include_name : str
+            the filename from the INCLUDE card
+
+        Returns
+        -------
+        ifile : int
+            the index of the file
+        """
+        self.filenames.append(filename)
+        self.include_names.append(include_name)
+        self.parents.append(iparent)
+        return len(self.filenames) - 1
+
+    def set_file_stamps(self):
+        """gets the file stamps of the files that don't have one"""
+        for ifile, filename in enumerate(self.filenames):
+            if filename is not None and ifile not in self.file_stamps:
+                self.file_stamps[ifile] = get_file_stamps([filename])[0]
+
+    @staticmethod
+    def get_card_runs(card_ifiles):
+        """
+        Groups the cards into runs of cards that are from the same file
+
+        Parameters
+        ----------
+        card_ifiles : List[int]
+            the file of each card (-1 : the main file)
+
+        Returns
+        -------
+        runs : List[(ifile, icard0, icard1)]
+            the file and the range of the cards
+        """
+        runs = []
+        icard0 = 0
+        ncards = len(card_ifiles)
+        for icard in range(1, ncards + 1):
+            if icard == ncards or card_ifiles[icard] != card_ifiles[icard0]:
+                runs.append((card_ifiles[icard0], icard0, icard))
+                icard0 = icard
+        return runs
+
+    @staticmethod
+    def start_run(model):
+        """
+        Gets the number of ids of each card type and the length of the
+        card lists before the cards of a run are added
+
+        Returns
+        -------
+        nids0 : Dict[card_type] = int
+            the number of ids
+        list_lengths0 : Dict[slot_name] = Dict[id] = int
+            the length of the card lists
+        """
+        nids0 = {card_type : len(ids) for card_type, ids in iteritems(model._type_to_id_map)}
+        list_lengths0 = {}
+        for slot_name in LIST_SLOTS:
+            slot = getattr(model, slot_name)
+            list_lengths0[slot_name] = {idi : len(cards) for idi, cards in iteritems(slot)}
+        return nids0, list_lengths0
+
+    def end_run(self, model, ifile, cards, run0):
+        """
+        Stores the ids/cards that were added by a run of cards
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+        ifile : int
+            the file of the cards
+        cards : List[[card_name, comment, card_lines]]
+            the cards from ``get_bdf_cards``
+        run0 : (nids0, list_lengths0)
+            the output from ``start_run``
+        """
+        nids0, list_lengths0 = run0
+        rslot_map = model.get_rslot_map()
+        file_cards = self.cards.setdefault(ifile, [])
+        nids = Counter()
+        for card_type, ids in iteritems(model._type_to_id_map):
+            nid0 = nids0.get(card_type, 0)
+            slot_name = rslot_map[card_type]
+            if len(ids) == nid0 or slot_name in LIST_SLOTS:
+                continue
+            new_ids = ids[nid0:]
+            file_cards.append((card_type, slot_name, new_ids, None))
+            nids[card_type] += len(new_ids)
+
+        # the cards that are stored in lists (e.g., model.loads) only add
+        # an id to _type_to_id_map for the first card with the id
+        for slot_name, lengths0 in iteritems(list_lengths0):
+            list_cards = defaultdict(list)
+            for idi, slot_cards in iteritems(getattr(model, slot_name)):
+                for card in slot_cards[lengths0.get(idi, 0):]:
+                    list_cards[card.type].append((idi, card))
+            for card_type, ids_cards in iteritems(list_cards):
+                ids = [idi for idi, card in ids_cards]
+                file_cards.append((card_type, slot_name, ids,
+                                   [card for idi, card in ids_cards]))
+                nids[card_type] += len(ids)
+
+        card_names = Counter([card[0] for card in cards
+                              if card[0] not in ['ECHOON', 'ECHOOFF']])
+        file_card_names = self.card_names.setdefault(ifile, Counter())
+        file_card_names.update(card_names)
+        for card_name, ncards in iteritems(card_names):
+            if nids[card_name] < ncards:
+                self.untracked_ifiles.add(ifile)
+
+    def _get_child_ifiles(self, ifiles):
+        """gets the files and the files that they include"""
+        ifiles = set(ifiles)
+        nfiles = 0
+        while nfiles != len(ifiles):
+            nfiles = len(ifiles)
+            ifiles.update([ifile for ifile, iparent in enumerate(self.parents)
+                           if iparent in ifiles and self.filenames[ifile] is not None])
+        return ifiles
+
+    def get_changed_files(self):
+        """
+        Gets the INCLUDE files that have changed
+
+        Returns
+        -------
+        ifiles : List[int]
+            the changed files that aren't included by another changed file
+        all_ifiles : List[int]
+            the changed files and the files that they include
+        """
+        changed_ifiles = [ifile for ifile, file_stamp in sorted(iteritems(self.file_stamps))
+                          if not is_valid_file_stamps([file_stamp])]
+        all_ifiles = self._get_child_ifiles(changed_ifiles)
+        ifiles = []
+        for ifile in changed_ifiles:
+            iparent = self.parents[ifile]
+            while iparent != -1 and iparent not in all_ifiles:
+                iparent = self.parents[iparent]
+            if iparent == -1:
+                ifiles.append(ifile)
+        return ifiles, sorted(all_ifiles)
+
+    def get_cards(self, model, ifiles):
+        """
+        Gets the cards that were read from the files
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+        ifiles : List[int]
+            the files
+
+        Returns
+        -------
+        cards : List[BaseCard]
+            the cards
+        """
+        cards = []
+        for ifile in ifiles:
+            for card_type, slot_name, ids, list_cards in self.cards.get(ifile, []):
+                if list_cards is not None:
+                    cards.extend(list_cards)
+                    continue
+                slot = getattr(model, slot_name)
+                for idi in ids:
+                    card = slot.get(idi)
+                    if card is not None and getattr(card, 'type', card_type) == card_type:
+                        cards.append(card)
+        return cards
+
+    def remove_cards(self, model, ifiles):
+        """
+        Removes the cards that were read from the files and forgets
+        the files
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+        ifiles : List[int]
+            the files
+
+        Returns
+        -------
+        old_cards : List[BaseCard]
+            the cards that were removed
+        list_positions : Dict[(slot_name, id)] = int
+            the index of the first card that was removed from a list
+            (see ``move_list_cards``)
+        """
+        old_cards = self.get_cards(model, ifiles)
+        old_card_ids = set(map(id, old_cards))
+
+        ids_to_remove = defaultdict(list)
+        list_positions = {}
+        for ifile in ifiles:
+            for card_type, slot_name, ids, list_cards in self.cards.pop(ifile, []):
+                slot = getattr(model, slot_name)
+                if list_cards is None:
+                    ids_to_remove[card_type].extend(ids)
+                    for idi in ids:
+                        if id(slot.get(idi)) in old_card_ids:
+                            del slot[idi]
+                    continue
+
+                for idi in set(ids):
+                    if idi not in slot:
+                        continue
+                    cards = slot[idi]
+                    for i, card in enumerate(cards):
+                        if id(card) in old_card_ids:
+                            key = (slot_name, idi)
+                            list_positions[key] = min(i, list_positions.get(key, i))
+                            break
+                    slot[idi] = [card for card in cards if id(card) not in old_card_ids]
+                    if not slot[idi]:
+                        del slot[idi]
+                        _remove_list_id(model, slot_name, idi)
+
+            for card_name, ncards in iteritems(self.card_names.pop(ifile, {})):
+                if card_name not in model.card_count:
+                    continue
+                model.card_count[card_name] -= ncards
+                if model.card_count[card_name] <= 0:
+                    del model.card_count[card_name]
+            self.file_stamps.pop(ifile, None)
+            self.untracked_ifiles.discard(ifile)
+            self.filenames[ifile] = None
+
+        for card_type, ids in iteritems(ids_to_remove):
+            nremove = Counter(ids)
+            kept_ids = []
+            for idi in model._type_to_id_map[card_type]:
+                if nremove[idi]:
+                    nremove[idi] -= 1
+                else:
+                    kept_ids.append(idi)
+            model._type_to_id_map[card_type] = kept_ids
+        return old_cards, list_positions
+
+    def move_list_cards(self, model, ifiles, list_positions):
+        """
+        Moves the cards of the reloaded files, which were appended to the
+        lists (e.g., model.loads), to the place of the cards that were
+        removed, so the order is the same as reading the model again
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+        ifiles : List[int]
+            the reloaded files
+        list_positions : Dict[(slot_name, id)] = int
+            the index of the first card that was removed from a list
+        """
+        new_cards = defaultdict(list)
+        for ifile in ifiles:
+            for unused_card_type, slot_name, ids, list_cards in self.cards.get(ifile, []):
+                if list_cards is None:
+                    continue
+                for idi, card in zip(ids, list_cards):
+                    new_cards[(slot_name, idi)].append(card)
+
+        for key, cards in iteritems(new_cards):
+            if key not in list_positions:
+                continue
+            slot_name, idi = key
+            slot = getattr(model, slot_name)
+            card_ids = set(map(id, cards))
+            cards = [card for card in slot[idi] if id(card) in card_ids]
+            old_cards = [card for card in slot[idi] if id(card) not in card_ids]
+            i = list_positions[key]
+            slot[idi] = old_cards[:i] + cards + old_cards[i:]
+
+    def __repr__(self):
+        nfiles = len([filename for filename in self.filenames if filename is not None])
+        msg = 'IncludeTracker(nfiles=%s, nuntracked_files=%s)' % (
+            nfiles, len(self.untracked_ifiles))
+        return msg
+
+
+def _remove_list_id(model, slot_name, idi):
+    """
+    Removes the id of an empty card list (e.g., model.loads[idi])
+    from _type_to_id_map
+    """
+    for card_type in model._slot_to_type_map[slot_name]:
+        ids = model._type_to_id_map.get(card_type, [])
+        if idi in ids:
+            ids.remove(idi)
+            break
+
+
+def _get_ref_names(card):
+    """gets the ``*_ref`` attributes of a card (not GRID.elements_ref)"""
+    card_class = card.__class__
+    try:
+        ref_names = _SLOT_REF_NAMES[card_class]
+    except KeyError:
+        ref_names = [name for name in _get_slot_names(card_class)
+                     if name.endswith('_ref') and name != 'elements_ref']
+        _SLOT_REF_NAMES[card_class] = ref_names
+
+    if card_class.__dictoffset__:
+        ref_names = ref_names + [name for name in card.__dict__
+                                 if name.endswith('_ref') and name != 'elements_ref']
+    return ref_names
+
+
+def _is_ref(value, old_card_ids):
+    """is the value (or a card in the list) one of the old cards?"""
+    if isinstance(value, (list, tuple)):
+        for valuei in value:
+            if _is_ref(valuei, old_card_ids):
+                return True
+        return False
+    return id(value) in old_card_ids
+
+
+def get_cards_with_refs(model, old_cards, cards_to_skip=None):
+    """
+    Gets the cards that reference the old cards through a ``*_ref``
+    attribute (except for GRID.elements_ref)
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    old_cards : List[BaseCard]
+        the cards that were removed
+    cards_to_skip : Set[int]; default=None
+        the id(card) of the cards that shouldn't be checked (e.g., the
+        lazily cross referenced cards)
+
+    Returns
+    -------
+    cards : List[BaseCard]
+        the cards that need to be cross referenced again
+    """
+    old_card_ids = set(map(id, old_cards))
+    if cards_to_skip is None:
+        cards_to_skip = set([])
+
+    cards = []
+    for slot_name in model._slot_to_type_map:
+        slot = getattr(model, slot_name, None)
+        if not isinstance(slot, dict):
+            continue
+        for value in itervalues(slot):
+            slot_cards = value if isinstance(value, list) else [value]
+            for card in slot_cards:
+                if id(card) in cards_to_skip or not hasattr(card, 'cross_reference'):
+                    continue
+                for name in _get_ref_names(card):
+                    if _is_ref(getattr(card, name, None), old_card_ids):
+                        cards.append(card)
+                        break
+    return cards
@@ -0,0 +1,385 @@
+"""
+Defines the lazy cross referencing that's used by
+``read_bdf(..., xref='lazy')``:
+ - LazyRef(name, slot=None)
+ - LazyCrossReference(model, eager_xrefs=None)
+   - add_cards(cards)
+   - add_card(card, old_card=None, update_elements_ref=False)
+   - resolve(card, name)
+   - invalidate()
+   - disable()
+
+The nodes, elements, properties, masses, materials, and loads aren't
+cross referenced up front.  Instead, each card is switched to a subclass
+of its card class that's only used by the model (the "lazy class").
+The ``*_ref`` attributes of the lazy class are a ``LazyRef``, which
+cross references the card (and only that card) the first time one of
+its ``*_ref`` attributes is accessed and is None (or doesn't exist yet).
+The card is then switched back to its original class, so the card
+classes themselves (and the eagerly cross referenced models) aren't
+changed.  ``GRID.elements_ref`` is built for all the GRIDs the first
+time it's accessed.  Setting up the lazy model only requires storing
+the ids of the cards, so it's much faster than cross referencing.
+
+Cards that are added (``add_*``) are also lazily cross referenced.  When
+a card is replaced (``replace_cards`` or ``add_*`` with
+``allow_overwrites=True``), the cards that were already resolved are put
+back in the lazy state, so they pick up the new card, and the cards that
+were cross referenced up front (e.g., coordinate systems, constraints)
+are cross referenced again.
+"""
+from __future__ import print_function
+import types
+import traceback
+from six import itervalues
+
+from pyNastran.bdf.cards.base_card import _get_slot_names
+from pyNastran.bdf.errors import CrossReferenceError
+
+
+class LazyRef(object):
+    """
+    Replaces a ``*_ref`` attribute in the lazy class of a card class,
+    so a lazily cross referenced card is cross referenced the first time
+    the attribute is accessed.  The value is stored in the ``__slots__``
+    member or the ``__dict__`` of the card like before.
+    """
+    __slots__ = ('name', 'slot')
+
+    def __init__(self, name, slot=None):
+        """
+        Creates the LazyRef
+
+        Parameters
+        ----------
+        name : str
+            the attribute name (e.g., 'nodes_ref')
+        slot : member_descriptor; default=None
+            the ``__slots__`` member that stores the value
+            None : the value is stored in the ``__dict__``
+        """
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, card, card_class=None):
+        if card is None:
+            return self
+        if self.slot is None:
+            try:
+                value = card.__dict__[self.name]
+            except KeyError:
+                raise AttributeError('%r object has no attribute %r' % (
+                    card.__class__.__name__, self.name))
+        else:
+            value = self.slot.__get__(card, card_class)
+
+        if value is None and card.__class__._lazy_xref.resolve(card, self.name):
+            return getattr(card, self.name)
+        return value
+
+    def __set__(self, card, value):
+        if self.slot is None:
+            card.__dict__[self.name] = value
+        else:
+            self.slot.__set__(card, value)
+
+    def __delete__(self, card):
+        if self.slot is None:
+            del card.__dict__[self.name]
+        else:
+            self.slot.__delete__(card)
+
+
+def _lazy_getattr(card, name):
+    """
+    resolves a ``*_ref`` attribute of a lazy card that's only created
+    by ``cross_reference``
+    """
+    if name.endswith('_ref') and card.__class__._lazy_xref.resolve(card, name):
+        return getattr(card, name)
+    raise AttributeError('%r object has no attribute %r' % (
+        card.__class__.__name__, name))
+
+
+def _lazy_reduce(card):
+    """pickles a lazy card as a card of the original class"""
+    return _new_card, (card.__class__._lazy_base_class, ), card.__getstate__()
+
+
+def _new_card(card_class):
+    """creates an empty card when unpickling a lazy card"""
+    return card_class.__new__(card_class)
+
+
+def _get_class_attribute(card_class, name):
+    """gets the class that defines an attribute and the attribute"""
+    for base_class in card_class.__mro__:
+        if name in base_class.__dict__:
+            return base_class, base_class.__dict__[name]
+    return None, None
+
+
+class LazyCrossReference(object):
+    """
+    Resolves the ``*_ref`` attributes of a model on first access
+
+    Attributes
+    ----------
+    card_ids : Set[int]
+        the id(card) of the cards that haven't been cross referenced
+    cards : List[BaseCard]
+        the lazily cross referenced cards (so the ids aren't reused)
+    resolved_cards : List[BaseCard]
+        the cards that have been cross referenced
+    is_elements_ref_lazy : bool
+        is GRID.elements_ref built on first access
+    eager_xrefs : List[(str, str)]
+        the (uncross_reference, cross_reference) methods of the model
+        for the cards that were cross referenced up front
+    """
+    def __init__(self, model, eager_xrefs=None):
+        """
+        Creates the LazyCrossReference
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+        eager_xrefs : List[(str, str)]; default=None
+            the (uncross_reference, cross_reference) methods of the model
+            for the cards that were cross referenced up front, which are
+            called again when a card is replaced
+        """
+        self.model = model
+        self.card_ids = set([])
+        self.cards = []
+        self.resolved_cards = []
+        self.is_elements_ref_lazy = False
+        self.eager_xrefs = [] if eager_xrefs is None else eager_xrefs
+
+        #: the lazy class of a card class (and the lazy class itself)
+        self._lazy_classes = {}
+        #: the ``*_ref`` attributes of a card class that are a LazyRef
+        #: (not including GRID.elements_ref)
+        self._ref_names = {}
+
+    def _get_lazy_class(self, card_class):
+        """
+        Creates the subclass of a card class, which replaces the
+        ``*_ref`` attributes with a LazyRef
+
+        Parameters
+        ----------
+        card_class : type
+            the card class
+
+        Returns
+        -------
+        lazy_class : type
+            the lazy class
+        """
+        ref_names = []
+        attributes = {
+            '__slots__' : (),
+            '__module__' : card_class.__module__,
+            '__doc__' : card_class.__doc__,
+            '__getattr__' : _lazy_getattr,
+            '__reduce__' : _lazy_reduce,
+            '_lazy_xref' : self,
+            '_lazy_base_class' : card_class,
+        }
+        for name in _get_slot_names(card_class):
+            if not name.endswith('_ref'):
+                continue
+            unused_base_class, slot = _get_class_attribute(card_class, name)
+            if not isinstance(slot, types.MemberDescriptorType):
+                continue
+            attributes[name] = LazyRef(name, slot)
+            if name != 'elements_ref':
+                ref_names.append(name)
+
+        lazy_class = type(card_class.__name__, (card_class, ), attributes)
+        self._lazy_classes[card_class] = lazy_class
+        self._lazy_classes[lazy_class] = lazy_class
+        self._ref_names[card_class] = ref_names
+        return lazy_class
+
+    def _add_dict_refs(self, card, lazy_class):
+        """
+        Adds a LazyRef to the lazy class for the ``*_ref`` attributes in
+        the ``__dict__`` of a card
+        """
+        card_class = lazy_class._lazy_base_class
+        ref_names = self._ref_names[card_class]
+        for name in card.__dict__:
+            if not name.endswith('_ref') or name in lazy_class.__dict__:
+                continue
+            base_class = _get_class_attribute(card_class, name)[0]
+            if base_class is not None:
+                # a property
+                continue
+            setattr(lazy_class, name, LazyRef(name))
+            ref_names.append(name)
+
+    def _set_lazy_class(self, card):
+        """switches a card to its lazy class"""
+        card_class = card.__class__
+        try:
+            lazy_class = self._lazy_classes[card_class]
+        except KeyError:
+            # a card of the lazy class of another model
+            card_class = getattr(card_class, '_lazy_base_class', card_class)
+            lazy_class = self._lazy_classes.get(card_class)
+            if lazy_class is None:
+                lazy_class = self._get_lazy_class(card_class)
+        if card_class.__dictoffset__:
+            self._add_dict_refs(card, lazy_class)
+        card.__class__ = lazy_class
+
+    def _set_base_class(self, card):
+        """switches a card of a lazy class (of this model) back to the original class"""
+        card_class = card.__class__
+        if self._lazy_classes.get(card_class) is card_class:
+            card.__class__ = card_class._lazy_base_class
+
+    def add_cards(self, cards):
+        """
+        Puts cards in the lazy state
+
+        Parameters
+        ----------
+        cards : List[BaseCard]
+            the cards to lazily cross reference
+        """
+        cards = list(cards)
+        for card in cards:
+            self._set_lazy_class(card)
+        self.card_ids.update(map(id, cards))
+        self.cards.extend(cards)
+
+    def add_card(self, card, old_card=None, update_elements_ref=False):
+        """
+        Puts a card that was added to the model in the lazy state
+
+        Parameters
+        ----------
+        card : BaseCard
+            the card that was added
+        old_card : BaseCard; default=None
+            the card that was replaced
+        update_elements_ref : bool; default=False
+            is the card a GRID or an element, which changes
+            GRID.elements_ref
+        """
+        self.add_cards([card])
+        if old_card is not None and old_card is not card:
+            self.invalidate()
+        elif update_elements_ref:
+            self.set_elements_ref_lazy()
+
+    def set_elements_ref_lazy(self):
+        """clears GRID.elements_ref, so it's built on first access"""
+        if self.is_elements_ref_lazy:
+            return
+        for node in itervalues(self.model.nodes):
+            self._set_lazy_class(node)
+            node.elements_ref = None
+        self.is_elements_ref_lazy = True
+
+    def resolve(self, card, name):
+        """
+        Cross references a lazy card
+
+        Parameters
+        ----------
+        card : BaseCard
+            the card that's being accessed
+        name : str
+            the ``*_ref`` attribute that's being accessed
+
+        Returns
+        -------
+        is_resolved : bool
+            True : the card was cross referenced by this model
+        """
+        model = self.model
+        if name == 'elements_ref' and self.is_elements_ref_lazy:
+            if model.nodes.get(getattr(card, 'nid', None)) is card:
+                self.is_elements_ref_lazy = False
+                model._cross_reference_nodes_with_elements()
+                card_ids = self.card_ids
+                for node in itervalues(model.nodes):
+                    if id(node) not in card_ids:
+                        self._set_base_class(node)
+                return True
+
+        card_id = id(card)
+        if card_id not in self.card_ids:
+            return False
+        self.card_ids.remove(card_id)
+        if not (self.is_elements_ref_lazy and card.type == 'GRID'):
+            self._set_base_class(card)
+
+        try:
+            if card.type == 'GRID':
+                card.cross_reference(model, model.grdset)
+            else:
+                card.cross_reference(model)
+        except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
+            var = traceback.format_exception_only(type(error), error)
+            if model._stop_on_xref_error:
+                self._clear_refs(card)
+                msg = 'There are cross-reference errors.\n\n%scard=%s' % (var[0], card)
+
+                # try again on the next access
+                self._set_lazy_class(card)
+                self.card_ids.add(card_id)
+                raise CrossReferenceError(msg.rstrip())
+            model._ixref_errors += 1
+            model._stored_xref_errors.append((card, var))
+        self.resolved_cards.append(card)
+        return True
+
+    def _clear_refs(self, card):
+        """sets the ``*_ref`` attributes of a card to None"""
+        card_class = getattr(card.__class__, '_lazy_base_class', card.__class__)
+        for name in self._ref_names[card_class]:
+            setattr(card, name, None)
+
+    def invalidate(self):
+        """
+        Puts the cards that were cross referenced back in the lazy state,
+        so they pick up cards that were replaced, and cross references
+        the cards that were cross referenced up front again
+        """
+        for card in self.resolved_cards:
+            self._clear_refs(card)
+            self._set_lazy_class(card)
+            self.card_ids.add(id(card))
+        self.resolved_cards = []
+        self.set_elements_ref_lazy()
+
+        model = self.model
+        for uncross_reference, cross_reference in self.eager_xrefs:
+            if uncross_reference is not None:
+                getattr(model, uncross_reference)()
+            getattr(model, cross_reference)()
+
+    def disable(self):
+        """
+        Turns off the lazy cross referencing, so the unresolved
+        ``*_ref`` attributes stay None
+        """
+        for card in self.cards:
+            self._set_base_class(card)
+        for node in itervalues(self.model.nodes):
+            self._set_base_class(node)
+        self.card_ids = set([])
+        self.cards = []
+        self.resolved_cards = []
+        self.is_elements_ref_lazy = False
+
+    def __repr__(self):
+        msg = 'LazyCrossReference(nlazy_cards=%s, nresolved_cards=%s)' % (
+            len(self.card_ids), len(self.resolved_cards))
+        return msg
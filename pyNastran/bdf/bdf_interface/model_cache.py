@@ -0,0 +1,204 @@
+"""
+Defines the binary model cache that's used by ``read_bdf(..., cache_dir=...)``:
+ - get_cache_filename(cache_dir, bdf_filename, settings)
+ - get_file_stamps(filenames)
+ - is_valid_file_stamps(file_stamps)
+ - write_model_cache(cache_filename, file_stamps, state)
+ - read_model_cache(cache_filename)
+
+A cache file holds two pickles:
+ 1. the header (the cache version, pyNastran version, and the mtime,
+    size and sha1 of the main file and every INCLUDE file)
+ 2. the parsed (not cross-referenced) model state
+
+The header is checked before the model state is loaded, so a stale
+cache costs a few ``os.stat`` calls.  A file with a new mtime/size is
+hashed, so touching a file doesn't invalidate the cache.
+"""
+from __future__ import print_function
+import os
+import gc
+import hashlib
+from six.moves import cPickle
+
+import pyNastran
+
+#: bump this when the cache format changes
+CACHE_VERSION = 1
+
+
+class _GarbageCollectionOff(object):
+    """
+    Turns off the garbage collector, which otherwise runs many times
+    while the card objects are created by pickle
+    """
+    def __init__(self):
+        self.is_enabled = gc.isenabled()
+
+    def __enter__(self):
+        gc.disable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.is_enabled:
+            gc.enable()
+
+
+def get_cache_filename(cache_dir, bdf_filename, settings):
+    """
+    Gets the cache filename for a BDF
+
+    Parameters
+    ----------
+    cache_dir : str
+        the directory to store the cache files in
+    bdf_filename : str
+        the main bdf filename
+    settings : List[(name, value)]
+        the reader settings that change the model (e.g., punch, encoding)
+
+    Returns
+    -------
+    cache_filename : str
+        <cache_dir>/<basename>.<key>.bdf_cache
+    """
+    abs_filename = os.path.abspath(bdf_filename)
+    key = repr((abs_filename, pyNastran.__version__, CACHE_VERSION, settings))
+    sha1 = hashlib.sha1(key.encode('utf8')).hexdigest()[:16]
+    basename = os.path.basename(bdf_filename)
+    return os.path.join(cache_dir, '%s.%s.bdf_cache' % (basename, sha1))
+
+
+def _get_sha1(filename, chunk_size=1024 ** 2):
+    """hashes a file"""
+    sha1 = hashlib.sha1()
+    with open(filename, 'rb') as file_obj:
+        while 1:
+            data = file_obj.read(chunk_size)
+            if not data:
+                break
+            sha1.update(data)
+    return sha1.hexdigest()
+
+
+def get_file_stamps(filenames):
+    """
+    Gets the mtime, size, and content hash of the files
+
+    Parameters
+    ----------
+    filenames : List[str]
+        the main bdf filename and the INCLUDE files
+
+    Returns
+    -------
+    file_stamps : List[(abs_filename, mtime, size, sha1)]
+        the file stamps (duplicate filenames are removed)
+    """
+    file_stamps = []
+    used_filenames = set([])
+    for filename in filenames:
+        abs_filename = os.path.abspath(filename)
+        if abs_filename in used_filenames:
+            continue
+        used_filenames.add(abs_filename)
+        stat = os.stat(abs_filename)
+        file_stamps.append((abs_filename, stat.st_mtime, stat.st_size,
+                            _get_sha1(abs_filename)))
+    return file_stamps
+
+
+def is_valid_file_stamps(file_stamps):
+    """
+    Checks that the files haven't changed since the cache was written
+
+    Parameters
+    ----------
+    file_stamps : List[(abs_filename, mtime, size, sha1)]
+        the file stamps from ``get_file_stamps``
+
+    Returns
+    -------
+    is_valid : bool
+        True : the files are the same
+
+    A different size means the file changed, but the same size and
+    mtime don't mean it didn't (e.g., the mtime resolution is coarse
+    or the mtime was reset), so the hash is always checked.
+    """
+    for abs_filename, unused_mtime, size, sha1 in file_stamps:
+        if not os.path.isfile(abs_filename):
+            return False
+        if os.path.getsize(abs_filename) != size:
+            return False
+        if _get_sha1(abs_filename) != sha1:
+            return False
+    return True
+
+
+def write_model_cache(cache_filename, file_stamps, state):
+    """
+    Writes the cache file
+
+    Parameters
+    ----------
+    cache_filename : str
+        the cache filename from ``get_cache_filename``
+    file_stamps : List[(abs_filename, mtime, size, sha1)]
+        the file stamps from ``get_file_stamps``
+    state : dict
+        the model attributes
+    """
+    cache_dir = os.path.dirname(cache_filename)
+    if cache_dir and not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+    header = {
+        'cache_version' : CACHE_VERSION,
+        'version' : pyNastran.__version__,
+        'file_stamps' : file_stamps,
+    }
+
+    # write to a temporary file, so a crash doesn't leave a partial cache
+    tmp_filename = cache_filename + '.tmp'
+    with open(tmp_filename, 'wb') as cache_file, _GarbageCollectionOff():
+        cPickle.dump(header, cache_file, cPickle.HIGHEST_PROTOCOL)
+        cPickle.dump(state, cache_file, cPickle.HIGHEST_PROTOCOL)
+    if os.path.exists(cache_filename):
+        os.remove(cache_filename)
+    os.rename(tmp_filename, cache_filename)
+
+
+def read_model_cache(cache_filename):
+    """
+    Reads the cache file if the files haven't changed
+
+    Parameters
+    ----------
+    cache_filename : str
+        the cache filename from ``get_cache_filename``
+
+    Returns
+    -------
+    state : dict / None
+        the model attributes; None if the cache is missing/stale
+    """
+    if not os.path.exists(cache_filename):
+        return None
+
+    with open(cache_filename, 'rb') as cache_file:
+        try:
+            header = cPickle.load(cache_file)
+            is_valid = (
+                header.get('cache_version') == CACHE_VERSION and
+                header.get('version') == pyNastran.__version__ and
+                is_valid_file_stamps(header['file_stamps']))
+            if not is_valid:
+                return None
+            with _GarbageCollectionOff():
+                state = cPickle.load(cache_file)
+        except (EOFError, ValueError, KeyError, AttributeError, ImportError,
+                IndexError, TypeError, cPickle.UnpicklingError):
+            # a corrupt cache or a cache from an older version of a card
+            return None
+    return state
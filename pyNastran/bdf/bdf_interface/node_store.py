@@ -0,0 +1,173 @@
+"""
+Defines the array-backed (columnar) GRID storage that's used by
+``model.node_store``:
+ - NodeStore(model)
+   - is_current()
+   - update()
+   - get_node_index(nids)
+   - get_xyz_in_coord(cid=0, xref=True)
+
+The GRID objects in ``model.nodes`` are still the primary data.  The
+store builds the nid, cp, cd, ps, seid, and xyz arrays (sorted by node
+id) the first time they're needed and rebuilds them when a GRID is
+added/removed/replaced or one of its fields is set.  Each GRID points
+back to the store that owns it, so setting a field only flags that
+store as stale.  The xyz of each GRID is a row of ``NodeStore.xyz``,
+so in-place edits (e.g., ``node.xyz[0] = 1.``) don't require a rebuild.
+"""
+from __future__ import print_function
+import numpy as np
+
+
+class NodeStore(object):
+    """
+    The GRID data as arrays sorted by node id
+
+    Attributes
+    ----------
+    nid : (nnodes, ) int ndarray
+        the sorted node ids
+    cp : (nnodes, ) int ndarray
+        the coordinate system of xyz
+    cd : (nnodes, ) int ndarray
+        the analysis (output) coordinate system
+    ps : (nnodes, ) int ndarray
+        the GRID-based SPC (e.g., '123' -> 123; '' -> 0)
+    seid : (nnodes, ) int ndarray
+        the superelement id
+    xyz : (nnodes, 3) float ndarray
+        the location of the nodes in their cp frame
+    version : int
+        incremented when a GRID is added/replaced or one of the GRID
+        fields is set, which flags the arrays as stale
+    """
+    def __init__(self, model):
+        """
+        Creates the NodeStore
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+        """
+        self.model = model
+        self._nodes = None
+        self._nnodes = -1
+        self.version = 0
+        self._version = -1
+
+        self.nid = np.zeros(0, dtype='int32')
+        self.cp = np.zeros(0, dtype='int32')
+        self.cd = np.zeros(0, dtype='int32')
+        self.ps = np.zeros(0, dtype='int32')
+        self.seid = np.zeros(0, dtype='int32')
+        self.xyz = np.zeros((0, 3), dtype='float64')
+
+    @property
+    def nnodes(self):
+        """gets the number of GRIDs"""
+        return len(self.nid)
+
+    def is_current(self):
+        """are the arrays in sync with ``model.nodes``?"""
+        nodes = self.model.nodes
+        return (
+            self._nodes is nodes and
+            self._nnodes == len(nodes) and
+            self._version == self.version)
+
+    def update(self):
+        """rebuilds the arrays if the GRIDs have changed"""
+        if self.is_current():
+            return
+        nodes = self.model.nodes
+        nnodes = len(nodes)
+        nids = sorted(nodes)
+        grids = [nodes[nid] for nid in nids]
+
+        self.nid = np.array(nids, dtype='int32')
+        self.cp = np.array([node.Cp() for node in grids], dtype='int32')
+        self.cd = np.array([node.Cd() for node in grids], dtype='int32')
+        self.ps = np.array([int(node.ps) if node.ps else 0 for node in grids],
+                           dtype='int32')
+        self.seid = np.array([node.seid for node in grids], dtype='int32')
+        xyz = np.array([node.xyz for node in grids], dtype='float64').reshape(nnodes, 3)
+
+        # share the memory, so in-place edits of node.xyz update the store
+        for node, xyzi in zip(grids, xyz):
+            node._xyz = xyzi
+            node._node_store = self
+        self.xyz = xyz
+
+        self._nodes = nodes
+        self._nnodes = nnodes
+        self._version = self.version
+
+    def get_node_index(self, nids):
+        """
+        Gets the index of the nodes in the arrays
+
+        Parameters
+        ----------
+        nids : (n, ) int ndarray
+            the node ids
+
+        Returns
+        -------
+        inode : (n, ) int ndarray
+            the index of the nodes in ``self.nid``
+        """
+        self.update()
+        nids = np.asarray(nids)
+        inode = np.searchsorted(self.nid, nids)
+        is_valid = inode < len(self.nid)
+        is_valid[is_valid] = self.nid[inode[is_valid]] == nids[is_valid]
+        if not is_valid.all():
+            missing = nids[~is_valid]
+            raise KeyError('nids=%s are not GRIDs' % missing.tolist())
+        return inode
+
+    def get_xyz_in_coord(self, cid=0, xref=True):
+        """
+        Gets the xyz of the GRIDs in the desired coordinate frame
+
+        Parameters
+        ----------
+        cid : int; default=0
+            the desired coordinate system
+        xref : bool; default=True
+            has the model been cross referenced
+
+        Returns
+        -------
+        xyz : (nnodes, 3) float ndarray
+            the xyz points in the cid coordinate frame (sorted by node id)
+        """
+        self.update()
+        model = self.model
+        xyz_cid = self.xyz.copy()
+        cps = np.unique(self.cp)
+        if len(cps) == 1 and cps[0] == cid:
+            return xyz_cid
+
+        coord_cache = model.coord_cache
+        for cp in cps:
+            if cp == cid:
+                continue
+            icp = np.where(self.cp == cp)[0]
+            if not xref:
+                # the coords might not be resolved, so use the GRID method
+                nodes = model.nodes
+                for inode, nid in zip(icp, self.nid[icp]):
+                    if cid == 0:
+                        xyz_cid[inode, :] = nodes[nid].get_position_no_xref(model)
+                    else:
+                        xyz_cid[inode, :] = nodes[nid].get_position_wrt_no_xref(model, cid)
+                continue
+
+            xyz_cid[icp, :] = coord_cache.transform_node_to_coord(self.xyz[icp, :], int(cp), cid)
+        return xyz_cid
+
+    def __repr__(self):
+        msg = 'NodeStore(nnodes=%s, is_current=%s)' % (len(self.nid), self.is_current())
+        return msg
@@ -49,6 +49,9 @@ class SafeXrefMesh(XrefMesh):
         """
         if not xref:
             return
+        if self._lazy_xref is not None:
+            self._lazy_xref.disable()
+            self._lazy_xref = None
         self.log.debug("Safe Cross Referencing...")
         if xref_nodes:
             self._cross_reference_nodes()
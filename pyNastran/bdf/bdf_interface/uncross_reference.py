@@ -18,6 +18,9 @@ class UnXrefMesh(SafeXrefMesh):
 
     def uncross_reference(self):
         """uncross references the model"""
+        if self._lazy_xref is not None:
+            self._lazy_xref.disable()
+            self._lazy_xref = None
         self.log.debug("Uncross Referencing...")
         self._uncross_reference_nodes()
         self._uncross_reference_coords()
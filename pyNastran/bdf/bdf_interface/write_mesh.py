@@ -15,6 +15,7 @@ from pyNastran.bdf.utils import print_filename
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.write_mesh_bulk import write_cards
 from pyNastran.bdf.cards.nodes import write_xpoints
 
 
@@ -284,13 +285,8 @@ class WriteMesh(BDFAttributes):
                 for (eid, element) in sorted(iteritems(self.elements)):
                     bdf_file.write(element.write_card_16(is_double))
             else:
-                for (eid, element) in sorted(iteritems(self.elements)):
-                    try:
-                        bdf_file.write(element.write_card(size, is_double))
-                    except:
-                        print('failed printing element...'
-                              'type=%s eid=%s' % (element.type, eid))
-                        raise
+                elements = [element for (unused_eid, element) in sorted(iteritems(self.elements))]
+                write_cards(bdf_file, elements, size, is_double)
         if self.ao_element_flags:
             for (eid, element) in sorted(iteritems(self.ao_element_flags)):
                 bdf_file.write(element.write_card(size, is_double))
@@ -537,9 +533,12 @@ class WriteMesh(BDFAttributes):
             for (unused_id, spcadds) in sorted(iteritems(self.spcadds)):
                 for spcadd in spcadds:
                     msg.append(str(spcadd))
-            for (unused_id, spcs) in sorted(iteritems(self.spcs)):
-                for spc in spcs:
-                    msg.append(str(spc))
+            bdf_file.write(''.join(msg))
+            spcs = [spc for (unused_id, spcsi) in sorted(iteritems(self.spcs))
+                    for spc in spcsi]
+            write_cards(bdf_file, spcs, write_card=str)
+
+            msg = []
             for (unused_id, spcoffs) in sorted(iteritems(self.spcoffs)):
                 for spc in spcoffs:
                     msg.append(str(spc))
@@ -668,14 +667,12 @@ class WriteMesh(BDFAttributes):
                         print('failed printing load...type=%s key=%r'
                               % (load_combination.type, key))
                         raise
-            for (key, loadcase) in sorted(iteritems(self.loads)):
-                for load in loadcase:
-                    try:
-                        msg.append(load.write_card(size, is_double))
-                    except:
-                        print('failed printing load...type=%s key=%r'
-                              % (load.type, key))
-                        raise
+            bdf_file.write(''.join(msg))
+            loads = [load for (unused_key, loadcase) in sorted(iteritems(self.loads))
+                     for load in loadcase]
+            write_cards(bdf_file, loads, size, is_double)
+
+            msg = []
             for key, tempd in sorted(iteritems(self.tempds)):
                 msg.append(tempd.write_card(size, is_double))
             bdf_file.write(''.join(msg))
@@ -721,13 +718,8 @@ class WriteMesh(BDFAttributes):
 
         if self.masses:
             bdf_file.write('$MASSES\n')
-            for (eid, mass) in sorted(iteritems(self.masses)):
-                try:
-                    bdf_file.write(mass.write_card(size, is_double))
-                except:
-                    print('failed printing masses...'
-                          'type=%s eid=%s' % (mass.type, eid))
-                    raise
+            masses = [mass for (unused_eid, mass) in sorted(iteritems(self.masses))]
+            write_cards(bdf_file, masses, size, is_double)
 
     def _write_materials(self, bdf_file, size=8, is_double=False):
         # type: (Any, int, bool) -> None
@@ -811,10 +803,11 @@ class WriteMesh(BDFAttributes):
             if self.is_long_ids:
                 for (unused_nid, node) in sorted(iteritems(self.nodes)):
                     msg.append(node.write_card_16(is_double))
+                bdf_file.write(''.join(msg))
             else:
-                for (unused_nid, node) in sorted(iteritems(self.nodes)):
-                    msg.append(node.write_card(size, is_double))
-            bdf_file.write(''.join(msg))
+                bdf_file.write(''.join(msg))
+                nodes = [node for (unused_nid, node) in sorted(iteritems(self.nodes))]
+                write_cards(bdf_file, nodes, size, is_double)
 
     #def _write_nodes_associated(self, bdf_file, size=8, is_double=False):
         #"""
@@ -0,0 +1,522 @@
+"""
+Defines the bulk writers for the high-volume cards that are used by
+``BDF.write_bdf``:
+ - write_cards(bdf_file, cards, size=8, is_double=False, write_card=None)
+ - get_cards_text(cards, size=8, is_double=False, write_card=None)
+
+The cards are written in chunks.  The cards in a chunk are grouped by
+class, the fields of each group are formatted as arrays with the
+``field_writer_array`` functions, and the text is put back in the
+original order, so the output is identical to calling
+``card.write_card(size, is_double)`` on each card.  Cards that don't
+have a bulk writer or that can't be written in bulk (e.g., they have a
+comment or a field that doesn't fit) use ``card.write_card``.
+"""
+from __future__ import print_function
+import types
+from itertools import chain
+from six import integer_types
+import numpy as np
+
+from pyNastran.bdf.cards.base_card import BaseCard
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CTRIA3, CQUAD4
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CPENTA6, CHEXA8
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.bush import CBUSH
+from pyNastran.bdf.cards.elements.mass import CONM2
+from pyNastran.bdf.cards.loads.static_loads import FORCE, MOMENT, PLOAD4
+from pyNastran.bdf.cards.constraints import SPC1
+from pyNastran.bdf.field_writer_array import (
+    _field_chars, _float_chars, _int_chars, _SPACE,
+    join_rows, get_card_rows, rows_to_bytes, merge_rows)
+
+_INT_TYPES = set(integer_types)
+
+
+def _int_column(values, size=8, default=None):
+    """
+    Formats integer fields (e.g., ``'%8i' % value``)
+
+    Parameters
+    ----------
+    values : List[int]
+        the values
+    size : int; default=8
+        the field width
+    default : int; default=None
+        the value that's written as a blank (set_string8_blank_if_default)
+
+    Returns
+    -------
+    chars : (n, size) uint8 ndarray
+        the ASCII codes of the fields
+    is_valid : (n, ) bool ndarray
+        the value is an integer that fits in the field
+    """
+    ivalues = None
+    if set(map(type, values)) <= _INT_TYPES:
+        try:
+            ivalues = np.array(values, dtype='int64')
+            is_int = np.ones(len(values), dtype='bool')
+        except OverflowError:
+            pass
+    if ivalues is None:
+        is_int = np.array([type(value) in _INT_TYPES and -10**15 < value < 10**15
+                           for value in values], dtype='bool')
+        ivalues = np.array([value if is_int_value else 0
+                            for value, is_int_value in zip(values, is_int)], dtype='int64')
+    chars, is_valid = _int_chars(ivalues, size)
+    is_valid &= is_int
+    if default is not None:
+        chars[ivalues == default, :] = _SPACE
+    return chars, is_valid
+
+
+def _float_column(values, size=8):
+    """
+    Formats float fields (e.g., ``print_float_8``)
+
+    Returns
+    -------
+    chars : (n, size) uint8 ndarray
+        the ASCII codes of the fields
+    is_valid : (n, ) bool ndarray
+        the value fits in the field
+    """
+    is_float = np.array([isinstance(value, (float, np.float32)) or type(value) in _INT_TYPES
+                         for value in values], dtype='bool')
+    if not is_float.all():
+        values = [value if is_floati else 0.
+                  for value, is_floati in zip(values, is_float)]
+    chars, is_valid = _float_chars(np.array(values, dtype='float64'), size)
+    return chars, is_valid & is_float
+
+
+def _default_column(values, default, size=8):
+    """
+    Formats fields with ``print_field_8(set_blank_if_default(value, default))``
+
+    Returns
+    -------
+    chars : (n, size) uint8 ndarray
+        the ASCII codes of the fields
+    is_valid : (n, ) bool ndarray
+        the value fits in the field
+    """
+    chars, is_valid, unused_is_none = _field_chars(values, size)
+    is_default = np.array([value == default for value in values], dtype='bool')
+    chars[is_default, :] = _SPACE
+    return chars, is_valid
+
+
+def _has_comment(cards):
+    """does the card have a comment (which uses the scalar writer)?"""
+    card_class = cards[0].__class__
+    slot = getattr(card_class, '_comment', None)
+    if card_class.comment is not BaseCard.comment or not isinstance(
+            slot, types.MemberDescriptorType):
+        return np.array([card.comment != '' for card in cards], dtype='bool')
+
+    # the comment is a __slots__ member, which isn't set for most cards,
+    # so skip the hasattr in BaseCard.comment
+    has_comment = np.zeros(len(cards), dtype='bool')
+    for icard, card in enumerate(cards):
+        try:
+            has_comment[icard] = slot.__get__(card, card_class) != ''
+        except AttributeError:
+            pass
+    return has_comment
+
+
+def _get_node_ids(cards, nnodes):
+    """
+    Gets the node ids of elements (``element.node_ids``)
+
+    Returns
+    -------
+    nids : (n, nnodes) int ndarray
+        the node ids
+    is_valid : (n, ) bool ndarray
+        the element has nnodes integer node ids
+    """
+    node_ids = []
+    for card in cards:
+        nodes_ref = card.nodes_ref
+        if nodes_ref:
+            node_ids.append([node.nid for node in nodes_ref])
+        else:
+            node_ids.append(card.nodes)
+
+    if set(map(len, node_ids)) == {nnodes} and set(
+            map(type, chain.from_iterable(node_ids))) <= _INT_TYPES:
+        is_valid = np.ones(len(cards), dtype='bool')
+    else:
+        is_valid = np.array([len(nids) == nnodes and all(type(nid) in _INT_TYPES for nid in nids)
+                             for nids in node_ids], dtype='bool')
+    if not is_valid.all():
+        node_ids = [nids if is_validi else [1] * nnodes
+                    for nids, is_validi in zip(node_ids, is_valid)]
+    nids = np.array(node_ids, dtype='int64').reshape(len(cards), nnodes)
+
+    # _node_ids doesn't allow a node id of 0
+    is_valid &= (nids != 0).all(axis=1)
+    return nids, is_valid
+
+
+def _get_pids(cards):
+    """gets the property ids of elements (``element.Pid()``)"""
+    pids = []
+    for card in cards:
+        pid_ref = card.pid_ref
+        pids.append(card.pid if pid_ref is None else pid_ref.pid)
+    return pids
+
+
+def _grid_rows(cards, size, is_double):
+    """
+    Writes GRIDs like ``GRID.write_card``
+
+    Returns
+    -------
+    chars, nchars, is_valid : see ``get_card_rows``
+    """
+    if is_double:
+        return None
+    ncards = len(cards)
+    data = [(node.nid, node.Cp(), node.Cd(), node.ps, node.seid, node.SEid())
+            for node in cards]
+    nids, cps, cds, pss, seids, seids_out = zip(*data)
+    xyz = np.array([node.xyz for node in cards], dtype='float64').reshape(ncards, 3)
+
+    nid_chars, is_valid = _int_column(nids, size)
+    cp_chars, is_valid_cp = _int_column(cps, size, default=0)
+    cd_chars, is_valid_cd = _int_column(cds, size, default=0)
+    seid_chars, is_valid_seid = _int_column(seids_out, size, default=0)
+    is_valid &= is_valid_cp & is_valid_cd & is_valid_seid
+    is_valid &= ~_has_comment(cards)
+
+    xyz_chars = []
+    for i in range(3):
+        xyz_charsi, is_validi = _float_chars(xyz[:, i], size)
+        xyz_chars.append(xyz_charsi)
+        is_valid &= is_validi
+
+    ps_chars, is_valid_ps, unused_is_none = _field_chars(
+        ['%*s' % (size, ps) for ps in pss], size)
+    is_valid &= is_valid_ps
+
+    if size == 8:
+        chars, nchars = join_rows(
+            [b'GRID    ', nid_chars, cp_chars] + xyz_chars +
+            [cd_chars, ps_chars, seid_chars, b'\n'], ncards)
+
+        # the short form of the card
+        is_default = np.array([cd == 0 and ps == '' and seid == 0
+                               for cd, ps, seid in zip(cds, pss, seids)], dtype='bool')
+        chars[is_default, 48] = ord('\n')
+        nchars[is_default] = 49
+    else:
+        # GRID.write_card_16 always writes the long form
+        chars, nchars = join_rows(
+            [b'GRID*   ', nid_chars, cp_chars, xyz_chars[0], xyz_chars[1], b'\n',
+             b'*       ', xyz_chars[2], cd_chars, ps_chars, seid_chars, b'\n'], ncards)
+    return chars, nchars, is_valid
+
+
+def _shell_rows(cards, card_name, nnodes, defaults, is_quad):
+    """
+    Writes CTRIA3s/CQUAD4s like ``CTRIA3.write_card``/``CQUAD4.write_card``
+
+    Returns
+    -------
+    chars, nchars, is_valid : see ``get_card_rows``
+    """
+    ncards = len(cards)
+    eid_chars, is_valid = _int_column([card.eid for card in cards])
+    pid_chars, is_valid_pid = _int_column(_get_pids(cards))
+    nids, is_valid_nids = _get_node_ids(cards, nnodes)
+    nid_chars, is_valid_nid_chars = _int_chars(nids.ravel(), 8)
+    nid_chars = nid_chars.reshape(ncards, nnodes * 8)
+    is_valid &= is_valid_pid & is_valid_nids
+    is_valid &= is_valid_nid_chars.reshape(ncards, nnodes).all(axis=1)
+    is_valid &= ~_has_comment(cards)
+
+    # the fields on the second line; a CQUAD4 with the default values
+    # writes the short form, which is the same as the long form with
+    # blank fields
+    if is_quad:
+        row2s = [(card.theta_mcid, card.zoffset, card.tflag,
+                  card.T1, card.T2, card.T3, card.T4) for card in cards]
+    else:
+        row2s = [(card.theta_mcid, card.zoffset, card.tflag,
+                  card.T1, card.T2, card.T3) for card in cards]
+    is_default = np.array([row2 == defaults for row2 in row2s], dtype='bool')
+    if not is_quad:
+        # CTRIA3 always blanks the default values
+        is_default[:] = False
+
+    nfields = len(defaults)
+    blank = np.full((ncards, 8), _SPACE, dtype='uint8')
+    columns = [blank.copy() for unused_i in range(nfields)]
+    icards = np.where(~is_default)[0]
+    if len(icards):
+        cards2 = [cards[icard] for icard in icards]
+        row2s = [row2s[icard] for icard in icards]
+        theta_mcids = [card.Theta_mcid() for card in cards2]
+        values = [theta_mcids] + [[row2[i] for row2 in row2s] for i in range(1, nfields)]
+        for i, (valuesi, default) in enumerate(zip(values, defaults)):
+            chars, is_validi = _default_column(valuesi, default)
+            columns[i][icards, :] = chars
+            is_valid[icards] &= is_validi
+
+    chars, nchars = join_rows(
+        [('%-8s' % card_name).encode('ascii'), eid_chars, pid_chars, nid_chars,
+         columns[0], columns[1], b'\n', b'                '] + columns[2:] + [b'\n'],
+        ncards, rstrip=True)
+    return chars, nchars, is_valid
+
+
+def _ctria3_rows(cards, size, is_double):
+    """writes CTRIA3s like ``CTRIA3.write_card``"""
+    return _shell_rows(cards, 'CTRIA3', 3, (0.0, 0.0, 0, 1.0, 1.0, 1.0), False)
+
+
+def _cquad4_rows(cards, size, is_double):
+    """writes CQUAD4s like ``CQUAD4.write_card``"""
+    return _shell_rows(cards, 'CQUAD4', 4, (0.0, 0.0, 0, 1.0, 1.0, 1.0, 1.0), True)
+
+
+def _solid_rows(cards, card_name, nnodes):
+    """
+    Writes CTETRA4s/CPENTA6s/CHEXA8s like ``CTETRA4.write_card``
+
+    Returns
+    -------
+    chars, nchars, is_valid : see ``get_card_rows``
+    """
+    ncards = len(cards)
+    eid_chars, is_valid = _int_column([card.eid for card in cards])
+    pid_chars, is_valid_pid = _int_column(_get_pids(cards))
+    nids, is_valid_nids = _get_node_ids(cards, nnodes)
+    nid_chars, is_valid_nid_chars = _int_chars(nids.ravel(), 8)
+    is_valid &= is_valid_pid & is_valid_nids
+    is_valid &= is_valid_nid_chars.reshape(ncards, nnodes).all(axis=1)
+    is_valid &= ~_has_comment(cards)
+
+    nid_chars = nid_chars.reshape(ncards, nnodes * 8)
+    pieces = [('%-8s' % card_name).encode('ascii'), eid_chars, pid_chars]
+    if nnodes <= 6:
+        pieces += [nid_chars, b'\n']
+    else:
+        pieces += [nid_chars[:, :48], b'\n', b'        ', nid_chars[:, 48:], b'\n']
+    chars, nchars = join_rows(pieces, ncards)
+    return chars, nchars, is_valid
+
+
+def _ctetra4_rows(cards, size, is_double):
+    """writes CTETRA4s like ``CTETRA4.write_card``"""
+    return _solid_rows(cards, 'CTETRA', 4)
+
+
+def _cpenta6_rows(cards, size, is_double):
+    """writes CPENTA6s like ``CPENTA6.write_card``"""
+    return _solid_rows(cards, 'CPENTA', 6)
+
+
+def _chexa8_rows(cards, size, is_double):
+    """writes CHEXA8s like ``CHEXA8.write_card``"""
+    return _solid_rows(cards, 'CHEXA', 8)
+
+
+def _load0_rows(cards, card_name, size, is_double):
+    """
+    Writes FORCEs/MOMENTs like ``FORCE.write_card``
+
+    Returns
+    -------
+    chars, nchars, is_valid : see ``get_card_rows``
+    """
+    if is_double:
+        return None
+    ncards = len(cards)
+    data = [(load.sid, load.node_id, load.Cid(), load.mag) for load in cards]
+    sids, nids, cids, mags = zip(*data)
+    xyz = np.array([load.xyz for load in cards], dtype='float64').reshape(ncards, 3)
+
+    sid_chars, is_valid = _int_column(sids, size)
+    nid_chars, is_valid_nid = _int_column(nids, size)
+    cid_chars, is_valid_cid = _int_column(cids, size, default=0)
+    mag_chars, is_valid_mag = _float_column(mags, size)
+    is_valid &= is_valid_nid & is_valid_cid & is_valid_mag
+    is_valid &= ~_has_comment(cards)
+
+    xyz_chars = []
+    for i in range(3):
+        xyz_charsi, is_validi = _float_chars(xyz[:, i], size)
+        xyz_chars.append(xyz_charsi)
+        is_valid &= is_validi
+
+    if size == 8:
+        pieces = [('%-8s' % card_name).encode('ascii'), sid_chars, nid_chars,
+                  cid_chars, mag_chars] + xyz_chars + [b'\n']
+    else:
+        pieces = [('%-8s' % (card_name + '*')).encode('ascii'), sid_chars, nid_chars,
+                  cid_chars, mag_chars, b'\n', b'*       '] + xyz_chars + [b'\n']
+    chars, nchars = join_rows(pieces, ncards)
+    return chars, nchars, is_valid
+
+
+def _force_rows(cards, size, is_double):
+    """writes FORCEs like ``FORCE.write_card``"""
+    return _load0_rows(cards, 'FORCE', size, is_double)
+
+
+def _moment_rows(cards, size, is_double):
+    """writes MOMENTs like ``MOMENT.write_card``"""
+    return _load0_rows(cards, 'MOMENT', size, is_double)
+
+
+def _fields_rows(cards, size, raw=False):
+    """
+    Writes cards like ``print_card_8(card.repr_fields())``
+
+    Returns
+    -------
+    chars, nchars, is_valid : see ``get_card_rows``
+    """
+    if raw:
+        cards_fields = [card.raw_fields() for card in cards]
+    else:
+        cards_fields = [card.repr_fields() for card in cards]
+    chars, nchars, is_valid = get_card_rows(cards_fields, size)
+    is_valid &= ~_has_comment(cards)
+    return chars, nchars, is_valid
+
+
+def _print_card_rows(cards, size, is_double):
+    """writes cards like ``print_card_8/16(card.repr_fields())`` (e.g., CBAR)"""
+    return _fields_rows(cards, size)
+
+
+def _print_card_8_rows(cards, size, is_double):
+    """writes cards like ``print_card_8(card.repr_fields())`` (e.g., CBUSH)"""
+    return _fields_rows(cards, 8)
+
+
+def _print_card_8_raw_rows(cards, size, is_double):
+    """writes cards like ``print_card_8(card.raw_fields())`` (e.g., SPC1)"""
+    return _fields_rows(cards, 8, raw=True)
+
+
+#: the bulk writers for each card class; the card subclasses (e.g.,
+#: CTETRA10) have a different writer, so it's not by card type
+BULK_WRITERS = {
+    GRID : _grid_rows,
+    CTRIA3 : _ctria3_rows,
+    CQUAD4 : _cquad4_rows,
+    CTETRA4 : _ctetra4_rows,
+    CPENTA6 : _cpenta6_rows,
+    CHEXA8 : _chexa8_rows,
+    CBAR : _print_card_rows,
+    CBUSH : _print_card_8_rows,
+    CONM2 : _print_card_rows,
+    FORCE : _force_rows,
+    MOMENT : _moment_rows,
+    PLOAD4 : _print_card_rows,
+    SPC1 : _print_card_8_raw_rows,
+}
+
+
+def get_cards_text(cards, size=8, is_double=False, write_card=None):
+    """
+    Writes cards with the bulk writers
+
+    Parameters
+    ----------
+    cards : List[BaseCard]
+        the cards in the order they're written
+    size : int; default=8
+        the field size (8/16)
+    is_double : bool; default=False
+        should the cards be written with double precision
+    write_card : function; default=None
+        the scalar writer (e.g., ``str``) for the cards that aren't
+        written in bulk
+        None : ``card.write_card(size, is_double)``
+
+    Returns
+    -------
+    msg : str
+        the same string as
+        ``''.join([card.write_card(size, is_double) for card in cards])``
+    """
+    if write_card is None:
+        def write_card(card):
+            """the default scalar writer"""
+            return card.write_card(size, is_double)
+
+    groups = {}
+    for icard, card in enumerate(cards):
+        try:
+            groups[card.__class__].append(icard)
+        except KeyError:
+            groups[card.__class__] = [icard]
+
+    blocks = []
+    iscalar = []
+    for card_class, icards in groups.items():
+        rows = None
+
+        # a lazily cross referenced card uses a subclass (see LazyCrossReference)
+        card_class = getattr(card_class, '_lazy_base_class', card_class)
+        if card_class in BULK_WRITERS:
+            rows = BULK_WRITERS[card_class]([cards[icard] for icard in icards],
+                                            size, is_double)
+        if rows is None:
+            iscalar.extend(icards)
+            continue
+
+        chars, nchars, is_valid = rows
+        icards = np.array(icards)
+        if is_valid.any():
+            blocks.append((icards[is_valid],
+                           rows_to_bytes(chars[is_valid], nchars[is_valid]),
+                           nchars[is_valid]))
+        iscalar.extend(icards[~is_valid].tolist())
+
+    if not blocks:
+        return ''.join([write_card(card) for card in cards])
+    if iscalar:
+        texts = [write_card(cards[icard]).encode('utf8') for icard in iscalar]
+        blocks.append((np.array(iscalar),
+                       np.frombuffer(b''.join(texts), dtype='uint8'),
+                       np.array([len(text) for text in texts], dtype='int64')))
+    return merge_rows(blocks, len(cards)).tobytes().decode('utf8')
+
+
+def write_cards(bdf_file, cards, size=8, is_double=False, write_card=None,
+                chunk_size=100000):
+    """
+    Writes cards with the bulk writers
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    cards : List[BaseCard]
+        the cards in the order they're written
+    size : int; default=8
+        the field size (8/16)
+    is_double : bool; default=False
+        should the cards be written with double precision
+    write_card : function; default=None
+        the scalar writer (e.g., ``str``) for the cards that aren't
+        written in bulk
+        None : ``card.write_card(size, is_double)``
+    chunk_size : int; default=100000
+        the number of cards that are written at once
+    """
+    for icard in range(0, len(cards), chunk_size):
+        bdf_file.write(get_cards_text(cards[icard:icard + chunk_size],
+                                      size, is_double, write_card=write_card))
@@ -3,10 +3,14 @@ This file contains additional methods that do not directly relate to the
 reading/writing/accessing of BDF data.  Such methods include:
   - mass_poperties
       get the mass & moment of inertia of the model
+  - mass_properties_breakdown
+      get the mass & moment of inertia of the model and each property
   - sum_forces_moments
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - sum_forces_moments_subcases
+      find the net force/moment on the model for many subcases at once
   - resolve_grids
       change all nodes to a specific coordinate system
   - unresolve_grids
@@ -24,8 +28,9 @@ from pyNastran.utils import integer_types
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
 from pyNastran.bdf.mesh_utils.mass_properties import (
     _mass_properties_elements_init, _mass_properties_no_xref, _apply_mass_symmetry,
-    _mass_properties, _mass_properties_new)
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+    _mass_properties_new, mass_properties_breakdown)
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements, sum_forces_moments_subcases)
 from pyNastran.bdf.mesh_utils.skin_solid_elements import write_skin_solid_faces
 
 
@@ -34,10 +39,15 @@ class BDFMethods(BDFAttributes):
     Has the following methods:
         mass_properties(element_ids=None, reference_point=None, sym_axis=None,
             scale=None)
+        mass_properties_breakdown(element_ids=None, mass_ids=None,
+            reference_point=None, group_by='property', sym_axis=None,
+            scale=None)
         resolve_grids(cid=0)
         unresolve_grids(model_old)
         sum_forces_moments_elements(p0, loadcase_id, eids, nids,
             include_grav=False, xyz_cid0=None)
+        sum_forces_moments_subcases(p0, subcase_ids=None,
+            include_grav=False, xyz_cid0=None)
         sum_forces_moments(p0, loadcase_id, include_grav=False,
             xyz_cid0=None)
     """
@@ -346,18 +356,64 @@ class BDFMethods(BDFAttributes):
         for pid, eids in sorted(iteritems(pid_eids)):
             mass, cg, I = model.mass_properties(element_ids=eids)
         """
-        if reference_point is None:
-            reference_point = np.array([0., 0., 0.])
-        elif isinstance(reference_point, integer_types):
-            reference_point = self.nodes[reference_point].get_position()
-
-        elements, masses = _mass_properties_elements_init(self, element_ids, mass_ids)
-        mass, cg, I = _mass_properties(
-            self, elements, masses,
-            reference_point=reference_point)
-        mass, cg, I = _apply_mass_symmetry(self, sym_axis, scale, mass, cg, I)
+        mass, cg, I = _mass_properties_new(
+            self, element_ids=element_ids, mass_ids=mass_ids,
+            reference_point=reference_point,
+            sym_axis=sym_axis, scale=scale)
         return (mass, cg, I)
 
+    def mass_properties_breakdown(self, element_ids=None, mass_ids=None, reference_point=None,
+                                  group_by='property', sym_axis=None, scale=None):
+        """
+        Calculates the mass properties of the model and a breakdown by
+        property/type/group in the global system about the reference point.
+
+        Parameters
+        ----------
+        element_ids : list[int]; (n, ) ndarray, optional
+            An array of element ids.
+        mass_ids : list[int]; (n, ) ndarray, optional
+            An array of mass ids.
+        reference_point : ndarray/str/int, optional
+            type : ndarray
+                An array that defines the origin of the frame.
+                default = <0,0,0>.
+            type : str
+                'cg' is the only allowed string
+            type : int
+                the node id
+        group_by : str / dict; default='property'
+            'property' : group by property id (the cards without a
+                         property, e.g. CONROD/CONM2, are in group 0)
+            'type' : group by card type (e.g., 'CQUAD4')
+            dict[group] = ids : the element/mass ids in each group
+        sym_axis : str, optional
+            The axis to which the model is symmetric.
+            If AERO cards are used, this can be left blank.
+            allowed_values = 'no', x', 'y', 'z', 'xy', 'yz', 'xz', 'xyz'
+        scale : float, optional
+            The WTMASS scaling value.
+            default=None -> PARAM, WTMASS is used
+            float > 0.0
+
+        Returns
+        -------
+        mass : float
+            The mass of the model.
+        cg : ndarray
+            The cg of the model as an array.
+        I : ndarray
+            Moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz]).
+        breakdown : dict[group] = (mass, cg, I)
+            the mass properties of each group about the reference point
+
+        .. seealso:: model.mass_properties
+        """
+        return mass_properties_breakdown(
+            self, element_ids=element_ids, mass_ids=mass_ids,
+            reference_point=reference_point, group_by=group_by,
+            sym_axis=sym_axis, scale=scale)
+
     def mass_properties_no_xref(self, element_ids=None, mass_ids=None, reference_point=None,
                                 sym_axis=None, scale=None):
         """
@@ -446,8 +502,8 @@ class BDFMethods(BDFAttributes):
 
     def _mass_properties_new(self, element_ids=None, mass_ids=None,
                              reference_point=None,
-                             sym_axis=None, scale=None, xyz_cid0=None):  # pragma: no cover
-        """not done"""
+                             sym_axis=None, scale=None, xyz_cid0=None):
+        """see ``mass_properties``"""
         mass, cg, I = _mass_properties_new(
             self, element_ids=element_ids, mass_ids=mass_ids,
             reference_point=reference_point,
@@ -584,6 +640,37 @@ class BDFMethods(BDFAttributes):
                                              include_grav=include_grav, xyz_cid0=xyz_cid0)
         return forces, moments
 
+    def sum_forces_moments_subcases(self, p0, subcase_ids=None, include_grav=False,
+                                    xyz_cid0=None):
+        # type: (int, Union[None, List[int]], bool, Union[None, Dict[int, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]
+        """
+        Sums applied forces & moments about a reference point p0 for many
+        subcases at once.  The loads are the same as ``sum_forces_moments``,
+        but the common loads are summed with arrays and a load set that's
+        used by multiple subcases is only summed once.
+
+        Parameters
+        ----------
+        p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+            the reference point
+        subcase_ids : List[int]; default=None
+            the subcases to analyze
+            None : the subcases with a LOAD
+        include_grav : bool; default=False
+            includes gravity in the summation
+        xyz_cid0 : None / Dict[int] = (3, ) ndarray
+            the nodes in the global coordinate system
+
+        Returns
+        -------
+        subcase_ids : (nsubcases, ) int ndarray
+            the subcases
+        forces_moments : (nsubcases, 6) float ndarray
+            the [Fx, Fy, Fz, Mx, My, Mz] of each subcase
+        """
+        return sum_forces_moments_subcases(self, p0, subcase_ids=subcase_ids,
+                                           include_grav=include_grav, xyz_cid0=xyz_cid0)
+
     def get_element_faces(self, element_ids=None, allow_blank_nids=True):
         """
         Gets the elements and faces that are skinned from solid elements.
@@ -38,6 +38,41 @@ else:
     pass
 
 
+#: the ``__slots__`` names of a card class and its base classes
+_SLOT_NAMES = {}  # type: Dict[type, List[str]]
+
+#: the ``__slots__`` (name, member) of a card class and its base classes
+_SLOT_MEMBERS = {}  # type: Dict[type, List[Any]]
+
+def _get_slot_names(card_class):
+    """gets the ``__slots__`` names of a card class and its base classes"""
+    try:
+        return _SLOT_NAMES[card_class]
+    except KeyError:
+        pass
+    slot_names = [name for name, unused_member in _get_slot_members(card_class)]
+    _SLOT_NAMES[card_class] = slot_names
+    return slot_names
+
+def _get_slot_members(card_class):
+    """
+    gets the ``__slots__`` (name, member) of a card class and its base
+    classes; the member reads the value that's stored in the slot (even
+    if a subclass replaces the attribute, e.g., with a ``LazyRef``)
+    """
+    try:
+        return _SLOT_MEMBERS[card_class]
+    except KeyError:
+        pass
+    slot_members = []
+    for base_class in card_class.__mro__:
+        for name in base_class.__dict__.get('__slots__', ()):
+            if name not in ('__dict__', '__weakref__'):
+                slot_members.append((name, base_class.__dict__[name]))
+    _SLOT_MEMBERS[card_class] = slot_members
+    return slot_members
+
+
 class BaseCard(object):
     """
     Defines a series of base methods for every card class
@@ -51,11 +86,39 @@ class BaseCard(object):
      - comment
      - update_field(self, n, value)
 
-
+    The high-volume cards (e.g., GRID, CQUAD4) use ``__slots__`` instead
+    of a per-instance ``__dict__``, so the base classes define empty
+    slots.  The other cards still have a ``__dict__``.
     """
+    __slots__ = ()
+
     def __init__(self):
         pass
 
+    def __getstate__(self):
+        """gets the attributes for pickling (including the ``__slots__``)"""
+        slot_members = _get_slot_members(self.__class__)
+        if not slot_members:
+            return self.__dict__
+        state = {}
+        if hasattr(self, '__dict__'):
+            state.update(self.__dict__)
+        for name, member in slot_members:
+            try:
+                state[name] = member.__get__(self)
+            except AttributeError:
+                # an unset slot (e.g., no comment)
+                pass
+        return state
+
+    def __setstate__(self, state):
+        """sets the attributes when unpickling (including the ``__slots__``)"""
+        if hasattr(self, '__dict__') and not _get_slot_names(self.__class__):
+            self.__dict__.update(state)
+            return
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __deepcopy__(self, memo_dict):
         #raw_fields = self.repr_fields()
         raw_fields = self.raw_fields()
@@ -402,6 +465,7 @@ class Material(BaseCard):
 
 class Element(BaseCard):
     """defines the Element class"""
+    __slots__ = ()
     pid = 0  # CONM2, rigid
 
     def __init__(self):
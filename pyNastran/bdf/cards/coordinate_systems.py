@@ -13,6 +13,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import copy
 from math import sqrt, degrees, radians, atan2, acos, sin, cos
+from operator import attrgetter
 from six.moves import zip, range
 
 import numpy as np
@@ -50,9 +51,34 @@ def normalize(v):
     return v / norm_v
 
 
+def _coord_field(name, doc):
+    """
+    Creates a Coord field that flags the ``CoordCache`` transforms as
+    stale when it's set to a different value.  ``setup`` sets the fields
+    every time it's called, so setting the same value doesn't count.
+    """
+    private_name = '_' + name
+    def fset(self, value):
+        old_value = self.__dict__.get(private_name)
+        if old_value is not value and (
+                old_value is None or value is None or not np.array_equal(old_value, value)):
+            Coord._version += 1
+        setattr(self, private_name, value)
+    return property(attrgetter(private_name), fset, doc=doc)
+
+
 class Coord(BaseCard):
     type = 'COORD'
 
+    #: incremented when the origin/axes of a Coord are changed, which
+    #: lets the ``CoordCache`` know that its transforms are stale
+    _version = 0
+
+    origin = _coord_field('origin', 'the origin in the global frame')
+    i = _coord_field('i', 'the x-axis in the global frame')
+    j = _coord_field('j', 'the y-axis in the global frame')
+    k = _coord_field('k', 'the z-axis in the global frame')
+
     def __init__(self):
         """
         Defines a general CORDxx object
@@ -498,7 +524,7 @@ class Coord(BaseCard):
 
     def resolve(self):
         if not self.is_resolved:
-            if isinstance(self.rid, integer_types) and self.rid != 0:
+            if self.rid_ref is None and self.rid != 0:
                 raise RuntimeError("BDF has not been cross referenced.")
             if self.type in ['CORD2R', 'CORD2C', 'CORD2S']:
                 self.rid_ref.setup()
@@ -663,7 +689,21 @@ class Coord(BaseCard):
             return xyz
         return self.transform_vector_to_global_assuming_rectangular(xyz) + self.origin
 
-    def _transform_node_to_global_array(self, xyz):
+    def transform_node_to_global_array(self, xyz):
+        """
+        Transforms points from the local coordinate system to the
+        global coordinate system
+
+        Parameters
+        ----------
+        xyz : (n, 3) float ndarray
+            the points in the local frame
+
+        Returns
+        -------
+        xyz_global : (n, 3) float ndarray
+            the points in the global frame
+        """
         if self.cid == 0:
             return xyz
         return self.transform_vector_to_global_array(xyz) + self.origin
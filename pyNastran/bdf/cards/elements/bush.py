@@ -21,6 +21,7 @@ from pyNastran.bdf.field_writer_8 import print_card_8
 
 
 class BushElement(Element):
+    __slots__ = ()
     def __init__(self):
         self.cid = None
         Element.__init__(self)
@@ -57,6 +58,9 @@ class CBUSH(BushElement):
     +-------+-----+------+----+----+-------+----+----+-----+
     """
     type = 'CBUSH'
+    __slots__ = ('eid', 'pid', 'ga', 'gb', 'x', 'g0', 'cid', 's', 'ocid', 'si',
+                 'nodes', 'pid_ref', 'ga_ref', 'gb_ref', 'nodes_ref',
+                 'cid_ref', 'ocid_ref', '_comment')
     _field_map = {
         1: 'eid', 2:'pid', 3:'ga', 4:'gb', 8:'cid', 9:'s', 10:'ocid'
     }
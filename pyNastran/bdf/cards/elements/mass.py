@@ -30,11 +30,13 @@ def is_positive_semi_definite(A, tol=1e-8):
     return np.all(vals > -tol), vals
 
 class PointElement(Element):
+    __slots__ = ()
     def __init__(self):
         Element.__init__(self)
 
 
 class PointMassElement(PointElement):
+    __slots__ = ()
     def __init__(self):
         self.mass = None
         PointElement.__init__(self)
@@ -947,6 +949,8 @@ class CONM2(PointMassElement):
     +-------+--------+-------+-------+---------+------+------+------+
     """
     type = 'CONM2'
+    __slots__ = ('eid', 'nid', 'mass', 'cid', 'X', 'I', 'nodes', 'nid_ref',
+                 'cid_ref', '_comment')
     _field_map = {
         1: 'eid', 2:'nid', 3:'cid', 4:'mass',
     }
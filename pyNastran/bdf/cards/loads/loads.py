@@ -29,6 +29,7 @@ from pyNastran.utils import float_types, integer_types
 class Load(BaseCard):
     """defines the DefaultLoad class"""
     type = 'DefLoad'
+    __slots__ = ()
 
     def __init__(self):
         self.cid = None
@@ -156,17 +157,19 @@ class LoadCombination(Load):
             'ACCEL', 'ACCEL1', #'SLOAD',
         ]
         for loads in self.load_ids_ref:
-            for load in loads:
-                if isinstance(load, integer_types):
-                    load_ids.append(load)
-                elif load.type == 'LOAD':
-                    load_ids.append(load.sid)
-                elif load.type in supported_loads:
-                    load_ids.append(load.sid)
-                else:
-                    msg = ('The get_load_ids method doesnt support %s cards.\n'
-                           '%s' % (load.__class__.__name__, str(load)))
-                    raise NotImplementedError(msg)
+            # the cards in a load set share the same sid, so there is
+            # one load id per load set (not per card)
+            load = loads[0] if isinstance(loads, list) else loads
+            if isinstance(load, integer_types):
+                load_ids.append(load)
+            elif load.type == 'LOAD':
+                load_ids.append(load.sid)
+            elif load.type in supported_loads:
+                load_ids.append(load.sid)
+            else:
+                msg = ('The get_load_ids method doesnt support %s cards.\n'
+                       '%s' % (load.__class__.__name__, str(load)))
+                raise NotImplementedError(msg)
         return load_ids
 
     def get_loads(self):
@@ -751,6 +751,7 @@ class ACCEL1(BaseCard):
 
 class Load0(BaseCard):
     """common class for FORCE, MOMENT"""
+    __slots__ = ()
     def __init__(self, sid, node, mag, xyz, cid=0, comment=''):
         """
         Creates a FORCE/MOMENT card
@@ -904,6 +905,8 @@ class FORCE(Load0):
     +-------+-----+------+-------+------+------+------+------+
     """
     type = 'FORCE'
+    __slots__ = ('sid', 'node', 'mag', 'xyz', 'cid', 'node_ref', 'cid_ref',
+                 '_comment')
 
     def __init__(self, sid, node, mag, xyz, cid=0, comment=''):
         """
@@ -2326,6 +2329,9 @@ class PLOAD4(Load):
     .. warning:: NX does not support SORL and LDIR, MSC does
     """
     type = 'PLOAD4'
+    __slots__ = ('sid', 'eids', 'pressures', 'g1', 'g34', 'cid', 'nvector',
+                 'surf_or_line', 'line_load_dir', 'nodes', 'eid', 'eids_ref',
+                 'g1_ref', 'g34_ref', 'cid_ref', 'eid_ref', '_comment')
 
     def __init__(self, sid, eids, pressures, g1, g34,
                  cid=0, nvector=None, surf_or_line='SURF',
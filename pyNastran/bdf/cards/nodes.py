@@ -25,6 +25,7 @@ EPOINTs/SPOINTs classes are for multiple degrees of freedom
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 from itertools import count
+from operator import attrgetter
 from six import string_types, PY2
 from typing import List, Union, Optional, Any
 import numpy as np
@@ -854,6 +855,21 @@ class GRIDB(BaseCard):
         return self.comment + print_card_16(card)
 
 
+def _grid_field(name, doc):
+    """
+    Creates a GRID field that flags the arrays of the ``NodeStore`` that
+    owns the GRID as stale when it's set.  The getter is an attrgetter,
+    so reading the field is nearly as fast as reading a normal attribute.
+    """
+    private_name = '_' + name
+    def fset(self, value):
+        setattr(self, private_name, value)
+        node_store = self._node_store
+        if node_store is not None:
+            node_store.version += 1
+    return property(attrgetter(private_name), fset, doc=doc)
+
+
 class GRID(BaseCard):
     """
     +------+-----+----+----+----+----+----+----+------+
@@ -863,6 +879,16 @@ class GRID(BaseCard):
     +------+-----+----+----+----+----+----+----+------+
     """
     type = 'GRID'
+    __slots__ = ('_nid', '_cp', '_xyz', '_cd', '_ps', '_seid', 'cp_ref',
+                 'cd_ref', 'elements_ref', 'ps_ref', 'seid_ref', '_comment',
+                 '_node_store')
+
+    nid = _grid_field('nid', 'the node id')
+    cp = _grid_field('cp', 'the coordinate system of xyz')
+    xyz = _grid_field('xyz', 'the location of the node in the cp frame')
+    cd = _grid_field('cd', 'the analysis (output) coordinate system')
+    ps = _grid_field('ps', 'the GRID-based SPC')
+    seid = _grid_field('seid', 'the superelement id')
 
     #: allows the get_field method and update_field methods to be used
     _field_map = {1: 'nid', 2:'cp', 6:'cd', 7:'ps', 8:'seid'}
@@ -938,19 +964,37 @@ class GRID(BaseCard):
         #Node.__init__(self)
         if comment:
             self.comment = comment
-        self.nid = nid
-        self.cp = cp
+        #: the NodeStore that has this GRID in its arrays
+        self._node_store = None
+        self._nid = nid
+        self._cp = cp
         if xyz is None:
             xyz = [0., 0., 0.]
-        self.xyz = np.asarray(xyz, dtype='float64')
-        assert self.xyz.size == 3, self.xyz.shape
-        self.cd = cd
-        self.ps = ps
-        self.seid = seid
+        self._xyz = np.asarray(xyz, dtype='float64')
+        assert self._xyz.size == 3, self._xyz.shape
+        self._cd = cd
+        self._ps = ps
+        self._seid = seid
         self.cp_ref = None # type: Any
         self.cd_ref = None # type: Any
         self.elements_ref = None # type: Any
 
+    def __getstate__(self):
+        """gets the attributes for pickling (without the ``NodeStore``)"""
+        state = super(GRID, self).__getstate__()
+        state.pop('_node_store', None)
+        return state
+
+    def __setstate__(self, state):
+        """loads GRIDs that were pickled before the fields were properties"""
+        self._node_store = None
+        if 'nid' in state:
+            for name in ('nid', 'cp', 'xyz', 'cd', 'ps', 'seid'):
+                if name in state:
+                    state['_' + name] = state.pop(name)
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @classmethod
     def add_op2_data(cls, data, comment=''):
         #type: (List[Union[int, float]], str) -> GRID
@@ -781,6 +781,53 @@ class TestCoords(unittest.TestCase):
                           xaxis=xaxis, yaxis=None, zaxis=None,
                           xyplane=xyplane, yzplane=None, xzplane=None, add=True)
 
+    def test_coord_cache(self):
+        """tests the batched transforms of model.coord_cache"""
+        model = BDF(debug=False)
+        model.add_cord2r(1, rid=0, origin=[1., 2., 3.], zaxis=[1., 2., 4.], xzplane=[2., 3., 3.])
+        model.add_cord2c(2, rid=1, origin=[0., 1., 0.], zaxis=[0., 1., 1.], xzplane=[1., 1., 0.])
+        model.add_cord2s(3, rid=2, origin=[2., 0., 0.], zaxis=[2., 1., 0.], xzplane=[3., 0., 1.])
+        xyz = array([
+            [1., 2., 3.],
+            [2., 30., 4.],
+            [3., 45., 60.],
+            [-1., 0.5, 2.],
+        ])
+        cps = array([0, 2, 3, 1])
+        for nid, (cp, xyzi) in enumerate(zip(cps, xyz)):
+            model.add_grid(nid + 1, xyzi, cp=cp)
+        model.cross_reference()
+
+        coord_cache = model.coord_cache
+        xyz_global = coord_cache.transform_node_to_global(xyz, cps)
+        expected = array([model.nodes[nid].get_position() for nid in [1, 2, 3, 4]])
+        assert allclose(xyz_global, expected), xyz_global - expected
+        for cid in [1, 2, 3]:
+            expected = array([model.nodes[nid].get_position_wrt(model, cid)
+                              for nid in [1, 2, 3, 4]])
+            xyz_cid = coord_cache.transform_node_to_coord(xyz, cps, cid)
+            assert allclose(xyz_cid, expected), xyz_cid - expected
+            assert allclose(model.get_xyz_in_coord(cid=cid), expected)
+
+        vectors_global = coord_cache.transform_vector_to_global(xyz, cps)
+        vectors = coord_cache.transform_vector_to_local(vectors_global, cps)
+        assert allclose(vectors, xyz), vectors - xyz
+        assert allclose(vectors_global[3, :], model.coords[1].transform_vector_to_global(xyz[3, :]))
+
+        # moving a coordinate system clears the transforms
+        coord, origin, beta = coord_cache.get_transform(1)
+        assert coord is model.coords[1]
+        assert coord_cache.is_current()
+        model.coords[1].move_origin(array([0., 0., 0.]))
+        assert not coord_cache.is_current()
+        coord, origin, beta = coord_cache.get_transform(1)
+        assert array_equal(origin, [0., 0., 0.]), origin
+
+        coord_cache.invalidate([2])
+        assert sorted(coord_cache.transforms) == [1], sorted(coord_cache.transforms)
+        with self.assertRaises(KeyError):
+            coord_cache.get_transform(42)
+
 
 def get_nodes(grids, grids_expected, coords):
     """
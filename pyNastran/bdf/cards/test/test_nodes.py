@@ -1,7 +1,9 @@
 from __future__ import print_function, unicode_literals
 import unittest
+from six.moves import cPickle
+import numpy as np
 
-from pyNastran.bdf.bdf import BDFCard
+from pyNastran.bdf.bdf import BDF, BDFCard
 from pyNastran.bdf.cards.nodes import GRID, SPOINTs as SPOINT
 
 class TestNodes(unittest.TestCase):
@@ -128,6 +130,75 @@ class TestNodes(unittest.TestCase):
         assert s5.write_card() == msg, '\n%s---\n%s' % (s5.write_card(), msg)
 
 
+    def test_node_store(self):
+        """tests the GRID arrays stay in sync with model.nodes"""
+        model = BDF(debug=False)
+        model.add_grid(10, [1., 2., 3.], cd=1)
+        model.add_grid(2, [4., 5., 6.], ps='123', seid=1)
+        model.add_grid(5, [7., 8., 9.], cp=1)
+        model.add_cord2r(1, origin=[0., 0., 1.], zaxis=[0., 0., 2.], xzplane=[1., 0., 1.])
+        model.add_spoint([3])
+        model.cross_reference()
+
+        node_store = model.node_store
+        assert np.array_equal(node_store.nid, [2, 5, 10]), node_store.nid
+        assert np.array_equal(node_store.cp, [0, 1, 0]), node_store.cp
+        assert np.array_equal(node_store.cd, [0, 0, 1]), node_store.cd
+        assert np.array_equal(node_store.ps, [123, 0, 0]), node_store.ps
+        assert np.array_equal(node_store.seid, [1, 0, 0]), node_store.seid
+        assert np.array_equal(node_store.get_node_index([10, 2]), [2, 0])
+        with self.assertRaises(KeyError):
+            node_store.get_node_index([2, 3])
+
+        xyz_cid0 = model.get_xyz_in_coord(cid=0)
+        expected = [[4., 5., 6.], [0., 0., 0.], [7., 8., 10.], [1., 2., 3.]]
+        assert np.allclose(xyz_cid0, expected), xyz_cid0
+        xyz_cid1 = model.get_xyz_in_coord(cid=1)
+        assert np.allclose(xyz_cid1[2, :], [7., 8., 9.]), xyz_cid1
+        xyz_cid0 = model.get_xyz_in_coord(cid=0, sort_ids=False)
+        assert np.allclose(xyz_cid0[:3, :], [[1., 2., 3.], [4., 5., 6.], [7., 8., 10.]])
+
+        icd_transform, icp_transform, xyz_cp, nid_cp_cd = model.get_displacement_index_xyz_cp_cd()
+        assert np.array_equal(nid_cp_cd[:, 0], [2, 3, 5, 10]), nid_cp_cd
+        assert np.array_equal(icd_transform[1], [3]), icd_transform
+        assert np.array_equal(icp_transform[0], [0, 3]), icp_transform
+        assert np.array_equal(icp_transform[1], [2]), icp_transform
+
+        # in-place edits, new values, and new nodes update the arrays
+        model.nodes[2].xyz[0] = 40.
+        assert model.get_xyz_in_coord(cid=0)[0, 0] == 40.
+        model.nodes[10].xyz = np.array([10., 20., 30.])
+        assert np.array_equal(model.get_xyz_in_coord(cid=0)[3, :], [10., 20., 30.])
+        model.add_grid(1, [0., 0., 0.])
+        assert np.array_equal(model.node_store.nid, [1, 2, 5, 10])
+        del model.nodes[1]
+        assert np.array_equal(model.node_store.nid, [2, 5, 10])
+
+        # a GRID that shares its xyz with the store still pickles
+        node = cPickle.loads(cPickle.dumps(model.nodes[2]))
+        assert np.array_equal(node.xyz, [40., 5., 6.])
+
+        # each model has its own store, so creating or editing a GRID
+        # that isn't in the model doesn't trigger a rebuild
+        assert model.node_store.is_current()
+        GRID(20, [1., 1., 1.])
+        node.cd = 2
+        assert model.node_store.is_current()
+        model.nodes[5].seid = 2
+        assert not model._node_store.is_current()
+        assert np.array_equal(model.node_store.seid, [1, 2, 0])
+
+        # replacing a GRID doesn't change the number of nodes
+        replace_model = BDF(debug=False)
+        replace_model.add_grid(10, [1., 1., 1.])
+        model.replace_cards(replace_model)
+        assert np.array_equal(model.node_store.xyz[2, :], [1., 1., 1.])
+
+        # a GRID and an SPOINT can't share an id
+        model.add_spoint([5])
+        with self.assertRaises(RuntimeError):
+            model.get_xyz_in_coord(cid=0)
+
     def test_time_type_check(self):
         """this tests what the best way to do type checking is"""
         g = GRID(4, [0., 0., 0.])
@@ -0,0 +1,771 @@
+"""
+Defines functions for writing many fields/cards at once with numpy:
+ - print_float_8_array(values)
+ - print_float_16_array(values)
+ - print_field_8_array(values)
+ - print_field_16_array(values)
+ - print_cards_8(cards_fields)
+ - print_cards_16(cards_fields)
+
+and the helpers for laying out the rows of a card:
+ - join_rows(pieces, nrows, rstrip=False)
+ - pack_rows(chars, is_kept)
+ - card_8_rows(card_name, fields)
+ - card_16_rows(card_name, fields, is_none)
+ - get_card_rows(cards_fields, size=8)
+ - rows_to_bytes(chars, nchars)
+ - merge_rows(blocks, nrows)
+
+The output is the same as the field_writer_8/field_writer_16 functions
+(e.g., ``print_float_8``, ``print_card_8``), but the fields are
+formatted as (n, size) arrays of ASCII codes, so the common cases don't
+need a Python call per field.  The floats that are written in fixed
+point notation (the vast majority of them) are rounded exactly like
+Python's ``'%8.7f' % value``.  The rest (e.g., 1.2e-9) use the scalar
+function.
+
+The rows of a card are built in a (ncards, nchars) array and the
+unneeded characters are masked off, so a block of cards is written as
+one string.
+"""
+from __future__ import print_function, division
+from six import string_types, integer_types
+import numpy as np
+
+from pyNastran.bdf.field_writer_8 import print_float_8, print_field_8, print_card_8
+from pyNastran.bdf.field_writer_16 import print_float_16, print_field_16, print_card_16
+
+_SPACE = ord(' ')
+_DOT = ord('.')
+_MINUS = ord('-')
+_ZERO = ord('0')
+_NEWLINE = ord('\n')
+_PLUS = ord('+')
+_STAR = ord('*')
+_DIGITS = np.arange(_ZERO, _ZERO + 10, dtype='uint8')
+
+#: the function for the floats that aren't written in fixed point
+_PRINT_FLOAT = {
+    8: print_float_8,
+    16: print_float_16,
+}
+
+
+def _two_product(avalues, bvalues):
+    """
+    Gets the product and the exact rounding error of the product
+    (Dekker's algorithm), so ``a * b = product + error``
+    """
+    product = avalues * bvalues
+    avalues2 = 134217729. * avalues
+    ahi = avalues2 - (avalues2 - avalues)
+    alo = avalues - ahi
+    bvalues2 = 134217729. * bvalues
+    bhi = bvalues2 - (bvalues2 - bvalues)
+    blo = bvalues - bhi
+    error = ((ahi * bhi - product) + ahi * blo + alo * bhi) + alo * blo
+    return product, error
+
+
+def _get_digits(ivalues, ndigits):
+    """gets the (n, ndigits) decimal digits of positive integers"""
+    digits = np.zeros((len(ivalues), ndigits), dtype='int64')
+    ivalues = ivalues.copy()
+    for j in range(ndigits - 1, -1, -1):
+        digits[:, j] = ivalues % 10
+        ivalues //= 10
+    return digits
+
+
+def _right_justify(chars, irows, text, start, end, is_negative):
+    """
+    Puts ``text[irow, start:end]`` (and a minus sign) at the end of the
+    ``chars`` rows
+    """
+    size = chars.shape[1]
+    nbody = end - start
+    for icol in range(size):
+        jchar = size - 1 - icol
+        is_body = jchar < nbody
+        chars[irows[is_body], icol] = text[is_body, (end - 1 - jchar)[is_body]]
+        is_sign = is_negative & (jchar == nbody)
+        chars[irows[is_sign], icol] = _MINUS
+
+
+def _float_chars(values, size):
+    """
+    Formats floats like ``print_float_8``/``print_float_16``
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to format
+    size : int
+        8/16
+
+    Returns
+    -------
+    chars : (n, size) uint8 ndarray
+        the ASCII codes of the fields
+    is_valid : (n, ) bool ndarray
+        False : the field isn't size characters long (e.g., 1.e+100),
+        so the scalar writer will raise an error
+    """
+    values = np.asarray(values, dtype='float64').ravel()
+    nvalues = len(values)
+    chars = np.full((nvalues, size), _SPACE, dtype='uint8')
+    is_valid = np.ones(nvalues, dtype='bool')
+
+    abs_values = np.abs(values)
+    is_negative = values < 0.
+    is_zero = values == 0.
+    chars[is_zero, size - 2] = _ZERO
+    chars[is_zero, size - 1] = _DOT
+
+    # the fixed point branches of print_float_8 (e.g., '%8.5f');
+    # negative values lose a digit to the sign
+    with np.errstate(invalid='ignore'):
+        lower = np.where(is_negative, 0.01, 0.001)
+        upper = np.where(is_negative, 10. ** (size - 3), 10. ** (size - 2))
+        is_fixed = (abs_values >= lower) & (abs_values < upper)
+
+    ifixed = np.where(is_fixed)[0]
+    if len(ifixed):
+        abs_fixed = abs_values[ifixed]
+        is_negative_fixed = is_negative[ifixed]
+
+        # the number of decimal places (the %8.Nf)
+        nint = np.searchsorted(10. ** np.arange(size), abs_fixed, side='right')
+        ndecimals = size - 1 - is_negative_fixed - nint
+
+        # round to ndecimals with the exact remainder (no double rounding)
+        product, error = _two_product(abs_fixed, 10. ** ndecimals)
+        ivalues = np.rint(product)
+        remainder = (product - ivalues) + error
+        ivalues += (remainder > 0.5).astype('float64') - (remainder < -0.5)
+        is_tie = np.abs(np.abs(remainder) - 0.5) < 1e-9
+        ivalues = ivalues.astype('int64')
+
+        digits = _get_digits(ivalues, size)
+        idot = size - ndecimals
+
+        # the digits with a decimal point at idot
+        icols = np.arange(size + 1)
+        isource = np.where(icols < idot[:, None], icols, icols - 1)
+        isource[:, 0] = np.maximum(isource[:, 0], 0)
+        text = _DIGITS[digits[np.arange(len(ifixed))[:, None], isource]]
+        text[icols == idot[:, None]] = _DOT
+
+        # strip(' 0') of the integer/decimal parts
+        is_nonzero = digits != 0
+        nleading = np.minimum(is_nonzero.argmax(axis=1), idot)
+        ntrailing = np.minimum(is_nonzero[:, ::-1].argmax(axis=1), ndecimals)
+        start = nleading
+        end = size + 1 - ntrailing
+        nchars = end - start + is_negative_fixed
+        is_written = ~is_tie & (nchars <= size)
+
+        iwritten = np.where(is_written)[0]
+        _right_justify(chars, ifixed[iwritten], text[iwritten],
+                       start[iwritten], end[iwritten],
+                       is_negative_fixed[iwritten])
+        is_fixed[ifixed[~is_written]] = False
+
+    # the small/large values
+    is_other = ~(is_fixed | is_zero | np.isnan(values))
+    if is_other.any():
+        print_float = _PRINT_FLOAT[size]
+        for ivalue in np.where(is_other)[0]:
+            field = print_float(values[ivalue])
+            if len(field) == size:
+                chars[ivalue, :] = np.frombuffer(field.encode('ascii'), dtype='uint8')
+            else:
+                is_valid[ivalue] = False
+    return chars, is_valid
+
+
+def _int_chars(values, size):
+    """
+    Formats integers like ``'%8i' % value``
+
+    Parameters
+    ----------
+    values : (n, ) int ndarray
+        the values to format
+    size : int
+        the field width
+
+    Returns
+    -------
+    chars : (n, size) uint8 ndarray
+        the ASCII codes of the fields
+    is_valid : (n, ) bool ndarray
+        False : the value is more than size characters long
+    """
+    values = np.asarray(values, dtype='int64').ravel()
+    nvalues = len(values)
+    chars = np.full((nvalues, size), _SPACE, dtype='uint8')
+    is_negative = values < 0
+    abs_values = np.abs(values)
+
+    ndigits = np.searchsorted(10 ** np.arange(1, 19, dtype='int64'), abs_values,
+                              side='right') + 1
+    is_valid = (ndigits + is_negative <= size) & (abs_values >= 0)
+    irows = np.where(is_valid)[0]
+    digits = _DIGITS[_get_digits(abs_values[irows], size)]
+    _right_justify(chars, irows, digits, size - ndigits[irows],
+                   np.full(len(irows), size), is_negative[irows])
+    return chars, is_valid
+
+
+def _str_chars(values, size):
+    """formats strings like ``'%8s' % value``"""
+    nvalues = len(values)
+    fields = ['%*s' % (size, value) for value in values]
+    if set(map(len, fields)) == {size}:
+        try:
+            chars = np.frombuffer(''.join(fields).encode('ascii'), dtype='uint8')
+            return chars.reshape(nvalues, size).copy(), np.ones(nvalues, dtype='bool')
+        except UnicodeEncodeError:
+            pass
+
+    chars = np.full((nvalues, size), _SPACE, dtype='uint8')
+    is_valid = np.ones(nvalues, dtype='bool')
+    for i, field in enumerate(fields):
+        try:
+            chars[i, :] = np.frombuffer(field.encode('ascii'), dtype='uint8')
+        except (ValueError, UnicodeEncodeError):
+            is_valid[i] = False
+    return chars, is_valid
+
+
+def _field_chars(values, size, strip_strings=False):
+    """
+    Formats fields like ``print_field_8``/``print_field_16``
+
+    Parameters
+    ----------
+    values : List[int/float/str/None]
+        the values to format
+    size : int
+        8/16
+    strip_strings : bool; default=False
+        strip strings and treat '' as None (``print_card_16``)
+
+    Returns
+    -------
+    chars : (n, size) uint8 ndarray
+        the ASCII codes of the fields
+    is_valid : (n, ) bool ndarray
+        False : the field isn't size characters long, so the scalar
+        writer will raise an error
+    is_none : (n, ) bool ndarray
+        the field is None
+    """
+    nvalues = len(values)
+    chars = np.full((nvalues, size), _SPACE, dtype='uint8')
+    is_valid = np.ones(nvalues, dtype='bool')
+    is_none = np.zeros(nvalues, dtype='bool')
+
+    # the values are grouped by type, so each group is one numpy call
+    value_types = [type(value) for value in values]
+    unique_types = set(value_types)
+    if len(unique_types) > 1:
+        type_ids = {value_type: i for i, value_type in enumerate(unique_types)}
+        itypes = np.array([type_ids[value_type] for value_type in value_types])
+
+    for itype, value_type in enumerate(unique_types):
+        if len(unique_types) == 1:
+            ivalues = slice(None)
+            subset = values
+        else:
+            ivalues = np.where(itypes == itype)[0]
+            subset = [values[i] for i in ivalues]
+
+        if value_type is type(None):
+            is_none[ivalues] = True
+            continue
+        elif issubclass(value_type, integer_types) and not (
+                size == 16 and issubclass(value_type, bool)):
+            try:
+                chars[ivalues, :], is_valid[ivalues] = _int_chars(
+                    np.array(subset, dtype='int64'), size)
+            except OverflowError:
+                chars[ivalues, :], is_valid[ivalues] = _str_chars(subset, size)
+            continue
+        elif issubclass(value_type, (float, np.float32)):
+            chars[ivalues, :], is_valid[ivalues] = _float_chars(
+                np.array(subset, dtype='float64'), size)
+            continue
+
+        if strip_strings and issubclass(value_type, string_types):
+            # wipe_empty_fields
+            subset = [value.strip() for value in subset]
+            is_none[ivalues] = [not value for value in subset]
+        chars[ivalues, :], is_valid[ivalues] = _str_chars(subset, size)
+    return chars, is_valid, is_none
+
+
+def print_float_8_array(values):
+    """
+    Prints floats in nastran 8-character width syntax
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : (n, ) |S8 ndarray
+        the same fields as ``print_float_8``
+    """
+    chars, is_valid = _float_chars(values, 8)
+    _check_valid(values, is_valid, print_field_8)
+    return chars.view('|S8').ravel()
+
+
+def print_float_16_array(values):
+    """
+    Prints floats in nastran 16-character width syntax
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : (n, ) |S16 ndarray
+        the same fields as ``print_float_16``
+    """
+    chars, is_valid = _float_chars(values, 16)
+    _check_valid(values, is_valid, print_field_16)
+    return chars.view('|S16').ravel()
+
+
+def print_field_8_array(values):
+    """
+    Prints 8-character width fields
+
+    Parameters
+    ----------
+    values : List[int/float/str/None]
+        the values to print
+
+    Returns
+    -------
+    fields : (n, ) |S8 ndarray
+        the same fields as ``print_field_8``
+    """
+    chars, is_valid, unused_is_none = _field_chars(values, 8)
+    _check_valid(values, is_valid, print_field_8)
+    return chars.view('|S8').ravel()
+
+
+def print_field_16_array(values):
+    """
+    Prints 16-character width fields
+
+    Parameters
+    ----------
+    values : List[int/float/str/None]
+        the values to print
+
+    Returns
+    -------
+    fields : (n, ) |S16 ndarray
+        the same fields as ``print_field_16``
+    """
+    chars, is_valid, unused_is_none = _field_chars(values, 16)
+    _check_valid(values, is_valid, print_field_16)
+    return chars.view('|S16').ravel()
+
+
+def _check_valid(values, is_valid, print_field):
+    """raises the error of the scalar writer for an invalid field"""
+    if not is_valid.all():
+        print_field(values[np.where(~is_valid)[0][0]])
+
+
+#-------------------------------------------------------------------------------
+# the card layouts
+
+def join_rows(pieces, nrows, rstrip=False):
+    """
+    Lays out a fixed format card (e.g., ``'GRID    %8i%8s...\\n'``)
+
+    Parameters
+    ----------
+    pieces : List[bytes/(nrows, n) uint8 ndarray]
+        the text (e.g., b'GRID    ') and the fields of the card; the
+        last piece ends with a newline
+    nrows : int
+        the number of cards
+    rstrip : bool; default=False
+        strip the trailing whitespace (``msg.rstrip() + '\\n'``)
+
+    Returns
+    -------
+    chars : (nrows, nchars) uint8 ndarray
+        the ASCII codes of the cards
+    nchars : (nrows, ) int ndarray
+        the length of the cards (including the newline)
+    """
+    arrays = []
+    for piece in pieces:
+        if isinstance(piece, bytes):
+            piece = np.broadcast_to(np.frombuffer(piece, dtype='uint8'),
+                                    (nrows, len(piece)))
+        arrays.append(piece)
+    chars = np.hstack(arrays)
+    ncols = chars.shape[1]
+    if not rstrip:
+        return chars, np.full(nrows, ncols, dtype='int64')
+
+    is_text = (chars != _SPACE) & (chars != _NEWLINE)
+    ilast = ncols - 1 - is_text[:, ::-1].argmax(axis=1)
+    irows = np.arange(nrows)
+    chars[irows, ilast + 1] = _NEWLINE
+    return chars, ilast + 2
+
+
+def _join_lines(lines, nrows):
+    """
+    Stacks the lines of a card, so each row is a card
+
+    Parameters
+    ----------
+    lines : List[((nrows, n) uint8 ndarray, (nrows, ) int ndarray)]
+        the text of each line (without the newline) and its length
+        (0 : the line isn't written)
+
+    Returns
+    -------
+    chars, nchars : see ``join_rows``
+    """
+    ncols = max(chars.shape[1] for chars, unused_nchars in lines) + 1
+    nlines = len(lines)
+    all_chars = np.full((nrows, nlines, ncols), _SPACE, dtype='uint8')
+    is_kept = np.zeros((nrows, nlines, ncols), dtype='bool')
+    icols = np.arange(ncols)
+    irows = np.arange(nrows)
+    for iline, (chars, nchars) in enumerate(lines):
+        all_chars[:, iline, :chars.shape[1]] = chars
+        is_line = nchars > 0
+        all_chars[irows[is_line], iline, nchars[is_line]] = _NEWLINE
+        is_kept[:, iline, :] = (icols <= nchars[:, None]) & is_line[:, None]
+
+    all_chars = all_chars.reshape(nrows, nlines * ncols)
+    is_kept = is_kept.reshape(nrows, nlines * ncols)
+    return pack_rows(all_chars, is_kept)
+
+
+def pack_rows(chars, is_kept):
+    """
+    Moves the kept characters to the front of the rows
+
+    Parameters
+    ----------
+    chars : (nrows, ncols) uint8 ndarray
+        the ASCII codes
+    is_kept : (nrows, ncols) bool ndarray
+        the characters to keep
+
+    Returns
+    -------
+    chars, nchars : see ``join_rows``
+    """
+    nchars = is_kept.sum(axis=1)
+    ncols = max(nchars.max(), 1)
+    packed = np.full((chars.shape[0], ncols), _SPACE, dtype='uint8')
+    packed[np.arange(ncols)[None, :] < nchars[:, None]] = chars[is_kept]
+    return packed, nchars
+
+
+def _rstrip_lengths(chars):
+    """gets the length of the rows with the trailing spaces stripped"""
+    is_text = chars != _SPACE
+    nchars = chars.shape[1] - is_text[:, ::-1].argmax(axis=1)
+    nchars[~is_text.any(axis=1)] = 0
+    return nchars
+
+
+def card_8_rows(card_name, fields):
+    """
+    Lays out the cards like ``print_card_8``
+
+    Parameters
+    ----------
+    card_name : str
+        the card name (e.g., 'CBAR')
+    fields : List[(nrows, 8) uint8 ndarray]
+        the formatted fields of the cards (not including the name)
+
+    Returns
+    -------
+    chars, nchars : see ``join_rows``
+    """
+    nrows = fields[0].shape[0] if fields else 0
+    prefix0 = ('%-8s' % card_name).encode('ascii')
+    blank = np.full((nrows, 8), _SPACE, dtype='uint8')
+    nlines = max((len(fields) + 7) // 8, 1)
+
+    lines = []
+    nchars_last = None
+    for iline in range(nlines):
+        line_fields = fields[8*iline:8*(iline+1)]
+        line_fields += [blank] * (8 - len(line_fields))
+        prefix = prefix0 if iline == 0 else b'        '
+        chars, unused_nchars = join_rows([prefix] + line_fields, nrows)
+        nchars = _rstrip_lengths(chars)
+        if iline:
+            # an empty line in the middle of the card is a '+'
+            is_empty = nchars == 0
+            chars[is_empty, 0] = _PLUS
+            nchars[is_empty] = 1
+        lines.append((chars, nchars))
+
+    # drop the trailing '+' lines
+    is_last = np.ones(nrows, dtype='bool')
+    for iline in range(nlines - 1, 0, -1):
+        chars, nchars = lines[iline]
+        is_plus = is_last & (nchars == 1) & (chars[:, 0] == _PLUS)
+        nchars[is_plus] = 0
+        is_last &= is_plus
+    return _join_lines(lines, nrows)
+
+
+def card_16_rows(card_name, fields, is_none):
+    """
+    Lays out the cards like ``print_card_16``
+
+    Parameters
+    ----------
+    card_name : str
+        the card name (e.g., 'CBAR')
+    fields : List[(nrows, 16) uint8 ndarray]
+        the formatted fields of the cards (not including the name)
+    is_none : List[(nrows, ) bool ndarray]
+        the fields that are None (for ``wipe_empty_fields``)
+
+    Returns
+    -------
+    chars, nchars : see ``join_rows``
+    """
+    nrows = fields[0].shape[0]
+    prefix0 = ('%-8s' % (card_name + '*')).encode('ascii')
+    blank = np.full((nrows, 16), _SPACE, dtype='uint8')
+
+    # the number of fields after the trailing Nones are removed;
+    # the fields are written in blocks of 8
+    nfields = np.zeros(nrows, dtype='int64')
+    for ifield, is_nonei in enumerate(is_none):
+        nfields[~is_nonei] = ifield + 1
+    nlines = 2 * ((nfields + 7) // 8)
+    nlines_max = max(nlines.max(), 1)
+
+    lines = []
+    for iline in range(nlines_max):
+        line_fields = fields[4*iline:4*(iline+1)]
+        line_fields += [blank] * (4 - len(line_fields))
+        prefix = prefix0 if iline == 0 else b'*       '
+        chars, unused_nchars = join_rows([prefix] + line_fields, nrows)
+        nchars = _rstrip_lengths(chars)
+        nchars[iline >= nlines] = 0
+        lines.append((chars, nchars))
+    return _join_lines(lines, nrows)
+
+
+def _card_rows(cards_fields, size):
+    """
+    Lays out the cards (with the same name) like print_card_8/16
+
+    Returns
+    -------
+    chars, nchars : see ``join_rows``
+    is_valid : (nrows, ) bool ndarray
+        the card was written
+    """
+    nrows = len(cards_fields)
+    nfields = max(len(fields) for fields in cards_fields) - 1
+    columns = []
+    is_nones = []
+    is_valid = np.ones(nrows, dtype='bool')
+    for ifield in range(1, nfields + 1):
+        values = [fields[ifield] if ifield < len(fields) else None
+                  for fields in cards_fields]
+        chars, is_validi, is_none = _field_chars(values, size,
+                                                 strip_strings=(size == 16))
+        columns.append(chars)
+        is_nones.append(is_none)
+        is_valid &= is_validi
+
+    card_name = cards_fields[0][0]
+    if size == 8:
+        if not columns:
+            columns = [np.full((nrows, 8), _SPACE, dtype='uint8')]
+        chars, nchars = card_8_rows(card_name, columns)
+
+        # print_card_8 strips a '+' at the end of the card (e.g., a
+        # string field), so use the scalar writer
+        is_valid &= chars[np.arange(nrows), nchars - 2] != _PLUS
+    else:
+        if not columns:
+            return (np.zeros((nrows, 1), dtype='uint8'), np.zeros(nrows, dtype='int64'),
+                    np.zeros(nrows, dtype='bool'))
+        # a card with only a name uses the scalar writer
+        is_valid &= ~np.logical_and.reduce(is_nones)
+        chars, nchars = card_16_rows(card_name, columns, is_nones)
+    return chars, nchars, is_valid
+
+
+def get_card_rows(cards_fields, size=8):
+    """
+    Lays out cards like print_card_8/16
+
+    Parameters
+    ----------
+    cards_fields : List[List[int/float/str/None]]
+        the fields of each card (e.g., ``card.repr_fields()``)
+    size : int; default=8
+        8/16
+
+    Returns
+    -------
+    chars : (ncards, nchars) uint8 ndarray
+        the ASCII codes of the cards
+    nchars : (ncards, ) int ndarray
+        the length of the cards (including the newline)
+    is_valid : (ncards, ) bool ndarray
+        the card was written; the other cards need to use the scalar
+        writer (e.g., a field is too long)
+    """
+    ncards = len(cards_fields)
+    nchars = np.zeros(ncards, dtype='int64')
+    is_valid = np.zeros(ncards, dtype='bool')
+
+    # cards with a similar length are written together, so an SPC1
+    # with a lot of nodes doesn't pad every card
+    groups = {}
+    for icard, fields in enumerate(cards_fields):
+        key = (fields[0], (len(fields) + 6) // 8)
+        try:
+            groups[key].append(icard)
+        except KeyError:
+            groups[key] = [icard]
+
+    blocks = []
+    for icards in groups.values():
+        chars, ncharsi, is_validi = _card_rows([cards_fields[icard] for icard in icards],
+                                               size)
+        icards = np.array(icards)
+        nchars[icards] = ncharsi
+        is_valid[icards] = is_validi
+        blocks.append((icards, chars, ncharsi))
+
+    if len(blocks) == 1:
+        icards, chars, unused_nchars = blocks[0]
+        if (icards == np.arange(ncards)).all():
+            return chars, nchars, is_valid
+
+    ncols = max(chars.shape[1] for unused_icards, chars, unused_nchars in blocks)
+    all_chars = np.full((ncards, ncols), _SPACE, dtype='uint8')
+    for icards, chars, unused_nchars in blocks:
+        all_chars[icards, :chars.shape[1]] = chars
+    return all_chars, nchars, is_valid
+
+
+def rows_to_bytes(chars, nchars):
+    """gets the text of the rows as a uint8 ndarray"""
+    is_kept = np.arange(chars.shape[1])[None, :] < nchars[:, None]
+    return chars[is_kept]
+
+
+def merge_rows(blocks, nrows):
+    """
+    Puts the text of blocks of rows in order
+
+    Parameters
+    ----------
+    blocks : List[((n, ) int ndarray, (m, ) uint8 ndarray, (n, ) int ndarray)]
+        the row index, text, and length of each row of the blocks
+    nrows : int
+        the total number of rows
+
+    Returns
+    -------
+    text : (nchars, ) uint8 ndarray
+        the text of the rows in order
+    """
+    if len(blocks) == 1:
+        irows, text, unused_nchars = blocks[0]
+        if len(irows) == nrows and (np.diff(irows) > 0).all():
+            return text
+
+    nchars = np.zeros(nrows, dtype='int64')
+    isource = np.zeros(nrows, dtype='int64')
+    texts = []
+    offset = 0
+    for irows, text, ncharsi in blocks:
+        nchars[irows] = ncharsi
+        isource[irows] = offset + np.cumsum(ncharsi) - ncharsi
+        offset += len(text)
+        texts.append(text)
+    all_text = np.concatenate(texts)
+
+    itarget = np.cumsum(nchars) - nchars
+    index = np.repeat(isource - itarget, nchars) + np.arange(nchars.sum())
+    return all_text[index]
+
+
+def print_cards_8(cards_fields):
+    """
+    Prints nastran-style cards with 8-character width fields
+
+    Parameters
+    ----------
+    cards_fields : List[List[int/float/str/None]]
+        the fields of each card
+
+    Returns
+    -------
+    msg : str
+        the same string as
+        ``''.join([print_card_8(fields) for fields in cards_fields])``
+    """
+    return _print_cards(cards_fields, 8, print_card_8)
+
+
+def print_cards_16(cards_fields):
+    """
+    Prints nastran-style cards with 16-character width fields
+
+    Parameters
+    ----------
+    cards_fields : List[List[int/float/str/None]]
+        the fields of each card
+
+    Returns
+    -------
+    msg : str
+        the same string as
+        ``''.join([print_card_16(fields) for fields in cards_fields])``
+    """
+    return _print_cards(cards_fields, 16, print_card_16)
+
+
+def _print_cards(cards_fields, size, print_card):
+    """helper for print_cards_8/print_cards_16"""
+    if not cards_fields:
+        return ''
+    chars, nchars, is_valid = get_card_rows(cards_fields, size)
+    irows = np.where(is_valid)[0]
+    blocks = [(irows, rows_to_bytes(chars[irows], nchars[irows]), nchars[irows])]
+
+    iinvalid = np.where(~is_valid)[0]
+    if len(iinvalid):
+        texts = [print_card(list(cards_fields[irow])).encode('utf8') for irow in iinvalid]
+        blocks.append((iinvalid, np.frombuffer(b''.join(texts), dtype='uint8'),
+                       np.array([len(text) for text in texts], dtype='int64')))
+    return merge_rows(blocks, len(cards_fields)).tobytes().decode('utf8')
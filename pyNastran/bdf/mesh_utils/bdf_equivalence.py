@@ -14,7 +14,6 @@ from six import iteritems, string_types, PY2
 import numpy as np
 from numpy import (array, unique, arange, searchsorted,
                    setdiff1d, intersect1d, asarray)
-from numpy.linalg import norm  # type: ignore
 import scipy
 
 from pyNastran.utils import integer_types
@@ -43,7 +42,8 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
     renumber_nodes : bool
         should the nodes be renumbered (default=False)
     neq_max : int
-        the number of "close" points (default=4)
+        the number of "close" points (default=4);
+        not used because all the nodes within tol are found
     xref bool: bool
         does the model need to be cross_referenced
         (default=True; only applies to model option)
@@ -77,11 +77,14 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
     model : BDF()
         The BDF model corresponding to bdf_filename_out
 
+    The nodes within tol of each other are grouped into clusters
+    (e.g., 1-2 and 2-3 are within tol, so 1, 2, and 3 are merged) and
+    each cluster is collapsed onto its lowest node id.  The model is
+    cross referenced, so renumbering the merged GRIDs updates the
+    elements/RBEs/loads/SPCs that reference them.
+
     .. warning:: I doubt SPOINTs/EPOINTs work correctly
-    .. warning:: xref not fully implemented (assumes cid=0)
 
-    .. todo:: node_set stil does work on the all the nodes in the big
-               kdtree loop, which is very inefficient
     .. todo:: remove_collapsed_elements is not supported
     .. todo:: avoid_collapsed_elements is not supported
     """
@@ -90,12 +93,8 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
     nodes_xyz, model, nids, inew = _eq_nodes_setup(
         bdf_filename, tol, renumber_nodes=renumber_nodes,
         xref=xref, node_set=node_set, debug=debug)
-    ieq, slots = _eq_nodes_build_tree(nodes_xyz, nids, tol,
-                                      inew=inew, node_set=node_set,
-                                      neq_max=neq_max)[1:]
-
-    nid_pairs = _eq_nodes_find_pairs(nids, slots, ieq, node_set=node_set)
-    _eq_nodes_final(nid_pairs, model, tol, node_set=node_set)
+    iroots = _eq_nodes_find_clusters(nodes_xyz[inew, :], tol)
+    _eq_nodes_final_clusters(model, nids, iroots)
 
     if bdf_filename_out is not None:
         model.write_bdf(bdf_filename_out, size=size, is_double=is_double)
@@ -130,9 +129,6 @@ def _eq_nodes_setup(bdf_filename, tol,
         model = bdf_filename
         model.cross_reference(xref=xref)
 
-    coord_ids = model.coord_ids
-    needs_get_position = True if coord_ids == [0] else False
-
     # quads / tris
     #nids_quads = []
     #eids_quads = []
@@ -190,12 +186,8 @@ def _eq_nodes_setup(bdf_filename, tol,
             nids = array([node.nid for nid, node in sorted(iteritems(model.nodes))], dtype='int32')
         all_nids = nids
 
-    if needs_get_position:
-        nodes_xyz = array([model.nodes[nid].get_position()
-                           for nid in nids], dtype='float32')
-    else:
-        nodes_xyz = array([model.nodes[nid].xyz
-                           for nid in nids], dtype='float32')
+    node_store = model.node_store
+    nodes_xyz = node_store.get_xyz_in_coord(cid=0)[node_store.get_node_index(nids), :]
 
     if node_set is not None:
         assert nodes_xyz.shape[0] == len(nids)
@@ -245,86 +237,107 @@ def _eq_nodes_setup(bdf_filename, tol,
     return nodes_xyz, model, nids, inew
 
 
-def _eq_nodes_find_pairs(nids, slots, ieq, node_set=None):
-    """helper function for `bdf_equivalence_nodes`"""
-    irows, icols = slots
-    #replacer = unique(ieq[slots])  ## TODO: turn this back on?
-
-    #skip_nodes = []
-    nid_pairs = []
-    for (irow, icol) in zip(irows, icols):
-        inid2 = ieq[irow, icol]
-        nid1 = nids[irow]
-        nid2 = nids[inid2]
-        if nid1 == nid2:
-            continue
-        if node_set is not None:
-            if nid1 not in node_set and nid2 not in node_set:
-                continue
-        nid_pairs.append((nid1, nid2))
-    return nid_pairs
-
-
-def _eq_nodes_final(nid_pairs, model, tol, node_set=None):
-    """apply nodal equivalencing to model"""
-    for (nid1, nid2) in nid_pairs:
-        node1 = model.nodes[nid1]
-        node2 = model.nodes[nid2]
-
-        # TODO: doesn't use get position...
-        distance = norm(node1.get_position() - node2.get_position())
-
-        #print('  irow=%s->n1=%s icol=%s->n2=%s' % (irow, nid1, icol, nid2))
-        if distance > tol:
-            #print('  *n1=%-4s xyz=%s\n  *n2=%-4s xyz=%s\n  *distance=%s\n' % (
-            #    nid1, list_print(node1.xyz),
-            #    nid2, list_print(node2.xyz),
-            #    distance))
-            continue
-
-        if node_set is not None:
-            assert nid1 in node_set, 'nid1=%s node_set=%s' % (nid1, node_set)
-            assert nid2 in node_set, 'nid2=%s node_set=%s' % (nid2, node_set)
-            #print('  n1=%-4s xyz=%s\n  n2=%-4s xyz=%s\n  distance=%s\n' % (
-                #nid1, str(node1.xyz),
-                #nid2, str(node2.xyz),
-                #distance))
-
-        # if hasattr(node2, 'new_node_id'):
-
-        # else:
-        node2.nid = node1.nid
-        node2.xyz = node1.xyz
-        node2.cp = node1.cp
-        assert node2.cd == node1.cd
-        assert node2.ps == node1.ps
-        assert node2.seid == node1.seid
-        # node2.new_nid = node1.nid
-        #skip_nodes.append(nid2)
-    return
-
-def _eq_nodes_build_tree(nodes_xyz, nids, tol, inew=None, node_set=None, neq_max=4, msg=''):
+def _eq_nodes_find_clusters(nodes_xyz, tol, msg=''):
     """
-    helper function for `bdf_equivalence_nodes`
+    Finds the clusters of nodes that are within tol of each other
 
     Parameters
     ----------
+    nodes_xyz : (nnodes, 3) float ndarray
+        the xyz of the nodes in the global frame (sorted by node id)
+    tol : float
+        the spherical tolerance
     msg : str; default=''
         custom message used for errors
+
+    Returns
+    -------
+    iroots : (nnodes, ) int ndarray
+        the index of the lowest node in each node's cluster
+        (a node that isn't merged is its own root)
     """
     assert isinstance(tol, float), 'tol=%r' % tol
     kdt = _get_tree(nodes_xyz, msg=msg)
+    try:
+        pairs = kdt.query_pairs(tol, output_type='ndarray')
+    except TypeError:
+        # scipy < 0.18.1
+        pairs = array(sorted(kdt.query_pairs(tol)), dtype='int64').reshape(-1, 2)
+    return _union_find(nodes_xyz.shape[0], pairs)
 
-    # check the closest 10 nodes for equality
-    deq, ieq = kdt.query(nodes_xyz[inew, :], k=neq_max, distance_upper_bound=tol)
 
-    if node_set is not None:
-        assert len(deq) == len(nids)
-    nnodes = len(nids)
+def _union_find(nnodes, pairs):
+    """
+    Collapses the pairs into clusters
 
-    # get the ids of the duplicate nodes
-    slots = np.where(ieq[:, :] < nnodes)
-    return kdt, ieq, slots
+    Parameters
+    ----------
+    nnodes : int
+        the number of nodes
+    pairs : (npairs, 2) int ndarray
+        the index of the nodes that are connected
+
+    Returns
+    -------
+    iroots : (nnodes, ) int ndarray
+        the lowest index in each node's cluster
+    """
+    iroots = arange(nnodes)
+    i1 = pairs[:, 0]
+    i2 = pairs[:, 1]
+    while len(i1):
+        root1 = iroots[i1]
+        root2 = iroots[i2]
+        is_split = root1 != root2
+        if not is_split.any():
+            break
+        i1 = i1[is_split]
+        i2 = i2[is_split]
+        root1 = root1[is_split]
+        root2 = root2[is_split]
+
+        # hook the higher root onto the lower root
+        np.minimum.at(iroots, np.maximum(root1, root2), np.minimum(root1, root2))
+
+        # point every node directly at its root
+        while True:
+            iroots2 = iroots[iroots]
+            if np.array_equal(iroots2, iroots):
+                break
+            iroots = iroots2
+    return iroots
+
+
+def _eq_nodes_final_clusters(model, nids, iroots):
+    """
+    Applies the nodal equivalencing to the model
+
+    Parameters
+    ----------
+    model : BDF()
+        the cross referenced BDF
+    nids : (nnodes, ) int ndarray
+        the sorted node ids
+    iroots : (nnodes, ) int ndarray
+        the index of the node that each node is merged onto
+    """
+    imerged = np.where(iroots != arange(len(nids)))[0]
+    nids_old = nids[imerged].tolist()
+    nids_new = nids[iroots[imerged]].tolist()
+    nodes = model.nodes
+    for nid2, nid1 in zip(nids_old, nids_new):
+        node1 = nodes[nid1]
+        node2 = nodes[nid2]
+        node2.nid = nid1
+        node2.xyz = node1.xyz
+        node2.cp = node1.cp
+        node2.cp_ref = node1.cp_ref
+        assert node2.cd == node1.cd, 'nid1=%s cd=%s; nid2=%s cd=%s' % (
+            nid1, node1.cd, nid2, node2.cd)
+        assert node2.ps == node1.ps, 'nid1=%s ps=%r; nid2=%s ps=%r' % (
+            nid1, node1.ps, nid2, node2.ps)
+        assert node2.seid == node1.seid, 'nid1=%s seid=%s; nid2=%s seid=%s' % (
+            nid1, node1.seid, nid2, node2.seid)
 
 
 def _get_tree(nodes_xyz, msg=''):
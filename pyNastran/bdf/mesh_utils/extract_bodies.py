@@ -1,199 +1,181 @@
 """
 defines:
-  - extract_bodies(bdf_filename)
+  - extract_bodies(bdf_filename, mpc_id=0, consider_rigid=True, consider_mass=False)
+  - get_body_labels(model, mpc_id=None, consider_rigid=True, consider_mass=False)
 """
 from __future__ import print_function
-from collections import defaultdict
-from six import iteritems, iterkeys
+from six import itervalues
 import numpy as np
-from pyNastran.bdf.bdf import BDF, read_bdf, print_card_16
+import scipy.sparse
+from scipy.sparse.csgraph import connected_components
 
-def extract_bodies(bdf_filename, mpc_id=0):
+from pyNastran.bdf.bdf import BDF, read_bdf
+
+
+def extract_bodies(bdf_filename, mpc_id=0, consider_rigid=True, consider_mass=False):
     """
     Finds the isolated bodies
 
-    Paramters
-    ---------
+    Parameters
+    ----------
     bdf_filename : str/BDF
         str : the path the the *.bdf file
         BDF : a BDF() boject
     mpc_id : int; default=0
+        None : don't consider MPCs
         0 : consider all MPCs
-        >0 : use this MPC set
-        not supported
+        >0 : use this MPC/MPCADD set
+    consider_rigid : bool; default=True
+        rigid elements connect nodes
+    consider_mass : bool; default=False
+        mass elements (e.g., CONM2) are part of a body;
+        a CMASS2 with 2 nodes connects nodes
+
+    Returns
+    -------
+    body_eids : Dict[ibody] = [eids, rigid_eids]
+        ibody : int
+            the body id (0 has the lowest node id)
+        eids : (neids, ) int ndarray
+            the sorted element ids
+        rigid_eids : (nrigid, ) int ndarray
+            the sorted rigid element ids
+
+    Use ``get_body_labels`` for the node ids and the mass ids of each body.
 
     Considers:
      - elements
      - rigid_elements
+     - masses (optional)
+     - MPC/MPCADD (optional)
 
     Doesn't consider:
-      - elements_mass
-      - MPC
-      - MPCADD
       - DMIx
-
-    Doesn't support:
-      - xref
-      - duplicate element ids
-      - large values
     """
     if isinstance(bdf_filename, BDF):
         model = bdf_filename
     else:
         model = read_bdf(bdf_filename, xref=False)
 
-    debug = False
-    nnodes = len(model.nodes)
-    nspoints = 0
-    nepoints = 0
-    if model.spoints:
-        nspoints = len(model.spoints)
-    if model.epoints:
-        nepoints = len(model.epoints)
-    npoints = nnodes + nspoints + nepoints
-    nelements = len(model.elements) + len(model.rigid_elements) + len(model.masses)
-    if npoints == 0 or nelements == 0:
-        return {}
-
-    nid_to_eid_map = defaultdict(list)
-    eid_to_nid_map = defaultdict(list)
-    for eid, elem in iteritems(model.elements):
-        if debug:  # pragma: no cover
-            print(print_card_16(elem.repr_fields()))
-        node_ids = elem.node_ids
-        eid_to_nid_map[eid] = node_ids
-        for nid in node_ids:
-            if nid is None:
-                continue
-            nid_to_eid_map[nid].append(eid)
-
-    rigid_offset = 0
-    if len(model.elements):
-        rigid_offset = max(model.elements)
-    for eid, elem in iteritems(model.rigid_elements):
-        if debug:  # pragma: no cover
-            print(print_card_16(elem.repr_fields()))
-        eid += rigid_offset
-        assert eid not in model.elements, 'eid=%s cannot be used twice' % eid
-        #node_ids = elem.node_ids
-        node_ids = elem.independent_nodes + elem.dependent_nodes
-        eid_to_nid_map[eid] = node_ids
-        for nid in node_ids:
-            if nid is None:
-                raise RuntimeError(elem)
-            nid_to_eid_map[nid].append(eid)
-    #mpc_offset = rigid_offset + max(model.rigid_elements)
-
-    if len(nid_to_eid_map) == 0:
-        raise RuntimeError(model.get_bdf_stats())
-        #return {}
-
-    nids_used = set([])
-    eids_used = set([])
-    ibody = 0
-    all_nids_to_check = set(list(nid_to_eid_map.keys()))
-    nids_to_check = set([next(iterkeys(nid_to_eid_map))])
-    if debug:  # pragma: no cover
-        print('all_nids_to_check= ', all_nids_to_check)
-    body_eids = {ibody : set([])}
-    nbodies_max = 3
-    while all_nids_to_check:
-        if debug:  # pragma: no cover
-            print(all_nids_to_check)
-        while nids_to_check:
-            #if len(nids_to_check) < 10:
-                #print('nids_to_check =', nids_to_check)
-            nid = nids_to_check.pop()
-            if debug:  # pragma: no cover
-                print('nid = ', nid)
-                print('all_nids_to_check =', all_nids_to_check)
-            if nid not in all_nids_to_check:
-                msg = 'nids_to_check = %s' % nids_to_check
-                raise RuntimeError(msg)
-            if debug:  # pragma: no cover
-                print('nids_used         =', nids_used)
-                print('all_nids_to_check =', all_nids_to_check)
-
-            nids_used.add(nid)
-            if debug:  # pragma: no cover
-                print('  adding nid=%s' % nid)
-            all_nids_to_check.remove(nid)
-            if debug:  # pragma: no cover
-                print('  nids_used         =', nids_used)
-                print('  all_nids_to_check =', all_nids_to_check)
-
-            eids = nid_to_eid_map[nid]
-            if debug:  # pragma: no cover
-                print('  eids = %s' % eids)
-            for eidi in eids:
-                if eidi in eids_used:
-                    continue
-                eids_used.add(eidi)
-                try:
-                    elem = model.elements[eidi]
-                except KeyError:
-                    elem = model.rigid_elements[eidi - rigid_offset]
-                if debug:  # pragma: no cover
-                    print(print_card_16(elem.repr_fields()))
-                    print('adding eidi=%s' % eidi)
-                body_eids[ibody].add(eidi)
-                nidsi = eid_to_nid_map[eidi]
-                for nidi in nidsi:
-                    if nidi not in nids_used:
-                        nids_to_check.add(nidi)
-                        if debug:  # pragma: no cover
-                            print('  adding nid=%s' % nidi)
-                del nidsi # , elem
-            if debug:  # pragma: no cover
-                print('next eid\n')
-                print('---------------------------')
-            del nid, eids
-
-        if len(body_eids[ibody]) == 0:
-            return body_eids
-            # unused node
-            #try:
-                #nid = nids_to_check.pop()
-            #except KeyError:
-                #break
-            #continue
-            #msg = 'cannot find a new body...nbodies=%s\nelements:' % ibody
-            #for nid, eids in sorted(iteritems(nid_to_eid_map)):
-                #msg += '  nid=%r eids=%s\n' % (nid, eids)
-                #for eid in eids:
-                    #try:
-                        #elem = model.elements[eid]
-                    #except KeyError:
-                        #elem = model.rigid_elements[eid - rigid_offset]
-                    #msg += print_card_16(elem.repr_fields())
-
-                    #msg += 'eid=%s used=%s\n\n' % (eid, eid in eids_used)
-                #msg += '----------------\n'
-            #msg += ''
-            #raise RuntimeError(msg + model.get_bdf_stats())
-        ibody += 1
-        if ibody > nbodies_max:
-            raise RuntimeError('Too many bodies...\n' + model.get_bdf_stats())
-        body_eids[ibody] = set([])
-        #print('--------------------------------------')
-    if len(body_eids[ibody]) == 0:
-        del body_eids[ibody]
-
-    body_eids2 = {}
-    for ibody, body in sorted(iteritems(body_eids)):
-        abody = np.unique(np.array(list(body), dtype='int64'))
-        ielem = np.where(abody <= rigid_offset)
-        irigid = np.where(abody > rigid_offset)
-        #ielem = np.asarray(ielem, dtype='int32')
-        #ielem = np.asarray(ielem, dtype='int32')
-        body_eids2[ibody] = [
-            np.asarray(abody[ielem], dtype='int32'),
-            np.asarray(abody[irigid], dtype='int32')
-        ]
-    #print('body_eids = %s' % body_eids2)
-    nbodies = len(body_eids2)
+    nbodies, unused_nids, unused_nid_labels, eid_labels = get_body_labels(
+        model, mpc_id=mpc_id, consider_rigid=consider_rigid, consider_mass=consider_mass)
+
+    names = ['elements', 'rigid_elements']
+    body_eids = {}
+    for ibody in range(nbodies):
+        body_eids[ibody] = [
+            eid_labels[name][0][eid_labels[name][1] == ibody].astype('int32')
+            for name in names]
     if nbodies > 1:
-        print('nbodies = %i' % nbodies)
-    return body_eids2
+        model.log.info('nbodies = %i' % nbodies)
+    return body_eids
+
+
+def get_body_labels(model, mpc_id=None, consider_rigid=True, consider_mass=False):
+    """
+    Labels the isolated bodies, which are found from the connected
+    components of the sparse node-element incidence matrix
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    mpc_id : int; default=None
+        None : don't consider MPCs
+        0 : consider all MPCs
+        >0 : use this MPC/MPCADD set
+    consider_rigid : bool; default=True
+        rigid elements connect nodes
+    consider_mass : bool; default=False
+        mass elements (e.g., CONM2) are part of a body;
+        a CMASS2 with 2 nodes connects nodes
+
+    Returns
+    -------
+    nbodies : int
+        the number of bodies
+    nids : (nnodes, ) int ndarray
+        the sorted ids of the nodes/SPOINTs/EPOINTs that are used by
+        the elements/rigid elements/masses/MPCs
+    nid_labels : (nnodes, ) int ndarray
+        the body id (0 to nbodies-1) of each node
+    eid_labels : Dict[name] = (eids, labels)
+        name : str
+            'elements', 'rigid_elements', 'masses'
+        eids : (neids, ) int ndarray
+            the sorted element ids
+        labels : (neids, ) int ndarray
+            the body id of each element; -1 for an element without nodes
+            (e.g., a grounded spring) or one that's not considered
+    """
+    cards = [
+        ('elements', model.elements, True),
+        ('rigid_elements', model.rigid_elements, consider_rigid),
+        ('masses', model.masses, consider_mass),
+    ]
+
+    # the nodes of each connector (element, rigid element, mass, MPC)
+    connector_nids = []
+    connectors = []
+    for name, cards_dict, is_considered in cards:
+        eids = sorted(cards_dict)
+        if is_considered:
+            connectors.append((name, eids, len(connector_nids)))
+            connector_nids.extend(
+                _get_connector_node_ids(name, cards_dict[eid]) for eid in eids)
+        else:
+            connectors.append((name, eids, None))
+
+    if mpc_id is not None:
+        for mpc in _get_mpcs(model, mpc_id):
+            connector_nids.append([nid for nid in mpc.node_ids if nid])
+
+    nnodes_per_connector = np.array([len(nids) for nids in connector_nids], dtype='int64')
+    inode_connector = np.repeat(np.arange(len(connector_nids)), nnodes_per_connector)
+    all_nids = np.array([nid for nids in connector_nids for nid in nids], dtype='int64')
+    nids, inode = np.unique(all_nids, return_inverse=True)
+    nnodes = len(nids)
+    nconnectors = len(connector_nids)
+
+    # the node-connector incidence matrix is stored as a bipartite
+    # graph of nodes (0 to nnodes-1) and connectors (nnodes+)
+    nvertices = nnodes + nconnectors
+    incidence = scipy.sparse.coo_matrix(
+        (np.ones(len(inode), dtype='int8'), (inode, nnodes + inode_connector)),
+        shape=(nvertices, nvertices))
+    unused_ncomponents, labels = connected_components(incidence, directed=False)
+
+    # every body has a node, so the bodies are numbered by their lowest
+    # node id; a connector without nodes isn't part of a body (-1)
+    unused_labels, first_node = np.unique(labels[:nnodes], return_index=True)
+    body_labels = np.full(nvertices, -1, dtype='int64')
+    body_labels[labels[np.sort(first_node)]] = np.arange(len(first_node))
+    labels = body_labels[labels]
+    nbodies = len(first_node)
+
+    connector_labels = labels[nnodes:]
+    eid_labels = {}
+    for name, eids, ioffset in connectors:
+        neids = len(eids)
+        if ioffset is None:
+            eid_labels[name] = (np.array(eids, dtype='int64'), np.full(neids, -1, dtype='int64'))
+        else:
+            eid_labels[name] = (np.array(eids, dtype='int64'),
+                                connector_labels[ioffset:ioffset + neids])
+    return nbodies, nids, labels[:nnodes], eid_labels
+
+
+def _get_connector_node_ids(name, card):
+    """gets the node ids of an element, rigid element, or mass"""
+    if name == 'rigid_elements':
+        node_ids = card.independent_nodes + card.dependent_nodes
+    else:
+        node_ids = card.node_ids
+    return [nid for nid in node_ids if nid]
 
 
+def _get_mpcs(model, mpc_id):
+    """gets the MPCs of a set or all the MPCs (mpc_id=0)"""
+    if mpc_id == 0:
+        return [mpc for mpcs in itervalues(model.mpcs) for mpc in mpcs]
+    return model.get_reduced_mpcs(mpc_id, consider_mpcadd=True)
@@ -1,27 +1,163 @@
 """
 defines:
-    free_edges(model)
+    free_edges(model, eids=None)
+    get_shell_edges_array(model, eids=None)
+    get_free_edges_array(model, eids=None)
+    pack_rows(rows)
 """
 from __future__ import print_function
 from collections import defaultdict
 from six import iteritems
+import numpy as np
 
+#: the corner nodes of the shell elements, which define the edges
+SHELL_CORNERS = {
+    'CTRIA3' : [0, 1, 2],
+    'CTRIA6' : [0, 1, 2],
+    'CTRIAR' : [0, 1, 2],
+    'CTRIAX' : [0, 1, 2],
+    'CTRIAX6' : [0, 2, 4],
+    'CQUAD4' : [0, 1, 2, 3],
+    'CQUAD' : [0, 1, 2, 3],
+    'CQUAD8' : [0, 1, 2, 3],
+    'CQUADR' : [0, 1, 2, 3],
+    'CQUADX' : [0, 1, 2, 3],
+    'CQUADX8' : [0, 1, 2, 3],
+    'CSHEAR' : [0, 1, 2, 3],
+}
 
-def free_edges(model):
-    """gets the free edges for shell elements"""
-    edge_to_eids = defaultdict(set)
-    shell_elements = ['CTRIA3', 'CTRIAX', 'CTRIA6', 'CTRIAX6',
-                      'CQUAD4', 'CQUAD', 'CQUAD8', 'CQUADR', 'CQUADX', 'CQUADX8',
-                      'CSHEAR']
-    for eid, elem in iteritems(model.elements):
-        if elem.type not in shell_elements:
+
+def free_edges(model, eids=None):
+    """
+    Gets the free edges for shell elements
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    eids : List[int]; default=None -> all
+        the element ids to consider
+
+    Returns
+    -------
+    free_edges : List[(int nid1, int nid2), ...]
+        the sorted node ids of the edges that are used by one element
+    """
+    edges = get_free_edges_array(model, eids=eids)[0]
+    return [tuple(edge) for edge in edges.tolist()]
+
+
+def get_shell_edges_array(model, eids=None):
+    """
+    Gets the edges of the shell elements
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    eids : List[int]; default=None -> all
+        the element ids to consider
+
+    Returns
+    -------
+    edges : (nedges, 2) int ndarray
+        the sorted node ids of every element edge
+    edge_eids : (nedges, ) int ndarray
+        the element id of each edge
+    """
+    if eids is None:
+        eids = model.elements.keys()
+    nodes_by_type = defaultdict(list)
+    eids_by_type = defaultdict(list)
+    for eid in eids:
+        elem = model.elements[eid]
+        if elem.type not in SHELL_CORNERS:
             continue
-        edges = elem.get_edges()
-        for edge in edges:
-            edge_to_eids[edge].add(eid)
-
-    free_edges = []
-    for edge, eids in iteritems(edge_to_eids):
-        if len(eids) == 1:
-            free_edges.append(edge)
-    return free_edges
+        nodes_by_type[elem.type].append(elem.node_ids)
+        eids_by_type[elem.type].append(eid)
+
+    all_edges = [np.zeros((0, 2), dtype='int64')]
+    all_eids = [np.zeros(0, dtype='int64')]
+    for etype, node_ids in sorted(iteritems(nodes_by_type)):
+        corners = SHELL_CORNERS[etype]
+        # the midside nodes are optional (None), so only the corners
+        # go into the array
+        nodes = np.array([[nids[i] for i in corners] for nids in node_ids], dtype='int64')
+
+        # n1-n2, n2-n3, ..., nn-n1 for each element
+        ncorners = len(corners)
+        edges = np.dstack([nodes, np.roll(nodes, -1, axis=1)]).reshape(-1, 2)
+        all_edges.append(edges)
+        all_eids.append(np.repeat(np.array(eids_by_type[etype], dtype='int64'), ncorners))
+    edges = np.sort(np.vstack(all_edges), axis=1)
+    edge_eids = np.hstack(all_eids)
+    return edges, edge_eids
+
+
+def get_free_edges_array(model, eids=None):
+    """
+    Gets the free edges for shell elements
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    eids : List[int]; default=None -> all
+        the element ids to consider
+
+    Returns
+    -------
+    edges : (nfree, 2) int ndarray
+        the sorted node ids of the edges that are used by one element
+    edge_eids : (nfree, ) int ndarray
+        the element id of each free edge
+    """
+    edges, edge_eids = get_shell_edges_array(model, eids=eids)
+    unused_keys, iedge, counts = np.unique(
+        pack_rows(edges), return_index=True, return_counts=True)
+    ifree = np.sort(iedge[counts == 1])
+    return edges[ifree, :], edge_eids[ifree]
+
+
+def pack_rows(rows):
+    """
+    Packs each row of an integer array into a single key, so equal rows
+    have equal keys (e.g., for ``np.unique``).
+
+    The rows are packed into an int64 when the range of values allows
+    it; otherwise, the values are renumbered from 0 and tried again.
+    If the keys still don't fit, each row is viewed as a single
+    void (raw bytes) value, which ``np.unique`` can also sort.
+
+    Parameters
+    ----------
+    rows : (n, ncols) int ndarray
+        the rows (e.g., sorted node ids of the edges/faces)
+
+    Returns
+    -------
+    keys : (n, ) int64/void ndarray
+        the key for each row
+    """
+    rows = np.asarray(rows, dtype='int64')
+    nrows, ncols = rows.shape
+    if nrows == 0:
+        return np.zeros(0, dtype='int64')
+
+    vmin = rows.min()
+    nvalues = int(rows.max()) - int(vmin) + 1
+    if nvalues ** ncols < 2 ** 63:
+        rows = rows - vmin
+    else:
+        values, rows = np.unique(rows, return_inverse=True)
+        rows = rows.reshape(nrows, ncols).astype('int64')
+        nvalues = len(values)
+        if nvalues ** ncols >= 2 ** 63:
+            rows = np.ascontiguousarray(rows)
+            return rows.view(np.dtype((np.void, rows.dtype.itemsize * ncols))).ravel()
+
+    keys = rows[:, 0].copy()
+    for icol in range(1, ncols):
+        keys *= nvalues
+        keys += rows[:, icol]
+    return keys
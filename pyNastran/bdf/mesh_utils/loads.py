@@ -4,8 +4,13 @@ Defines:
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - sum_forces_moments_loadcases
+      find the net force/moment on the model for many load cases at once
+  - sum_forces_moments_subcases
+      find the net force/moment on the model for many subcases at once
 """
 from __future__ import print_function
+from collections import defaultdict
 from six import iteritems
 import numpy as np
 from numpy import array, cross, allclose, mean
@@ -51,9 +56,33 @@ def sum_forces_moments(model, p0, loadcase_id, include_grav=False, xyz_cid0=None
 
     Pressure acts in the normal direction per model/real/loads.bdf and loads.f06
     """
-    if not isinstance(loadcase_id, integer_types):
-        raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+    p = _get_reference_point(model, p0)
+    _check_loadcase_id(model, loadcase_id)
+    #for (key, load_case) in iteritems(model.loads):
+        #if key != loadcase_id:
+            #continue
+
+    loads, scale_factors, is_grav = model.get_reduced_loads(
+        loadcase_id, skip_scale_factor0=True)
+
+    if xyz_cid0 is None:
+        xyz = {}
+        for nid, node in iteritems(model.nodes):
+            xyz[nid] = node.get_position()
+    else:
+        xyz = xyz_cid0
+
+    unsupported_types = set([])
+    F, M = _sum_forces_moments_loads(model, p, loads, scale_factors, xyz,
+                                     loadcase_id, include_grav, unsupported_types)
+
+    for Type in unsupported_types:
+        model.log.debug('case=%s loadtype=%r not supported' % (loadcase_id, Type))
+    return (F, M)
 
+
+def _get_reference_point(model, p0):
+    """gets the reference point for sum_forces_moments"""
     cid = 0
     if isinstance(p0, integer_types):
         if cid == 0:
@@ -62,9 +91,16 @@ def sum_forces_moments(model, p0, loadcase_id, include_grav=False, xyz_cid0=None
             p = model.nodes[p0].get_position_wrt(model, cid)
     else:
         p = array(p0)
+    return p
+
+
+def _check_loadcase_id(model, loadcase_id):
+    """checks that the LOAD=ID exists for sum_forces_moments"""
+    if not isinstance(loadcase_id, integer_types):
+        raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
 
     try:
-        load_case = model.Load(loadcase_id, consider_load_combinations=True)
+        model.Load(loadcase_id, consider_load_combinations=True)
     except KeyError:
         msg = 'load_case=%s is invalid; ' % loadcase_id
         msg += 'load_cases = %s\n' % np.unique(list(model.loads.keys()))
@@ -76,24 +112,41 @@ def sum_forces_moments(model, p0, loadcase_id, include_grav=False, xyz_cid0=None
                 msg += '  SUBCASE %i has no LOAD\n' % (subcase_id)
         model.log.error(msg)
         raise KeyError(msg)
-    #for (key, load_case) in iteritems(model.loads):
-        #if key != loadcase_id:
-            #continue
 
-    loads, scale_factors, is_grav = model.get_reduced_loads(
-        loadcase_id, skip_scale_factor0=True)
 
-    F = array([0., 0., 0.])
-    M = array([0., 0., 0.])
+def _sum_forces_moments_loads(model, p, loads, scale_factors, xyz,
+                              loadcase_id, include_grav, unsupported_types):
+    """
+    Sums the forces & moments of the reduced loads one load at a time
 
-    if xyz_cid0 is None:
-        xyz = {}
-        for nid, node in iteritems(model.nodes):
-            xyz[nid] = node.get_position()
-    else:
-        xyz = xyz_cid0
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p : (3, ) float ndarray
+        the reference point
+    loads : List[load]
+        the reduced loads (see ``get_reduced_loads``)
+    scale_factors : List[float]
+        the scale factor of each load
+    xyz : Dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+    loadcase_id : int
+        the LOAD=ID (for the messages)
+    include_grav : bool
+        includes gravity in the summation
+    unsupported_types : Set[str]
+        the load types that aren't supported, which is updated
 
-    unsupported_types = set([])
+    Returns
+    -------
+    forces : (3, ) float ndarray
+        the forces
+    moments : (3, ) float ndarray
+        the moments
+    """
+    F = array([0., 0., 0.])
+    M = array([0., 0., 0.])
     for load, scale in zip(loads, scale_factors):
         #if load.type not in ['FORCE1']:
             #continue
@@ -481,9 +534,6 @@ def sum_forces_moments(model, p0, loadcase_id, include_grav=False, xyz_cid0=None
         else:
             # we collect them so we only get one print
             unsupported_types.add(load.type)
-
-    for Type in unsupported_types:
-        model.log.debug('case=%s loadtype=%r not supported' % (loadcase_id, Type))
     return (F, M)
 
 def sum_forces_moments_elements(model, p0, loadcase_id, eids, nids,
@@ -988,3 +1038,497 @@ def sum_forces_moments_elements(model, p0, loadcase_id, eids, nids,
         model.log.debug('case=%s loadtype=%r not supported' % (loadcase_id, loadtype))
     #model.log.info("case=%s F=%s M=%s\n" % (loadcase_id, F, M))
     return (F, M)
+
+
+def sum_forces_moments_subcases(model, p0, subcase_ids=None, include_grav=False,
+                                xyz_cid0=None):
+    """
+    Sums applied forces & moments about a reference point p0 for many
+    subcases at once.  See ``sum_forces_moments_loadcases``.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    subcase_ids : List[int]; default=None
+        the subcases to analyze
+        None : the subcases with a LOAD
+    include_grav : bool; default=False
+        includes gravity in the summation (slow)
+    xyz_cid0 : None / Dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+
+    Returns
+    -------
+    subcase_ids : (nsubcases, ) int ndarray
+        the subcases
+    forces_moments : (nsubcases, 6) float ndarray
+        the [Fx, Fy, Fz, Mx, My, Mz] of each subcase
+    """
+    subcases = model.subcases
+    if subcase_ids is None:
+        subcase_ids = [subcase_id for subcase_id, subcase in sorted(iteritems(subcases))
+                       if subcase_id > 0 and 'LOAD' in subcase]
+        if not subcase_ids and 0 in subcases and 'LOAD' in subcases[0]:
+            subcase_ids = [0]
+
+    loadcase_ids = []
+    for subcase_id in subcase_ids:
+        if subcase_id not in subcases:
+            raise KeyError('subcase_id=%s not found; subcase_ids=%s' % (
+                subcase_id, sorted(subcases)))
+        subcase = subcases[subcase_id]
+        if 'LOAD' not in subcase:
+            raise KeyError('SUBCASE %i has no LOAD' % subcase_id)
+        loadcase_ids.append(subcase.get_parameter('LOAD')[0])
+
+    forces_moments = sum_forces_moments_loadcases(
+        model, p0, loadcase_ids, include_grav=include_grav, xyz_cid0=xyz_cid0)
+    return np.array(subcase_ids, dtype='int32'), forces_moments
+
+
+def sum_forces_moments_loadcases(model, p0, loadcase_ids, include_grav=False,
+                                 xyz_cid0=None):
+    """
+    Sums applied forces & moments about a reference point p0 for many
+    load cases at once.  This considers the same loads as
+    ``sum_forces_moments``, but the FORCE/MOMENT/PLOAD/PLOAD2/PLOAD4
+    cards are grouped by type and the areas, normals, and resultants
+    are found with arrays.  A load set (e.g., the FORCE cards with the
+    same sid) that's used by multiple load cases is only summed once.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    loadcase_ids : List[int]
+        the LOAD=IDs to analyze
+    include_grav : bool; default=False
+        includes gravity in the summation (slow)
+    xyz_cid0 : None / Dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+
+    Returns
+    -------
+    forces_moments : (nloadcases, 6) float ndarray
+        the [Fx, Fy, Fz, Mx, My, Mz] of each load case
+    """
+    p = _get_reference_point(model, p0)
+    nloadcases = len(loadcase_ids)
+    forces_moments = np.zeros((nloadcases, 6), dtype='float64')
+
+    # a load set (e.g., the FORCE/PLOAD4 cards with the same sid) that's
+    # used by multiple load cases is only summed once
+    iload_sets_map = {}
+    load_set_ids = []
+    iloadcases = []
+    iload_sets = []
+    scales = []
+    for iloadcase, loadcase_id in enumerate(loadcase_ids):
+        _check_loadcase_id(model, loadcase_id)
+        load_set_idsi, scale_factors = _reduce_load_sets(model, loadcase_id)
+        for load_set_id in load_set_idsi:
+            if load_set_id not in iload_sets_map:
+                iload_sets_map[load_set_id] = len(load_set_ids)
+                load_set_ids.append(load_set_id)
+            iload_sets.append(iload_sets_map[load_set_id])
+        iloadcases.extend([iloadcase] * len(load_set_idsi))
+        scales.extend(scale_factors)
+
+    loads = []
+    iload_set_of_load = []
+    for iload_set, load_set_id in enumerate(load_set_ids):
+        loadsi = [load for load in model.Load(load_set_id) if load.type != 'LOAD']
+        loads += loadsi
+        iload_set_of_load.extend([iload_set] * len(loadsi))
+    if not loads:
+        return forces_moments
+    unit_forces_moments = _get_unit_forces_moments(
+        model, p, loads, loadcase_ids, include_grav, xyz_cid0)
+
+    nload_sets = len(load_set_ids)
+    load_set_forces_moments = np.zeros((nload_sets, 6), dtype='float64')
+    for i in range(6):
+        load_set_forces_moments[:, i] = np.bincount(
+            iload_set_of_load, weights=unit_forces_moments[:, i], minlength=nload_sets)
+
+    iloadcases = np.array(iloadcases, dtype='int64')
+    weights = (load_set_forces_moments[iload_sets, :] *
+               np.array(scales, dtype='float64')[:, np.newaxis])
+    for i in range(6):
+        forces_moments[:, i] = np.bincount(iloadcases, weights=weights[:, i],
+                                           minlength=nloadcases)
+    return forces_moments
+
+
+def _reduce_load_sets(model, load_id, scale=1., load_id_trace=None):
+    """
+    Reduces a load case to its load sets (the non-LOAD cards with the
+    same sid) and their scale factors.  This is the same as
+    ``model.get_reduced_loads``, but the load sets aren't expanded.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    load_id : int
+        the LOAD id
+    scale : float; default=1.0
+        the scale factor on the LOAD
+    load_id_trace : List[int]; default=None
+        the LOAD ids that are being reduced, which prevents recursion
+
+    Returns
+    -------
+    load_set_ids : List[int]
+        the sids of the load sets
+    scale_factors : List[float]
+        the scale factor on each load set
+    """
+    if load_id_trace is None:
+        load_id_trace = []
+    load_set_ids = []
+    scale_factors = []
+    is_load_set = False
+    for load in model.Load(load_id):
+        if load.type != 'LOAD':
+            is_load_set = True
+            continue
+
+        load_scale = load.scale * scale
+        for load_idi, scalei in zip(load.get_load_ids(), load.scale_factors):
+            if load_idi in load_id_trace:
+                msg = 'There is a recursion error.  LOAD trace=%s; load_id=%s' % (
+                    load_id_trace, load_idi)
+                raise RuntimeError(msg)
+            load_set_idsi, scale_factorsi = _reduce_load_sets(
+                model, load_idi, scale=load_scale * scalei,
+                load_id_trace=load_id_trace + [load_idi])
+            load_set_ids += load_set_idsi
+            scale_factors += scale_factorsi
+
+    if is_load_set:
+        load_set_ids.append(load_id)
+        scale_factors.append(scale)
+    return load_set_ids, scale_factors
+
+
+def _get_unit_forces_moments(model, p, loads, loadcase_ids, include_grav, xyz_cid0):
+    """
+    Gets the forces/moments of the loads for a scale factor of 1.0
+
+    Returns
+    -------
+    forces_moments : (nloads, 6) float ndarray
+        the [Fx, Fy, Fz, Mx, My, Mz] of each load
+    """
+    if xyz_cid0 is None:
+        nids = model.node_store.nid
+        xyz = model.node_store.get_xyz_in_coord(cid=0)
+    else:
+        nids = np.array(sorted(xyz_cid0), dtype='int32')
+        xyz = np.array([xyz_cid0[nid] for nid in nids.tolist()],
+                       dtype='float64').reshape(len(nids), 3)
+
+    nloads = len(loads)
+    forces_moments = np.zeros((nloads, 6), dtype='float64')
+    is_summed = np.zeros(nloads, dtype='bool')
+    iloads_by_type = defaultdict(list)
+    for iload, load in enumerate(loads):
+        iloads_by_type[load.type].append(iload)
+
+    for load_type, iloads in sorted(iteritems(iloads_by_type)):
+        if load_type not in BULK_LOADS:
+            continue
+        iloads = np.array(iloads)
+        try:
+            forces_momentsi, is_valid = BULK_LOADS[load_type](
+                model, p, [loads[iload] for iload in iloads], nids, xyz)
+        except (TypeError, ValueError):
+            # e.g., a load that hasn't been cross referenced
+            continue
+        forces_moments[iloads[is_valid], :] = forces_momentsi[is_valid, :]
+        is_summed[iloads[is_valid]] = True
+
+    # the rest of the loads (e.g., GRAV, PLOAD1, a PLOAD4 on a solid)
+    # are summed one at a time
+    iloads = np.where(~is_summed)[0]
+    if len(iloads):
+        if xyz_cid0 is None:
+            xyz_cid0 = dict(zip(nids.tolist(), xyz.copy()))
+        unsupported_types = set([])
+        for iload in iloads:
+            F, M = _sum_forces_moments_loads(model, p, [loads[iload]], [1.], xyz_cid0,
+                                             loadcase_ids, include_grav, unsupported_types)
+            forces_moments[iload, :3] = F
+            forces_moments[iload, 3:] = M
+        for load_type in sorted(unsupported_types):
+            model.log.debug('case=%s loadtype=%r not supported' % (loadcase_ids, load_type))
+    return forces_moments
+
+
+def _get_node_index(nids, node_ids, nnodes):
+    """
+    Gets the index of the nodes in the sorted node ids
+
+    Returns
+    -------
+    inode : (n, nnodes) int ndarray
+        the index of the nodes in nids
+    is_valid : (n, ) bool ndarray
+        are all the nodes in nids
+    """
+    node_ids = np.array(node_ids, dtype='int64').reshape(-1, nnodes)
+    if len(nids) == 0:
+        return np.zeros(node_ids.shape, dtype='int64'), np.zeros(len(node_ids), dtype='bool')
+    inode = np.searchsorted(nids, node_ids)
+    inode[inode == len(nids)] = 0
+    is_valid = (nids[inode] == node_ids).all(axis=1)
+    return inode, is_valid
+
+
+def _area_centroid_normal(xyz_faces):
+    """
+    Gets the area, centroid, and normal of tri/quad faces like the
+    CTRIA3/CQUAD4
+
+    Parameters
+    ----------
+    xyz_faces : (n, 3/4, 3) float ndarray
+        the nodes of the faces
+
+    Returns
+    -------
+    area : (n, ) float ndarray
+        the area of each face
+    centroid : (n, 3) float ndarray
+        the centroid of each face
+    normal : (n, 3) float ndarray
+        the unit normal of each face
+    is_valid : (n, ) bool ndarray
+        does the face have a normal
+    """
+    if xyz_faces.shape[1] == 3:
+        n1, n2, n3 = xyz_faces[:, 0, :], xyz_faces[:, 1, :], xyz_faces[:, 2, :]
+        axb = cross(n1 - n2, n1 - n3)
+        centroid = (n1 + n2 + n3) / 3.
+    else:
+        n1, n2, n3, n4 = (xyz_faces[:, 0, :], xyz_faces[:, 1, :],
+                          xyz_faces[:, 2, :], xyz_faces[:, 3, :])
+        axb = cross(n1 - n3, n2 - n4)
+        centroid = (n1 + n2 + n3 + n4) / 4.
+    nunit = norm(axb, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normal = axb / nunit[:, np.newaxis]
+    is_valid = (nunit > 0.) & np.isfinite(normal).all(axis=1)
+    return 0.5 * nunit, centroid, normal, is_valid
+
+
+def _get_load_vectors(model, loads):
+    """gets mag * xyz of a FORCE/MOMENT in the global frame"""
+    nloads = len(loads)
+    mags = np.array([load.mag for load in loads], dtype='float64')
+    vectors = np.array([load.xyz for load in loads], dtype='float64').reshape(nloads, 3)
+    if loads[0].type in ['FORCE', 'MOMENT']:
+        cids = np.array([load.Cid() for load in loads])
+        if cids.any():
+            vectors = model.coord_cache.transform_vector_to_global(vectors, cids)
+    return mags[:, np.newaxis] * vectors
+
+
+def _force_resultants(model, p, loads, nids, xyz):
+    """sums a FORCE, FORCE1, FORCE2 (see ``BULK_LOADS``)"""
+    forces = _get_load_vectors(model, loads)
+    inode, is_valid = _get_node_index(nids, [load.node_id for load in loads], 1)
+    r = xyz[inode[:, 0], :] - p
+    return np.hstack([forces, cross(r, forces)]), is_valid
+
+
+def _moment_resultants(model, p, loads, nids, xyz):
+    """sums a MOMENT, MOMENT1, MOMENT2 (see ``BULK_LOADS``)"""
+    moments = _get_load_vectors(model, loads)
+    is_valid = np.ones(len(loads), dtype='bool')
+    return np.hstack([np.zeros(moments.shape), moments]), is_valid
+
+
+def _sum_face_resultants(p, xyz, pressures, iloads, inode, nloads):
+    """
+    Sums the pressure loads on tri/quad faces
+
+    Parameters
+    ----------
+    p : (3, ) float ndarray
+        the reference point
+    xyz : (nnodes, 3) float ndarray
+        the nodes in the global frame
+    pressures : (nfaces, ) float ndarray
+        the pressure on each face
+    iloads : (nfaces, ) int ndarray
+        the load of each face
+    inode : (nfaces, 3/4) int ndarray
+        the index of the nodes of each face
+    nloads : int
+        the number of loads
+
+    Returns
+    -------
+    forces_moments : (nloads, 6) float ndarray
+        the summed forces/moments of each load
+    is_valid : (nloads, ) bool ndarray
+        do all the faces of the load have a normal
+    """
+    forces_moments = np.zeros((nloads, 6), dtype='float64')
+    is_valid = np.ones(nloads, dtype='bool')
+    if len(iloads) == 0:
+        return forces_moments, is_valid
+
+    area, centroid, normal, is_face = _area_centroid_normal(xyz[inode, :])
+    forces = (pressures * area)[:, np.newaxis] * normal
+    moments = cross(centroid - p, forces)
+    is_valid[iloads[~is_face]] = False
+    for i, values in enumerate([forces[:, 0], forces[:, 1], forces[:, 2],
+                                moments[:, 0], moments[:, 1], moments[:, 2]]):
+        forces_moments[:, i] = np.bincount(iloads[is_face], weights=values[is_face],
+                                           minlength=nloads)
+    return forces_moments, is_valid
+
+
+def _pload_resultants(model, p, loads, nids, xyz):
+    """sums a PLOAD (see ``BULK_LOADS``)"""
+    nloads = len(loads)
+    forces_moments = np.zeros((nloads, 6), dtype='float64')
+    is_valid = np.zeros(nloads, dtype='bool')
+    node_ids = [load.node_ids for load in loads]
+    pressures = np.array([load.pressure for load in loads], dtype='float64')
+    for nnodes in [3, 4]:
+        iloads = np.array([iload for iload, nodes in enumerate(node_ids)
+                           if len(nodes) == nnodes], dtype='int64')
+        if len(iloads) == 0:
+            continue
+        inode, is_validi = _get_node_index(nids, [node_ids[iload] for iload in iloads], nnodes)
+        irows = np.arange(len(iloads))
+        forces_momentsi, is_face = _sum_face_resultants(
+            p, xyz, pressures[iloads], irows, inode, len(iloads))
+        is_validi &= is_face
+        forces_moments[iloads[is_validi], :] = forces_momentsi[is_validi, :]
+        is_valid[iloads[is_validi]] = True
+    return forces_moments, is_valid
+
+
+def _get_face_rows(loads, elements_list, tri_types, quad_types):
+    """
+    Gets the tri/quad faces of the elements of the PLOAD2/PLOAD4s
+
+    Returns
+    -------
+    faces : Dict[nnodes] = (iloads, node_ids)
+        iloads : List[int]
+            the load of each face
+        node_ids : List[List[int]]
+            the nodes of each face
+    is_valid : (nloads, ) bool ndarray
+        are all the elements tris/quads
+    """
+    is_valid = np.ones(len(loads), dtype='bool')
+    faces = {3 : ([], []), 4 : ([], [])}
+    tri_iloads, tri_nodes = faces[3]
+    quad_iloads, quad_nodes = faces[4]
+    for iload, elements in enumerate(elements_list):
+        if elements is None:
+            is_valid[iload] = False
+            continue
+        for elem in elements:
+            etype = elem.type
+            if etype in tri_types:
+                tri_iloads.append(iload)
+                tri_nodes.append(elem.node_ids[:3])
+            elif etype in quad_types:
+                quad_iloads.append(iload)
+                quad_nodes.append(elem.node_ids[:4])
+            else:
+                is_valid[iload] = False
+                break
+    return faces, is_valid
+
+
+def _sum_faces(p, nids, xyz, faces, face_pressures, is_valid, nloads):
+    """sums the tri/quad faces of the PLOAD2/PLOAD4s"""
+    forces_moments = np.zeros((nloads, 6), dtype='float64')
+    for nnodes, (iloads, node_ids) in sorted(iteritems(faces)):
+        if not iloads:
+            continue
+        iloads = np.array(iloads, dtype='int64')
+        inode, is_node = _get_node_index(nids, node_ids, nnodes)
+        is_valid[iloads[~is_node]] = False
+        forces_momentsi, is_face = _sum_face_resultants(
+            p, xyz, face_pressures[nnodes][iloads], iloads, inode, nloads)
+        forces_moments += forces_momentsi
+        is_valid &= is_face
+    return forces_moments, is_valid
+
+
+def _pload2_resultants(model, p, loads, nids, xyz):
+    """sums a PLOAD2 on CTRIA3/CQUAD4/CSHEARs (see ``BULK_LOADS``)"""
+    elements = model.elements
+    elements_list = []
+    for load in loads:
+        eids = load.element_ids
+        if all(eid in elements for eid in eids):
+            elements_list.append([elements[eid] for eid in eids])
+        else:
+            elements_list.append(None)
+    faces, is_valid = _get_face_rows(loads, elements_list, ['CTRIA3'], ['CQUAD4', 'CSHEAR'])
+
+    pressures = np.array([load.pressure for load in loads], dtype='float64')
+    face_pressures = {3 : pressures, 4 : pressures}
+    return _sum_faces(p, nids, xyz, faces, face_pressures, is_valid, len(loads))
+
+
+def _pload4_resultants(model, p, loads, nids, xyz):
+    """sums a SURF PLOAD4 on shells (see ``BULK_LOADS``)"""
+    nloads = len(loads)
+    nvectors = np.array([load.nvector for load in loads], dtype='float64').reshape(nloads, 3)
+    is_normal = (nvectors == 0.).all(axis=1)
+    elements_list = []
+    for load, is_normali in zip(loads, is_normal):
+        if (is_normali and load.Cid() == 0 and load.surf_or_line == 'SURF' and
+                load.line_load_dir == 'NORM'):
+            elements_list.append(load.eids_ref)
+        else:
+            elements_list.append(None)
+    faces, is_valid = _get_face_rows(
+        loads, elements_list,
+        ['CTRIA3', 'CTRIA6', 'CTRIA', 'CTRIAR'],
+        ['CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR'])
+
+    # the average pressure is used if the pressures on the face aren't the same
+    all_pressures = np.array([load.pressures for load in loads], dtype='float64').reshape(nloads, 4)
+    face_pressures = {}
+    for nface in [3, 4]:
+        pressures = all_pressures[:, :nface]
+        face_pressures[nface] = np.where(
+            pressures.min(axis=1) != pressures.max(axis=1),
+            pressures.mean(axis=1), pressures[:, 0])
+    return _sum_faces(p, nids, xyz, faces, face_pressures, is_valid, nloads)
+
+
+#: the functions that sum a group of loads of the same type with arrays
+#: (see ``sum_forces_moments_loadcases``), which return
+#:   forces_moments : (nloads, 6) float ndarray
+#:   is_valid : (nloads, ) bool ndarray
+#:       the loads that weren't summed and are summed one at a time
+BULK_LOADS = {
+    'FORCE' : _force_resultants,
+    'FORCE1' : _force_resultants,
+    'FORCE2' : _force_resultants,
+    'MOMENT' : _moment_resultants,
+    'MOMENT1' : _moment_resultants,
+    'MOMENT2' : _moment_resultants,
+    'PLOAD' : _pload_resultants,
+    'PLOAD2' : _pload2_resultants,
+    'PLOAD4' : _pload4_resultants,
+}
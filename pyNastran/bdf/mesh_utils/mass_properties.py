@@ -2,14 +2,19 @@
 Defines:
   - mass_poperties
       get the mass & moment of inertia of the model
+  - mass_properties_breakdown
+      get the mass & moment of inertia of the model and each
+      property/type/group
+  - get_mass_centroid_arrays
+      get the mass & centroid of each element
 """
 from __future__ import print_function
+from collections import defaultdict
 from six import string_types, iteritems
-from numpy import array, cross, dot
+from numpy import array, cross
 from numpy.linalg import norm  # type: ignore
 import numpy as np
 from pyNastran.utils import integer_types
-from pyNastran.utils.mathematics import integrate_positive_unit_line
 
 
 def transform_inertia(mass, xyz_cg, xyz_ref, xyz_ref2, I_ref):
@@ -325,13 +330,12 @@ def _mass_properties_no_xref(model, elements, masses, reference_point):  # pragm
     return (mass, cg, I)
 
 def _mass_properties_new(model, element_ids=None, mass_ids=None, reference_point=None,
-                         sym_axis=None, scale=None, xyz_cid0=None):  # pragma: no cover
+                         sym_axis=None, scale=None, xyz_cid0=None):
     """
-    half implemented, not tested, should be faster someday...
-    don't use this
-
     Caclulates mass properties in the global system about the
-    reference point.
+    reference point.  This is the same as ``_mass_properties``, but the
+    masses/centroids of the common elements are calculated by type with
+    arrays (see ``get_mass_centroid_arrays``).
 
     Parameters
     ----------
@@ -368,467 +372,445 @@ def _mass_properties_new(model, element_ids=None, mass_ids=None, reference_point
     I : ndarray
         Moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz]).
 
-    I = mass * centroid * centroid
+    .. seealso:: model.mass_properties
+    """
+    mass, cg, I = mass_properties_breakdown(
+        model, element_ids=element_ids, mass_ids=mass_ids,
+        reference_point=reference_point, group_by=None,
+        sym_axis=sym_axis, scale=scale, xyz_cid0=xyz_cid0)[:3]
+    return mass, cg, I
 
-    .. math:: I_{xx} = m (dy^2 + dz^2)
 
-    .. math:: I_{yz} = -m * dy * dz
+def mass_properties_breakdown(model, element_ids=None, mass_ids=None, reference_point=None,
+                              group_by='property', sym_axis=None, scale=None,
+                              xyz_cid0=None):
+    """
+    Caclulates the mass properties of the model and a breakdown by
+    property/type/group in the global system about the reference point.
 
-    where:
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    element_ids : list[int]; (n, ) ndarray, optional
+        An array of element ids.
+    mass_ids : list[int]; (n, ) ndarray, optional
+        An array of mass ids.
+    reference_point : ndarray/str/int, optional
+        type : ndarray
+            An array that defines the origin of the frame.
+            default = <0,0,0>.
+        type : str
+            'cg' is the only allowed string
+        type : int
+            the node id
+    group_by : str / dict; default='property'
+        'property' : group by property id (the cards without a
+                     property, e.g. CONROD/CONM2, are in group 0)
+        'type' : group by card type (e.g., 'CQUAD4')
+        dict[group] = ids : the element/mass ids in each group
+        None : no breakdown
+    sym_axis : str, optional
+        The axis to which the model is symmetric. If AERO cards are used, this can be left blank
+        allowed_values = 'no', x', 'y', 'z', 'xy', 'yz', 'xz', 'xyz'
+    scale : float, optional
+        The WTMASS scaling value.
+        default=None -> PARAM, WTMASS is used
+        float > 0.0
+    xyz_cid0 : dict[nid] : xyz; default=None -> auto-calculate
+        mapping of the node id to the global position
 
-    .. math:: dx = x_{element} - x_{ref}
+    Returns
+    -------
+    mass : float
+        The mass of the model.
+    cg : ndarray
+        The cg of the model as an array.
+    I : ndarray
+        Moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz]).
+    breakdown : dict[group] = (mass, cg, I)
+        the mass properties of each group about the reference point
 
-    .. seealso:: http://en.wikipedia.org/wiki/Moment_of_inertia#Moment_of_inertia_tensor
+    Example
+    -------
+    # mass properties of model based on Property ID
+    mass, cg, I, breakdown = mass_properties_breakdown(model)
+    for pid, (massi, cgi, Ii) in sorted(iteritems(breakdown)):
+        print(pid, massi)
+    """
+    if reference_point is None:
+        reference_point = np.array([0., 0., 0.])
+    elif isinstance(reference_point, integer_types):
+        reference_point = model.nodes[reference_point].get_position()
 
-    .. note::
-       This doesn't use the mass matrix formulation like Nastran.
-       It assumes m*r^2 is the dominant term.
-       If you're trying to get the mass of a single element, it
-       will be wrong, but for real models will be correct.
+    elements, masses = _mass_properties_elements_init(model, element_ids, mass_ids)
+    cards = list(elements) + list(masses)
+    mass_array, centroid, is_valid = get_mass_centroid_arrays(model, cards, xyz_cid0=xyz_cid0)
+    mass_array = mass_array[is_valid]
+    centroid = centroid[is_valid, :]
+    cards = [card for card, is_validi in zip(cards, is_valid) if is_validi]
 
-    Example 1
-    ---------
-    # mass properties of entire structure
-    mass, cg, I = model.mass_properties()
-    Ixx, Iyy, Izz, Ixy, Ixz, Iyz = I
+    breakdown = {}
+    if isinstance(reference_point, string_types):
+        if reference_point != 'cg':
+            raise RuntimeError('reference_point=%r and must be an array, node id, '
+                               'or \'cg\'' % reference_point)
+        mass = mass_array.sum()
+        if mass == 0.0:
+            return mass, np.zeros(3), np.zeros(6), breakdown
+        reference_point = np.dot(mass_array, centroid) / mass
+
+    inertia = _get_point_inertia(mass_array, centroid, reference_point)
+    mass, cg, I = _sum_mass_properties(mass_array, centroid, inertia)
+    mass, cg, I = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, I)
+    if group_by is None:
+        return mass, cg, I, breakdown
+
+    if isinstance(group_by, dict):
+        ids = np.array([card.eid for card in cards], dtype='int64')
+        for group, group_ids in iteritems(group_by):
+            is_group = np.in1d(ids, np.asarray(list(group_ids), dtype='int64'))
+            breakdown[group] = _sum_mass_properties(
+                mass_array[is_group], centroid[is_group, :], inertia[is_group, :])
+    else:
+        if group_by == 'property':
+            keys = [_get_pid(card) for card in cards]
+        elif group_by == 'type':
+            keys = [card.type for card in cards]
+        else:
+            raise RuntimeError('group_by=%r and must be property, type, or a dict' % group_by)
+        groups = sorted(set(keys))
+        igroup_map = {group: igroup for igroup, group in enumerate(groups)}
+        igroups = np.array([igroup_map[key] for key in keys], dtype='int64')
+        ngroups = len(groups)
+        group_mass = np.bincount(igroups, weights=mass_array, minlength=ngroups)
+        group_moment = np.zeros((ngroups, 3), dtype='float64')
+        group_inertia = np.zeros((ngroups, 6), dtype='float64')
+        for i in range(3):
+            group_moment[:, i] = np.bincount(
+                igroups, weights=mass_array * centroid[:, i], minlength=ngroups)
+        for i in range(6):
+            group_inertia[:, i] = np.bincount(igroups, weights=inertia[:, i], minlength=ngroups)
+
+        for igroup, group in enumerate(groups):
+            massi = group_mass[igroup]
+            cgi = group_moment[igroup, :] / massi if massi else np.zeros(3)
+            breakdown[group] = (massi, cgi, group_inertia[igroup, :])
+
+    for group, (massi, cgi, Ii) in list(iteritems(breakdown)):
+        breakdown[group] = _apply_mass_symmetry(model, sym_axis, scale, massi, cgi, Ii)
+    return mass, cg, I, breakdown
+
+
+def _get_pid(card):
+    """gets the property id of an element/mass (0 for no property)"""
+    pid_ref = getattr(card, 'pid_ref', None)
+    if pid_ref is not None:
+        return pid_ref.pid
+    # a CONROD has a pid of -10
+    pid = getattr(card, 'pid', None)
+    return pid if isinstance(pid, integer_types) and pid > 0 else 0
+
+
+def _get_point_inertia(mass, centroid, reference_point):
+    """
+    Gets the point mass moment of inertia of each element
 
+    Returns
+    -------
+    inertia : (n, 6) float ndarray
+        [Ixx, Iyy, Izz, Ixy, Ixz, Iyz] about the reference point
+    """
+    dxyz = centroid - reference_point
+    x = dxyz[:, 0]
+    y = dxyz[:, 1]
+    z = dxyz[:, 2]
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    inertia = np.column_stack([
+        mass * (y2 + z2),  # Ixx
+        mass * (x2 + z2),  # Iyy
+        mass * (x2 + y2),  # Izz
+        mass * x * y,      # Ixy
+        mass * x * z,      # Ixz
+        mass * y * z,      # Iyz
+    ]).reshape(len(mass), 6)
+    return inertia
+
+
+def _sum_mass_properties(mass, centroid, inertia):
+    """sums the masses, cg, and inertias"""
+    total_mass = mass.sum()
+    cg = np.dot(mass, centroid) if len(mass) else np.zeros(3)
+    if total_mass:
+        cg /= total_mass
+    I = inertia.sum(axis=0)
+    return total_mass, cg, I
+
+
+def get_mass_centroid_arrays(model, cards, xyz_cid0=None):
+    """
+    Gets the mass and centroid of the elements/masses
 
-    Example 2
-    ---------
-    # mass properties of model based on Property ID
-    pids = list(model.pids.keys())
-    pid_eids = model.get_element_ids_dict_with_pids(pids)
+    The CTRIA3/CTRIAR/CQUAD4/CQUADR, CTETRA/CPENTA6/CPYRAM5/CHEXA,
+    CROD/CONROD/CTUBE/CBAR, and CONM2 cards are grouped by type and
+    calculated with arrays.  Everything else (e.g., CBEAM, CQUAD8,
+    CMASS1) uses ``element.Mass()`` and ``element.Centroid()``.
 
-    for pid, eids in sorted(iteritems(pid_eids)):
-        mass, cg, I = mass_properties(model, element_ids=eids)
-    """
-    #if reference_point is None:
-    reference_point = array([0., 0., 0.])
+    Parameters
+    ----------
+    model : BDF()
+        a cross referenced BDF object
+    cards : List[element/mass]
+        the elements/masses
+    xyz_cid0 : dict[nid] : xyz; default=None -> auto-calculate
+        mapping of the node id to the global position
 
+    Returns
+    -------
+    mass : (n, ) float ndarray
+        the mass of each card
+    centroid : (n, 3) float ndarray
+        the centroid of each card in the global frame
+    is_valid : (n, ) bool ndarray
+        does the card have a mass & centroid (e.g., a CELAS1 is skipped)
+    """
     if xyz_cid0 is None:
-        xyz = {}
-        for nid, node in iteritems(model.nodes):
-            xyz[nid] = node.get_position()
+        nids = model.node_store.nid
+        xyz = model.node_store.get_xyz_in_coord(cid=0)
     else:
-        xyz = xyz_cid0
+        nids = np.array(sorted(xyz_cid0), dtype='int32')
+        xyz = np.array([xyz_cid0[nid] for nid in nids.tolist()],
+                       dtype='float64').reshape(len(nids), 3)
+
+    ncards = len(cards)
+    mass = np.zeros(ncards, dtype='float64')
+    centroid = np.zeros((ncards, 3), dtype='float64')
+    is_summed = np.zeros(ncards, dtype='bool')
+    icards_by_class = defaultdict(list)
+    for icard, card in enumerate(cards):
+        icards_by_class[card.__class__.__name__].append(icard)
+
+    for class_name, icards in sorted(iteritems(icards_by_class)):
+        if class_name not in BULK_MASSES:
+            continue
+        func, args = BULK_MASSES[class_name]
+        icards = np.array(icards)
+        try:
+            massi, centroidi = func([cards[icard] for icard in icards], nids, xyz, *args)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            # e.g., an element that hasn't been cross referenced
+            continue
+        is_validi = np.isfinite(massi) & np.isfinite(centroidi).all(axis=1)
+        mass[icards[is_validi]] = massi[is_validi]
+        centroid[icards[is_validi], :] = centroidi[is_validi, :]
+        is_summed[icards[is_validi]] = True
+
+    is_valid = is_summed.copy()
+    for icard in np.where(~is_summed)[0]:
+        out = _get_mass_centroid(model, cards[icard])
+        if out is None:
+            continue
+        mass[icard], centroid[icard, :] = out
+        is_valid[icard] = True
+    return mass, centroid, is_valid
 
-    elements, masses = _mass_properties_elements_init(model, element_ids, mass_ids)
 
-    #mass = 0.
-    #cg = array([0., 0., 0.])
-    #I = array([0., 0., 0., 0., 0., 0., ])
-    #if isinstance(reference_point, string_types):
-        #if reference_point == 'cg':
-            #mass = 0.
-            #for pack in [elements, masses]:
-                #for element in pack:
-                    #try:
-                        #p = element.Centroid()
-                        #m = element.Mass()
-                        #mass += m
-                        #cg += m * p
-                    #except:
-                        #pass
-            #if mass == 0.0:
-                #return mass, cg, I
+def _get_mass_centroid(model, element):
+    """
+    Gets the mass and centroid of an element (see ``_mass_properties``)
 
-            #reference_point = cg / mass
-        #else:
-            ## reference_point = [0.,0.,0.] or user-defined array
-            #pass
+    Returns
+    -------
+    out : (mass, centroid) / None
+        None : the element doesn't have a mass (e.g., a CELAS1)
+    """
+    try:
+        centroid = element.Centroid()
+    except:
+        return None
+
+    try:
+        mass = element.Mass()
+        centroid = np.asarray(centroid, dtype='float64')
+        # checks that the mass is a number
+        mass * centroid
+    except:
+        # PLPLANE
+        if element.pid_ref.type == 'PSHELL':
+            model.log.warning('element=%s centroid=%s' % (element, centroid))
+            raise
+        model.log.warning("could not get the inertia for element/property\n%s%s" % (
+            element, element.pid_ref))
+        return None
+    return mass, centroid
+
+
+def _get_node_xyz(elements, nids, xyz, nnodes):
+    """
+    Gets the global xyz of the first nnodes nodes of the elements
 
-    mass = 0.
-    cg = array([0., 0., 0.])
-    I = array([0., 0., 0., 0., 0., 0., ])
+    Returns
+    -------
+    xyzs : List[(n, 3) float ndarray]
+        the xyz of node 1, node 2, ...
+    """
+    node_ids = np.array([elem.node_ids[:nnodes] for elem in elements],
+                        dtype='int64').reshape(len(elements), nnodes)
+    inode = np.searchsorted(nids, node_ids)
+    inode[inode == len(nids)] = 0
+    if not np.array_equal(nids[inode], node_ids):
+        raise KeyError('missing nodes')
+    return [xyz[inode[:, i], :] for i in range(nnodes)]
 
-    no_mass = [
-        'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4', #'CLEAS5',
-        'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
-        'CBUSH', 'CBUSH1D', 'CBUSH2D', 'CVISC', 'CGAP', # is this right?
-        'CFAST',
-        'CRAC2D', 'CRAC3D',
-
-        'CSSCHD', 'CAERO1', 'CAERO2', 'CAERO3', 'CAERO4', 'CAERO5',
-        'CBARAO', 'CORD1R', 'CORD2R', 'CORD1C', 'CORD2C', 'CORD1S', 'CORD2S',
-        'CORD3G', 'CONV', 'CONVM', 'CSET', 'CSET1', 'CLOAD',
-        'CHBDYG', 'CHBDYE', 'CHBDYP',
-
-        'CTRAX3', 'CTRAX6', 'CQUADX8', 'CQUADX4',
-        'CPLSTN3', 'CPLSTN6', 'CPLSTN4', 'CPLSTN8',
-    ]
-    all_eids = np.array(list(model.elements.keys()), dtype='int32')
-    all_eids.sort()
-
-    all_mass_ids = np.array(list(model.masses.keys()), dtype='int32')
-    all_mass_ids.sort()
-
-    #def _increment_inertia0(centroid, reference_point, m, mass, cg, I):
-        #"""helper method"""
-        #(x, y, z) = centroid - reference_point
-        #mass += m
-        #cg += m * centroid
-        #return mass
-
-    def _increment_inertia(centroid, reference_point, m, mass, cg, I):
-        """helper method"""
-        (x, y, z) = centroid - reference_point
-        x2 = x * x
-        y2 = y * y
-        z2 = z * z
-        I[0] += m * (y2 + z2)  # Ixx
-        I[1] += m * (x2 + z2)  # Iyy
-        I[2] += m * (x2 + y2)  # Izz
-        I[3] += m * x * y      # Ixy
-        I[4] += m * x * z      # Ixz
-        I[5] += m * y * z      # Iyz
-        mass += m
-        cg += m * centroid
-        return mass
-
-    def get_sub_eids(all_eids, eids):
-        """supports limiting the element/mass ids"""
-        eids = np.array(eids)
-        ieids = np.searchsorted(all_eids, eids)
-        eids2 = eids[all_eids[ieids] == eids]
-        return eids2
-
-    etypes_skipped = set([])
-    for etype, eids in iteritems(model._type_to_id_map):
-        if etype in no_mass:
-            continue
-        elif len(eids) == 0:
-            continue
-        elif etype in ['CROD', 'CONROD']:
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2 = elem.node_ids
-                length = norm(xyz[n2] - xyz[n1])
-                centroid = (xyz[n1] + xyz[n2]) / 2.
-                mpl = elem.MassPerLength()
-                m = mpl * length
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-        elif etype == 'CTUBE':
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2 = elem.node_ids
-                length = norm(xyz[n2] - xyz[n1])
-                centroid = (xyz[n1] + xyz[n2]) / 2.
-                mpl = elem.pid_ref.MassPerLength()
-                m = mpl * length
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-        elif etype == 'CBAR':
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2 = elem.node_ids
-                centroid = (xyz[n1] + xyz[n2]) / 2.
-                length = norm(xyz[n2] - xyz[n1])
-                mpl = elem.pid_ref.MassPerLength()
-                m = mpl * length
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-        elif etype == 'CBEAM':
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                prop = elem.pid_ref
-                n1, n2 = elem.node_ids
-                node1 = xyz[n1]
-                node2 = xyz[n2]
-                centroid = (node1 + node2) / 2.
-                length = norm(node2 - node1)
-                #cda = model.nodes[n1].cid_ref
-                #cdb = model.nodes[n2].cid_ref
-
-                is_failed, out = elem.get_axes(model)
-                if is_failed:
-                    model.log.error(out)
-                    raise RuntimeError(out)
-                wa, wb, _ihat, jhat, khat = out
-                p1 = node1 + wa
-                p2 = node2 + wb
-                if prop.type == 'PBEAM':
-                    rho = prop.Rho()
-                    mass_per_lengths = []
-                    nsm_per_lengths = []
-                    for (area, nsm) in zip(prop.A, prop.nsm):
-                        mass_per_lengths.append(area * rho)
-                        nsm_per_lengths.append(nsm)
-                    mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
-                    nsm_per_length = integrate_positive_unit_line(prop.xxb, nsm_per_lengths)
-                    #nsm = np.mean(prop.nsm)
-                    nsm = nsm_per_length * length
-                    m = mass_per_length * length
-                    nsm_n1 = (p1 + jhat * prop.m1a + khat * prop.m2a)
-                    nsm_n2 = (p2 + jhat * prop.m1b + khat * prop.m2b)
-                    nsm_centroid = (nsm_n1 + nsm_n2) / 2.
-                    #if nsm != 0.:
-                        #p1_nsm = p1 + prop.ma
-                        #p2_nsm = p2 + prop.mb
-                elif prop.type == 'PBEAML':
-                    #mass_per_lengths = elem.get_mass_per_lengths()
-                    mass_per_length = prop.MassPerLength() # includes simplified nsm
-                    m = mass_per_length * length
-                    nsm_centroid = np.zeros(3)
-                    nsm = prop.nsm[0]  # TODO: simplified
-                elif prop.type == 'PBCOMP':
-                    mass_per_length = prop.MassPerLength()
-                    m = mass_per_length * length
-                    nsm = prop.nsm
-                    nsm_n1 = (p1 + jhat * prop.m1 + khat * prop.m2)
-                    nsm_n2 = (p2 + jhat * prop.m1 + khat * prop.m2)
-                    nsm_centroid = (nsm_n1 + nsm_n2) / 2.
-                elif prop.type == 'PBMSECT':
-                    continue
-                    #mass_per_length = prop.MassPerLength()
-                    #m = mass_per_length * length
-                    #nsm = prop.nsm
-                else:
-                    raise NotImplementedError(prop.type)
-
-                #mpl = elem.pid_ref.MassPerLength()
-                #m = mpl * length
-
-                (x, y, z) = centroid - reference_point
-                (xm, ym, zm) = nsm_centroid - reference_point
-                x2 = x * x
-                y2 = y * y
-                z2 = z * z
-                xm2 = xm * xm
-                ym2 = ym * ym
-                zm2 = zm * zm
-
-                # Ixx, Iyy, Izz, Ixy, Ixz, Iyz
-                I[0] += m * (y2 + z2) + nsm * (ym2 + zm2)
-                I[1] += m * (x2 + z2) + nsm * (xm2 + zm2)
-                I[2] += m * (x2 + y2) + nsm * (xm2 + ym2)
-                I[3] += m * x * y + nsm * xm * ym
-                I[4] += m * x * z + nsm * xm * zm
-                I[5] += m * y * z + nsm * ym * zm
-                mass += m + nsm
-                cg += m * centroid + nsm * nsm_centroid
-
-        elif etype in ['CTRIA3', 'CTRIA6', 'CTRIAR']:
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2, n3 = elem.node_ids[:3]
-                prop = elem.pid_ref
-                centroid = (xyz[n1] + xyz[n2] + xyz[n3]) / 3.
-                area = 0.5 * norm(cross(xyz[n1] - xyz[n2], xyz[n1] - xyz[n3]))
-                if prop.type == 'PSHELL':
-                    tflag = elem.tflag
-                    ti = prop.Thickness()
-                    if tflag == 0:
-                        # absolute
-                        t1 = elem.T1 if elem.T1 else ti
-                        t2 = elem.T2 if elem.T2 else ti
-                        t3 = elem.T3 if elem.T3 else ti
-                    elif tflag == 1:
-                        # relative
-                        t1 = elem.T1 * ti if elem.T1 else ti
-                        t2 = elem.T2 * ti if elem.T2 else ti
-                        t3 = elem.T3 * ti if elem.T3 else ti
-                    else:
-                        raise RuntimeError('tflag=%r' % tflag)
-                    assert t1 + t2 + t3 > 0., 't1=%s t2=%s t3=%s' % (t1, t2, t3)
-                    t = (t1 + t2 + t3) / 3.
-
-                    # m/A = rho * A * t + nsm
-                    #mass_per_area = elem.nsm + rho * elem.t
-
-                    mpa = prop.nsm + prop.Rho() * t
-                    #mpa = elem.pid_ref.MassPerArea()
-                    m = mpa * area
-                elif prop.type in ['PCOMP', 'PCOMPG']:
-                    # PCOMP, PCOMPG
-                    #rho_t = prop.get_rho_t()
-                    #nsm = prop.nsm
-                    #rho_t = [mat.Rho() * t for (mat, t) in zip(prop.mids_ref, prop.ts)]
-                    #mpa = sum(rho_t) + nsm
-
-                    # works for PCOMP
-                    # F:\Program Files\Siemens\NXNastran\nxn10p1\nxn10p1\nast\tpl\cqr3compbuck.dat
-                    mpa = prop.get_mass_per_area()
-                elif prop.type == 'PLPLANE':
-                    continue
-                else:
-                    raise NotImplementedError(prop.type)
-                m = area * mpa
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-        elif etype in ['CQUAD4', 'CQUAD8', 'CQUADR']:
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2, n3, n4 = elem.node_ids[:4]
-                prop = elem.pid_ref
-                centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-                area = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-
-                if prop.type == 'PSHELL':
-                    tflag = elem.tflag
-                    ti = prop.Thickness()
-                    if tflag == 0:
-                        # absolute
-                        t1 = elem.T1 if elem.T1 else ti
-                        t2 = elem.T2 if elem.T2 else ti
-                        t3 = elem.T3 if elem.T3 else ti
-                        t4 = elem.T4 if elem.T4 else ti
-                    elif tflag == 1:
-                        # relative
-                        t1 = elem.T1 * ti if elem.T1 else ti
-                        t2 = elem.T2 * ti if elem.T2 else ti
-                        t3 = elem.T3 * ti if elem.T3 else ti
-                        t4 = elem.T4 * ti if elem.T4 else ti
-                    else:
-                        raise RuntimeError('tflag=%r' % tflag)
-                    assert t1 + t2 + t3 + t4 > 0., 't1=%s t2=%s t3=%s t4=%s' % (t1, t2, t3, t4)
-                    t = (t1 + t2 + t3 + t4) / 4.
-
-                    # m/A = rho * A * t + nsm
-                    #mass_per_area = model.nsm + rho * model.t
-
-                    mpa = prop.nsm + prop.Rho() * t
-                    #mpa = elem.pid_ref.MassPerArea()
-                    #m = mpa * area
-                elif prop.type in ['PCOMP', 'PCOMPG']:
-                    # PCOMP, PCOMPG
-                    #rho_t = prop.get_rho_t()
-                    #nsm = prop.nsm
-                    #rho_t = [mat.Rho() * t for (mat, t) in zip(prop.mids_ref, prop.ts)]
-                    #mpa = sum(rho_t) + nsm
-                    mpa = prop.get_mass_per_area()
-                elif prop.type == 'PLPLANE':
-                    continue
-                    #raise NotImplementedError(prop.type)
-                else:
-                    raise NotImplementedError(prop.type)
-                m = area * mpa
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-        elif etype == 'CQUAD':
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2, n3, n4 = elem.node_ids[:4]
-                prop = elem.pid_ref
-                centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-                area = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-
-                if prop.type == 'PSHELL':
-                    t = prop.Thickness()
-                    mpa = prop.nsm + prop.Rho() * t
-                elif prop.type in ['PCOMP', 'PCOMPG']:
-                    mpa = prop.get_mass_per_area()
-                elif prop.type == 'PLPLANE':
-                    continue
-                    #raise NotImplementedError(prop.type)
-                else:
-                    raise NotImplementedError(prop.type)
-                m = area * mpa
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-        elif etype == 'CSHEAR':
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2, n3, n4 = elem.node_ids
-                prop = elem.pid_ref
-                centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-                area = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-                mpa = prop.MassPerArea()
-                m = area * mpa
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-        elif etype in ['CONM1', 'CONM2', 'CMASS1', 'CMASS2', 'CMASS3', 'CMASS4']:
-            eids2 = get_sub_eids(all_mass_ids, eids)
-            for eid in eids2:
-                elem = model.masses[eid]
-                m = elem.Mass()
-                centroid = elem.Centroid()
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-        elif etype == 'CTETRA':
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2, n3, n4 = elem.node_ids[:4]
-                centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-                #V = -dot(n1 - n4, cross(n2 - n4, n3 - n4)) / 6.
-                volume = -dot(xyz[n1] - xyz[n4], cross(xyz[n2] - xyz[n4], xyz[n3] - xyz[n4])) / 6.
-                m = elem.Rho() * volume
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-        elif etype == 'CPYRAM':
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2, n3, n4, n5 = elem.node_ids[:5]
-                centroid1 = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-                area1 = 0.5 * norm(cross(xyz[n3]-xyz[n1], xyz[n4]-xyz[n2]))
-                centroid5 = xyz[n5]
-                centroid = (centroid1 + centroid5) / 2.
-                volume = area1 / 3. * norm(centroid1 - centroid5)
-                m = elem.Rho() * volume
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-        elif etype == 'CPENTA':
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2, n3, n4, n5, n6 = elem.node_ids[:6]
-                area1 = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n2] - xyz[n1]))
-                area2 = 0.5 * norm(cross(xyz[n6] - xyz[n4], xyz[n5] - xyz[n4]))
-                centroid1 = (xyz[n1] + xyz[n2] + xyz[n3]) / 3.
-                centroid2 = (xyz[n4] + xyz[n5] + xyz[n6]) / 3.
-                centroid = (centroid1 + centroid2) / 2.
-                volume = (area1 + area2) / 2. * norm(centroid1 - centroid2)
-                m = elem.Rho() * volume
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-        elif etype == 'CHEXA':
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-                n1, n2, n3, n4, n5, n6, n7, n8 = elem.node_ids[:8]
-                #(A1, c1) = area_centroid(n1, n2, n3, n4)
-                centroid1 = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-                area1 = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-                #(A2, c2) = area_centroid(n5, n6, n7, n8)
-                centroid2 = (xyz[n5] + xyz[n6] + xyz[n7] + xyz[n8]) / 4.
-                area2 = 0.5 * norm(cross(xyz[n7] - xyz[n5], xyz[n8] - xyz[n6]))
-
-                volume = (area1 + area2) / 2. * norm(centroid1 - centroid2)
-                m = elem.Rho() * volume
-                centroid = (centroid1 + centroid2) / 2.
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-        elif etype == 'CBEND':
-            model.log.info('elem.type=%s doesnt have mass' % etype)
-            continue
-        elif etype.startswith('C'):
-            eids2 = get_sub_eids(all_eids, eids)
-            for eid in eids2:
-                elem = model.elements[eid]
-
-                #if elem.pid_ref.type in ['PPLANE']:
-                try:
-                    m = elem.Mass()
-                except:
-                    model.log.error('etype = %r' % etype)
-                    print(elem)
-                    print(elem.pid_ref)
-                    raise
-                centroid = elem.Centroid()
-                if m > 0.0:
-                    model.log.info('elem.type=%s is not supported in new '
-                                   'mass properties method' % elem.type)
-                    mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-                elif etype not in etypes_skipped:
-                    model.log.info('elem.type=%s doesnt have mass' % elem.type)
-                    etypes_skipped.add(etype)
 
-    if mass:
-        cg /= mass
-    mass, cg, I = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, I)
-    # Ixx, Iyy, Izz, Ixy, Ixz, Iyz = I
-    return mass, cg, I
+def _get_property_values(elements, func):
+    """
+    Gets a value from the property of each element, which is only
+    calculated once per property (NaN if it can't be calculated)
+    """
+    values = {}
+    out = np.zeros(len(elements), dtype='float64')
+    for i, elem in enumerate(elements):
+        key = id(elem.pid_ref)
+        try:
+            value = values[key]
+        except KeyError:
+            try:
+                value = float(func(elem))
+            except:
+                value = np.nan
+            values[key] = value
+        out[i] = value
+    return out
+
+
+def _area_centroid_quad(n1, n2, n3, n4):
+    """vectorized version of ``solid.area_centroid``"""
+    area1 = 0.5 * norm(cross(n1 - n2, n2 - n4), axis=1)
+    c1 = (n1 + n2 + n4) / 3.
+    area2 = 0.5 * norm(cross(n2 - n4, n2 - n3), axis=1)
+    c2 = (n2 + n3 + n4) / 3.
+    area = area1 + area2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        centroid = (c1 * area1[:, np.newaxis] + c2 * area2[:, np.newaxis]) / area[:, np.newaxis]
+    return area, centroid
+
+
+def _tri_mass_centroid(elements, nids, xyz):
+    """CTRIA3, CTRIAR"""
+    n1, n2, n3 = _get_node_xyz(elements, nids, xyz, 3)
+    area = 0.5 * norm(cross(n1 - n2, n1 - n3), axis=1)
+    centroid = (n1 + n2 + n3) / 3.
+    mpa = _get_property_values(elements, lambda elem: elem.pid_ref.MassPerArea())
+    return mpa * area, centroid
+
+
+def _quad_mass_centroid(elements, nids, xyz):
+    """CQUAD4, CQUADR"""
+    n1, n2, n3, n4 = _get_node_xyz(elements, nids, xyz, 4)
+    area = 0.5 * norm(cross(n3 - n1, n4 - n2), axis=1)
+    centroid = (n1 + n2 + n3 + n4) / 4.
+    mpa = _get_property_values(elements, lambda elem: elem.pid_ref.MassPerArea())
+    return mpa * area, centroid
+
+
+def _tetra_mass_centroid(elements, nids, xyz):
+    """CTETRA4, CTETRA10"""
+    n1, n2, n3, n4 = _get_node_xyz(elements, nids, xyz, 4)
+    volume = -np.einsum('ij,ij->i', n1 - n4, cross(n2 - n4, n3 - n4)) / 6.
+    centroid = (n1 + n2 + n3 + n4) / 4.
+    rho = _get_property_values(elements, lambda elem: elem.Rho())
+    return rho * volume, centroid
+
+
+def _penta_mass_centroid(elements, nids, xyz):
+    """CPENTA6"""
+    n1, n2, n3, n4, n5, n6 = _get_node_xyz(elements, nids, xyz, 6)
+    area1 = 0.5 * norm(cross(n3 - n1, n2 - n1), axis=1)
+    area2 = 0.5 * norm(cross(n6 - n4, n5 - n4), axis=1)
+    c1 = (n1 + n2 + n3) / 3.
+    c2 = (n4 + n5 + n6) / 3.
+    volume = np.abs((area1 + area2) / 2. * norm(c1 - c2, axis=1))
+    centroid = (c1 + c2) / 2.
+    rho = _get_property_values(elements, lambda elem: elem.Rho())
+    return rho * volume, centroid
+
+
+def _pyram_mass_centroid(elements, nids, xyz):
+    """CPYRAM5"""
+    n1, n2, n3, n4, n5 = _get_node_xyz(elements, nids, xyz, 5)
+    area1, c1 = _area_centroid_quad(n1, n2, n3, n4)
+    volume = np.abs(area1 / 3. * norm(c1 - n5, axis=1))
+    centroid = (c1 + n5) / 2.
+    rho = _get_property_values(elements, lambda elem: elem.Rho())
+    return rho * volume, centroid
+
+
+def _hexa_mass_centroid(elements, nids, xyz):
+    """CHEXA8, CHEXA20"""
+    n1, n2, n3, n4, n5, n6, n7, n8 = _get_node_xyz(elements, nids, xyz, 8)
+    area1, c1 = _area_centroid_quad(n1, n2, n3, n4)
+    area2, c2 = _area_centroid_quad(n5, n6, n7, n8)
+    volume = np.abs((area1 + area2) / 2. * norm(c1 - c2, axis=1))
+    centroid = (c1 + c2) / 2.
+    rho = _get_property_values(elements, lambda elem: elem.Rho())
+    return rho * volume, centroid
+
+
+def _line_mass_centroid(elements, nids, xyz, mass_per_length):
+    """CROD, CONROD, CTUBE, CBAR"""
+    n1, n2 = _get_node_xyz(elements, nids, xyz, 2)
+    length = norm(n2 - n1, axis=1)
+    centroid = (n1 + n2) / 2.
+    if mass_per_length is None:
+        # CONROD; there is no property
+        mpl = np.array([elem.MassPerLength() for elem in elements], dtype='float64')
+    else:
+        mpl = _get_property_values(elements, mass_per_length)
+    return mpl * length, centroid
+
+
+def _conm2_mass_centroid(elements, nids, xyz):
+    """CONM2"""
+    mass = np.array([elem.mass for elem in elements], dtype='float64')
+    cids = np.array([elem.Cid() for elem in elements], dtype='int64')
+    offset = np.array([elem.X for elem in elements], dtype='float64').reshape(len(elements), 3)
+
+    centroid = np.full((len(elements), 3), np.nan)
+    icid0 = np.where(cids == 0)[0]
+    if len(icid0):
+        n1 = _get_node_xyz([elements[i] for i in icid0], nids, xyz, 1)[0]
+        centroid[icid0, :] = n1 + offset[icid0, :]
+
+    # the offset is the cg in the basic coordinate system
+    icid_neg1 = cids == -1
+    centroid[icid_neg1, :] = offset[icid_neg1, :]
+
+    # cid > 0 uses the Centroid method
+    return mass, centroid
+
+
+BULK_MASSES = {
+    # class name : (function, extra args)
+    'CTRIA3' : (_tri_mass_centroid, ()),
+    'CTRIAR' : (_tri_mass_centroid, ()),
+    'CQUAD4' : (_quad_mass_centroid, ()),
+    'CQUADR' : (_quad_mass_centroid, ()),
+    'CTETRA4' : (_tetra_mass_centroid, ()),
+    'CTETRA10' : (_tetra_mass_centroid, ()),
+    'CPENTA6' : (_penta_mass_centroid, ()),
+    'CPYRAM5' : (_pyram_mass_centroid, ()),
+    'CHEXA8' : (_hexa_mass_centroid, ()),
+    'CHEXA20' : (_hexa_mass_centroid, ()),
+    'CROD' : (_line_mass_centroid, (lambda elem: elem.MassPerLength(), )),
+    'CTUBE' : (_line_mass_centroid, (lambda elem: elem.pid_ref.MassPerLength(), )),
+    'CBAR' : (_line_mass_centroid, (lambda elem: elem.pid_ref.MassPerLength(), )),
+    'CONROD' : (_line_mass_centroid, (None, )),
+    'CONM2' : (_conm2_mass_centroid, ()),
+}
+
 
 def _apply_mass_symmetry(model, sym_axis, scale, mass, cg, I):
     """
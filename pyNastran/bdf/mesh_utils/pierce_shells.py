@@ -1,14 +1,14 @@
 """
 Defines:
  - pierce_shell_model(bdf_filename, xyz_points, tol=1.0)
+ - quad_intersection(orig, direction, v0, v1, v2, v3)
+ - triangle_intersection(orig, direction, v0, v1, v2)
 """
-from itertools import count
 from typing import List, Optional
-from six import iteritems
 from six.moves import zip
 import numpy as np
 from pyNastran.bdf.bdf import BDF, read_bdf
-from pyNastran.bdf.mesh_utils.bdf_equivalence import _get_tree
+from pyNastran.bdf.mesh_utils.shell_tree import ShellTree
 
 
 def quad_intersection(orig, direction, v0, v1, v2, v3):
@@ -91,8 +91,7 @@ def pierce_shell_model(bdf_filename, xyz_points, tol=1.0):
     xyz_points : (npoints, 3) float ndarray
         the xyz_points to pierce
     tol : float; default=1.0
-        the pierce tolerance
-        pick a value that is ~3x the max local element edge length
+        unused; the candidate elements are found from the element sizes
 
     Returns
     -------
@@ -107,124 +106,41 @@ def pierce_shell_model(bdf_filename, xyz_points, tol=1.0):
     node_ids : List[int ndarray, None]
         ndarray : pierced element's nodes
         None : invalid pierce
+
+    .. seealso:: ``ShellTree``, which supports any direction and
+                 reuses the spatial index for multiple calls
     """
     xyz_points = np.asarray(xyz_points)
     assert xyz_points.shape[1] == 3, xyz_points.shape
-    xy_points = xyz_points[:, :2]
-    assert xy_points.shape[1] == 2, xy_points.shape
 
     if isinstance(bdf_filename, BDF):
         model = bdf_filename
     else:
         model = read_bdf(bdf_filename)
 
-    eids = []
-    centroids = []
-    etypes_to_skip = [
-        'CHEXA', 'CPENTA', 'CTETRA', 'CPYRAM',
-        'CBUSH', 'CBUSH1D', 'CBUSH2D',
-        'CBEAM', 'CROD', 'CONROD',
-        'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
-        'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
-    ]
-    for eid, elem in iteritems(model.elements):
-        if elem.type in ['CQUAD4', 'CTRIA3']:
-            centroid = elem.Centroid()
-        elif elem.type in etypes_to_skip:
-            continue
-        else:
-            print(elem.type)
-            #raise NotImplementedError(elem)
-            continue
-        eids.append(eid)
-        centroids.append(centroid)
-    eids = np.array(eids, dtype='int32')
-    assert len(eids) > 0, 'eids=%s\n' % eids
-    centroids_xy = np.array(centroids, dtype='float64')[:, :2]
-
-    #print('centroids:\n%s\n' % str(centroids_xy))
-    assert centroids_xy.shape[1] == 2, centroids_xy.shape
-
-
-    msg = 'which is required by pierce_shell_model'
-    kdt = _get_tree(centroids_xy, msg=msg)
-    results = kdt.query_ball_point(xy_points, tol)
-    nresults = len(results)
-    iresults = np.arange(nresults)
-    #print(results)
-    #print(iresults)
-
+    tree = ShellTree(model)
     direction = np.array([0., 0., 1.])
-    ipoints = []
+    eids, xyz_pierces = tree.pierce(xyz_points, direction)
+
     eids_pierce = []
     xyz_pierces_max = []
     node_ids = []
-    for i, xyz_point, eidsi in zip(count(), xyz_points, results):
-        model.log.debug('eidsi = [%s]' % ', '.join([str(eidii).rstrip('L') for eidii in eidsi]))
-        if not eidsi:
-            ipoints.append(i)
+    for xyz_point, eid, xyz_pierce in zip(xyz_points, eids, xyz_pierces):
+        if eid == -1:
             eids_pierce.append(None)
             xyz_pierces_max.append(None)
             node_ids.append(None)
-            model.log.warning('skipping %s because it failed tolerancing (tol=%s)' % (xyz_point, tol))
+            model.log.warning('skipping %s because no pierces found' % xyz_point)
             continue
+        eid = int(eid)
+        eids_pierce.append(eid)
+        xyz_pierces_max.append(xyz_pierce)
+        node_ids.append(model.elements[eid].node_ids)
 
-        model.log.debug('xyz_point = %s' % xyz_point)
-        eidsi2 = eids[eidsi]
-        eids_newi = []
-        piercesi = []
-        zpiercesi = []
-        for eid in eidsi2:
-            elem = model.elements[eid]
-            if elem.type == 'CQUAD4':
-                v0 = elem.nodes_ref[0].get_position()
-                v1 = elem.nodes_ref[1].get_position()
-                v2 = elem.nodes_ref[2].get_position()
-                v3 = elem.nodes_ref[3].get_position()
-                xyz_pierce = quad_intersection(xyz_point, direction, v0, v1, v2, v3)
-            elif elem.type == 'CTRIA3':
-                v0 = elem.nodes_ref[0].get_position()
-                v1 = elem.nodes_ref[1].get_position()
-                v2 = elem.nodes_ref[2].get_position()
-                xyz_pierce = triangle_intersection(xyz_point, direction, v0, v1, v2)
-            else:
-                raise NotImplementedError(elem)
-
-            if xyz_pierce is None:
-                #model.log.warning('failed to pierce eid=%s' % eid)
-                continue
-
-            zpierce = xyz_pierce[2]
-            model.log.debug('  eid=%s xyz_pierce=%s zpierce=%s' % (eid, xyz_pierce, zpierce))
-            eids_newi.append(eid)
-            piercesi.append(xyz_pierce)
-            zpiercesi.append(zpierce)
-
-        if len(zpiercesi) == 0:
-            ipoints.append(i)
-            eids_pierce.append(None)
-            xyz_pierces_max.append(None)
-            node_ids.append(None)
-            model.log.warning('skipping %s because no pierces found (tol=%s)' % (xyz_point, tol))
-            continue
-
-        #print('zpiercesi = %s' % zpiercesi)
-        zpiercesi_max = max(zpiercesi)
-        ipierce_max = zpiercesi.index(zpiercesi_max)
-        eid_max = eids_newi[ipierce_max]
-        xyz_piercei_max = piercesi[ipierce_max]
-        model.log.debug('i=%s xyz_point=%s xyz_piercei_max=%s zpiercesi=%s zmax=%s eid_max=%s' % (
-            i, xyz_point, xyz_piercei_max,
-            zpiercesi, zpiercesi_max, eid_max))
-
-        ipoints.append(i)
-        eids_pierce.append(eid_max)
-        xyz_pierces_max.append(xyz_piercei_max)
-        #print(model.elements[eid_max])
-        node_ids.append(model.elements[eid_max].node_ids)
-
-    xyz_pierces_max = np.array(xyz_pierces_max)
-    model.log.debug('ipoints=%s' % ipoints)
+    if None in eids_pierce:
+        xyz_pierces_max = np.array(xyz_pierces_max, dtype='object')
+    else:
+        xyz_pierces_max = np.array(xyz_pierces_max)
     model.log.info('eids_pierce=%s' % eids_pierce)
     model.log.info('xyz_pierces_max:\n%s' % xyz_pierces_max)
     model.log.info('node_ids=%s' % node_ids)
@@ -0,0 +1,513 @@
+"""
+Defines a spatial index of the shell elements that's built once and
+then queried with many points (e.g., mapping CFD pressures onto a
+structural model):
+ - ShellTree(model, element_ids=None, xref=True)
+   - pierce(xyz_points, direction, is_ray=False)
+   - get_closest_elements(xyz_points)
+   - is_inside(xyz_points, directions=None)
+
+The shells are split into triangles (a quad is split across its 1-3
+diagonal like ``quad_intersection``).  A triangle can't be closer to a
+point (or a line) than the distance to its centroid minus its radius
+(the largest centroid-to-corner distance), so the triangles are grouped
+by radius and each group gets a KD-tree of its centroids.  A ball query
+of each group finds the candidate triangles, which are tested exactly
+with vectorized operations on the (point, triangle) pairs.
+"""
+from __future__ import print_function, division
+from collections import defaultdict
+from itertools import chain
+from six import iteritems
+import numpy as np
+
+from pyNastran.bdf.mesh_utils.bdf_equivalence import _get_tree
+from pyNastran.bdf.mesh_utils.free_edges import pack_rows
+
+#: the triangles (corner node indices) of each shell element type
+SHELL_TRIANGLES = {
+    'CTRIA3' : [[0, 1, 2]],
+    'CTRIA6' : [[0, 1, 2]],
+    'CTRIAR' : [[0, 1, 2]],
+    'CQUAD4' : [[0, 1, 2], [0, 2, 3]],
+    'CQUAD8' : [[0, 1, 2], [0, 2, 3]],
+    'CQUADR' : [[0, 1, 2], [0, 2, 3]],
+    'CQUAD' : [[0, 1, 2], [0, 2, 3]],
+    'CSHEAR' : [[0, 1, 2], [0, 2, 3]],
+}
+
+#: the number of points that are queried at once, which limits the
+#: memory of the (point, triangle) pairs
+CHUNK_SIZE = 100000
+
+#: the ray directions used by ``is_inside``; they're skewed, so a ray
+#: doesn't run along the edges of an axis aligned mesh
+INSIDE_DIRECTIONS = np.array([
+    [0.267261241912, 0.534522483825, 0.801783725737],
+    [-0.801783725737, 0.267261241912, 0.534522483825],
+    [0.534522483825, -0.801783725737, -0.267261241912],
+])
+
+
+class ShellTree(object):
+    """
+    A spatial index of the shell elements
+
+    Attributes
+    ----------
+    eids : (ntris, ) int ndarray
+        the element id of each triangle
+    xyz1, xyz2, xyz3 : (ntris, 3) float ndarray
+        the corners of the triangles in the global frame
+    centroids : (ntris, 3) float ndarray
+        the centroids of the triangles
+    radii : (ntris, ) float ndarray
+        the largest distance from the centroid to a corner
+    tree : cKDTree
+        the KD-tree of the centroids
+    groups : List[(itris, radius, tree)]
+        itris : (n, ) int ndarray
+            the triangles in the group
+        radius : float
+            the largest radius of the triangles in the group
+        tree : cKDTree
+            the KD-tree of the centroids of the triangles
+    """
+    def __init__(self, model, element_ids=None, xref=True):
+        """
+        Creates the ShellTree
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+        element_ids : List[int]; default=None -> all
+            the element ids to consider; elements that aren't shells
+            are skipped
+        xref : bool; default=True
+            has the model been cross referenced
+        """
+        self.model = model
+        if element_ids is None:
+            element_ids = model.elements.keys()
+
+        nodes_by_type = defaultdict(list)
+        eids_by_type = defaultdict(list)
+        for eid in element_ids:
+            elem = model.elements[eid]
+            if elem.type not in SHELL_TRIANGLES:
+                continue
+            nodes_by_type[elem.type].append(elem.node_ids)
+            eids_by_type[elem.type].append(eid)
+
+        all_nids = [np.zeros((0, 3), dtype='int64')]
+        all_eids = [np.zeros(0, dtype='int64')]
+        for etype, node_ids in sorted(iteritems(nodes_by_type)):
+            triangles = SHELL_TRIANGLES[etype]
+            nnodes = 3 if len(triangles) == 1 else 4
+            nodes = np.array([nids[:nnodes] for nids in node_ids], dtype='int64')
+            all_nids.append(nodes[:, triangles].reshape(-1, 3))
+            all_eids.append(np.repeat(np.array(eids_by_type[etype], dtype='int64'),
+                                      len(triangles)))
+        tri_nids = np.vstack(all_nids)
+        self.eids = np.hstack(all_eids)
+        if len(self.eids) == 0:
+            raise RuntimeError('no shell elements were found')
+
+        node_store = model.node_store
+        xyz = node_store.get_xyz_in_coord(cid=0, xref=xref)
+        inode = node_store.get_node_index(tri_nids.ravel()).reshape(tri_nids.shape)
+        self.xyz1 = xyz[inode[:, 0], :]
+        self.xyz2 = xyz[inode[:, 1], :]
+        self.xyz3 = xyz[inode[:, 2], :]
+        self.centroids = (self.xyz1 + self.xyz2 + self.xyz3) / 3.
+        self.radii = np.sqrt(np.max([
+            ((self.xyz1 - self.centroids) ** 2).sum(axis=1),
+            ((self.xyz2 - self.centroids) ** 2).sum(axis=1),
+            ((self.xyz3 - self.centroids) ** 2).sum(axis=1),
+        ], axis=0))
+
+        self.tree = _get_tree(self.centroids, msg=', which is required by ShellTree')
+
+        # group the triangles by powers of 2 of the radius, so a few
+        # big triangles don't increase the candidates of the others
+        radii = np.maximum(self.radii, self.radii.max() * 1e-6)
+        levels = np.floor(np.log2(radii)).astype('int64')
+        self.groups = []
+        for level in np.unique(levels):
+            itris = np.where(levels == level)[0]
+            tree = _get_tree(self.centroids[itris, :], msg=', which is required by ShellTree')
+            self.groups.append((itris, self.radii[itris].max(), tree))
+        self._projected_groups = {}
+
+    def pierce(self, xyz_points, direction, is_ray=False):
+        """
+        Pierces the shells with lines/rays
+
+        Parameters
+        ----------
+        xyz_points : (npoints, 3) float ndarray
+            the points to pierce from
+        direction : (3, ) float ndarray
+            the pierce vector
+        is_ray : bool; default=False
+            False : pierce a line through the point and return the
+                    pierce that's the furthest along direction
+            True : pierce a ray from the point and return the first
+                   pierce along direction
+
+        Returns
+        -------
+        eids : (npoints, ) int ndarray
+            the pierced element id; -1 for a failed pierce
+        xyz_pierce : (npoints, 3) float ndarray
+            the pierce location; nan for a failed pierce
+        """
+        xyz_points, direction = _get_points_direction(xyz_points, direction)
+        npoints = len(xyz_points)
+        eids = np.full(npoints, -1, dtype='int64')
+        xyz_pierce = np.full((npoints, 3), np.nan, dtype='float64')
+        for ichunk in range(0, npoints, CHUNK_SIZE):
+            xyz = xyz_points[ichunk:ichunk + CHUNK_SIZE, :]
+            ipoint, itri, t = self._get_pierces(xyz, direction)
+            if is_ray:
+                is_ahead = t >= 0.
+                ipoint, itri, t = ipoint[is_ahead], itri[is_ahead], t[is_ahead]
+                iorder = np.lexsort((t, ipoint))
+            else:
+                iorder = np.lexsort((-t, ipoint))
+
+            # the first pierce of each point
+            ipoint, ifirst = np.unique(ipoint[iorder], return_index=True)
+            ipierce = iorder[ifirst]
+            ipoint += ichunk
+            eids[ipoint] = self.eids[itri[ipierce]]
+            xyz_pierce[ipoint, :] = (
+                xyz_points[ipoint, :] + np.outer(t[ipierce], direction))
+        return eids, xyz_pierce
+
+    def get_closest_elements(self, xyz_points):
+        """
+        Projects points onto the closest shell element
+
+        Parameters
+        ----------
+        xyz_points : (npoints, 3) float ndarray
+            the points to project
+
+        Returns
+        -------
+        eids : (npoints, ) int ndarray
+            the closest element id
+        xyz_closest : (npoints, 3) float ndarray
+            the closest point on the element
+        distance : (npoints, ) float ndarray
+            the distance to the closest point
+        """
+        xyz_points = np.asarray(xyz_points, dtype='float64').reshape(-1, 3)
+        npoints = len(xyz_points)
+        eids = np.zeros(npoints, dtype='int64')
+        xyz_closest = np.zeros((npoints, 3), dtype='float64')
+        distance = np.zeros(npoints, dtype='float64')
+        for ichunk in range(0, npoints, CHUNK_SIZE):
+            xyz = xyz_points[ichunk:ichunk + CHUNK_SIZE, :]
+            itri, xyz_closesti, distancei = self._get_closest(xyz)
+            irows = slice(ichunk, ichunk + len(xyz))
+            eids[irows] = self.eids[itri]
+            xyz_closest[irows, :] = xyz_closesti
+            distance[irows] = distancei
+        return eids, xyz_closest, distance
+
+    def is_inside(self, xyz_points, directions=None):
+        """
+        Determines if points are inside a closed shell model by
+        counting the pierces of rays from the points.  An odd count is
+        inside.  The rays are cast in 3 directions and the majority is
+        used, so a ray through an edge/corner doesn't change the answer.
+
+        Parameters
+        ----------
+        xyz_points : (npoints, 3) float ndarray
+            the points to check
+        directions : (ndirections, 3) float ndarray; default=None
+            the ray directions (an odd number)
+            None : use 3 skewed directions
+
+        Returns
+        -------
+        is_inside : (npoints, ) bool ndarray
+            is the point inside the model
+        """
+        if directions is None:
+            directions = INSIDE_DIRECTIONS
+        directions = np.asarray(directions, dtype='float64').reshape(-1, 3)
+        xyz_points = np.asarray(xyz_points, dtype='float64').reshape(-1, 3)
+        npoints = len(xyz_points)
+        nvotes = np.zeros(npoints, dtype='int64')
+        for direction in directions:
+            unused_xyz_points, direction = _get_points_direction(xyz_points, direction)
+            for ichunk in range(0, npoints, CHUNK_SIZE):
+                xyz = xyz_points[ichunk:ichunk + CHUNK_SIZE, :]
+                ipoint, itri, t = self._get_pierces(xyz, direction)
+                ipoint = ipoint[t > 0.]
+                itri = itri[t > 0.]
+
+                # a ray through the diagonal of a quad pierces it once
+                unused_keys, ipierce = np.unique(
+                    pack_rows(np.column_stack([ipoint, self.eids[itri]])),
+                    return_index=True)
+                npierces = np.bincount(ipoint[ipierce], minlength=len(xyz))
+                nvotes[ichunk:ichunk + len(xyz)] += npierces % 2
+        return 2 * nvotes > len(directions)
+
+    def _get_pierces(self, xyz_points, direction):
+        """
+        Pierces the candidate triangles with lines through the points
+
+        Returns
+        -------
+        ipoint : (npierces, ) int ndarray
+            the point of each pierce
+        itri : (npierces, ) int ndarray
+            the triangle of each pierce
+        t : (npierces, ) float ndarray
+            the distance along direction to the pierce
+        """
+        # a line can only pierce a triangle if the projected distance
+        # to the centroid is less than the radius
+        axes = _get_projection_axes(direction)
+        xy_points = np.dot(xyz_points, axes.T)
+        all_ipoints = []
+        all_itris = []
+        for itris, radius, tree in self._get_projected_groups(direction):
+            ipoint, itri = _query_pairs(tree, xy_points, radius)
+            all_ipoints.append(ipoint)
+            all_itris.append(itris[itri])
+        ipoint = np.hstack(all_ipoints)
+        itri = np.hstack(all_itris)
+
+        is_pierced, t = _pierce_triangles(
+            xyz_points[ipoint, :], direction,
+            self.xyz1[itri, :], self.xyz2[itri, :], self.xyz3[itri, :])
+        return ipoint[is_pierced], itri[is_pierced], t[is_pierced]
+
+    def _get_closest(self, xyz_points):
+        """helper method for ``get_closest_elements``"""
+        # the distance to the triangle with the closest centroid is an
+        # upper bound, so a closer triangle has a centroid within
+        # distance0 + radius
+        unused_centroid_distance, itri0 = self.tree.query(xyz_points)
+        xyz_closest = _closest_point_on_triangles(
+            xyz_points, self.xyz1[itri0, :], self.xyz2[itri0, :], self.xyz3[itri0, :])
+        distance0 = np.sqrt(((xyz_points - xyz_closest) ** 2).sum(axis=1))
+        distance0[np.isnan(distance0)] = np.inf
+
+        all_ipoints = []
+        all_itris = []
+        for itris, radius, tree in self.groups:
+            ipoint, itri = _query_pairs(tree, xyz_points, distance0 + radius)
+            all_ipoints.append(ipoint)
+            all_itris.append(itris[itri])
+        ipoint = np.hstack(all_ipoints)
+        itri = np.hstack(all_itris)
+
+        xyz_closest = _closest_point_on_triangles(
+            xyz_points[ipoint, :], self.xyz1[itri, :], self.xyz2[itri, :], self.xyz3[itri, :])
+        distance = np.sqrt(((xyz_points[ipoint, :] - xyz_closest) ** 2).sum(axis=1))
+        distance[np.isnan(distance)] = np.inf
+
+        iorder = np.lexsort((distance, ipoint))
+        ipoint, ifirst = np.unique(ipoint[iorder], return_index=True)
+        iclosest = iorder[ifirst]
+        assert len(ipoint) == len(xyz_points), 'a point was not projected'
+        return itri[iclosest], xyz_closest[iclosest, :], distance[iclosest]
+
+    def _get_projected_groups(self, direction):
+        """
+        Gets the KD-trees of the centroids of each group, which are
+        projected into the plane normal to the direction
+        """
+        key = tuple(direction)
+        try:
+            return self._projected_groups[key]
+        except KeyError:
+            pass
+        axes = _get_projection_axes(direction)
+        groups = []
+        for itris, radius, unused_tree in self.groups:
+            xy_centroids = np.dot(self.centroids[itris, :], axes.T)
+            tree = _get_tree(xy_centroids, msg=', which is required by ShellTree')
+            groups.append((itris, radius, tree))
+        if len(self._projected_groups) > 4:
+            self._projected_groups = {}
+        self._projected_groups[key] = groups
+        return groups
+
+    def __repr__(self):
+        msg = 'ShellTree(neids=%s, ntris=%s, ngroups=%s)' % (
+            len(np.unique(self.eids)), len(self.eids), len(self.groups))
+        return msg
+
+
+def _get_points_direction(xyz_points, direction):
+    """checks the points and normalizes the direction"""
+    xyz_points = np.asarray(xyz_points, dtype='float64').reshape(-1, 3)
+    direction = np.asarray(direction, dtype='float64').ravel()
+    assert direction.shape == (3, ), direction.shape
+    magnitude = np.linalg.norm(direction)
+    if magnitude == 0.:
+        raise RuntimeError('direction=%s has no length' % direction)
+    return xyz_points, direction / magnitude
+
+
+def _get_projection_axes(direction):
+    """gets 2 unit vectors that are normal to the (unit) direction"""
+    iaxis = np.argmin(np.abs(direction))
+    axis = np.zeros(3, dtype='float64')
+    axis[iaxis] = 1.
+    u = np.cross(direction, axis)
+    u /= np.linalg.norm(u)
+    v = np.cross(direction, u)
+    return np.array([u, v])
+
+
+def _query_pairs(tree, xyz_points, radius):
+    """
+    Gets the (point, centroid) pairs that are within the radius
+
+    Parameters
+    ----------
+    tree : cKDTree
+        the KD-tree of the centroids
+    xyz_points : (npoints, ndim) float ndarray
+        the points
+    radius : float / (npoints, ) float ndarray
+        the search radius of the points
+
+    Returns
+    -------
+    ipoint : (npairs, ) int ndarray
+        the point of each pair
+    icentroid : (npairs, ) int ndarray
+        the centroid of each pair
+    """
+    results = tree.query_ball_point(xyz_points, radius)
+    nresults = np.array([len(result) for result in results], dtype='int64')
+    ipoint = np.repeat(np.arange(len(xyz_points)), nresults)
+    icentroid = np.fromiter(chain.from_iterable(results), dtype='int64',
+                            count=nresults.sum())
+    return ipoint, icentroid
+
+
+def _pierce_triangles(xyz_points, direction, xyz1, xyz2, xyz3):
+    """
+    Pierces triangles with lines using the Moller-Trumbore algorithm,
+    which is the vectorized version of ``triangle_intersection``
+
+    Parameters
+    ----------
+    xyz_points : (n, 3) float ndarray
+        the points to pierce
+    direction : (3, ) float ndarray
+        the pierce vector
+    xyz1, xyz2, xyz3 : (n, 3) float ndarray
+        the xyz points of the triangles
+
+    Returns
+    -------
+    is_pierced : (n, ) bool ndarray
+        was the triangle pierced
+    t : (n, ) float ndarray
+        the pierce location is xyz_points + direction * t
+    """
+    e1 = xyz2 - xyz1
+    e2 = xyz3 - xyz1
+    pvec = np.cross(direction, e2)
+    det = (e1 * pvec).sum(axis=1)
+
+    # the line is parallel to the plane; det scales with the size of the
+    # triangle and the direction vector, so the tolerance does too
+    tol = 1e-10 * np.linalg.norm(direction) * (
+        np.linalg.norm(e1, axis=1) * np.linalg.norm(e2, axis=1))
+    is_pierced = np.abs(det) > tol
+    inv_det = np.zeros(len(det), dtype='float64')
+    inv_det[is_pierced] = 1. / det[is_pierced]
+
+    tvec = xyz_points - xyz1
+    u = (tvec * pvec).sum(axis=1) * inv_det
+    qvec = np.cross(tvec, e1)
+    v = np.dot(qvec, direction) * inv_det
+    t = (e2 * qvec).sum(axis=1) * inv_det
+    is_pierced &= (u >= 0.) & (u <= 1.) & (v >= 0.) & (u + v <= 1.)
+    return is_pierced, t
+
+
+def _closest_point_on_triangles(xyz_points, a, b, c):
+    """
+    Gets the closest point on triangles using the Voronoi regions of
+    the corners and edges (Ericson, Real-Time Collision Detection, 5.1.5)
+
+    Parameters
+    ----------
+    xyz_points : (n, 3) float ndarray
+        the points
+    a, b, c : (n, 3) float ndarray
+        the corners of the triangles
+
+    Returns
+    -------
+    xyz_closest : (n, 3) float ndarray
+        the closest point on the triangles
+    """
+    ab = b - a
+    ac = c - a
+    ap = xyz_points - a
+    bp = xyz_points - b
+    cp = xyz_points - c
+    d1 = (ab * ap).sum(axis=1)
+    d2 = (ac * ap).sum(axis=1)
+    d3 = (ab * bp).sum(axis=1)
+    d4 = (ac * bp).sum(axis=1)
+    d5 = (ab * cp).sum(axis=1)
+    d6 = (ac * cp).sum(axis=1)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # the face region; the other regions are applied in reverse
+        # order, so the earlier regions take priority
+        denom = va + vb + vc
+        v = vb / denom
+        w = vc / denom
+        xyz_closest = a + ab * v[:, np.newaxis] + ac * w[:, np.newaxis]
+
+        # edge bc
+        d43 = d4 - d3
+        d56 = d5 - d6
+        i = (va <= 0.) & (d43 >= 0.) & (d56 >= 0.)
+        w = d43[i] / (d43[i] + d56[i])
+        xyz_closest[i, :] = b[i, :] + (c[i, :] - b[i, :]) * w[:, np.newaxis]
+
+        # edge ac
+        i = (vb <= 0.) & (d2 >= 0.) & (d6 <= 0.)
+        w = d2[i] / (d2[i] - d6[i])
+        xyz_closest[i, :] = a[i, :] + ac[i, :] * w[:, np.newaxis]
+
+        # corner c
+        i = (d6 >= 0.) & (d5 <= d6)
+        xyz_closest[i, :] = c[i, :]
+
+        # edge ab
+        i = (vc <= 0.) & (d1 >= 0.) & (d3 <= 0.)
+        v = d1[i] / (d1[i] - d3[i])
+        xyz_closest[i, :] = a[i, :] + ab[i, :] * v[:, np.newaxis]
+
+        # corner b
+        i = (d3 >= 0.) & (d4 <= d3)
+        xyz_closest[i, :] = b[i, :]
+
+        # corner a
+        i = (d1 <= 0.) & (d2 <= 0.)
+        xyz_closest[i, :] = a[i, :]
+    return xyz_closest
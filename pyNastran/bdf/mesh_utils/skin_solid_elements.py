@@ -1,15 +1,37 @@
 """
 defines:
+ - write_skin_solid_faces(model, skin_filename,
+                          write_solids=False, write_shells=True,
+                          size=8, is_double=False, encoding=None)
  - get_solid_skin_faces(model)
+ - get_solid_faces_array(model, element_ids=None)
+ - get_solid_free_faces(model, element_ids=None)
 """
 from __future__ import print_function
 from collections import defaultdict
-from copy import deepcopy
 from six import PY2, iteritems
 from codecs import open
+import numpy as np
 
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
+from pyNastran.bdf.mesh_utils.free_edges import pack_rows
+
+#: the number of corner nodes and the corner nodes of each face; the faces
+#: are in the same order as ``elem.faces`` and the nodes of each face are
+#: ordered so the normal points out of the element
+SOLID_FACES = {
+    'CTETRA4' : (4, [[0, 1, 3], [0, 3, 2], [1, 2, 3], [0, 2, 1]]),
+    'CTETRA10' : (4, [[0, 2, 1], [0, 1, 3], [1, 2, 3], [2, 0, 3]]),
+    'CPYRAM5' : (5, [[0, 3, 2, 1], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]]),
+    'CPYRAM13' : (5, [[0, 3, 2, 1], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]]),
+    'CPENTA6' : (6, [[0, 2, 1], [3, 4, 5], [0, 1, 4, 3], [1, 2, 5, 4], [2, 0, 3, 5]]),
+    'CPENTA15' : (6, [[0, 2, 1], [3, 4, 5], [0, 1, 4, 3], [1, 2, 5, 4], [2, 0, 3, 5]]),
+    'CHEXA8' : (8, [[0, 3, 2, 1], [0, 1, 5, 4], [1, 2, 6, 5],
+                    [2, 3, 7, 6], [3, 0, 4, 7], [4, 5, 6, 7]]),
+    'CHEXA20' : (8, [[0, 3, 2, 1], [0, 1, 5, 4], [1, 2, 6, 5],
+                     [2, 3, 7, 6], [3, 0, 4, 7], [4, 5, 6, 7]]),
+}
 
 
 def write_skin_solid_faces(model, skin_filename,
@@ -123,45 +145,106 @@ def get_solid_skin_faces(model):
        face : List(int, int, ...)
            the face nids
     """
-    eid_faces = model.get_element_faces()
-    face_set = defaultdict(int)
+    faces, face_eids, face_ids = get_solid_faces_array(model)
+    unused_keys, inverse, counts = np.unique(
+        pack_rows(np.sort(faces, axis=1)), return_inverse=True, return_counts=True)
+
+    # a face that's used by 2 elements is internal
+    is_skin = counts[inverse] != 2
+
     eid_set = defaultdict(list)
     face_map = {}
-    for eid, face in eid_faces:
-        #print(eid, face)
-        raw_face = deepcopy(face)
-        try:
-            face.sort()
-        except:
-            print('face = %s' % str(face))
-            raise
-        tface = tuple(face)
-        #print(tface)
-        face_set[tface] += 1
+    for eid, face_id in zip(face_eids[is_skin].tolist(), face_ids[is_skin].tolist()):
+        face = model.elements[eid].faces[face_id]
+        tface = tuple(sorted(face))
         eid_set[tface].append(eid)
-        face_map[tface] = raw_face
+        face_map[tface] = face
+    return eid_set, face_map
 
-    #print('eid_set:')
-    #for tface, eidset in iteritems(eid_set):
-        #print(tface, eidset)
 
-    #print('face_set:')
-    #for tface, faceset in iteritems(face_set):
-        #print(tface, faceset)
+def get_solid_faces_array(model, element_ids=None):
+    """
+    Gets the faces of the solid elements.  This includes internal faces.
 
-    #print('face_map:')
-    #for tface, facemap in iteritems(face_map):
-        #print(tface, facemap)
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    element_ids : List[int]; default=None -> all
+        the element ids to consider
 
-    del_faces = []
-    for face, face_count in iteritems(face_set):
-        if face_count == 2:
-            del_faces.append(face)
+    Returns
+    -------
+    faces : (nfaces, 4) int ndarray
+        the corner node ids of every face in the order of ``elem.faces``;
+        the normal points out of the element and the 4th node of a
+        triangular face is 0
+    face_eids : (nfaces, ) int ndarray
+        the element id of each face
+    face_ids : (nfaces, ) int ndarray
+        the face id (the key in ``elem.faces``) of each face
+    """
+    if element_ids is None:
+        element_ids = model.elements.keys()
+    nodes_by_class = defaultdict(list)
+    eids_by_class = defaultdict(list)
+    for eid in element_ids:
+        elem = model.elements[eid]
+        if elem.type not in ['CTETRA', 'CPENTA', 'CHEXA', 'CPYRAM']:
+            continue
+        class_name = elem.__class__.__name__
+        nodes_by_class[class_name].append(elem.node_ids)
+        eids_by_class[class_name].append(eid)
+
+    all_faces = [np.zeros((0, 4), dtype='int64')]
+    all_eids = [np.zeros(0, dtype='int64')]
+    all_face_ids = [np.zeros(0, dtype='int64')]
+    for class_name, node_ids in sorted(iteritems(nodes_by_class)):
+        nelements = len(node_ids)
+        ncorners, element_faces = SOLID_FACES[class_name]
+        nodes = np.array([nids[:ncorners] for nids in node_ids], dtype='int64')
+
+        # append a column of 0s, so the 4th node of a tri face is 0
+        nodes = np.hstack([nodes, np.zeros((nelements, 1), dtype='int64')])
+        inodes = [face + [-1] * (4 - len(face)) for face in element_faces]
+        faces = nodes[:, inodes].reshape(-1, 4)
+
+        nfaces = len(element_faces)
+        all_faces.append(faces)
+        all_eids.append(np.repeat(np.array(eids_by_class[class_name], dtype='int64'), nfaces))
+        all_face_ids.append(np.tile(np.arange(1, nfaces + 1, dtype='int64'), nelements))
+    faces = np.vstack(all_faces)
+    face_eids = np.hstack(all_eids)
+    face_ids = np.hstack(all_face_ids)
+    return faces, face_eids, face_ids
+
+
+def get_solid_free_faces(model, element_ids=None):
+    """
+    Gets the faces of the solid elements that are used by one element.
+    Faces are matched by their corner nodes.
 
-    for face in del_faces:
-        del face_set[face]
-        del eid_set[face]
-    return eid_set, face_map
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    element_ids : List[int]; default=None -> all
+        the element ids to consider
+
+    Returns
+    -------
+    faces : (nfree, 4) int ndarray
+        the corner node ids of the free faces in the order of
+        ``elem.faces``; the normal points out of the element and
+        the 4th node of a triangular face is 0
+    face_eids : (nfree, ) int ndarray
+        the element id of each free face
+    """
+    faces, face_eids, unused_face_ids = get_solid_faces_array(model, element_ids=element_ids)
+    unused_keys, iface, counts = np.unique(
+        pack_rows(np.sort(faces, axis=1)), return_index=True, return_counts=True)
+    ifree = np.sort(iface[counts == 1])
+    return faces[ifree, :], face_eids[ifree]
 
 
 def _write_skin_solid_faces(model, skin_filename, face_map,
@@ -4,6 +4,8 @@ import os
 import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.mesh_utils.mass_properties import (
+    _mass_properties, _mass_properties_elements_init)
 from pyNastran.utils import object_methods
 
 rootpath = pyNastran.__path__[0]
@@ -162,5 +164,49 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_mass_breakdown(self):
+        """tests the array based mass properties against the element methods"""
+        model = BDF(debug=False, log=None)
+        bdfname = os.path.join(mesh_utils_path, 'test_mass.dat')
+        model.read_bdf(bdfname, xref=False)
+        model.add_prod(5, 2, 0.5, nsm=0.2)
+        model.add_crod(10, 5, [1, 3])
+        model.add_conrod(11, 2, [2, 4], A=2.0)
+        model.add_conm2(12, 11, 2.0, X=[0., 0., 1.])
+        model.add_conm2(13, 12, 3.0, cid=-1, X=[1., 2., 3.])
+        model.cross_reference()
+
+        reference_point = np.array([1., 2., 3.])
+        elements, masses = _mass_properties_elements_init(model, None, None)
+        mass1, cg1, I1 = _mass_properties(model, elements, masses, reference_point)
+        mass, cg, I, breakdown = model.mass_properties_breakdown(
+            reference_point=reference_point, scale=1.0)
+        assert np.allclose(mass, mass1), 'mass=%s expected=%s' % (mass, mass1)
+        assert np.allclose(cg, cg1), 'cg=%s expected=%s' % (cg, cg1)
+        assert np.allclose(I, I1), 'I=%s expected=%s' % (I, I1)
+
+        assert sorted(breakdown) == [0, 1, 2, 3, 4, 5], sorted(breakdown)
+        assert np.allclose(sum(value[0] for value in breakdown.values()), mass)
+        assert np.allclose(sum(value[2] for value in breakdown.values()), I)
+
+        # CONROD + CONM2s
+        conrod_mass = model.elements[11].Mass()
+        assert np.allclose(breakdown[0][0], conrod_mass + 5.), breakdown[0]
+        assert np.allclose(breakdown[5][0], (0.1 * 0.5 + 0.2) * np.sqrt(2.)), breakdown[5]
+
+        mass2, cg2, I2 = model.mass_properties(reference_point='cg', scale=1.0)
+        assert np.allclose(mass2, mass)
+        assert np.allclose(cg2, cg)
+
+        groups = {'shells' : [1, 2, 3, 4, 5, 6], 'masses' : [12, 13]}
+        breakdown = model.mass_properties_breakdown(
+            reference_point=reference_point, group_by=groups, scale=1.0)[3]
+        assert np.allclose(breakdown['masses'][0], 5.), breakdown['masses']
+        assert np.allclose(breakdown['masses'][1], [0.6, 1.2, 2.2]), breakdown['masses']
+
+        breakdown = model.mass_properties_breakdown(group_by='type', scale=1.0)[3]
+        assert sorted(breakdown) == ['CHEXA', 'CONM2', 'CONROD', 'CPENTA',
+                                     'CQUAD4', 'CROD', 'CTETRA', 'CTRIA3'], sorted(breakdown)
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -4,7 +4,7 @@ import os
 import unittest
 from codecs import open as codec_open
 
-from six import StringIO, iteritems
+from six import StringIO, iteritems, itervalues
 import numpy as np
 #import pyNastran
 #from pyNastran.bdf.bdf import BDF
@@ -18,9 +18,14 @@ from pyNastran.bdf.mesh_utils.bdf_equivalence import bdf_equivalence_nodes
 from pyNastran.bdf.mesh_utils.collapse_bad_quads import convert_bad_quads_to_tris
 from pyNastran.bdf.mesh_utils.delete_bad_elements import get_bad_shells
 from pyNastran.bdf.mesh_utils.export_mcids import export_mcids
+from pyNastran.bdf.mesh_utils.extract_bodies import extract_bodies, get_body_labels
+from pyNastran.bdf.mesh_utils.free_edges import free_edges, get_free_edges_array
+from pyNastran.bdf.mesh_utils.skin_solid_elements import (
+    get_solid_faces_array, get_solid_free_faces, get_solid_skin_faces)
 from pyNastran.bdf.mesh_utils.split_cbars_by_pin_flag import split_cbars_by_pin_flag
 from pyNastran.bdf.mesh_utils.split_elements import split_line_elements
 from pyNastran.bdf.mesh_utils.pierce_shells import pierce_shell_model, quad_intersection, triangle_intersection
+from pyNastran.bdf.mesh_utils.shell_tree import ShellTree
 from pyNastran.utils.log import SimpleLogger
 
 # testing these imports are up to date
@@ -351,6 +356,189 @@ class TestMeshUtils(unittest.TestCase):
         os.remove(bdf_filename)
         os.remove(bdf_filename_out)
 
+    def test_eq5(self):
+        """collapses clusters that are bigger than neq_max and chains"""
+        model = BDF(log=log, debug=False)
+        # 6 coincident nodes
+        for nid in [16, 15, 14, 13, 12, 11]:
+            model.add_grid(nid, [0., 0., 0.])
+
+        # a chain: 21-22 and 22-23 are within tol, but 21-23 are not
+        model.add_grid(21, [1., 0., 0.])
+        model.add_grid(22, [1.15, 0., 0.])
+        model.add_grid(23, [1.3, 0., 0.])
+        model.add_grid(30, [2., 0., 0.])
+
+        model.add_ctria3(1, 100, [16, 23, 30])
+        model.add_ctria3(2, 100, [11, 22, 30])
+        model.add_pshell(100, mid1=1000, t=0.1)
+        model.add_mat1(1000, 3.0e7, None, 0.3)
+        model.add_spc1(1, '123', [13, 21])
+        model.add_force(2, 15, 1., [0., 0., 1.])
+
+        tol = 0.2
+        model = bdf_equivalence_nodes(model, None, tol,
+                                      renumber_nodes=False, neq_max=4, xref=True,
+                                      node_set=None, crash_on_collapse=False,
+                                      log=log, debug=False)
+        assert model.elements[1].node_ids == [11, 21, 30], model.elements[1].node_ids
+        assert model.elements[2].node_ids == [11, 21, 30], model.elements[2].node_ids
+        assert model.spcs[1][0].node_ids == [11, 21], model.spcs[1][0].node_ids
+        assert model.loads[2][0].node_id == 11, model.loads[2][0].node_id
+        assert np.allclose(model.nodes[23].get_position(), [1., 0., 0.])
+
+    def test_free_edges(self):
+        """gets the free edges of a quad and a tri"""
+        model = BDF(log=log, debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [2., 0., 0.])
+        model.add_cquad4(10, 100, [1, 2, 3, 4])
+        model.add_ctria3(11, 100, [2, 5, 3])
+        model.add_pshell(100, mid1=1000, t=0.1)
+        model.add_mat1(1000, 3.0e7, None, 0.3)
+
+        edges, eids = get_free_edges_array(model)
+        assert edges.tolist() == [[1, 2], [3, 4], [1, 4], [2, 5], [3, 5]], edges.tolist()
+        assert eids.tolist() == [10, 10, 10, 11, 11], eids.tolist()
+        assert free_edges(model, eids=[11]) == [(2, 5), (3, 5), (2, 3)]
+
+        # the CTRIAX6 corners are nodes 1, 3, and 5 and the midside
+        # nodes are optional
+        model.add_grid(6, [2., 1., 0.])
+        model.add_ctriax6(12, 1000, [5, None, 6, None, 3, None])
+        edges, eids = get_free_edges_array(model)
+        assert edges.tolist() == [[1, 2], [3, 4], [1, 4], [2, 5], [5, 6], [3, 6]], edges.tolist()
+        assert eids.tolist() == [10, 10, 10, 11, 12, 12], eids.tolist()
+
+    def test_free_faces(self):
+        """gets the free faces of 2 hexas and a penta"""
+        model = BDF(log=log, debug=False)
+        nid = 1
+        for z in [0., 1.]:
+            for y in [0., 1.]:
+                for x in [0., 1., 2., 3.]:
+                    model.add_grid(nid, [x, y, z])
+                    nid += 1
+        # nodes 1-4 are at y=0, z=0; 5-8 at y=1, z=0; 9-16 are at z=1
+        model.add_chexa(1, 100, [1, 2, 6, 5, 9, 10, 14, 13])
+        model.add_chexa(2, 100, [2, 3, 7, 6, 10, 11, 15, 14])
+        model.add_cpenta(3, 100, [3, 4, 7, 11, 12, 15])
+        model.add_psolid(100, 1000)
+        model.add_mat1(1000, 3.0e7, None, 0.3)
+
+        faces, eids = get_solid_free_faces(model)
+        assert len(faces) == 13, len(faces)
+        assert eids.tolist() == [1] * 5 + [2] * 4 + [3] * 4, eids.tolist()
+
+        # the tri faces of the penta have a 0 for the 4th node
+        assert faces[-4:, :].tolist() == [
+            [3, 7, 4, 0],
+            [11, 12, 15, 0],
+            [3, 4, 12, 11],
+            [4, 7, 15, 12],
+        ], faces[-4:, :].tolist()
+
+        # the normals point out of the elements
+        for face, eid in zip(faces, eids):
+            nids = face[face > 0]
+            xyz = np.array([model.nodes[nid].xyz for nid in nids])
+            normal = np.cross(xyz[1, :] - xyz[0, :], xyz[-1, :] - xyz[0, :])
+            centroid = np.array([
+                model.nodes[nid].xyz for nid in model.elements[eid].node_ids]).mean(axis=0)
+            assert np.dot(normal, xyz.mean(axis=0) - centroid) > 0., (eid, face)
+
+        eid_set, face_map = get_solid_skin_faces(model)
+        assert len(eid_set) == 13, len(eid_set)
+        assert (2, 6, 10, 14) not in eid_set
+        assert (3, 7, 11, 15) not in eid_set
+        assert eid_set[(3, 4, 7)] == [3], eid_set[(3, 4, 7)]
+        assert face_map[(3, 4, 7)] == [3, 4, 7], face_map[(3, 4, 7)]
+
+    def test_solid_face_normals(self):
+        """the faces of every solid element type point out of the element"""
+        corners = {
+            'CTETRA' : [[0., 0., 0.], [1., 0., 0.], [0., 1., 0.], [0., 0., 1.]],
+            'CPYRAM' : [[0., 0., 0.], [1., 0., 0.], [1., 1., 0.], [0., 1., 0.],
+                        [0.5, 0.5, 1.]],
+            'CPENTA' : [[0., 0., 0.], [1., 0., 0.], [0., 1., 0.],
+                        [0., 0., 1.], [1., 0., 1.], [0., 1., 1.]],
+            'CHEXA' : [[0., 0., 0.], [1., 0., 0.], [1., 1., 0.], [0., 1., 0.],
+                       [0., 0., 1.], [1., 0., 1.], [1., 1., 1.], [0., 1., 1.]],
+        }
+        nnodes = [
+            ('CTETRA', 4), ('CTETRA', 10), ('CPYRAM', 5), ('CPYRAM', 13),
+            ('CPENTA', 6), ('CPENTA', 15), ('CHEXA', 8), ('CHEXA', 20),
+        ]
+        model = BDF(log=log, debug=False)
+        nid = 1
+        for eid, (etype, nnodesi) in enumerate(nnodes, start=1):
+            nids = []
+            for inode in range(nnodesi):
+                # the midside nodes are at the centroid of the corners
+                xyz = np.array(corners[etype])
+                xyz = xyz[inode, :] if inode < len(xyz) else xyz.mean(axis=0)
+                model.add_grid(nid, xyz + 10. * eid)
+                nids.append(nid)
+                nid += 1
+            getattr(model, 'add_' + etype.lower())(eid, 100, nids)
+        model.add_psolid(100, 1000)
+        model.add_mat1(1000, 3.0e7, None, 0.3)
+
+        faces, eids, unused_face_ids = get_solid_faces_array(model)
+        assert len(faces) == 2 * (4 + 5 + 5 + 6), len(faces)
+        for face, eid in zip(faces, eids):
+            elem = model.elements[eid]
+            nids = face[face > 0]
+            xyz = np.array([model.nodes[nid].xyz for nid in nids])
+            normal = np.cross(xyz[1, :] - xyz[0, :], xyz[-1, :] - xyz[0, :])
+            dxyz = xyz.mean(axis=0) - np.array(
+                [model.nodes[nid].xyz for nid in elem.node_ids[:len(corners[elem.type])]]
+            ).mean(axis=0)
+            assert np.dot(normal, dxyz) > 0., (elem.__class__.__name__, face)
+
+    def test_extract_bodies(self):
+        """finds the bodies with/without the rigid elements, MPCs, and masses"""
+        model = BDF(log=log, debug=False)
+        for nid in range(1, 9):
+            model.add_grid(nid, [float(nid), 0., 0.])
+        model.add_conrod(1, 1000, [1, 2], A=1.0)
+        model.add_conrod(2, 1000, [2, 3], A=1.0)
+        model.add_conrod(3, 1000, [4, 5], A=1.0)
+        model.add_conrod(4, 1000, [6, 7], A=1.0)
+        model.add_mat1(1000, 3.0e7, None, 0.3)
+        model.add_rbe2(5, 3, '123456', [4])
+        model.add_mpc(10, [5, 6], ['1', '1'], [1., -1.])
+        model.add_conm2(20, 8, 1.0)
+
+        bodies = extract_bodies(model, mpc_id=None, consider_rigid=False)
+        assert len(bodies) == 3, bodies
+        assert bodies[0][0].tolist() == [1, 2], bodies
+        assert bodies[2][0].tolist() == [4], bodies
+
+        bodies = extract_bodies(model, mpc_id=None)
+        assert len(bodies) == 2, bodies
+        assert bodies[0][0].tolist() == [1, 2, 3], bodies
+        assert bodies[0][1].tolist() == [5], bodies
+
+        # all the MPCs are considered by default
+        bodies = extract_bodies(model, consider_mass=True)
+        assert len(bodies) == 2, bodies
+        assert bodies[0][0].tolist() == [1, 2, 3, 4], bodies
+        assert bodies[0][1].tolist() == [5], bodies
+        assert len(bodies[1]) == 2 and len(bodies[1][0]) == 0, bodies
+
+        nbodies, nids, nid_labels, eid_labels = get_body_labels(
+            model, mpc_id=10, consider_mass=True)
+        assert nbodies == 2, nbodies
+        assert nids.tolist() == [1, 2, 3, 4, 5, 6, 7, 8], nids
+        assert nid_labels.tolist() == [0, 0, 0, 0, 0, 0, 0, 1], nid_labels
+        assert eid_labels['elements'][1].tolist() == [0, 0, 0, 0], eid_labels
+        assert eid_labels['masses'][0].tolist() == [20], eid_labels
+        assert eid_labels['masses'][1].tolist() == [1], eid_labels
+
     def test_fix_bad_quads(self):
         """split high interior angle quads"""
         msg = [
@@ -746,7 +934,66 @@ class TestMeshUtils(unittest.TestCase):
             [0.4, 0.6, 0.],
             [-1., -1, 0.],
         ]
-        pierce_shell_model(model, xyz_points)
+        eids, xyz_pierces, node_ids = pierce_shell_model(model, xyz_points)
+        assert eids == [2, None], eids
+        assert np.allclose(xyz_pierces[0], [0.4, 0.6, 1.]), xyz_pierces
+        assert node_ids == [[5, 6, 7, 8], None], node_ids
+
+        tree = ShellTree(model)
+        eids, xyz_pierces = tree.pierce(xyz_points, [0., 0., 1.], is_ray=True)
+        assert eids.tolist() == [1, -1], eids
+        assert np.allclose(xyz_pierces[0], [0.4, 0.6, 0.]), xyz_pierces
+        assert np.isnan(xyz_pierces[1, :]).all(), xyz_pierces
+
+        # pierce the quads at 45 degrees
+        eids, xyz_pierces = tree.pierce([[0., 0.5, 0.25]], [1., 0., 1.], is_ray=True)
+        assert eids.tolist() == [3], eids
+        assert np.allclose(xyz_pierces[0], [0.25, 0.5, 0.5]), xyz_pierces
+
+        # the parallel check doesn't depend on the units
+        for node in itervalues(model.nodes):
+            node.xyz *= 1e-5
+        tree = ShellTree(model)
+        eids, xyz_pierces = tree.pierce([[0.4e-5, 0.6e-5, -1e-5]], [0., 0., 1.], is_ray=True)
+        assert eids.tolist() == [1], eids
+        assert np.allclose(xyz_pierces[0], [0.4e-5, 0.6e-5, 0.], atol=1e-12), xyz_pierces
+
+    def test_shell_tree(self):
+        """tests the closest element and inside/outside of a box"""
+        model = BDF(log=log)
+        nid = 1
+        for z in [0., 1.]:
+            for y in [0., 1.]:
+                for x in [0., 2.]:
+                    model.add_grid(nid, [x, y, z])
+                    nid += 1
+        faces = [
+            [1, 3, 4, 2], [5, 6, 8, 7],  # z=0, z=1
+            [1, 2, 6, 5], [3, 7, 8, 4],  # y=0, y=1
+            [1, 5, 7, 3], [2, 4, 8, 6],  # x=0, x=2
+        ]
+        for eid, nids in enumerate(faces, 1):
+            model.add_cquad4(eid, 10, nids)
+        model.add_pshell(10, mid1=100, t=0.1)
+        model.add_mat1(100, 3.0e7, None, 0.3)
+        model.cross_reference()
+
+        tree = ShellTree(model)
+        xyz_points = [
+            [1.0, 0.5, 0.5],
+            [0.1, 0.2, 0.4],
+            [3.0, 0.5, 0.5],
+            [1.0, -2., 0.5],
+            [1.0, 0.5, 1.0],
+        ]
+        eids, xyz_closest, distance = tree.get_closest_elements(xyz_points)
+        assert eids[1:4].tolist() == [5, 6, 3], eids
+        assert np.allclose(distance, [0.5, 0.1, 1.0, 2.0, 0.]), distance
+        assert np.allclose(xyz_closest[2, :], [2., 0.5, 0.5]), xyz_closest
+        assert np.allclose(xyz_closest[3, :], [1., 0., 0.5]), xyz_closest
+
+        is_inside = tree.is_inside(xyz_points[:4])
+        assert is_inside.tolist() == [True, True, False, False], is_inside
 
     #def test_intersect(self):
         #p0 = np.array([0,0,0], 'd')
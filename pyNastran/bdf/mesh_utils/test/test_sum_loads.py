@@ -6,7 +6,7 @@ from numpy import array, allclose, cross
 import numpy as np
 
 import pyNastran
-from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf import BDF, CaseControlDeck
 from pyNastran.bdf.bdf import CORD2C, GRID, FORCE
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
@@ -482,6 +482,62 @@ class TestLoadSum(unittest.TestCase):
         self.assertTrue(allclose(F2_expected, F), 'loadcase_id=%s F_expected=%s F=%s' % (loadcase_id, F2_expected, F))
         self.assertTrue(allclose(M2_expected, M), 'loadcase_id=%s M_expected=%s M=%s' % (loadcase_id, M2_expected, M))
 
+    def test_loads_sum_subcases(self):
+        """tests sum_forces_moments_subcases against sum_forces_moments"""
+        model = BDF(debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [2., 0.5, 0.])
+        model.add_cquad4(1, 10, [1, 2, 3, 4])
+        model.add_ctria3(2, 10, [2, 5, 3])
+        model.add_pshell(10, mid1=100, t=0.1)
+        model.add_mat1(100, 3.0e7, None, 0.3)
+        model.add_cord2r(1, rid=0, origin=[0., 0., 0.], zaxis=[0., 0., 1.],
+                         xzplane=[0., 1., 0.])
+
+        # a load set with 2 cards
+        model.add_force(1, 1, 1., [0., 0., 1.])
+        model.add_force(1, 2, 2., [0., 0., 1.])
+
+        model.add_force(2, 3, 1., [1., 0., 0.], cid=1)
+        model.add_moment(2, 4, 5., [0., 0., 1.])
+
+        model.add_pload4(3, [1], [2., 2., 2., 2.])
+        model.add_pload2(3, 3., [2])
+        model.add_load(10, 1., [2., 3.], [1, 3])
+
+        lines = [
+            'SUBCASE 1',
+            '    LOAD = 1',
+            'SUBCASE 2',
+            '    LOAD = 2',
+            'SUBCASE 3',
+            '    LOAD = 10',
+        ]
+        model.case_control_deck = CaseControlDeck(lines, log=model.log)
+        model.cross_reference()
+
+        p0 = np.array([0.5, 0.5, 1.])
+        subcase_ids, forces_moments = model.sum_forces_moments_subcases(p0)
+        assert np.array_equal(subcase_ids, [1, 2, 3]), subcase_ids
+        assert forces_moments.shape == (3, 6), forces_moments.shape
+        for i, loadcase_id in enumerate([1, 2, 10]):
+            F, M = model.sum_forces_moments(p0, loadcase_id)
+            assert np.allclose(forces_moments[i, :3], F), 'F=%s F2=%s' % (F, forces_moments[i, :3])
+            assert np.allclose(forces_moments[i, 3:], M), 'M=%s M2=%s' % (M, forces_moments[i, 3:])
+
+        # the FORCE in cid=1 acts in the global y direction
+        assert np.allclose(forces_moments[1, :3], [0., 1., 0.]), forces_moments[1, :3]
+
+        # 2*(1+2) + 3*(2*1.0 + 3*0.5)
+        assert np.allclose(forces_moments[0, 2], 3.), forces_moments[0, :3]
+        assert np.allclose(forces_moments[2, 2], 16.5), forces_moments[2, :3]
+
+        subcase_ids, forces_moments2 = model.sum_forces_moments_subcases(p0, subcase_ids=[3])
+        assert np.allclose(forces_moments2, forces_moments[2:, :])
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
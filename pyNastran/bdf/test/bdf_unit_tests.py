@@ -1,15 +1,22 @@
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
+import shutil
+import tempfile
+import types
 import unittest
+from six import PY2
+from six.moves import cPickle
 from numpy import allclose, array
 from numpy.linalg import norm  # type: ignore
 
 import pyNastran
 from pyNastran.utils import object_attributes, object_methods
 from pyNastran.bdf.cards.collpase_card import collapse_thru_by
-from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf import BDF, read_bdf, PSHELL, CQUAD4
+from pyNastran.bdf.errors import CrossReferenceError
 from pyNastran.bdf.write_path import write_include, _split_path
+from pyNastran.bdf.bdf_interface.write_mesh_bulk import get_cards_text
 
 pkg_path = pyNastran.__path__[0]
 test_path = os.path.join(pkg_path, 'bdf', 'test')
@@ -371,6 +378,277 @@ class TestBaseCard(Tester):
         expected = [1, 'THRU', 8]
         self.assertEqual(collapse_thru_by(data), expected, collapse_thru_by(data))
 
+    def test_base_card_02_slots(self):
+        """tests the __slots__ cards pickle and write the same way"""
+        model = BDF(debug=False)
+        model.add_grid(1, [0., 0., 0.], comment='grid')
+        for nid in range(2, 11):
+            model.add_grid(nid, [float(nid), 0., 0.])
+        model.add_cquad4(1, 1, [1, 2, 3, 4], comment='cquad4')
+        model.add_ctria3(2, 1, [1, 2, 3])
+        model.add_chexa(3, 2, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_ctetra(4, 2, [1, 2, 3, 4])
+        model.add_cbar(5, 3, [1, 2], [0., 1., 0.], None)
+        model.add_cbeam(6, 4, [1, 2], [0., 1., 0.], None)
+        model.add_cbush(7, 5, [1, 2], [0., 1., 0.], None)
+        model.add_conm2(8, 1, 1.0)
+        model.add_force(1, 1, 1.0, [0., 0., 1.])
+        model.add_pload4(1, [1], [1.0, None, None, None])
+
+        cards = list(model.nodes.values()) + list(model.elements.values()) + \
+            list(model.masses.values()) + model.loads[1]
+        for card in cards:
+            if card.type != 'CBEAM':
+                assert not hasattr(card, '__dict__'), card.type
+            card2 = cPickle.loads(cPickle.dumps(card, cPickle.HIGHEST_PROTOCOL))
+            self.assertEqual(card2.write_card(size=8), card.write_card(size=8))
+            self.assertEqual(card2.write_card(size=16), card.write_card(size=16))
+            self.assertEqual(card2.comment, card.comment)
+        self.assertEqual(model.nodes[1].comment, '$grid\n')
+        self.assertEqual(model.nodes[2].comment, '')
+
+        # a GRID pickled before the fields were slots
+        grid = model.nodes[2]
+        grid2 = grid.__class__.__new__(grid.__class__)
+        grid2.__setstate__({
+            'nid' : 2, 'cp' : 0, 'xyz' : array([2., 0., 0.]), 'cd' : 0,
+            'ps' : '', 'seid' : 0, 'cp_ref' : None, 'cd_ref' : None,
+            'elements_ref' : None})
+        self.assertEqual(grid2.write_card(), grid.write_card())
+
+        if not PY2:
+            from pyNastran.bdf.test.benchmark_bdf_memory import get_bytes_per_card
+            assert get_bytes_per_card('CQUAD4', ncards=100) > 0.
+
+    def test_bdf_xref_bulk(self):
+        """tests the bulk element cross referencing matches the per element one"""
+        models = []
+        for bulk_xref in [False, True]:
+            model = BDF(debug=False)
+            model._bulk_xref = bulk_xref
+            for nid in range(1, 9):
+                model.add_grid(nid, [float(nid), 0., 0.])
+            model.add_spoint([20])
+            model.add_cord2r(1, origin=[0., 0., 0.], zaxis=[0., 0., 1.],
+                             xzplane=[1., 0., 0.])
+            model.add_cquad4(1, 1, [1, 2, 3, 4])
+            model.add_cquad4(2, 1, [2, 3, 4, 5], theta_mcid=1)
+            model.add_ctria3(3, 1, [1, 2, 2])
+            model.add_chexa(4, 2, [1, 2, 3, 4, 5, 6, 7, 8])
+            model.add_ctetra(5, 2, [1, 2, 3, 4])
+            model.add_cpenta(6, 2, [1, 2, 3, 4, 5, 6])
+            model.add_celas2(7, 1.0, [20, 0])
+            model.add_pshell(1, mid1=1, t=0.1)
+            model.add_psolid(2, 1)
+            model.add_mat1(1, 3.0e7, None, 0.3)
+            model.cross_reference()
+            models.append(model)
+
+            for elem in model.elements.values():
+                if elem.type == 'CELAS2':
+                    continue
+                self.assertEqual([node.nid for node in elem.nodes_ref], elem.nodes)
+                assert elem.pid_ref is model.properties[elem.pid], elem
+            self.assertEqual(model.elements[2].theta_mcid_ref.cid, 1)
+            self.assertEqual([elem.eid for elem in model.nodes[2].elements_ref],
+                             [1, 2, 3, 3, 4, 5, 6])
+            self.assertEqual(model.nodes[8].elements_ref, [model.elements[4]])
+
+        model1, model2 = models
+        for nid, node in model1.nodes.items():
+            self.assertEqual([elem.eid for elem in node.elements_ref],
+                             [elem.eid for elem in model2.nodes[nid].elements_ref])
+
+        # the missing references are reported the same way
+        errors = []
+        for bulk_xref in [False, True]:
+            model = BDF(debug=None)
+            model._bulk_xref = bulk_xref
+            for nid in range(1, 4):
+                model.add_grid(nid, [float(nid), 0., 0.])
+            model.add_pshell(1, mid1=1, t=0.1)
+            model.add_mat1(1, 3.0e7, None, 0.3)
+            model.add_cquad4(1, 1, [1, 2, 3, 10])
+            model.add_ctria3(2, 2, [1, 2, 3])
+            model.add_ctria3(3, 1, [1, 2, 3])
+            model.cross_reference()
+            assert model.elements[3].pid_ref is model.properties[1]
+            self.assertEqual(len(model._stored_xref_errors), 2)
+            with self.assertRaises(CrossReferenceError) as error:
+                model.pop_xref_errors()
+            errors.append(str(error.exception))
+        self.assertEqual(errors[0], errors[1])
+
+    def test_bdf_xref_lazy(self):
+        """tests the *_ref attributes are resolved on first access"""
+        model = BDF(debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_cquad4(1, 1, [1, 2, 3, 4])
+        model.add_ctria3(2, 1, [1, 2, 3])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.add_force(10, 4, 1.0, [0., 0., 1.])
+        model.add_cord1r(1, 1, 2, 4)
+        model.add_spc1(100, '123', [1, 2])
+        model.cross_reference(xref='lazy')
+
+        lazy_xref = model._lazy_xref
+        cquad4 = model.elements[1]
+
+        # the CORD1R is cross referenced up front, which resolves its GRIDs
+        self.assertEqual(len(lazy_xref.resolved_cards), 3)
+
+        # the card classes aren't changed; the lazy cards use a subclass
+        assert isinstance(CQUAD4.__dict__['nodes_ref'], types.MemberDescriptorType)
+        assert type(cquad4) is not CQUAD4 and isinstance(cquad4, CQUAD4)
+        assert type(BDF(debug=False).add_cquad4(1, 1, [1, 2, 3, 4])) is CQUAD4
+
+        # pickling a lazy card doesn't cross reference it
+        cquad4_copy = cPickle.loads(cPickle.dumps(cquad4))
+        assert type(cquad4_copy) is CQUAD4
+        assert cquad4_copy.nodes_ref is None
+        self.assertEqual(len(lazy_xref.resolved_cards), 3)
+
+        self.assertEqual([node.nid for node in cquad4.nodes_ref], [1, 2, 3, 4])
+        self.assertEqual(len(lazy_xref.resolved_cards), 4)
+        assert cquad4.pid_ref is model.properties[1]
+        assert cquad4.pid_ref.mid1_ref is model.materials[1]
+        self.assertEqual(model.loads[10][0].node_ref.nid, 4)
+        self.assertEqual([elem.eid for elem in model.nodes[2].elements_ref], [1, 2])
+        self.assertAlmostEqual(cquad4.Area(), 1.)
+        model._verify_bdf(xref=True)
+        assert type(cquad4) is CQUAD4
+
+        # a replaced card is picked up by the cards that reference it
+        model._add_property_object(PSHELL(1, mid1=1, t=0.2), allow_overwrites=True)
+        self.assertEqual(cquad4.pid_ref.t, 0.2)
+        model.add_ctria3(3, 1, [2, 3, 4])
+        self.assertEqual([elem.eid for elem in model.nodes[4].elements_ref], [1, 3])
+
+        replace_model = BDF(debug=False)
+        replace_model.add_pshell(1, mid1=1, t=0.3)
+        model.replace_cards(replace_model)
+        self.assertEqual(cquad4.pid_ref.t, 0.3)
+        self.assertEqual(model.elements[3].pid_ref.t, 0.3)
+
+        # the cards that were cross referenced up front pick up a new GRID
+        replace_model = BDF(debug=False)
+        replace_model.add_grid(2, [2., 0., 0.])
+        model.replace_cards(replace_model)
+        assert model.coords[1].g2_ref is model.nodes[2]
+        assert model.spcs[100][0].nodes_ref[1] is model.nodes[2]
+        self.assertAlmostEqual(cquad4.Area(), 1.5)
+
+        model.uncross_reference()
+        assert model._lazy_xref is None
+        model.cross_reference(xref='lazy')
+        model.safe_cross_reference()
+        assert model._lazy_xref is None
+        assert cquad4.pid_ref is model.properties[1]
+
+        # a missing reference is raised on access
+        model = BDF(debug=None)
+        for nid in range(1, 4):
+            model.add_grid(nid, [float(nid), 0., 0.])
+        model.add_ctria3(1, 2, [1, 2, 3])
+        model.cross_reference(xref='lazy')
+        with self.assertRaises(CrossReferenceError):
+            model.elements[1].pid_ref
+        with self.assertRaises(CrossReferenceError):
+            model.elements[1].nodes_ref
+
+    def test_bdf_reload_changed_includes(self):
+        """tests only the INCLUDE files that changed are reloaded"""
+        dirname = tempfile.mkdtemp()
+        bdf_filename = os.path.join(dirname, 'reload_main.bdf')
+        props_filename = os.path.join(dirname, 'reload_props.inc')
+        mesh_filename = os.path.join(dirname, 'reload_mesh.inc')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\nCEND\nBEGIN BULK\n'
+                "INCLUDE 'reload_mesh.inc'\n"
+                "INCLUDE 'reload_props.inc'\n"
+                'FORCE,10,3,,1.0,0.,0.,1.\n'
+                'ENDDATA\n')
+        def write_mesh(x3):
+            with open(mesh_filename, 'w') as bdf_file:
+                bdf_file.write(
+                    'GRID,1,,0.,0.,0.\nGRID,2,,1.,0.,0.\n'
+                    'GRID,3,,%s,1.,0.\nGRID,4,,0.,1.,0.\n'
+                    'CQUAD4,1,1,1,2,3,4\n' % x3)
+        def write_props(thickness, mag):
+            with open(props_filename, 'w') as bdf_file:
+                bdf_file.write(
+                    'PSHELL,1,1,%s\nMAT1,1,3.0e7,,0.3\n'
+                    'FORCE,10,4,,%s,0.,0.,1.\n' % (thickness, mag))
+
+        write_mesh(1.)
+        write_props(0.1, 2.0)
+        try:
+            model = read_bdf(bdf_filename, debug=None)
+            cquad4 = model.elements[1]
+            self.assertEqual(model.reload_changed_includes(), [])
+
+            write_props(0.2, 5.0)
+            self.assertEqual(model.reload_changed_includes(), [props_filename])
+            assert model.elements[1] is cquad4
+            assert cquad4.pid_ref is model.properties[1]
+            self.assertEqual(cquad4.pid_ref.t, 0.2)
+            assert cquad4.pid_ref.mid1_ref is model.materials[1]
+
+            # the FORCE from the include is still before the one in the main file
+            loads = model.loads[10]
+            self.assertEqual([load.mag for load in loads], [5.0, 1.0])
+            self.assertEqual(loads[0].node_ref.nid, 4)
+            self.assertEqual(model.card_count['FORCE'], 2)
+            model._verify_bdf(xref=True)
+            self.assertEqual(model.reload_changed_includes(), [])
+
+            # the GRIDs are in the reloaded file
+            assert model.nodes[3].elements_ref == [cquad4]
+            write_mesh(2.)
+            self.assertEqual(model.reload_changed_includes(), [mesh_filename])
+            node = model.nodes[3]
+            self.assertEqual(node.xyz[0], 2.)
+            assert node.elements_ref == [model.elements[1]], node.elements_ref
+            assert model.elements[1].nodes_ref[2] is node
+            model._verify_bdf(xref=True)
+        finally:
+            shutil.rmtree(dirname)
+
+    def test_bdf_write_bulk(self):
+        """tests the bulk writer matches write_card"""
+        model = BDF(debug=None)
+        for nid in range(1, 13):
+            model.add_grid(nid, [float(nid), 0.1 * nid, -1.2e-9 * nid])
+        model.add_grid(13, [1e20, 1. / 3., 0.], cp=1, cd=2, ps='123', seid=1)
+        model.add_grid(14, [0., 0., 0.], comment='a comment')
+        model.add_cquad4(1, 1, [1, 2, 3, 4])
+        model.add_cquad4(2, 1, [1, 2, 3, 4], theta_mcid=45., zoffset=0.1,
+                         T1=0.1, T2=0.2, T3=0.3, T4=0.4)
+        model.add_cquad4(3, 1, [1, 2, 3, 4], theta_mcid=2)
+        model.add_ctria3(4, 1, [1, 2, 3], comment='tri')
+        model.add_ctria3(5, 1, [1, 2, 3], zoffset=-0.25)
+        model.add_ctetra(6, 2, [1, 2, 3, 4])
+        model.add_chexa(7, 2, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_chexa(8, 2, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, None,
+                               None, None, None, None, None, None, None])
+        model.add_force(10, 1, 2.5, [0., 0., 1.])
+        model.add_force(10, 2, -1e-10, [1., 0., 0.], cid=1)
+        model.add_conm2(20, 3, 1.5, X=[0.1, 0., 0.], I=[1., 0., 2., 0., 0., 3.])
+        model.add_spc1(30, '123456', [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+        cards = (list(model.nodes.values()) + list(model.elements.values()) +
+                 model.loads[10] + list(model.masses.values()) + model.spcs[30])
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            expected = ''.join([card.write_card(size, is_double) for card in cards])
+            self.assertEqual(get_cards_text(cards, size, is_double), expected)
+        self.assertEqual(get_cards_text(model.spcs[30], write_card=str),
+                         str(model.spcs[30][0]))
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
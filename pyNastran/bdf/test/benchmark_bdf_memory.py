@@ -0,0 +1,135 @@
+"""
+Defines the memory benchmark for the high-volume BDF cards:
+ - get_bytes_per_card(card_type, ncards=100000)
+ - run_benchmark(nelements=10000000, ncards=100000, log=None)
+
+Each card is created ``ncards`` times (with unique ids) and the memory
+that's allocated is measured with ``tracemalloc``.  The bytes per card
+include the card object and the data it owns (e.g., the node list), but
+not the model dictionary that stores it.  The result is multiplied by
+``nelements`` to estimate the size of a large model.
+
+Usage::
+
+    python benchmark_bdf_memory.py [NCARDS]
+"""
+from __future__ import print_function, division
+import sys
+import gc
+
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CHEXA8, CTETRA4
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.bush import CBUSH
+from pyNastran.bdf.cards.elements.mass import CONM2
+from pyNastran.bdf.cards.loads.static_loads import FORCE, PLOAD4
+from pyNastran.utils.log import get_logger2
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    # python 2
+    tracemalloc = None
+
+
+def _create_card(card_type, i):
+    """creates a card with unique ids"""
+    n1 = 10 * i + 1
+    if card_type == 'GRID':
+        return GRID(i + 1, [float(i), 1., 2.])
+    elif card_type == 'CQUAD4':
+        return CQUAD4(i + 1, 1, [n1, n1 + 1, n1 + 2, n1 + 3])
+    elif card_type == 'CTRIA3':
+        return CTRIA3(i + 1, 1, [n1, n1 + 1, n1 + 2])
+    elif card_type == 'CHEXA':
+        return CHEXA8(i + 1, 1, [n1 + j for j in range(8)])
+    elif card_type == 'CTETRA':
+        return CTETRA4(i + 1, 1, [n1, n1 + 1, n1 + 2, n1 + 3])
+    elif card_type == 'CBAR':
+        return CBAR(i + 1, 1, [n1, n1 + 1], [0., 0., 1.], None)
+    elif card_type == 'CBUSH':
+        return CBUSH(i + 1, 1, [n1, n1 + 1], [0., 0., 1.], None)
+    elif card_type == 'CONM2':
+        return CONM2(i + 1, n1, 1.0)
+    elif card_type == 'FORCE':
+        return FORCE(1, i + 1, 1.0, [0., 0., 1.])
+    elif card_type == 'PLOAD4':
+        return PLOAD4(1, [i + 1], [1.0, None, None, None], None, None)
+    raise ValueError('card_type=%r is not supported; use %s' % (card_type, CARD_TYPES))
+
+#: the cards that are benchmarked
+CARD_TYPES = ['GRID', 'CQUAD4', 'CTRIA3', 'CHEXA', 'CTETRA', 'CBAR',
+              'CBUSH', 'CONM2', 'FORCE', 'PLOAD4']
+
+
+def get_bytes_per_card(card_type, ncards=100000):
+    """
+    Gets the memory used by a card
+
+    Parameters
+    ----------
+    card_type : str
+        the card to benchmark (e.g., 'CQUAD4')
+    ncards : int; default=100000
+        the number of cards to create
+
+    Returns
+    -------
+    nbytes : float
+        the bytes per card
+    """
+    if tracemalloc is None:  # pragma: no cover
+        raise RuntimeError('tracemalloc is required (Python 3)')
+    gc.collect()
+    cards = [None] * ncards
+    tracemalloc.start()
+    try:
+        nbytes0 = tracemalloc.get_traced_memory()[0]
+        for i in range(ncards):
+            cards[i] = _create_card(card_type, i)
+        nbytes = tracemalloc.get_traced_memory()[0] - nbytes0
+    finally:
+        tracemalloc.stop()
+    del cards
+    return nbytes / ncards
+
+
+def run_benchmark(nelements=10000000, ncards=100000, log=None):
+    """
+    Prints the bytes per card and the memory for a model with
+    ``nelements`` of each card
+
+    Parameters
+    ----------
+    nelements : int; default=10000000
+        the number of cards to extrapolate to
+    ncards : int; default=100000
+        the number of cards to create
+    log : logger; default=None
+        the logger
+
+    Returns
+    -------
+    bytes_per_card : Dict[str] = float
+        the bytes per card
+    """
+    log = get_logger2(log, debug=True)
+    bytes_per_card = {}
+    log.info('%-8s %14s %16s' % ('card', 'bytes/card', 'GB/%ie6 cards' % (nelements // 10**6)))
+    for card_type in CARD_TYPES:
+        nbytes = get_bytes_per_card(card_type, ncards=ncards)
+        bytes_per_card[card_type] = nbytes
+        log.info('%-8s %14.1f %16.2f' % (card_type, nbytes, nbytes * nelements / 1024**3))
+    return bytes_per_card
+
+
+def main():  # pragma: no cover
+    """runs the benchmark"""
+    ncards = 100000
+    if len(sys.argv) > 1:
+        ncards = int(sys.argv[1])
+    run_benchmark(ncards=ncards)
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
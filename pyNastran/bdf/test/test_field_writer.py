@@ -9,6 +9,9 @@ from pyNastran.bdf.field_writer_8 import (print_field_8, print_float_8,
                                           set_blank_if_default, is_same, print_card_8)
 from pyNastran.bdf.field_writer_16 import print_field_16, print_card_16, print_float_16, print_scientific_16
 from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.field_writer_array import (
+    print_float_8_array, print_float_16_array, print_field_8_array, print_field_16_array,
+    print_cards_8, print_cards_16)
 
 
 from pyNastran.bdf.bdf_interface.assign_type import interpret_value
@@ -441,6 +444,47 @@ class Testfield_writer_8(unittest.TestCase):
             positive_output = [print_float_16(x) for x in nums]
             negative_output = [print_float_16(-x) for x in nums]
 
+    def test_float_array(self):
+        """tests that the array writers match print_float_8/print_float_16"""
+        nums = [0., 1., -1., 0.5, -0.5, 1.2e-9, -1.2e-9, 1e20, 123456789.,
+                1. / 3., -2. / 3., 0.001, 0.0099999, -0.0099999, 99999.9, 12.345678951]
+        for exponent in range(-20, 21):
+            nums += [1.234567890123 * 10.**exponent, -8.181818181818 * 10.**exponent,
+                     0.99999999999999 * 10.**exponent, -0.99999 * 10.**exponent]
+        nums += [random.uniform(-1000., 1000.) for i in range(1000)]
+
+        fields8 = [field.decode('ascii') for field in print_float_8_array(nums)]
+        fields16 = [field.decode('ascii') for field in print_float_16_array(nums)]
+        self.assertEqual(fields8, [print_float_8(num) for num in nums])
+        self.assertEqual(fields16, [print_float_16(num) for num in nums])
+
+        values = [1, -1234567, None, 'CAT', 1.5, '', 0, 12.345678951]
+        fields8 = [field.decode('ascii') for field in print_field_8_array(values)]
+        fields16 = [field.decode('ascii') for field in print_field_16_array(values)]
+        self.assertEqual(fields8, [print_field_8(value) for value in values])
+        self.assertEqual(fields16, [print_field_16(value) for value in values])
+        with self.assertRaises(RuntimeError):
+            print_field_8_array([1, 123456789])
+
+    def test_print_cards(self):
+        """tests that the array card writers match print_card_8/print_card_16"""
+        cards_fields = [
+            ['GRID', 1, None, 0., 1.5, -2.25],
+            ['GRID', 2, 1, 1.2e-9, 1e20, 3., 2, '123456', 0],
+            ['CQUAD4', 10, 1, 1, 2, 3, 4],
+            ['CQUAD4', 11, 1, 1, 2, 3, 4, 45., None, None, 0.1, 0.1, 0.1, 0.1],
+            ['CHEXA', 20, 2, 1, 2, 3, 4, 5, 6, 7, 8, None, None],
+            ['CBAR', None, None],
+            ['PARAM', 'POST', -1],
+            ['SPC1', 1, '123456', 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],
+            ['SPC1', 1, 123, 1, None, None, None, None, None, None, None],
+        ]
+        self.assertEqual(print_cards_8(cards_fields),
+                         ''.join(print_card_8(fields) for fields in cards_fields))
+        self.assertEqual(print_cards_16(cards_fields),
+                         ''.join(print_card_16(fields) for fields in cards_fields))
+
+
 def compare(value_in):
     field = print_field_8(value_in)
 
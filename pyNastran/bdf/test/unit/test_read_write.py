@@ -406,6 +406,197 @@ class TestReadWrite(unittest.TestCase):
         model.read_bdf(bdf_filename)
         assert len(model.elements) == 0, len(model.elements)
 
+    def test_fast_tokenizer(self):
+        """tests that read_bdf(..., fast_tokenizer=True) makes the same cards"""
+        bdf_filename = os.path.join(test_path, 'fast_tokenizer.bdf')
+        with codec_open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'CEND\n'
+                'BEGIN BULK\n'
+                '$ a comment\n'
+                'GRID    1               0.      1.-3    -2.5\n'
+                'GRID,2,,1.0,2.0,3.0,,123456\n'
+                'GRID*   3                               1.0             2.0\n'
+                '*       3.0\n'
+                'GRID    4       0       1.D+2   +1.     .5      1       345\n'
+                'GRID\t5\t\t1.0\t2.0\t3.0\n'
+                'GRID    6               1       2.      3.\n'
+                'GRID    7               1.      2.      3.      0       1130\n'
+                'GRID    2               4.      5.      6.\n'
+                'CQUAD4  10      1       1       2       3       4\n'
+                'CQUAD4  11              1       2       3       4       45.     .1\n'
+                '                        1.      2.      3.      4.\n'
+                'CQUAD4  12      1       1       2       3       4       7\n'
+                'CTRIA3  20      1       1       2       3       1.+1\n'
+                'CTRIA3,21,1,1,2,3\n'
+                'CHEXA   30      2       1       2       3       4       5       6\n'
+                '        7       8\n'
+                'CHEXA   31      2       1       2       3       4       5       6\n'
+                '        7       8       9               10\n'
+                'CTETRA  40      2       1       2       3       4\n'
+                'CTETRA  41      2       1       2       3       4       5       6\n'
+                '        7\n'
+                'CBAR    50      3       1       2       0.      0.      1.\n'
+                'CBAR    51      3       1       2       8\n'
+                'CBAR    52      3       1       2       1.      0.      0.      GGO\n'
+                'CBUSH   60      4       1       2       1.      0.      0.\n'
+                'CBUSH   61      4       1               8\n'
+                'CBUSH   62      4       1       2       1.      1.      1.\n'
+                'RBE2    70      1       123     2       3       4\n'
+                'RBE2    71      1       123456  2       3       4       1.-5\n'
+                'RBE2    72      1       123     2       3       4       .001\n'
+                'ENDDATA\n')
+
+        models = []
+        for fast_tokenizer in [False, True]:
+            model = BDF(log=log, debug=False)
+            model.set_error_storage(nparse_errors=100, stop_on_parsing_error=False,
+                                    nxref_errors=100, stop_on_xref_error=False)
+            model.read_bdf(bdf_filename, xref=False, validate=False,
+                           fast_tokenizer=fast_tokenizer)
+            models.append(model)
+        os.remove(bdf_filename)
+
+        model, model_fast = models
+        assert len(model._stored_parse_errors) == 4, model._stored_parse_errors
+        assert len(model_fast._stored_parse_errors) == 4, model_fast._stored_parse_errors
+        for (card, var), (card_fast, var_fast) in zip(
+                model._stored_parse_errors, model_fast._stored_parse_errors):
+            assert var == var_fast, (var, var_fast)
+
+        # the duplicate GRID is added by the bulk tokenizer, which keeps the fields
+        card_fast = model_fast._stored_parse_errors[2][0]
+        assert card_fast == ['GRID', '2', None, '4.', '5.', '6.'], card_fast
+        assert model.card_count == model_fast.card_count
+        assert model._type_to_id_map == model_fast._type_to_id_map
+        for name in ['nodes', 'elements', 'rigid_elements']:
+            cards = getattr(model, name)
+            cards_fast = getattr(model_fast, name)
+            assert list(cards) == list(cards_fast), name
+            for key, card in cards.items():
+                card_fast = cards_fast[key]
+                assert type(card) == type(card_fast), (card, card_fast)
+                state = _repr_types(card.__getstate__())
+                state_fast = _repr_types(card_fast.__getstate__())
+                assert state == state_fast, (card, card_fast)
+
+    def test_model_cache(self):
+        """tests read_bdf(..., cache_dir=...)"""
+        bdf_filename = os.path.join(test_path, 'model_cache.bdf')
+        include_filename = os.path.join(test_path, 'model_cache.inc')
+        cache_dir = os.path.join(test_path, 'model_cache')
+        with codec_open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'SUBCASE 1\n'
+                '  LOAD = 2\n'
+                'BEGIN BULK\n'
+                "INCLUDE 'model_cache.inc'\n"
+                'CQUAD4  10      1       1       2       3       4\n'
+                'PSHELL  1       1       0.1\n'
+                'MAT1    1       3.e7            .3\n'
+                'FORCE   2       1               1.      1.      0.      0.\n'
+                'ENDDATA\n')
+        with codec_open(include_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'GRID    1               0.      0.      0.\n'
+                'GRID    2               1.      0.      0.\n'
+                'GRID    3               1.      1.      0.\n'
+                'GRID    4               0.      1.      0.\n')
+
+        model = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        cache_filenames = os.listdir(cache_dir)
+        assert len(cache_filenames) == 1, cache_filenames
+
+        def _read_bdf_cards(bdf_filename):
+            """the cache should be used"""
+            raise RuntimeError('the model cache was not used')
+
+        model2 = BDF(log=log)
+        model2._read_bdf_cards = _read_bdf_cards
+        model2.read_bdf(bdf_filename, cache_dir=cache_dir)
+        assert model2.card_count == model.card_count
+        assert sorted(model2.nodes) == [1, 2, 3, 4]
+        assert model2.case_control_deck.has_parameter(1, 'LOAD')
+        assert model2.elements[10].Area() == 1.0
+
+        # a changed INCLUDE file is read again
+        with codec_open(include_filename, 'a') as bdf_file:
+            bdf_file.write('GRID    5               0.      2.      0.\n')
+        with self.assertRaises(RuntimeError):
+            model2 = BDF(log=log)
+            model2._read_bdf_cards = _read_bdf_cards
+            model2.read_bdf(bdf_filename, cache_dir=cache_dir)
+
+        model3 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        assert sorted(model3.nodes) == [1, 2, 3, 4, 5]
+
+        # a change that keeps the size and the mtime is still found
+        stat = os.stat(include_filename)
+        with codec_open(include_filename, 'r') as bdf_file:
+            lines = bdf_file.read().replace('0.      2.', '0.      3.')
+        with codec_open(include_filename, 'w') as bdf_file:
+            bdf_file.write(lines)
+        os.utime(include_filename, (stat.st_atime, stat.st_mtime))
+        with self.assertRaises(RuntimeError):
+            model2 = BDF(log=log)
+            model2._read_bdf_cards = _read_bdf_cards
+            model2.read_bdf(bdf_filename, cache_dir=cache_dir)
+        model4 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        assert model4.nodes[5].xyz[1] == 3.
+
+        for cache_filename in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, cache_filename))
+        os.rmdir(cache_dir)
+        os.remove(bdf_filename)
+        os.remove(include_filename)
+
+    def test_read_bdf_nworkers(self):
+        """tests that read_bdf(..., nworkers=2) makes the same model"""
+        bdf_filename = os.path.join(test_path, 'nworkers.bdf')
+        with codec_open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write('CEND\nBEGIN BULK\n')
+            for nid in range(1, 1202):
+                bdf_file.write('GRID,%i,,%i.,0.,0.\n' % (nid, nid))
+                bdf_file.write('GRID,%i,,%i.,1.,0.\n' % (nid + 2000, nid))
+            for eid in range(1, 1201):
+                bdf_file.write('CQUAD4,%i,1,%i,%i,%i,%i\n' % (
+                    eid, eid, eid + 1, eid + 2001, eid + 2000))
+            bdf_file.write(
+                'CQUAD4,1,1,3,4,2004,2003\n'  # duplicate
+                'GRID,3,,9.,9.,9.\n'  # duplicate
+                'CROD,5000,2,1,2\n'
+                'PROD,2,1,0.1\n'
+                'PSHELL,1,1,0.1\n'
+                'MAT1,1,3.e7,,.3\n')
+
+        models = []
+        for nworkers in [1, 2]:
+            model = BDF(log=log, debug=False)
+            model.set_error_storage(nparse_errors=100, stop_on_parsing_error=False,
+                                    nxref_errors=100, stop_on_xref_error=False)
+            model.read_bdf(bdf_filename, xref=False, nworkers=nworkers)
+            models.append(model)
+        os.remove(bdf_filename)
+
+        model, model2 = models
+        assert model.card_count == model2.card_count
+        assert len(model._duplicate_elements) == 1
+        assert len(model2._duplicate_elements) == 1
+        assert len(model._stored_parse_errors) == 1, model._stored_parse_errors
+        assert len(model2._stored_parse_errors) == 1, model2._stored_parse_errors
+        card, var = model._stored_parse_errors[0]
+        card2, var2 = model2._stored_parse_errors[0]
+        assert var == var2, (var, var2)
+        assert card2 == ['GRID', '3', None, '9.', '9.', '9.'], card2
+        for name in ['nodes', 'elements', 'properties', 'materials']:
+            cards = getattr(model, name)
+            cards2 = getattr(model2, name)
+            assert list(cards) == list(cards2), name
+            for key, card in cards.items():
+                assert _repr_types(card.__getstate__()) == _repr_types(cards2[key].__getstate__())
+
     def test_solid_shell_bar_buckling(self):
         bdf_filename = os.path.join(root_path, '..', 'models',
                                     'sol_101_elements', 'buckling_solid_shell_bar.bdf')
@@ -582,5 +773,17 @@ class TestReadWrite(unittest.TestCase):
         #pth2 = get_include_filename([pth], include_dir='', is_windows=False)
         #print(pth2)
 
+
+def _repr_types(value):
+    """gets the value and types of a card's attributes, so 1 != 1.0"""
+    if isinstance(value, dict):
+        return [(key, _repr_types(valuei)) for key, valuei in sorted(value.items())]
+    elif isinstance(value, (list, tuple)):
+        return [_repr_types(valuei) for valuei in value]
+    elif hasattr(value, 'tolist'):
+        return (value.dtype.name, _repr_types(value.tolist()))
+    return (type(value).__name__, value)
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -763,9 +763,10 @@ def Position(xyz, cid, model, is_cid_int=True):
         the position of the GRID in an arbitrary coordinate system
     """
     if is_cid_int:
-        cp_ref = model.Coord(cid)
-    else:
-        cp_ref = cid
+        if cid == 0:
+            return xyz
+        return model.coord_cache.transform_node_to_global(xyz, cid).reshape(np.shape(xyz))
+    cp_ref = cid
     xyz2 = cp_ref.transform_node_to_global(xyz)
     return xyz2
 
@@ -803,12 +804,17 @@ def TransformLoadWRT(F, M, cid, cid_new, model, is_cid_int=True):
     # find the vector r for doing:
     #     M = r x F
     if is_cid_int:
-        cp_ref = model.Coord(cid)
-        coord_to_ref = model.Coord(cid_new)
+        coord_cache = model.coord_cache
+        cp_ref, origin, beta = coord_cache.get_transform(cid)
+        coord_to_ref, origin_to, beta_to = coord_cache.get_transform(cid_new)
     else:
         cp_ref = cid
         coord_to_ref = cid_new
-    r = cp_ref.origin - coord_to_ref.origin
+        origin = cp_ref.origin
+        origin_to = coord_to_ref.origin
+        beta = cp_ref.beta()
+        beta_to = coord_to_ref.beta()
+    r = origin - origin_to
 
     # change R-theta-z to xyz
     Fxyz_local_1 = cp_ref.coord_to_xyz(F)
@@ -824,8 +830,8 @@ def TransformLoadWRT(F, M, cid, cid_new, model, is_cid_int=True):
     # Fglobal = Flocal1 * beta1
     # Flocal2 = (Flocal1 * beta1) * beta2.T
 
-    Fxyz_global = dot(Fxyz_local_1, cp_ref.beta())
-    Fxyz_local_2 = dot(dot(Fxyz_local_1, cp_ref.beta()), coord_to_ref.beta().T)
+    Fxyz_global = dot(Fxyz_local_1, beta)
+    Fxyz_local_2 = dot(Fxyz_global, beta_to.T)
 
     # find the moment about the new origin due to the force
     Mxyz_global = cross(r, Fxyz_global)
@@ -865,12 +871,11 @@ def PositionWRT(xyz, cid, cid_new, model, is_cid_int=True):
         return xyz
 
     if is_cid_int:
-        cp_ref = model.Coord(cid)
-        coord_to_ref = model.Coord(cid_new)
-    else:
-        cp_ref = cid
-        coord_to_ref = cid_new
+        xyz_local = model.coord_cache.transform_node_to_coord(xyz, cid, cid_new)
+        return xyz_local.reshape(np.shape(xyz))
 
+    cp_ref = cid
+    coord_to_ref = cid_new
     if 0:
         # pGlobal = pLocal1 * beta1 + porigin1
         # pGlobal = pLocal2 * beta2 + porigin2
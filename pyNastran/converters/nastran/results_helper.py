@@ -523,6 +523,7 @@ class NastranGuiResults(NastranGuiAttributes):
             'nonlinear_plate_stress',
             'nonlinear_plate_strain',
             #'hyperelastic_plate_stress',
+            'hyperelastic_cquad4_stress',
             'hyperelastic_cquad4_strain',
 
             # OES - composite CTRIA3/CQUAD4 stress
@@ -699,6 +699,7 @@ class F06Writer(OP2_F06_Common):
             self.nonlinear_ctria3_strain,
             self.nonlinear_cquad4_strain,
             self.ctriax_strain,
+            self.hyperelastic_cquad4_strain,
 
             # rods
             self.nonlinear_crod_strain,
@@ -771,7 +772,7 @@ class F06Writer(OP2_F06_Common):
             self.nonlinear_cquad4_stress,
             self.ctriax_stress,
 
-            self.hyperelastic_cquad4_strain,
+            self.hyperelastic_cquad4_stress,
 
             #------------------------------------------
             #OEF - Fluxes - tCode=4 thermal=1
@@ -4,9 +4,10 @@ Defines:
 """
 from __future__ import print_function
 import sys
+import time
 from copy import deepcopy
 from struct import unpack
-from six import iteritems, b
+from six import iteritems, itervalues, b
 from six.moves import range
 
 from pyNastran.utils import integer_types
@@ -33,8 +34,35 @@ class FortranFormat(object):
         self.binary_debug = None
         self.read_mode = 1
         self._endian = None
+
+        #: the file reader {file, mmap}
+        self.backend = 'file'
+        #: a memoryview of the memory mapped file (backend='mmap')
+        self._data_view = None
         self._table_mapper = {}
 
+        #: the (table_name, n_start, n_end, is_pass2) for each table;
+        #: built on read_mode=1 and used to jump over tables on read_mode=2
+        self._table_index = []
+        #: is the table that is currently being read needed on read_mode=2
+        self._table_pass2 = True
+        #: the self._count at the start of each table (key=file position)
+        self._table_counts = {}
+        #: the table names that fill each result object (key=id(obj))
+        self._result_tables = {}
+        #: called with the result object after each time step is filled
+        #: (used by iter_op2_results)
+        self._stream_callback = None
+        #: the record lengths found on read_mode=1 (key=file position)
+        self._record_lengths = {}
+        #: the per-table timings of read_op2(..., profile=True) (OP2Profile)
+        self.op2_profile = None
+
+        #: are the results being loaded on demand (lazy=True)
+        self._is_lazy_loading = False
+        #: the lazy (table_name, isubcase) of each result object (key=id(obj))
+        self._lazy_groups = {}
+
         #: stores if the user entered [] for iSubcases
         self.is_all_subcases = True
         self.valid_subcases = []
@@ -201,14 +229,20 @@ class FortranFormat(object):
         self.n += 8 + ndata
         return data_out
 
-    def _read_block_ndata(self):
+    def _read_block_ndata(self, view=False):
         """
         Reads a block following a pattern of:
             [nbytes, data, nbytes]
 
+        Parameters
+        ----------
+        view : bool; default=False
+            return a zero-copy memoryview of the block instead of bytes
+            (only used for backend='mmap')
+
         Returns
         -------
-        data : bytes
+        data : bytes / memoryview
             the data in binary
         ndata : int
             len(data)
@@ -216,8 +250,13 @@ class FortranFormat(object):
         data = self.f.read(4)
         ndata, = self.struct_i.unpack(data)
 
-        data_out = self.f.read(ndata)
-        data = self.f.read(4)
+        if view and self._data_view is not None:
+            n = self.f.tell()
+            data_out = self._data_view[n:n + ndata]
+            self.f.seek(n + ndata + 4)
+        else:
+            data_out = self.f.read(ndata)
+            data = self.f.read(4)
         self.n += 8 + ndata
         return data_out, ndata
 
@@ -449,6 +488,7 @@ class FortranFormat(object):
                         self.data_code = data_code_old
                         for key, value in iteritems(data_code_old):
                             setattr(self, key, value)
+                        self._table_pass2 = True
                         table4_parser(data, ndata)
                         return False
                     raise RuntimeError(self.code_information())
@@ -458,14 +498,36 @@ class FortranFormat(object):
             if passer or not self.is_valid_subcase():
                 data = self._skip_record()
             else:
-                if hasattr(self, 'num_wide'):
-                    # num_wide is the result size and is usually found in
-                    # table3, but some B-list tables don't have it
-                    n = self._read_subtable_results(table4_parser, record_len)
+                if table4_parser != self._table_passer:
+                    self._table_pass2 = True
+                if self.op2_profile is None:
+                    self._read_subtable_4(table4_parser, record_len)
                 else:
-                    data, ndata = self._read_record_ndata()
-                    n = table4_parser(data, ndata)
-                #del n
+                    self._profile_table4(table4_parser, record_len)
+
+    def _read_subtable_4(self, table4_parser, record_len):
+        """reads a table 4 record"""
+        if hasattr(self, 'num_wide'):
+            # num_wide is the result size and is usually found in
+            # table3, but some B-list tables don't have it
+            self._read_subtable_results(table4_parser, record_len)
+        else:
+            data, ndata = self._read_record_ndata()
+            table4_parser(data, ndata)
+
+    def _profile_table4(self, table4_parser, record_len):
+        """reads a table 4 record and adds it to ``self.op2_profile``"""
+        nunvectorized = sum(itervalues(self._unvectorized_results))
+        n0 = self.n
+        time0 = time.time()
+        self._read_subtable_4(table4_parser, record_len)
+        dt = time.time() - time0
+
+        is_vectorized = self.use_vector and (
+            nunvectorized == sum(itervalues(self._unvectorized_results)))
+        parser_name = getattr(table4_parser, '__name__', str(table4_parser))
+        self.op2_profile.add_table4(self.table_name, parser_name, self.read_mode,
+                                    self.n - n0, dt, is_vectorized, self.obj)
 
     def _read_subtable_results(self, table4_parser, record_len):
         """
@@ -500,9 +562,10 @@ class FortranFormat(object):
                     assert isinstance(n, integer_types), self.table_name
                     datai = data[n:]
             else:
-                data, ndata = self._read_record_ndata()
+                data, ndata = self._read_record_ndata(view=True)
                 n = table4_parser(data, ndata)
                 assert isinstance(n, integer_types), self.table_name
+                del data
 
             # PCOMPs are stupid, so we need an element flag
             if hasattr(self, 'eid_old'):
@@ -548,6 +611,8 @@ class FortranFormat(object):
                         self.obj._reset_indices()
                         self.obj.words = self.words
                         self.obj.itime += 1
+                        if self._stream_callback is not None:
+                            self._stream_callback(self.obj)
                     else:
                         # This happens when self._data_factor hasn't been reset
                         # or is set wrong.
@@ -697,6 +762,9 @@ class FortranFormat(object):
         to quickly size the arrays.  We just need a bit of meta data and can
         jump around quickly.
 
+        The length is cached on read_mode=1, so the continuation blocks
+        don't need to be walked again on read_mode=2.
+
         Returns
         -------
         record_length : int
@@ -704,8 +772,11 @@ class FortranFormat(object):
         """
         if self.is_debug_file:
             self.binary_debug.write('_get_record_length\n')
-        len_record = 0
         n0 = self.n
+        if self.read_mode == 2 and n0 in self._record_lengths:
+            return self._record_lengths[n0]
+
+        len_record = 0
         markers0 = self.get_nmarkers(1, rewind=False)
         if self.is_debug_file:
             self.binary_debug.write('  markers0=%s\n' % markers0)
@@ -727,6 +798,8 @@ class FortranFormat(object):
             len_record += self.n - n - 8  # -8 is for the block
             markers1 = self.get_nmarkers(1, rewind=True)
         self._goto(n0)
+        if self.read_mode == 1:
+            self._record_lengths[n0] = len_record
         return len_record
 
     def _skip_record(self):
@@ -787,13 +860,19 @@ class FortranFormat(object):
         """reads a record"""
         return self._read_record_ndata(stream, debug, macro_rewind)[0]
 
-    def _read_record_ndata(self, stream=False, debug=True, macro_rewind=False):
-        """reads a record and the length of the record"""
+    def _read_record_ndata(self, stream=False, debug=True, macro_rewind=False, view=False):
+        """
+        reads a record and the length of the record
+
+        For view=True, a record that is a single block is returned as a
+        memoryview of the memory mapped file; a record with continuation
+        blocks is copied into a new bytes object.
+        """
         markers0 = self.get_nmarkers(1, rewind=False, macro_rewind=macro_rewind)
         if self.is_debug_file and debug:
             self.binary_debug.write('read_record - marker = [4, %i, 4]; macro_rewind=%s\n' % (
                 markers0[0], macro_rewind))
-        record, nrecord = self._read_block_ndata()
+        record, nrecord = self._read_block_ndata(view=view)
 
         if self.is_debug_file and debug:
             msg = 'read_record - record = [%i, recordi, %i]; macro_rewind=%s\n' % (
@@ -811,7 +890,7 @@ class FortranFormat(object):
                 markers1 = self.get_nmarkers(1, rewind=False)
                 if self.is_debug_file and debug:
                     self.binary_debug.write('read_record - markers1 = [4, %i, 4]\n' % markers1[0])
-                recordi, nrecordi = self._read_block_ndata()
+                recordi, nrecordi = self._read_block_ndata(view=view)
                 nrecord += nrecordi
                 records.append(recordi)
                 #record += recordi
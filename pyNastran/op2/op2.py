@@ -5,17 +5,27 @@ Defines the main OP2 class.  Defines:
  - read_op2(op2_filename=None, combine=True, subcases=None,
             exclude_results=None, include_results=None,
             log=None, debug=True, debug_file=None, build_dataframe=None,
-            skip_undefined_matrices=True, mode='msc', encoding=None)
+            skip_undefined_matrices=True, mode='msc', encoding=None,
+            backend='file', lazy=False, index_filename=None, nworkers=1,
+            profile=False)
 
- - OP2(debug=True, log=None, debug_file=None, mode='msc')
+ - iter_op2_results(op2_filename=None, tables=None, subcases=None,
+                    log=None, debug=True, mode='msc', encoding=None, backend='file')
+
+ - OP2(debug=True, log=None, debug_file=None, mode='msc', backend='file')
    - build_dataframe()
    - combine_results(combine=True)
    - create_objects_from_matrices()
+   - get_vectorization_report()
+   - iter_op2_results(op2_filename=None, tables=None, encoding=None)
+   - load_hdf5(hdf5_filename, subcases=None, result_types=None, lazy=True)
    - object_attributes(mode='public', keys_to_skip=None)
    - object_methods(mode='public', keys_to_skip=None)
    - print_subcase_key()
    - read_op2(op2_filename=None, combine=True, build_dataframe=None,
-              skip_undefined_matrices=False, encoding=None)
+              skip_undefined_matrices=False, encoding=None,
+              lazy=False, index_filename=None, nworkers=1, profile=False)
+   - set_backend(backend)
    - set_mode(mode)
    - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False)
    - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None)
@@ -24,8 +34,12 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
 import sys
+import threading
+import multiprocessing
+from ast import literal_eval
 from six import iterkeys, iteritems, string_types, itervalues, b
 from six.moves.cPickle import load, dump
+from six.moves import queue
 
 import numpy as np
 
@@ -39,12 +53,19 @@ from pyNastran.op2.errors import SortCodeError, DeviceCodeError, FortranMarkerEr
 #from pyNastran.op2.op2_interface.op2_writer import OP2Writer
 from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.lazy_results import LazyResultDict
+from pyNastran.op2.op2_interface.op2_profile import OP2Profile
+from pyNastran.op2.op2_interface.hdf5_interface import (
+    get_result_classes, load_result_from_hdf5, load_matrix_from_hdf5, load_hdf5_dataset,
+    LAZY_NAMES)
 
 
 def read_op2(op2_filename=None, combine=True, subcases=None,
              exclude_results=None, include_results=None,
              log=None, debug=True, debug_file=None, build_dataframe=None,
-             skip_undefined_matrices=True, mode='msc', encoding=None):
+             skip_undefined_matrices=True, mode='msc', encoding=None,
+             backend='file', lazy=False, index_filename=None, nworkers=1,
+             profile=False):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -77,6 +98,17 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    backend : str; default='file'
+        the file reader
+        {file, mmap}
+    lazy : bool; default=False
+        only read the results when they're accessed
+    index_filename : str; default=None
+        the file to save/load the sizing pass of a lazy model to/from
+    nworkers : int; default=1
+        the number of processes used to fill the result tables
+    profile : bool; default=False
+        stores the time/bytes of each table in ``model.op2_profile``
 
     Returns
     -------
@@ -88,7 +120,7 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
     .. note :: this method will change in order to return an object that
                does not have so many methods
     """
-    model = OP2(log=log, debug=debug, debug_file=debug_file, mode=mode)
+    model = OP2(log=log, debug=debug, debug_file=debug_file, mode=mode, backend=backend)
     model.set_subcases(subcases)
     if exclude_results and include_results:
         msg = (
@@ -104,7 +136,8 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, lazy=lazy, index_filename=index_filename,
+                   nworkers=nworkers, profile=profile)
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
     ## doesn't support F06 writer
@@ -118,11 +151,68 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
 
 
 #class OP2(OP2_Scalar, OP2Writer):
+def iter_op2_results(op2_filename=None, tables=None, subcases=None,
+                     log=None, debug=True, mode='msc', encoding=None, backend='file'):
+    """
+    Reads the results of an OP2 one time step at a time, so the memory
+    is bounded by the size of a single record instead of the full
+    (ntimes, nelements, nresults) array.
+
+    Parameters
+    ----------
+    op2_filename : str (default=None -> popup)
+        the op2_filename
+    tables : List[str]; default=None -> all tables
+        the result tables to read (e.g., ['OUGV1', 'OES1X1'])
+    subcases : List[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    log : Log()
+        a logging object to write debug messages to
+        (.. seealso:: import logging)
+    debug : bool; default=False
+        enables the debug log and sets the debug in the logger
+    mode : str; default='msc'
+        the version of the Nastran you're using
+        {nx, msc, optistruct}
+    encoding : str
+        the unicode encoding (default=None; system default)
+    backend : str; default='file'
+        the file reader
+        {file, mmap}
+
+    Yields
+    ------
+    isubcase : int
+        the subcase id
+    result_type : str
+        the result (e.g., 'displacements', 'cquad4_stress')
+    time : float / None
+        the time/frequency/mode/load step; None for static results
+    ids : (nnodes, 2) / (nelements, ...) int ndarray
+        the node_gridtype, element_node, element_layer, node_element
+        or element
+    data : (nnodes, ...) / (nelements, ...) ndarray
+        the data for the time step (e.g., obj.data[itime, :, :])
+
+    .. note:: only SORT1 results are streamed
+    """
+    model = OP2(log=log, debug=debug, mode=mode, backend=backend)
+    model.set_subcases(subcases)
+    for chunk in model.iter_op2_results(op2_filename=op2_filename, tables=tables,
+                                        encoding=encoding):
+        yield chunk
+
+
+class _StreamClosed(Exception):
+    """the generator of ``iter_op2_results`` was closed, so the filling pass stops"""
+    pass
+
+
 class OP2(OP2_Scalar):
 
     def __init__(self,
                  debug=True, log=None,
-                 debug_file=None, mode='msc'):
+                 debug_file=None, mode='msc', backend='file'):
         """
         Initializes the OP2 object
 
@@ -137,12 +227,18 @@ class OP2(OP2_Scalar):
             sets the filename that will be written to
         mode : str; default='msc'
             {msc, nx}
+        backend : str; default='file'
+            the file reader
+            file : read the OP2 with file.read
+            mmap : memory map the OP2; results are parsed from views
+                   of the map instead of copies of the data
         """
         self.encoding = None
         self.set_mode(mode)
         make_geom = False
         assert make_geom == False, make_geom
         OP2_Scalar.__init__(self, debug=debug, log=log, debug_file=debug_file)
+        self.set_backend(backend)
         self.ask = False
 
     def object_attributes(self, mode='public', keys_to_skip=None):
@@ -263,6 +359,14 @@ class OP2(OP2_Scalar):
         else:
             raise RuntimeError("mode=%r and must be 'msc' or 'nx'")
 
+    def set_backend(self, backend):
+        """
+        Sets the file reader as 'file' or 'mmap'
+        """
+        if backend.lower() not in ['file', 'mmap']:
+            raise RuntimeError("backend=%r and must be 'file' or 'mmap'" % backend)
+        self.backend = backend.lower()
+
     def saves(self):
         """Saves a pickled string"""
         return dumps(self)
@@ -400,7 +504,8 @@ class OP2(OP2_Scalar):
         #self.ask = ask
 
     def read_op2(self, op2_filename=None, combine=True, build_dataframe=None,
-                 skip_undefined_matrices=False, encoding=None):
+                 skip_undefined_matrices=False, encoding=None,
+                 lazy=False, index_filename=None, nworkers=1, profile=False):
         """
         Starts the OP2 file reading
 
@@ -418,11 +523,36 @@ class OP2(OP2_Scalar):
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        lazy : bool; default=False
+            True : the result objects are sized, but the data is only
+                   read when a result is accessed (e.g., op2.displacements[1]);
+                   the results of a (table_name, isubcase) are loaded together
+                   build_dataframe is not called
+            False : read all the results
+        index_filename : str; default=None
+            the file that stores the sizing pass of a lazy model
+            (e.g., 'model.op2.idx'); if it exists and is up to date, the
+            sizing pass is skipped; if not, it's written
+            lazy=True is required
+        nworkers : int; default=1
+            the number of processes used to fill the result tables;
+            the tables are split between the processes after the sizing
+            pass and the results are merged back in file order
+            nworkers > 1 can't be used with lazy=True
+        profile : bool; default=False
+            True : the bytes, records, time, vectorized/scalar path and
+                   allocated arrays of each table/table4_parser are
+                   stored in ``self.op2_profile`` (OP2Profile); use
+                   ``self.op2_profile.to_dict()`` to get the report
         """
         if build_dataframe is None:
             build_dataframe = False
             if ipython_info():
                 build_dataframe = True
+        if index_filename is not None and not lazy:
+            raise RuntimeError('lazy=True is required for index_filename=%r' % index_filename)
+        if nworkers > 1 and lazy:
+            raise RuntimeError('nworkers=%s is not supported with lazy=True' % nworkers)
 
         if encoding is None:
             encoding = sys.getdefaultencoding()
@@ -435,9 +565,17 @@ class OP2(OP2_Scalar):
         self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
         self.read_mode = 1
         self._close_op2 = False
+        self.op2_profile = OP2Profile() if profile else None
 
         # get GUI object names, build objects, but don't read data
-        OP2_Scalar.read_op2(self, op2_filename=op2_filename)
+        is_indexed = False
+        if index_filename is not None:
+            op2_filename = self._validate_op2_filename(op2_filename)
+            is_indexed = self._load_lazy_index(op2_filename, index_filename)
+        if not is_indexed:
+            OP2_Scalar.read_op2(self, op2_filename=op2_filename)
+            if index_filename is not None:
+                self._save_lazy_index(index_filename)
 
         # TODO: stuff to figure out objects
         # TODO: stuff to show gui of table names
@@ -445,15 +583,162 @@ class OP2(OP2_Scalar):
         self.read_mode = 2
         self._close_op2 = True
         self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
-        OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+
+        # only the tables in self._table_index that need to be filled are read
+        if lazy:
+            self._set_lazy_results()
+            table_index = self._table_index
+            self._table_index = [
+                (table_name, n0, n1, is_pass2 and table_name not in self._lazy_table_names)
+                for (table_name, n0, n1, is_pass2) in table_index]
+            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+            self._table_index = table_index
+        elif nworkers > 1:
+            self._read_op2_parallel(nworkers)
+            self._record_lengths = {}
+        else:
+            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+            self._record_lengths = {}
 
         self._finalize()
-        if build_dataframe:
+        if build_dataframe and not lazy:
             self.build_dataframe()
         self.create_objects_from_matrices()
         self.combine_results(combine=combine)
         self.log.debug('finished reading op2')
 
+    def iter_op2_results(self, op2_filename=None, tables=None, encoding=None):
+        """
+        Reads the results one time step at a time.
+
+        The sizing pass is run as usual, but each result is sized for a
+        single time step and is rebuilt after every time step.  The
+        filling pass is run in a background thread that hands over one
+        time step at a time, so it's paused until the previous time step
+        is consumed.
+
+        See ``iter_op2_results`` for the parameters and the yielded values.
+        """
+        if encoding is None:
+            encoding = sys.getdefaultencoding()
+        self.encoding = encoding
+        self.is_vectorized = True
+        self.read_mode = 1
+        self._close_op2 = False
+        OP2_Scalar.read_op2(self, op2_filename=op2_filename)
+
+        if tables is not None:
+            if isinstance(tables, string_types):
+                tables = [tables]
+            tables = set([b(table_name) for table_name in tables])
+
+        result_types = {}
+        for result_type in self.get_table_types():
+            result = getattr(self, result_type)
+            if not isinstance(result, dict):
+                continue
+            for obj in itervalues(result):
+                result_types[id(obj)] = (result_type, obj)
+
+        # size the results for a single time step
+        stream_result_types = {}
+        sized_states = {}
+        table_names = set([])
+        for obj_id, obj_table_names in iteritems(self._result_tables):
+            if tables is not None:
+                obj_table_names = obj_table_names & tables
+            if obj_id not in result_types or not obj_table_names:
+                continue
+            result_type, obj = result_types[obj_id]
+            if not hasattr(obj, '_reset_indices') or not obj.is_sort1:
+                self.log.warning('skipping %s; it can\'t be streamed' % obj.__class__.__name__)
+                continue
+            if hasattr(obj, 'nelements'):
+                obj.nelements //= obj.ntimes
+            if hasattr(obj, '_nnodes'):
+                obj._nnodes //= obj.ntimes
+            obj.ntimes = 1
+            stream_result_types[obj_id] = result_type
+            sized_states[obj_id] = dict(obj.__dict__)
+            table_names.update(obj_table_names)
+
+        self._table_index = [
+            (table_name, n0, n1, is_pass2 and table_name in table_names)
+            for (table_name, n0, n1, is_pass2) in self._table_index]
+        self.read_mode = 2
+        self._close_op2 = True
+
+        chunks = queue.Queue(maxsize=1)
+        is_stopped = threading.Event()
+
+        def put(chunk):
+            """passes a time step to the generator; waits until it's taken"""
+            while not is_stopped.is_set():
+                try:
+                    chunks.put(chunk, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+            raise _StreamClosed('iter_op2_results was closed')
+
+        def stream_result(obj):
+            """the time step of obj is filled"""
+            time = None
+            if obj.nonlinear_factor is not None:
+                time = obj._times[0]
+            if hasattr(obj, 'finalize'):
+                obj.finalize()
+            ids = None
+            for name in ['node_gridtype', 'element_node', 'element_layer',
+                         'node_element', 'element']:
+                ids = getattr(obj, name, None)
+                if ids is not None:
+                    break
+            if name == 'element' and ids is not None and ids.ndim == 2:
+                # the elements can change with time (e.g., strain energy)
+                ids = ids[0]
+            result_type = stream_result_types[id(obj)]
+            put((obj.isubcase, result_type, time, ids, obj.data[0]))
+
+            # the next time step is built from the sizing pass
+            obj.__dict__.clear()
+            obj.__dict__.update(sized_states[id(obj)])
+
+        def read():
+            """the filling pass"""
+            try:
+                try:
+                    OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+                    chunk = None
+                except _StreamClosed:
+                    return
+                except Exception as error:
+                    chunk = error
+                put(chunk)
+            except _StreamClosed:
+                pass
+            finally:
+                if getattr(self, 'f', None) is not None:
+                    self._close_op2_file()
+
+        self._stream_callback = stream_result
+        thread = threading.Thread(target=read)
+        thread.daemon = True
+        thread.start()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                elif isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            is_stopped.set()
+            thread.join()
+            self._stream_callback = None
+            self.del_structs()
+
     def create_objects_from_matrices(self):
         """
         creates the following objects:
@@ -474,13 +759,281 @@ class OP2(OP2_Scalar):
     def _finalize(self):
         """internal method"""
         result_types = self.get_table_types()
+        self._is_lazy_loading = True
         for result_type in result_types:
             result = getattr(self, result_type)
             for obj in itervalues(result):
+                if id(obj) in self._lazy_groups:
+                    # finalized when it's loaded
+                    continue
                 if hasattr(obj, 'finalize'):
                     obj.finalize()
+        self._is_lazy_loading = False
         self.del_structs()
 
+    def _set_lazy_results(self):
+        """
+        Replaces the result dictionaries with LazyResultDicts after the
+        sizing pass, so the results are filled when they're accessed.
+        """
+        self._lazy_results = {}
+        self._lazy_groups = {}
+        self._lazy_loaded = set([])
+        for result_type in self.get_table_types():
+            result = getattr(self, result_type)
+            if not isinstance(result, dict):
+                continue
+            for code, obj in iteritems(result):
+                table_name = getattr(obj, 'table_name', None)
+                isubcase = getattr(obj, 'isubcase', None)
+                if table_name is None or isubcase is None:
+                    continue
+                group = (b(table_name), isubcase)
+                if group not in self._lazy_results:
+                    self._lazy_results[group] = []
+                self._lazy_results[group].append((result_type, code, obj))
+                self._lazy_groups[id(obj)] = group
+            setattr(self, result_type, LazyResultDict(self, result))
+        self._lazy_table_names = set([group[0] for group in self._lazy_results])
+
+    def _load_lazy_result(self, obj):
+        """fills a result (and the rest of its table/subcase) for lazy=True"""
+        if self._is_lazy_loading:
+            return
+        group = self._lazy_groups.get(id(obj))
+        if group is None or group in self._lazy_loaded:
+            return
+        if isinstance(group, string_types):
+            # load_hdf5
+            self._load_hdf5_result(obj, group)
+            return
+        self._load_lazy_group(group)
+
+    def _load_lazy_group(self, group):
+        """
+        Fills all the results of a (table_name, isubcase) for lazy=True
+        by reading just that table/subcase with read_mode=2.
+        """
+        table_name, isubcase = group
+        self.log.debug('loading table_name=%r isubcase=%s' % (table_name, isubcase))
+        self._lazy_loaded.add(group)
+        lazy_results = self._lazy_results[group]
+
+        # combine_results may have renamed the keys, but read_mode=2
+        # looks the results up by their original code
+        aliases = []
+        for result_type, code, obj in lazy_results:
+            result = getattr(self, result_type)
+            if code not in result:
+                dict.__setitem__(result, code, obj)
+                aliases.append((result, code))
+
+        is_all_subcases = self.is_all_subcases
+        valid_subcases = self.valid_subcases
+        table_index = self._table_index
+        self.is_all_subcases = False
+        self.valid_subcases = set([isubcase])
+        self._table_index = [
+            (table_namei, n0, n1, is_pass2 and table_namei == table_name)
+            for (table_namei, n0, n1, is_pass2) in table_index]
+        self._is_lazy_loading = True
+        self.read_mode = 2
+        self._close_op2 = True
+        self.binary_debug = None
+        self._set_structs()
+        try:
+            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+        finally:
+            self.del_structs()
+            self._is_lazy_loading = False
+            self.is_all_subcases = is_all_subcases
+            self.valid_subcases = valid_subcases
+            self._table_index = table_index
+            for result, code in aliases:
+                dict.__delitem__(result, code)
+
+        for result_type, code, obj in lazy_results:
+            if hasattr(obj, 'finalize'):
+                obj.finalize()
+
+    def _get_lazy_index_header(self, op2_filename):
+        """gets the data that says if a lazy index is up to date"""
+        stat = os.stat(op2_filename)
+        subcases = None
+        if not self.is_all_subcases:
+            subcases = sorted(self.valid_subcases)
+        header = {
+            'pyNastran_version' : pyNastran.__version__,
+            'class_name' : self.__class__.__name__,
+            'op2_filename' : os.path.abspath(op2_filename),
+            'size' : stat.st_size,
+            'mtime' : stat.st_mtime,
+            'subcases' : subcases,
+            'results' : sorted(self._results.saved),
+        }
+        return header
+
+    def _get_pass1_state(self):
+        """gets the picklable state of the model after the sizing pass"""
+        keys_to_skip = [
+            'log', 'f', 'binary_debug', '_data_view',
+            'fdtype', 'idtype', 'double_dtype', 'long_dtype',
+            'struct_i', 'struct_2i', 'struct_8s',
+            'generalized_tables', '_get_table_mapper', '_result_tables',
+            'op2_profile',
+        ]
+        state = {}
+        for key, value in iteritems(self.__dict__):
+            if key in keys_to_skip:
+                continue
+            state[key] = value
+        return state
+
+    def _save_lazy_index(self, index_filename):
+        """saves the sizing pass (read_mode=1) of a lazy model"""
+        state = self._get_pass1_state()
+        header = self._get_lazy_index_header(self.op2_filename)
+        with open(index_filename, 'wb') as index_file:
+            dump(header, index_file)
+            dump(state, index_file)
+
+    def _load_lazy_index(self, op2_filename, index_filename):
+        """
+        Loads the sizing pass (read_mode=1) of a lazy model
+
+        Returns
+        -------
+        is_loaded : bool
+            False : the index doesn't exist or is out of date
+        """
+        if not os.path.exists(index_filename):
+            return False
+        with open(index_filename, 'rb') as index_file:
+            header = load(index_file)
+            if header != self._get_lazy_index_header(op2_filename):
+                self.log.info('index_filename=%r is out of date' % index_filename)
+                return False
+            state = load(index_file)
+        self.log.debug('loading index_filename=%r' % index_filename)
+        self.__dict__.update(state)
+        self._set_structs()
+        return True
+
+    def _get_parallel_tables(self, nworkers):
+        """
+        Splits the result tables between the workers after the sizing pass.
+
+        Tables that fill the same result object (e.g., a SORT1 table that
+        is split in 2) are kept together.  Tables that don't create
+        result objects (e.g., geometry, LAMA, OGPWG) are read by the
+        main process.
+
+        Returns
+        -------
+        worker_tables : List[List[table_name]]
+            the table names to read for each worker
+        worker_keys : List[List[(result_type, code)]]
+            the result objects that are filled by each worker
+        """
+        result_keys = {}
+        for result_type in self.get_table_types():
+            result = getattr(self, result_type)
+            if not isinstance(result, dict):
+                continue
+            for code, obj in iteritems(result):
+                result_keys[id(obj)] = (result_type, code)
+
+        # group the tables that share result objects
+        table_groups = []
+        group_keys = []
+        for obj_id, table_names in iteritems(self._result_tables):
+            if obj_id not in result_keys:
+                # the object isn't stored in a result dictionary
+                continue
+            table_names = set(table_names)
+            keys = [result_keys[obj_id]]
+            for igroup in range(len(table_groups) - 1, -1, -1):
+                if table_groups[igroup] & table_names:
+                    table_names |= table_groups.pop(igroup)
+                    keys += group_keys.pop(igroup)
+            table_groups.append(table_names)
+            group_keys.append(keys)
+
+        table_sizes = {}
+        for table_name, n0, n1, is_pass2 in self._table_index:
+            if is_pass2:
+                table_sizes[table_name] = table_sizes.get(table_name, 0) + n1 - n0
+        groups = []
+        for table_names, keys in zip(table_groups, group_keys):
+            size = sum([table_sizes.get(table_name, 0) for table_name in table_names])
+            if size == 0:
+                continue
+            groups.append((size, sorted(table_names), keys))
+
+        # biggest groups first to the least loaded worker
+        groups.sort(key=lambda group: (-group[0], group[1]))
+        nworkers = min(nworkers, len(groups))
+        worker_sizes = [0] * nworkers
+        worker_tables = [[] for i in range(nworkers)]
+        worker_keys = [[] for i in range(nworkers)]
+        for size, table_names, keys in groups:
+            iworker = worker_sizes.index(min(worker_sizes))
+            worker_sizes[iworker] += size
+            worker_tables[iworker] += table_names
+            worker_keys[iworker] += keys
+        return worker_tables, worker_keys
+
+    def _read_op2_parallel(self, nworkers):
+        """
+        Fills the result tables (read_mode=2) using a process pool.
+
+        Each worker gets a copy of the sized model and reads its tables
+        using the table index.  The main process reads the remaining
+        tables while the workers run and then puts the filled results
+        back into the result dictionaries, so the keys are in the same
+        order as a serial read.
+        """
+        worker_tables, worker_keys = self._get_parallel_tables(nworkers)
+        if len(worker_tables) < 2:
+            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+            return
+
+        parallel_table_names = set([])
+        for table_names in worker_tables:
+            parallel_table_names.update(table_names)
+        self.log.debug('reading %s tables with nworkers=%s' % (
+            len(parallel_table_names), len(worker_tables)))
+
+        state = self._get_pass1_state()
+        is_profile = self.op2_profile is not None
+        args = [(state, table_names, keys, is_profile)
+                for table_names, keys in zip(worker_tables, worker_keys)]
+        pool = multiprocessing.Pool(len(worker_tables))
+        try:
+            async_results = pool.map_async(_read_tables_worker, args)
+
+            table_index = self._table_index
+            self._table_index = [
+                (table_name, n0, n1, is_pass2 and table_name not in parallel_table_names)
+                for (table_name, n0, n1, is_pass2) in table_index]
+            try:
+                OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+            finally:
+                self._table_index = table_index
+            worker_results = async_results.get()
+        finally:
+            pool.close()
+            pool.join()
+
+        for results, unvectorized_results, op2_profile in worker_results:
+            for (result_type, code), obj in results:
+                getattr(self, result_type)[code] = obj
+            for key, nelements in iteritems(unvectorized_results):
+                self._unvectorized_results[key] = (
+                    self._unvectorized_results.get(key, 0) + nelements)
+            if op2_profile is not None:
+                self.op2_profile.merge(op2_profile)
+
     def build_dataframe(self):
         """
         Converts the OP2 objects into pandas DataFrames
@@ -599,6 +1152,93 @@ class OP2(OP2_Scalar):
                     obj.export_to_hdf5(result_group, self.log)
                     i += 1
 
+    def load_hdf5(self, hdf5_filename, subcases=None, result_types=None, lazy=True):
+        """
+        Loads the results written by ``export_to_hdf5``
+
+        Parameters
+        ----------
+        hdf5_filename : str
+            the HDF5 file
+        subcases : List[int, ...] / int; default=None->all subcases
+            the subcases to load
+        result_types : List[str] / str; default=None -> all results
+            the results to load (e.g., ['displacements', 'cquad4_stress'])
+        lazy : bool; default=True
+            True : the result arrays (e.g., obj.data) are read from the
+                   HDF5 file when the result is accessed
+                   (e.g., op2.displacements[1])
+            False : read everything
+
+        .. note:: eigenvalues and files exported before the data_code was
+                  written aren't supported
+        """
+        import h5py
+        if isinstance(subcases, integer_types):
+            subcases = [subcases]
+        if isinstance(result_types, string_types):
+            result_types = [result_types]
+        table_types = self.get_table_types()
+
+        result_classes = get_result_classes()
+        self._lazy_groups = {}
+        self._lazy_loaded = set([])
+        self._hdf5_filename = hdf5_filename
+        lazy_result_types = set([])
+        with h5py.File(hdf5_filename, 'r') as hdf5_file:
+            for name, group in iteritems(hdf5_file):
+                if name == 'info':
+                    if 'nastran_format' in group:
+                        self._nastran_format = load_hdf5_dataset(
+                            'nastran_format', group['nastran_format'])
+                    continue
+                elif name == 'matrices':
+                    for matrix_name, matrix_group in iteritems(group):
+                        self.matrices[matrix_name] = load_matrix_from_hdf5(
+                            matrix_name, matrix_group)
+                    continue
+
+                # Subcase=1 or Subcase=(1, 2, 1, 0, '')
+                if not name.startswith('Subcase='):
+                    self.log.warning('HDF5: skipping group=%r' % name)
+                    continue
+                try:
+                    key = literal_eval(name[8:])
+                except (ValueError, SyntaxError):
+                    # eigenvalues use the title
+                    key = name[8:]
+                isubcase = key[0] if isinstance(key, tuple) else key
+                if subcases is not None and isubcase not in subcases:
+                    continue
+
+                for result_type, result_group in iteritems(group):
+                    if result_types is not None and result_type not in result_types:
+                        continue
+                    if result_type not in table_types:
+                        self.log.warning('HDF5: skipping result_type=%r' % result_type)
+                        continue
+                    obj = load_result_from_hdf5(result_group, result_classes,
+                                                self.log, lazy=lazy)
+                    if obj is None:
+                        continue
+                    getattr(self, result_type)[key] = obj
+                    if lazy:
+                        self._lazy_groups[id(obj)] = result_group.name
+                        lazy_result_types.add(result_type)
+
+        for result_type in lazy_result_types:
+            setattr(self, result_type, LazyResultDict(self, getattr(self, result_type)))
+
+    def _load_hdf5_result(self, obj, group_name):
+        """reads the arrays of a result that was loaded with load_hdf5(..., lazy=True)"""
+        import h5py
+        self._lazy_loaded.add(group_name)
+        with h5py.File(self._hdf5_filename, 'r') as hdf5_file:
+            group = hdf5_file[group_name]
+            for name in LAZY_NAMES:
+                if name in group:
+                    setattr(obj, name, load_hdf5_dataset(name, group[name]))
+
     def combine_results(self, combine=True):
         """
         we want the data to be in the same format and grouped by subcase, so
@@ -653,6 +1293,8 @@ class OP2(OP2_Scalar):
         unique_isubcases = np.unique(isubcases)
 
         self.log.debug('combine_results')
+        # renaming a lazy result doesn't load it
+        self._is_lazy_loading = True
         for result_type in result_types:
             result = getattr(self, result_type)
             if len(result) == 0:
@@ -707,6 +1349,11 @@ class OP2(OP2_Scalar):
                     else:
                         self.log.info("res=%s has combine" % res1.__class__.__name__)
                     res2 = result[key2]
+                    if self._lazy_groups:
+                        self._is_lazy_loading = False
+                        self._load_lazy_result(res1)
+                        self._load_lazy_result(res2)
+                        self._is_lazy_loading = True
                     del result[key1]
                     del result[key2]
                     res1.combine(res2)
@@ -716,6 +1363,7 @@ class OP2(OP2_Scalar):
                     #self.log.info("continue")
                     continue
             setattr(self, result_type, result)
+        self._is_lazy_loading = False
         #print('subcase_key =', self.subcase_key)
 
         subcase_key2 = {}
@@ -767,6 +1415,30 @@ class OP2(OP2_Scalar):
                     self.log.info('  %s' % str(key))
         #self.log.info('subcase_key = %s' % self.subcase_key)
 
+    def get_vectorization_report(self):
+        """
+        Lists the OES/OEF (table, element, format_code, num_wide) blocks
+        from the last read_op2 that don't have a vectorized reader and
+        were read one element at a time.
+
+        Returns
+        -------
+        msg : str
+            the report; each line has the table name, element name,
+            element type, format_code (1=real, 2=real/imag, 3=mag/phase),
+            num_wide and the number of elements that were read
+        """
+        if not self._unvectorized_results:
+            return 'all OES/OEF results were read with the vectorized readers\n'
+        msg = ['unvectorized OES/OEF results:\n']
+        msg.append('  %-10s %-10s %5s %6s %8s %10s\n' % (
+            'table', 'element', 'etype', 'format', 'num_wide', 'nelements'))
+        for key, nelements in sorted(iteritems(self._unvectorized_results)):
+            table_name, element_name, element_type, format_code, num_wide = key
+            msg.append('  %-10s %-10s %5s %6s %8s %10s\n' % (
+                table_name, element_name, element_type, format_code, num_wide, nelements))
+        return ''.join(msg)
+
     def transform_displacements_to_global(self, i_transform, coords, xyz_cid0=None, debug=False):
         """
         Transforms the ``data`` of displacement-like results into the
@@ -1160,6 +1832,52 @@ class OP2(OP2_Scalar):
         self.log.debug('-----------')
         return
 
+def _read_tables_worker(args):
+    """
+    Fills a subset of the result tables for ``read_op2(..., nworkers=N)``
+
+    Parameters
+    ----------
+    args : (state, table_names, keys, is_profile)
+        state : dict
+            the picklable state of the model after the sizing pass
+        table_names : List[bytes]
+            the tables to read
+        keys : List[(result_type, code)]
+            the result objects that are filled by the tables
+        is_profile : bool
+            is read_op2(..., profile=True) being used
+
+    Returns
+    -------
+    results : List[((result_type, code), obj)]
+        the filled result objects
+    unvectorized_results : dict
+        the blocks that were read with the unvectorized loops
+    op2_profile : OP2Profile / None
+        the filling pass timings (read_op2(..., profile=True))
+    """
+    state, table_names, keys, is_profile = args
+    model = OP2(debug=False)
+    model.__dict__.update(state)
+    model.debug_file = None
+    model.binary_debug = None
+    model._table_index = [
+        (table_name, n0, n1, is_pass2 and table_name in table_names)
+        for (table_name, n0, n1, is_pass2) in model._table_index]
+    model.read_mode = 2
+    model._close_op2 = True
+    model._set_structs()
+    if is_profile:
+        model.op2_profile = OP2Profile()
+    OP2_Scalar.read_op2(model, op2_filename=model.op2_filename)
+
+    results = []
+    for result_type, code in keys:
+        results.append(((result_type, code), getattr(model, result_type)[code]))
+    return results, model._unvectorized_results, model.op2_profile
+
+
 def main():  # pragma: no cover
     """testing new ideas"""
     import pyNastran
@@ -295,6 +295,23 @@ class OP2GeomCommon(OP2, GEOM1, GEOM2, GEOM3, GEOM4, EPT, MPT, DIT, DYNAMICS):
         with open(obj_filename, 'wb') as obj_file:
             dump(self, obj_file)
 
+    def _get_pass1_state(self):
+        """
+        Gets the picklable state of the model after the sizing pass.
+        The geometry is read on the second pass by the main process, so
+        the geometry parsers (bound methods) are skipped.
+        """
+        state = OP2._get_pass1_state(self)
+        keys_to_skip = [
+            '_geom1_map', '_geom2_map', '_geom3_map', '_geom4_map',
+            '_ept_map', '_mpt_map', '_dit_map', '_dynamics_map',
+            '_edom_map', '_contact_map', '_edt_map', '_viewtb_map',
+        ]
+        for key in keys_to_skip:
+            if key in state:
+                del state[key]
+        return state
+
     def _get_table_mapper(self):
         table_mapper = OP2._get_table_mapper(self)
 
@@ -0,0 +1,158 @@
+"""
+Defines methods for reading the results written by OP2.export_to_hdf5:
+ - get_result_classes()
+ - load_result_from_hdf5(group, result_classes, log, lazy=True)
+ - load_matrix_from_hdf5(name, group)
+ - load_hdf5_dataset(name, dataset)
+"""
+from __future__ import print_function
+import json
+from six import iteritems, string_types
+import numpy as np
+from scipy.sparse import coo_matrix
+
+from pyNastran.op2.result_objects.op2_objects import BaseScalarObject
+from pyNastran.op2.tables.matrix import Matrix
+
+#: these are lists on the result objects
+LIST_NAMES = ['headers', 'data_names', 'words', '_ntotals']
+
+#: the arrays that are only read when the result is accessed (lazy=True)
+LAZY_NAMES = ['data']
+
+
+def get_result_classes():
+    """
+    Gets the result classes (e.g., RealDisplacementArray)
+
+    Returns
+    -------
+    result_classes : dict[(module, class_name)] = class
+        the classes that are derived from BaseScalarObject;
+        the module is used because some class names aren't unique
+    """
+    result_classes = {}
+    classes = [BaseScalarObject]
+    while classes:
+        cls = classes.pop()
+        for subclass in cls.__subclasses__():
+            result_classes[(subclass.__module__, subclass.__name__)] = subclass
+            classes.append(subclass)
+    return result_classes
+
+
+def load_result_from_hdf5(group, result_classes, log, lazy=True):
+    """
+    Rebuilds a result object (e.g., RealDisplacementArray)
+
+    Parameters
+    ----------
+    group : h5py.Group
+        the group written by obj.export_to_hdf5
+    result_classes : dict[(module, class_name)] = class
+        the result classes from ``get_result_classes()``
+    log : Log()
+        a logging object
+    lazy : bool; default=True
+        don't read the LAZY_NAMES (e.g., data) arrays
+
+    Returns
+    -------
+    obj : varies / None
+        the result object; None if the object can't be rebuilt
+    """
+    class_name = load_hdf5_dataset('class_name', group['class_name'])
+    if 'data_code' not in group.attrs:
+        log.warning('HDF5: skipping %s; data_code was not exported' % class_name)
+        return None
+    class_key = (_cast_attr(group.attrs['class_module']), class_name)
+    if class_key not in result_classes:
+        log.warning('HDF5: skipping class_name=%r; unknown class' % class_name)
+        return None
+
+    data_code = json.loads(_cast_attr(group.attrs['data_code']), object_hook=_from_json)
+    is_sort1 = bool(group['is_sort1'][()]) if 'is_sort1' in group else True
+    obj = result_classes[class_key](data_code, is_sort1, data_code['isubcase'],
+                                    data_code['nonlinear_factor'])
+
+    cls = obj.__class__
+    for name, dataset in iteritems(group):
+        if name == 'class_name' or isinstance(getattr(cls, name, None), property):
+            continue
+        if lazy and name in LAZY_NAMES:
+            continue
+        setattr(obj, name, load_hdf5_dataset(name, dataset))
+
+    # the datasets are read as strings, so use the types in data_code
+    for name, value in iteritems(data_code):
+        if isinstance(value, bytes):
+            setattr(obj, name, value)
+
+    for data_name in data_code['data_names']:
+        # e.g., dts, modes, freqs
+        name = data_name + 's'
+        if isinstance(getattr(obj, name, None), np.ndarray):
+            setattr(obj, name, getattr(obj, name).tolist())
+    obj.is_built = True
+    return obj
+
+
+def load_matrix_from_hdf5(name, group):
+    """Rebuilds a Matrix written by Matrix.export_to_hdf5"""
+    matrix = Matrix(name, form=None)
+    for key, dataset in iteritems(group):
+        if key in ['row', 'col']:
+            continue
+        value = load_hdf5_dataset(key, dataset)
+        if isinstance(getattr(Matrix, key, None), property):
+            continue
+        setattr(matrix, key, value)
+
+    if 'row' in group and 'col' in group:
+        # sparse
+        data = group['data'][()]
+        row = group['row'][()]
+        col = group['col'][()]
+        matrix.data = coo_matrix((data, (row, col)), shape=tuple(group.attrs['shape']))
+    return matrix
+
+
+def _from_json(value):
+    """casts the bytes that were tagged by ``write_utils._to_json`` back to bytes"""
+    if len(value) == 1 and '__bytes__' in value:
+        return value['__bytes__'].encode('latin1')
+    return value
+
+
+def _cast_attr(value):
+    """h5py may return string attributes as bytes"""
+    if isinstance(value, bytes):
+        value = value.decode('latin1')
+    return value
+
+
+def load_hdf5_dataset(name, dataset):
+    """
+    Reads an HDF5 dataset and casts the strings that h5py stores as
+    bytes back to the types that are used by the result objects.
+    """
+    value = dataset[()]
+    if isinstance(value, bytes):
+        value = value.decode('latin1')
+    elif isinstance(value, np.ndarray):
+        if value.dtype.kind == 'O' and value.size and isinstance(value.flat[0], bytes):
+            # variable length strings
+            value = value.astype('S')
+        if value.dtype.kind == 'S':
+            value = value.astype('U')
+            if name in LIST_NAMES:
+                value = value.tolist()
+            elif name == 'gridtype_str':
+                value = value.view(np.chararray)
+        elif name in LIST_NAMES:
+            value = value.tolist()
+    elif isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, string_types) and name in LIST_NAMES:
+        value = [value]
+    return value
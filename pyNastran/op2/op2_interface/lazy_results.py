@@ -0,0 +1,56 @@
+"""
+Defines:
+ - LazyResultDict(model, results)
+
+   Methods
+   -------
+   - get(key, default=None)
+   - values()
+   - items()
+   - itervalues()
+   - iteritems()
+"""
+
+
+class LazyResultDict(dict):
+    """
+    A result dictionary (e.g., ``model.displacements``) that is used
+    by ``read_op2(..., lazy=True)``.
+
+    The result objects (e.g., RealDisplacementArray) are sized on the
+    first pass of the OP2, but the data isn't read until the object is
+    accessed.  Iterating over the keys doesn't load anything.
+    """
+    def __init__(self, model, results):
+        """
+        Parameters
+        ----------
+        model : OP2()
+            the model that loads the results
+        results : Dict[key] = result
+            the sized, but unfilled results
+        """
+        dict.__init__(self, results)
+        self.model = model
+
+    def __getitem__(self, key):
+        obj = dict.__getitem__(self, key)
+        self.model._load_lazy_result(obj)
+        return obj
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def values(self):
+        return [self[key] for key in list(self.keys())]
+
+    def items(self):
+        return [(key, self[key]) for key in list(self.keys())]
+
+    def itervalues(self):
+        return iter(self.values())
+
+    def iteritems(self):
+        return iter(self.items())
@@ -5,7 +5,7 @@ from six import string_types, b
 from six.moves import range
 
 import numpy as np
-from numpy import radians, sin, cos, fromstring, ones, dtype as npdtype
+from numpy import radians, sin, cos, frombuffer, ones, dtype as npdtype
 
 from pyNastran import is_release
 from pyNastran.f06.f06_writer import F06Writer
@@ -48,6 +48,12 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
         # -----------------
         self.use_vector = True
 
+        #: the (table_name, element_name, element_type, format_code, num_wide)
+        #: OES/OEF blocks that were read with the unvectorized (struct) loops
+        #: even though use_vector=True; the value is the number of elements
+        #: see ``OP2.get_vectorization_report()``
+        self._unvectorized_results = {}
+
         # is a debug file being written to
         self.is_debug_file = False
 
@@ -848,8 +854,8 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             n = nnodes * 4 * 8
             itotal2 = obj.itotal + nnodes
             #print('ndata=%s n=%s nnodes=%s' % (ndata, n, nnodes))
-            ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj._times[obj.itime] = dt
             #self.node_gridtype[self.itotal, :] = [node_id, grid_type]
             #self.data[self.itime, self.itotal, :] = [v1, v2, v3, v4, v5, v6]
@@ -903,13 +909,13 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj.data[obj.itime, obj.itotal:itotal2, 0] = floats[:, 2]
             assert np.abs(floats[:, 3:]).max() == 0, '%s is not a scalar result...' % obj.__class__.__name__
             obj._times[itime] = dt
@@ -947,14 +953,14 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal = obj.itotal
             itotal2 = itotal + nnodes
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
                 #nids = ints[:, 0] // 10
                 nids = ones(nnodes, dtype='int32') * eid
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj._times[itime] = floats[:, 0]
             obj.data[obj.itime, itotal:itotal2, :] = floats[:, 2]
             assert np.abs(floats[:, 3:]).max() == 0, '%s is not a scalar result...' % obj.__class__.__name__
@@ -993,8 +999,8 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             n = nnodes * 4 * 8
             itotal2 = obj.itotal + nnodes
             #print('ndata=%s n=%s nnodes=%s' % (ndata, n, nnodes))
-            ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj._times[obj.itime] = dt
             #self.node_gridtype[self.itotal, :] = [node_id, grid_type]
             #self.data[self.itime, self.itotal, :] = [v1, v2, v3, v4, v5, v6]
@@ -1044,14 +1050,14 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
 
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:]
             obj._times[itime] = dt
             obj.itotal = itotal2
@@ -1089,14 +1095,14 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal = obj.itotal
             itotal2 = itotal + nnodes
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
                 #nids = ints[:, 0] // 10
                 nids = ones(nnodes, dtype='int32') * eid
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj._times[itime] = floats[:, 0]
             obj.data[obj.itime, itotal:itotal2, :] = floats[:, 2:]
             obj.itotal = itotal2
@@ -1135,13 +1141,13 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = obj.itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 14)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 14)
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[obj.itotal:itotal2, 0] = nids
                 obj.node_gridtype[obj.itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 14)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 14)
             mag = floats[:, 2:8]
             phase = floats[:, 8:]
             rtheta = radians(phase)
@@ -1182,14 +1188,14 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 14)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 14)
                 #print(ints[:, :2])
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 14)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 14)
             real = floats[:, 2:8]
             imag = floats[:, 8:]
 
@@ -1395,6 +1401,9 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
                 self.obj = storage_obj[code]
             else:
                 storage_obj[code] = self.obj
+        if self.read_mode == 1:
+            # the tables that fill each result (used by nworkers > 1)
+            self._result_tables.setdefault(id(self.obj), set([])).add(self.table_name)
 
     def _get_code(self):
         code = self.isubcase
@@ -1928,6 +1937,22 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             auto_return = True
         return auto_return, is_vectorized
 
+    def _add_unvectorized_result(self, nelements):
+        """
+        Tracks an OES/OEF result block that is read with a struct.unpack
+        loop, so the missing vectorized readers can be found with
+        ``OP2.get_vectorization_report()``
+
+        Parameters
+        ----------
+        nelements : int
+            the number of elements in the block
+        """
+        if self.read_mode == 2 and self.use_vector:
+            key = (self.table_name_str, self.element_name, self.element_type,
+                   self.format_code, self.num_wide)
+            self._unvectorized_results[key] = self._unvectorized_results.get(key, 0) + nelements
+
     def _set_structs(self):
         """
         defines common struct formats
@@ -423,6 +423,7 @@ class OP2_F06_Common(object):
         #: OESNLXR - CTRIA3/CQUAD4 strain
         #self.nonlinearPlateStrain = {}
         #self.hyperelastic_plate_stress = {}
+        self.hyperelastic_cquad4_stress = {}
         self.hyperelastic_cquad4_strain = {}
 
         self.nonlinear_cquad4_stress = {}
@@ -837,6 +838,7 @@ class OP2_F06_Common(object):
             'nonlinear_ctria3_strain',
 
             #'hyperelastic_plate_stress',
+            'hyperelastic_cquad4_stress',
             'hyperelastic_cquad4_strain',
 
             # OES - CEALS1 224, CELAS3 225
@@ -0,0 +1,195 @@
+"""
+Defines:
+ - OP2Profile()
+
+   Methods
+   -------
+   - add_pass(read_mode, dt)
+   - add_table(table_name, read_mode, nbytes, dt)
+   - add_table4(table_name, parser_name, read_mode, nbytes, dt, is_vectorized, obj)
+   - merge(profile)
+   - to_dict()
+   - get_summary()
+"""
+from __future__ import print_function
+from six import iteritems, itervalues
+import numpy as np
+
+
+class OP2Profile(object):
+    """
+    The per-table and per-table4_parser timings of ``read_op2(..., profile=True)``
+
+    The timings are stored as numbers rather than text, so the cost is
+    a few calls to ``time.time()`` per table 4 record.
+    """
+    def __init__(self):
+        #: pass_times[read_mode] = dt
+        self.pass_times = {1 : 0., 2 : 0.}
+        #: tables[table_name] = stats
+        self.tables = {}
+        #: parsers[(table_name, parser_name)] = stats
+        self.parsers = {}
+        #: the ids of the result objects that have had their arrays counted
+        self._counted_objs = set([])
+
+    def add_pass(self, read_mode, dt):
+        """adds the time to read the tables on the sizing/filling pass"""
+        self.pass_times[read_mode] += dt
+
+    def add_table(self, table_name, read_mode, nbytes, dt):
+        """
+        Adds the time to read a table
+
+        Parameters
+        ----------
+        table_name : bytes
+            the table name (e.g., OUGV1)
+        read_mode : int
+            1 : the sizing pass
+            2 : the filling pass
+        nbytes : int
+            the number of bytes in the table
+        dt : float
+            the wall time in seconds
+        """
+        if table_name not in self.tables:
+            self.tables[table_name] = {
+                'ntables' : 0,
+                'nbytes' : 0,
+                'pass1_time' : 0.,
+                'pass2_time' : 0.,
+            }
+        stats = self.tables[table_name]
+        if read_mode == 1:
+            stats['ntables'] += 1
+            stats['nbytes'] += nbytes
+            stats['pass1_time'] += dt
+        else:
+            stats['pass2_time'] += dt
+
+    def add_table4(self, table_name, parser_name, read_mode, nbytes, dt,
+                   is_vectorized, obj):
+        """
+        Adds the time to read a table 4 record
+
+        Parameters
+        ----------
+        table_name : bytes
+            the table name (e.g., OES1X1)
+        parser_name : str
+            the name of the table4_parser (e.g., _read_oes1_4)
+        read_mode : int
+            1 : the sizing pass
+            2 : the filling pass
+        nbytes : int
+            the number of bytes in the record
+        dt : float
+            the wall time in seconds
+        is_vectorized : bool
+            was the record read with the vectorized (numpy) path
+        obj : varies / None
+            the result object that was filled; its arrays are counted
+            once they've been allocated
+        """
+        key = (table_name, parser_name)
+        if key not in self.parsers:
+            self.parsers[key] = {
+                'nrecords' : 0,
+                'nbytes' : 0,
+                'pass1_time' : 0.,
+                'pass2_time' : 0.,
+                'nvectorized' : 0,
+                'nscalar' : 0,
+                'narrays' : 0,
+                'array_nbytes' : 0,
+            }
+        stats = self.parsers[key]
+        if read_mode == 1:
+            stats['nrecords'] += 1
+            stats['nbytes'] += nbytes
+            stats['pass1_time'] += dt
+            return
+
+        stats['pass2_time'] += dt
+        if is_vectorized:
+            stats['nvectorized'] += 1
+        else:
+            stats['nscalar'] += 1
+
+        if getattr(obj, 'is_built', False) and id(obj) not in self._counted_objs:
+            self._counted_objs.add(id(obj))
+            for value in itervalues(obj.__dict__):
+                if isinstance(value, np.ndarray):
+                    stats['narrays'] += 1
+                    stats['array_nbytes'] += value.nbytes
+
+    def merge(self, profile):
+        """
+        Adds the filling pass of another profile (e.g., from a worker
+        of ``read_op2(..., nworkers=N)``)
+        """
+        for table_name, stats in iteritems(profile.tables):
+            self.add_table(table_name, 2, stats['nbytes'], stats['pass2_time'])
+        for key, stats in iteritems(profile.parsers):
+            if key not in self.parsers:
+                self.parsers[key] = dict(stats)
+                continue
+            statsi = self.parsers[key]
+            for name in ['pass2_time', 'nvectorized', 'nscalar', 'narrays', 'array_nbytes']:
+                statsi[name] += stats[name]
+
+    def to_dict(self):
+        """
+        Gets the report as a JSON-friendly dictionary
+
+        Returns
+        -------
+        report : dict
+            pass1_time / pass2_time : float
+                the time to read the tables on the sizing/filling pass
+            tables : dict[table_name] = stats
+                ntables, nbytes, pass1_time, pass2_time
+            parsers : List[stats]
+                table_name, parser, nrecords, nbytes, pass1_time,
+                pass2_time, nvectorized, nscalar, narrays, array_nbytes
+        """
+        tables = {}
+        for table_name, stats in sorted(iteritems(self.tables)):
+            tables[_to_str(table_name)] = dict(stats)
+
+        parsers = []
+        for (table_name, parser_name), stats in sorted(iteritems(self.parsers)):
+            statsi = dict(stats)
+            statsi['table_name'] = _to_str(table_name)
+            statsi['parser'] = parser_name
+            parsers.append(statsi)
+        report = {
+            'pass1_time' : self.pass_times[1],
+            'pass2_time' : self.pass_times[2],
+            'tables' : tables,
+            'parsers' : parsers,
+        }
+        return report
+
+    def get_summary(self):
+        """gets a printable version of the report"""
+        msg = '%-8s %-24s %7s %10s %10s %10s %6s %6s %10s\n' % (
+            'table', 'parser', 'records', 'MB', 'pass1', 'pass2',
+            'vector', 'scalar', 'array MB')
+        for (table_name, parser_name), stats in sorted(iteritems(self.parsers)):
+            msg += '%-8s %-24s %7i %10.3f %10.4f %10.4f %6i %6i %10.3f\n' % (
+                _to_str(table_name), parser_name, stats['nrecords'],
+                stats['nbytes'] / 1024. ** 2, stats['pass1_time'], stats['pass2_time'],
+                stats['nvectorized'], stats['nscalar'], stats['array_nbytes'] / 1024. ** 2)
+        return msg
+
+    def __repr__(self):
+        return 'OP2Profile(ntables=%s, nparsers=%s)' % (len(self.tables), len(self.parsers))
+
+
+def _to_str(table_name):
+    """the table names are bytes"""
+    if isinstance(table_name, bytes):
+        table_name = table_name.decode('latin1')
+    return table_name.strip()
@@ -34,8 +34,12 @@ Defines the sub-OP2 class.  This should never be called outisde of the OP2 class
    - _table_passer(data, ndata)
    - _validate_op2_filename(op2_filename)
    - _create_binary_debug()
+   - _close_op2_file()
    - _make_tables()
    - _read_tables(table_name)
+   - _read_indexed_tables()
+   - _read_profiled_table(table_name)
+   - _read_table(table_name)
    - _read_tol()
    - _skip_table(table_name)
    - _read_dit()
@@ -54,6 +58,8 @@ Defines the sub-OP2 class.  This should never be called outisde of the OP2 class
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
+import mmap
+import time
 #import sys
 from struct import unpack, Struct
 from collections import Counter
@@ -1294,6 +1300,11 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         """
         self._count = 0
         if self.read_mode == 1:
+            self._table_index = []
+            self._table_counts = {}
+            self._record_lengths = {}
+            self._result_tables = {}
+            self._unvectorized_results = {}
             #sr = list(self._results.saved)
             #sr.sort()
             #self.log.debug('_results.saved = %s' % str(sr))
@@ -1325,6 +1336,12 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         if not hasattr(self, 'f') or self.f is None:
             #: the OP2 file object
             self.f = open(self.op2_filename, 'rb')
+            if self.backend == 'mmap':
+                # the map holds its own handle, so the file can be closed
+                op2_file = self.f
+                self.f = mmap.mmap(op2_file.fileno(), 0, access=mmap.ACCESS_READ)
+                op2_file.close()
+                self._data_view = memoryview(self.f)
             self._endian = None
             flag_data = self.f.read(20)
             self.f.seek(0)
@@ -1359,18 +1376,37 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             raise FatalError('There was a Nastran FATAL Error.  Check the F06.\nNo tables exist...')
 
         self._make_tables()
-        table_names = self._read_tables(table_name)
+        if self.op2_profile is None:
+            table_names = self._read_tables(table_name)
+        else:
+            time0 = time.time()
+            table_names = self._read_tables(table_name)
+            self.op2_profile.add_pass(self.read_mode, time.time() - time0)
         if self.is_debug_file:
             self.binary_debug.write('-' * 80 + '\n')
             self.binary_debug.write('f.tell()=%s\ndone...\n' % self.f.tell())
             self.binary_debug.close()
         if self._close_op2:
-            self.f.close()
+            self._close_op2_file()
             del self.binary_debug
             del self.f
         #self.remove_unpickable_data()
         return table_names
 
+    def _close_op2_file(self):
+        """closes the OP2 file (or the memory map)"""
+        if self._data_view is not None:
+            if hasattr(self._data_view, 'release'):
+                # memoryview.release is new in Python 3.2
+                self._data_view.release()
+            self._data_view = None
+        try:
+            self.f.close()
+        except BufferError:
+            # a result is still holding a view of the memory map;
+            # the map is closed when the last view is garbage collected
+            self.log.debug('the memory map of %r is still in use' % self.op2_filename)
+
     def _read_version(self):
         """reads the version header"""
         #try:
@@ -1514,11 +1550,24 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         Reads all the geometry/result tables.
         The OP2 header is not read by this function.
 
+        On read_mode=1, the start/end location of each table is stored
+        in ``self._table_index``.  On read_mode=2, the index is used to
+        jump directly to the tables that still need to be filled, so
+        tables that were completely handled on the first pass (e.g.,
+        matrices, unsupported tables, unrequested subcases) aren't
+        walked a second time.
+
         Parameters
         ----------
         table_name : bytes str
             the first table's name
         """
+        if self.read_mode == 2 and self._table_index and (
+                not self.is_debug_file or self._is_lazy_loading):
+            return self._read_indexed_tables()
+
+        if self.read_mode == 1:
+            self._table_index = []
         table_names = []
         while table_name is not None:
             table_names.append(table_name)
@@ -1530,82 +1579,145 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             if is_release:
                 self.log.debug('  table_name=%r' % table_name)
 
-            self.table_name = table_name
-            #if 0:
-                #self._skip_table(table_name)
-            #else:
-            if table_name in self.generalized_tables:
-                self.generalized_tables[table_name](self)
-            elif table_name in GEOM_TABLES:
-                self._read_geom_table()  # DIT (agard)
-            elif table_name == b'GPL':
-                self._read_gpl()
-            #elif table_name == b'MEFF':
-                #self._read_meff()
-            elif table_name == b'INTMOD':
-                self._read_intmod()
-            elif table_name == b'HISADD':
-                self._read_hisadd()
-            elif table_name == b'FRL':  # frequency response list
-                self._skip_table(self.table_name)
-            elif table_name == b'EXTDB':
-                self._read_extdb()
-            elif table_name == b'OMM2':
-                self._read_omm2()
-            elif table_name == b'TOL':
-                self._read_tol()
-            elif table_name == b'PCOMPTS': # blade
-                self._read_pcompts()
-            elif table_name == b'MONITOR':
-                self._read_monitor()
-            elif table_name == b'AEMONPT':
-                self._read_aemonpt()
-            elif table_name == b'FOL':
-                self._read_fol()
-            elif table_name == b'SDF':
-                self._read_sdf()
-            elif table_name in [b'IBULK', b'CDDATA']:
-                self._read_ibulk()
-            elif table_name == b'CMODEXT':
-                self._read_cmodext()
-            elif table_name in MATRIX_TABLES:
-                self._read_matrix(table_name)
-            elif table_name in RESULT_TABLES:
-                self._read_results_table()
-            elif self.skip_undefined_matrices:
-                self._read_matrix(table_name)
-            elif table_name.strip() in self.additional_matrices:
-                self._read_matrix(table_name)
-            else:
-                msg = (
-                    'Invalid Table = %r\n\n'
-                    'If you have matrices that you want to read, see:\n'
-                    '  model.set_additional_matrices_to_read(matrices)'
-                    '  matrices = {\n'
-                    "      b'BHH' : True,\n"
-                    "      b'KHH' : False,\n"
-                    '  }  # you want to read some matrices, but not others\n'
-                    "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
-
-                    'If you the table is a geom/result table, see:\n'
-                    '  model.set_additional_result_tables_to_read(methods_dict)\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method3, method4],\n"
-                    "      b'GEOM4SX' : [method3, method4],\n"
-                    "      b'OES1X1' : False,\n"
-                    '  }\n\n'
-
-                    'If you want to take control of the OP2 reader (mainly useful for obscure tables), see:\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method],\n"
-                    '  }\n'
-                    '  model.set_additional_generalized_tables_to_read(methods_dict)\n' % table_name
-                )
-                raise NotImplementedError(msg)
+            n0 = self.n
+            if self.read_mode == 1:
+                self._table_counts[n0] = self._count
+            self._read_profiled_table(table_name)
+            if self.read_mode == 1:
+                self._table_index.append((table_name, n0, self.n, self._table_pass2))
 
             table_name = self._read_table_name(rewind=True, stop_on_failure=False)
         return table_names
 
+    def _read_indexed_tables(self):
+        """
+        Reads the tables found by the read_mode=1 scan.
+
+        Only the tables that require a second pass are read.  The rest
+        are jumped over without parsing their headers.
+        """
+        table_names = []
+        for table_name, n0, n1, is_pass2 in self._table_index:
+            table_names.append(table_name)
+            if not is_pass2:
+                if is_release:
+                    self.log.debug('  table_name=%r (read on pass 1)' % table_name)
+                continue
+
+            if is_release:
+                self.log.debug('  table_name=%r' % table_name)
+            self._goto(n0)
+            # the result keys depend on the number of tables before it
+            self._count = self._table_counts.get(n0, self._count)
+            self._read_profiled_table(table_name)
+            assert self.n == n1, 'table_name=%r n=%s expected=%s' % (table_name, self.n, n1)
+        return table_names
+
+    def _read_profiled_table(self, table_name):
+        """
+        Reads a single geometry/result table and adds its time to
+        ``self.op2_profile`` (read_op2(..., profile=True))
+        """
+        if self.op2_profile is None:
+            self._read_table(table_name)
+            return
+        n0 = self.n
+        time0 = time.time()
+        self._read_table(table_name)
+        self.op2_profile.add_table(table_name, self.read_mode, self.n - n0, time.time() - time0)
+
+    def _read_table(self, table_name):
+        """
+        Reads a single geometry/result table
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+        """
+        self.table_name = table_name
+
+        # tables are assumed to require a second pass until proven
+        # otherwise (e.g., all the subtables were skipped)
+        self._table_pass2 = True
+        #if 0:
+            #self._skip_table(table_name)
+        #else:
+        if table_name in self.generalized_tables:
+            self.generalized_tables[table_name](self)
+        elif table_name in GEOM_TABLES:
+            self._table_pass2 = False
+            self._read_geom_table()  # DIT (agard)
+        elif table_name == b'GPL':
+            self._read_gpl()
+        #elif table_name == b'MEFF':
+            #self._read_meff()
+        elif table_name == b'INTMOD':
+            self._read_intmod()
+        elif table_name == b'HISADD':
+            self._read_hisadd()
+        elif table_name == b'FRL':  # frequency response list
+            self._skip_table(self.table_name)
+            self._table_pass2 = False
+        elif table_name == b'EXTDB':
+            self._read_extdb()
+        elif table_name == b'OMM2':
+            self._read_omm2()
+        elif table_name == b'TOL':
+            self._read_tol()
+        elif table_name == b'PCOMPTS': # blade
+            self._read_pcompts()
+        elif table_name == b'MONITOR':
+            self._read_monitor()
+        elif table_name == b'AEMONPT':
+            self._read_aemonpt()
+        elif table_name == b'FOL':
+            self._read_fol()
+        elif table_name == b'SDF':
+            self._read_sdf()
+        elif table_name in [b'IBULK', b'CDDATA']:
+            self._read_ibulk()
+        elif table_name == b'CMODEXT':
+            self._read_cmodext()
+        elif table_name in MATRIX_TABLES:
+            self._read_matrix(table_name)
+            self._table_pass2 = False
+        elif table_name in RESULT_TABLES:
+            self._table_pass2 = False
+            self._read_results_table()
+        elif self.skip_undefined_matrices:
+            self._read_matrix(table_name)
+            self._table_pass2 = False
+        elif table_name.strip() in self.additional_matrices:
+            self._read_matrix(table_name)
+            self._table_pass2 = False
+        else:
+            msg = (
+                'Invalid Table = %r\n\n'
+                'If you have matrices that you want to read, see:\n'
+                '  model.set_additional_matrices_to_read(matrices)'
+                '  matrices = {\n'
+                "      b'BHH' : True,\n"
+                "      b'KHH' : False,\n"
+                '  }  # you want to read some matrices, but not others\n'
+                "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
+
+                'If you the table is a geom/result table, see:\n'
+                '  model.set_additional_result_tables_to_read(methods_dict)\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method3, method4],\n"
+                "      b'GEOM4SX' : [method3, method4],\n"
+                "      b'OES1X1' : False,\n"
+                '  }\n\n'
+
+                'If you want to take control of the OP2 reader (mainly useful for obscure tables), see:\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method],\n"
+                '  }\n'
+                '  model.set_additional_generalized_tables_to_read(methods_dict)\n' % table_name
+            )
+            raise NotImplementedError(msg)
+
     def _read_tol(self):
         """
         This is probably broken for MSC Nastran
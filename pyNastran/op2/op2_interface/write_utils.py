@@ -2,6 +2,7 @@
 Defines methods for the op2 writer
 """
 from __future__ import print_function
+import json
 from struct import Struct, pack
 import numpy as np
 import scipy.sparse as sp
@@ -82,7 +83,10 @@ def export_to_hdf5(self, group, log):
             #msg = 'sub-object export_to_hdf5 not supported\nkey=%s value=%s' % (key, value)
             #raise NotImplementedError(msg)
         try:
-            group.create_dataset(name, data=value)
+            if name == 'data' and isinstance(value, np.ndarray) and value.ndim == 3 and value.size:
+                _create_result_dataset(self, group, value)
+            else:
+                group.create_dataset(name, data=value)
         except TypeError:
             print('name = %r; type=%s' % (name, type(value)))
             print(value)
@@ -91,3 +95,39 @@ def export_to_hdf5(self, group, log):
             #continue
         #print('done')
 
+    # used by OP2.load_hdf5 to rebuild the object
+    for name in ['_times', '_ntotals']:
+        value = getattr(self, name, None)
+        if value is not None and len(value):
+            group.create_dataset(name, data=value)
+    if isinstance(getattr(self, 'data_code', None), dict):
+        group.attrs['class_module'] = self.__class__.__module__
+        group.attrs['data_code'] = json.dumps(self.data_code, default=_to_json)
+
+
+def _create_result_dataset(self, group, data):
+    """
+    Creates a compressed data array that is chunked by time step, so a
+    single time step can be read without reading the full array.
+    """
+    chunks = (1, ) + data.shape[1:]
+    if not getattr(self, 'is_sort1', True):
+        # SORT2 is (nnodes, ntimes, nresults), so a time step is
+        # data[:, itime, :] (all the nodes/elements)
+        chunks = (data.shape[0], 1, data.shape[2])
+    group.create_dataset('data', data=data, chunks=chunks, compression='gzip')
+
+
+def _to_json(value):
+    """
+    Casts numpy scalars/arrays in data_code to json types.  Bytes (e.g.,
+    table_name) are tagged, so load_hdf5 can cast them back to bytes.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    elif isinstance(value, np.generic):
+        return value.item()
+    elif isinstance(value, bytes):
+        return {'__bytes__' : value.decode('latin1')}
+    raise TypeError('value=%r of type %s is not JSON serializable' % (value, type(value)))
+
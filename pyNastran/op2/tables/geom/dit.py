@@ -61,8 +61,8 @@ class DIT(GeomCommon):
         nfields = (ndata - n) // 4
 
         datan = data[n:]
-        ints = np.fromstring(data[n:], self.idtype)
-        floats = np.fromstring(data[n:], self.fdtype)
+        ints = np.frombuffer(data[n:], self.idtype)
+        floats = np.frombuffer(data[n:], self.fdtype)
         iminus1_delta = get_iend_from_ints(ints)
         istart = 0
         nentries = 0
@@ -308,8 +308,8 @@ class DIT(GeomCommon):
         nfields = (ndata - n) // 4
 
         datan = data[n:]
-        ints = np.fromstring(data[n:], self.idtype)
-        floats = np.fromstring(data[n:], self.fdtype)
+        ints = np.frombuffer(data[n:], self.idtype)
+        floats = np.frombuffer(data[n:], self.fdtype)
         iminus1_delta = get_iend_from_ints(ints)
         istart = 0
         nentries = 0
@@ -145,8 +145,8 @@ class DYNAMICS(GeomCommon):
         #nfields = (ndata - n) // 4
 
         datan = data[n:]
-        ints = np.fromstring(data[n:], self.idtype)
-        floats = np.fromstring(data[n:], self.fdtype)
+        ints = np.frombuffer(data[n:], self.idtype)
+        floats = np.frombuffer(data[n:], self.fdtype)
         istart = 0
         iminus1_delta = get_iend_from_ints(ints)
         nentries = 0
@@ -518,8 +518,8 @@ class DYNAMICS(GeomCommon):
 
     def _read_freq(self, data, n):
         """FREQ(1307,13,126) - Record 13"""
-        ints = np.fromstring(data[n:], self.idtype)
-        floats = np.fromstring(data[n:], self.fdtype)
+        ints = np.frombuffer(data[n:], self.idtype)
+        floats = np.frombuffer(data[n:], self.fdtype)
         iminus1 = np.where(ints == -1)[0]
         istart = 0
         for iend in iminus1:
@@ -642,8 +642,8 @@ class DYNAMICS(GeomCommon):
         3 F2  RS Upper bound of modal frequency range
         4 FRI RS Fractions of natural frequencies
         """
-        ints = np.fromstring(data, dtype='int32')
-        floats = np.fromstring(data, dtype='float32')
+        ints = np.frombuffer(data, dtype='int32')
+        floats = np.frombuffer(data, dtype='float32')
         i_minus_1s = np.where(ints == -1)[0]
         nentries = len(i_minus_1s)
 
@@ -395,8 +395,8 @@ class EPT(GeomCommon):
         Word 7 repeats until (-1) occurs
         """
         #strs = numpy.core.defchararray.reshapesplit(data, sep=",")
-        ints = np.fromstring(data[n:], self._endian + 'i')
-        floats = np.fromstring(data[n:], self._endian + 'f')
+        ints = np.frombuffer(data[n:], self._endian + 'i')
+        floats = np.frombuffer(data[n:], self._endian + 'f')
         iminus1 = np.where(ints == -1)[0]
 
         istart = [0] + list(iminus1[:-1] + 1)
@@ -3,7 +3,7 @@ from __future__ import print_function, unicode_literals
 from six import b
 from six.moves import range
 from struct import Struct
-from numpy import fromstring, array
+from numpy import frombuffer, array
 
 from pyNastran.op2.tables.oee_energy.oee_objects import RealStrainEnergyArray, ComplexStrainEnergyArray
 from pyNastran.op2.op2_interface.op2_common import OP2Common
@@ -289,10 +289,10 @@ class ONR(OP2Common):
                 itotal = obj.itotal
                 itotal2 = obj.itotal + nelements * 4
 
-                floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 4)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
                 obj._times[itime] = dt
                 #if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nelements, 4)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
                 eids = ints[:, 0] // 10
                 assert eids.min() > 0, eids.min()
                 obj.element[itime, ielement:ielement2] = eids
@@ -331,13 +331,13 @@ class ONR(OP2Common):
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
-                floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                 obj._times[obj.itime] = dt
 
-                strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 5)
+                strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 5)
                 #print(strings)
                 if obj.itime == 0:
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                     if obj.element_name == 'DMIG':
                         s = array([(s1+s2).decode('latin1').strip()
                                    for s1, s2 in zip(strings[:, 0], strings[:, 1])], dtype='|U8')
@@ -393,11 +393,11 @@ class ONR(OP2Common):
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
-                floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                 obj._times[obj.itime] = dt
 
                 #if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                 eids = ints[:, 0] // 10
                 assert eids.min() > 0, eids.min()
                 obj.element[itotal:itotal2] = eids
@@ -438,14 +438,14 @@ class ONR(OP2Common):
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
-                floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                 obj._times[obj.itime] = dt
 
                 if obj.itime == 0:
-                    strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 6)
+                    strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 6)
                     s = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, 6)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 6)
                     eids = ints[:, 0] // 10
                     assert eids.min() > 0, eids.min()
                     obj.element[itotal:itotal2] = eids
@@ -8,7 +8,7 @@ from struct import Struct
 from six import b
 from six.moves import range
 import numpy as np
-from numpy import fromstring, vstack, sin, cos, radians, array
+from numpy import frombuffer, vstack, sin, cos, radians, array, repeat
 from numpy import hstack, zeros
 
 from pyNastran.op2.op2_helper import polar_to_real_imag
@@ -23,10 +23,6 @@ from pyNastran.op2.tables.oef_forces.oef_thermal_objects import (
 
     RealHeatFluxVUBeamArray,
     RealHeatFluxVU3DArray,
-
-    # TODO: vectorize 2
-    HeatFlux_VUBEAM,
-    HeatFlux_VU_3D,
 )
 from pyNastran.op2.tables.oef_forces.oef_force_objects import (
     RealRodForceArray, RealViscForceArray,
@@ -41,10 +37,6 @@ from pyNastran.op2.tables.oef_forces.oef_force_objects import (
     RealSolidPressureForceArray,
     RealCBeamForceArray,
     RealBendForceArray,
-
-
-    # TODO: vectorize 1
-    RealForce_VU_2D,
     RealForceVU2DArray,
 
     RealCBeamForceVUArray,
@@ -63,9 +55,7 @@ from pyNastran.op2.tables.oef_forces.oef_complex_force_objects import (
     ComplexPlate2ForceArray,
     ComplexSolidPressureForceArray,
     ComplexCBendForceArray,
-
-    # TODO: vectorize 1
-    ComplexForce_VU_2D,
+    ComplexForceVU2DArray,
     ComplexCBeamForceVUArray,
 )
 
@@ -391,16 +381,16 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
 
-                    strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 9)
+                    strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 9)
                     s = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
                     #print(s)
                     #print('itime = ', obj.itime)
                     #print('---------')
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -413,6 +403,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8s6f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -484,14 +475,14 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     #if obj.itime == 0:
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                     eids = ints[:, 0] // 10
                     assert eids.min() > 0, eids.min()
                     obj.element[itotal:itotal2] = eids
-                    strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 9)
+                    strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 9)
                     obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                     #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux]
@@ -501,6 +492,7 @@ class OEF(OP2Common):
                 else:
                     # no zed on this element for some reason...
                     s = Struct(b(self._endian + 'i8s6f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         n += ntotal
@@ -525,14 +517,14 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 10)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 10)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
-                        strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 10)
+                        strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 10)
                         obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                     #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux, zed]
@@ -541,6 +533,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8s6fi'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         n += ntotal
@@ -605,10 +598,10 @@ class OEF(OP2Common):
                         ielement2 = obj.itotal + nelements
                         itotal2 = ielement2
 
-                        floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 8)
+                        floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                         obj._times[obj.itime] = dt
                         if obj.itime == 0:
-                            ints = fromstring(data, dtype=self.idtype).reshape(nelements, 8)
+                            ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
                             eids = ints[:, 0] // 10
                             assert eids.min() > 0, eids.min()
                             obj.element[itotal:itotal2] = eids
@@ -620,6 +613,7 @@ class OEF(OP2Common):
                         obj.ielement = ielement2
                     else:
                         s1 = Struct(b(self._endian + 'i8s5f'))
+                        self._add_unvectorized_result(nelements)
                         for i in range(nelements):
                             edata = data[n:n+32]
                             n += ntotal
@@ -668,10 +662,10 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 4)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 4)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
                         eids = ints[:, 0] // 10
                         nids = ints[:, 2]
                         assert eids.min() > 0, eids.min()
@@ -685,6 +679,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s1 = Struct(b(self._endian + 'ifif'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]
                         n += 16
@@ -698,8 +693,6 @@ class OEF(OP2Common):
                 return self._not_implemented_or_skip(data, ndata, msg)
 
         elif self.element_type in [145, 146, 147]:  # VUHEXA,VUPENTA,VUTETRA
-            # TODO: vectorize
-
             # 145-VUHEXA
             # 146-VUPENTA
             # 147-VUTETRA
@@ -723,18 +716,11 @@ class OEF(OP2Common):
             if self.format_code == 1 and self.num_wide == numwide_real:  # real
                 ntotal = 8 + 28 * nnodes
                 nelements = ndata // ntotal
-                if 1:
-                    if self.read_mode == 1:
-                        return ndata
-                    self.create_transient_object(self.thermalLoad_VU_3D, HeatFlux_VU_3D)
-                    is_vectorized = False
-                else:
-                    nelements = ndata // ntotal
-                    auto_return, is_vectorized = self._create_oes_object4(
-                        nelements, result_name, slot, RealHeatFluxVU3DArray)
-                    if auto_return:
-                        self._data_factor = nnodes
-                        return nelements * self.num_wide * 4
+                auto_return, is_vectorized = self._create_oes_object4(
+                    nelements, result_name, slot, RealHeatFluxVU3DArray)
+                if auto_return:
+                    self._data_factor = nnodes
+                    return nelements * self.num_wide * 4
 
                 obj = self.obj
                 if self.use_vector and is_vectorized:
@@ -744,32 +730,33 @@ class OEF(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements * nnodes
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                     floats2 = floats[:, 2:].reshape(nelements * nnodes, 7)
                     obj._times[obj.itime] = dt
-                    #if obj.itime == 0:
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                     ints2 = ints[:, 2:].reshape(nelements * nnodes, 7)
-                    eids = ints[:, 0] // 10
-                    parent = ints[:, 1]
-                    assert eids.min() > 0, eids.min()
-                    obj.element_parent[ielement:ielement2] = eids
-                    obj.element_parent[ielement:ielement2] = parent
+                    if obj.itime == 0:
+                        eids = ints[:, 0] // 10
+                        parent = ints[:, 1]
+                        assert eids.min() > 0, eids.min()
+                        obj.element_parent[ielement:ielement2, 0] = eids
+                        obj.element_parent[ielement:ielement2, 1] = parent
 
                     #[vugrid, xgrad, ygrad, zgrad, xflux, yflux, zflux]
-                    obj.vugrid[obj.itime, itotal:itotal2, :] = ints2[:, 0]
-                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 3:]
+                    obj.vugrid[obj.itime, itotal:itotal2, 0] = ints2[:, 0]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 1:]
                     obj.itotal = itotal2
                     obj.ielement = ielement2
                 else:
                     s1 = self.struct_2i
                     s2 = Struct(b(self._endian + 'i6f'))
-                    grad_fluxes = []
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         out = s1.unpack(data[n:n+8])
                         n += 8
                         (eid_device, parent) = out
                         eid = eid_device // 10
+                        grad_fluxes = []
                         for i in range(nnodes):
                             out = s2.unpack(data[n:n+28])
                             grad_fluxes.append(out)
@@ -780,7 +767,6 @@ class OEF(OP2Common):
                 return self._not_implemented_or_skip(data, ndata, msg)
 
         elif self.element_type in [189, 190]:  # VUQUAD,VUTRIA
-            # TODO: vectorize
             # 189-VUQUAD
             # 190-VUTRIA
             if self.format_code == 1 and self.num_wide == 27:  # real
@@ -817,8 +803,8 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
                         eids = ints[:, 0] // 10
@@ -845,6 +831,7 @@ class OEF(OP2Common):
                 else:
                     s1 = Struct(b(self._endian + '3i4s2i'))
                     s2 = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+24]  # 6*4
                         n += 24
@@ -867,7 +854,6 @@ class OEF(OP2Common):
                 return self._not_implemented_or_skip(data, ndata, msg)
 
         elif self.element_type == 191:  # VUBEAM
-            # TODO: vectorize
             nnodes = 2
             numwide_real = 4 + 7 * nnodes
 
@@ -880,17 +866,11 @@ class OEF(OP2Common):
                 ntotal = 16 + 28 * nnodes
                 nelements = ndata // ntotal
 
-                if 0:
-                    if self.read_mode == 1:
-                        return ndata
-                    #assert self.num_wide==27,self.code_information()
-                    self.create_transient_object(self.thermalLoad_VUBeam, HeatFlux_VUBEAM)
-                else:
-                    auto_return, is_vectorized = self._create_oes_object4(
-                        nelements, result_name, slot, RealHeatFluxVUBeamArray)
-                    if auto_return:
-                        self._data_factor = nnodes
-                        return nelements * self.num_wide * 4
+                auto_return, is_vectorized = self._create_oes_object4(
+                    nelements, result_name, slot, RealHeatFluxVUBeamArray)
+                if auto_return:
+                    self._data_factor = nnodes
+                    return nelements * self.num_wide * 4
 
                 obj = self.obj
                 if self.use_vector and is_vectorized:
@@ -900,8 +880,8 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
                         eids = ints[:, 0] // 10
@@ -926,6 +906,7 @@ class OEF(OP2Common):
                 else:
                     s1 = Struct(b(self._endian + 'iii4s'))
                     s2 = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]  # 4*4
                         n += 16
@@ -1097,10 +1078,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1117,6 +1098,7 @@ class OEF(OP2Common):
 
                     obj = self.obj
                     s = Struct(b(self._endian + 'iff'))  # 3
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -1149,10 +1131,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1165,6 +1147,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i4f'))  # 5
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+20]
 
@@ -1207,10 +1190,10 @@ class OEF(OP2Common):
                     #itotal2 = obj.itotal + nelements
                     #ielement2 = obj.ielement + nelements
 
-                    #floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
+                    #floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
                     #obj._times[obj.itime] = dt
                     #if obj.itime == 0:
-                        #ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        #ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         #eids = ints[:, 0] // 10
                         #assert eids.min() > 0, eids.min()
                         #assert 0 not in eids, eids
@@ -1258,10 +1241,10 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 100)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 100)[:, 1:]
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 100)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 100)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         assert 0 not in eids, eids
@@ -1285,6 +1268,7 @@ class OEF(OP2Common):
                 else:
                     s1 = self.struct_i
                     s2 = Struct(b(self._endian + 'i8f'))  # 36
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+4]
                         eid_device, = s1.unpack(edata)
@@ -1324,10 +1308,10 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 177)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 177)[:, 1:]
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 177)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 177)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         assert 0 not in eids, eids
@@ -1364,6 +1348,7 @@ class OEF(OP2Common):
                     s2 = Struct(b(self._endian + 'i15f'))
                     ntotal = 708  # (16*11+1)*4 = 177*4
                     nelements = ndata // ntotal
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+4]
                         eid_device, = s1.unpack(edata)
@@ -1487,10 +1472,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 2)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 2)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 2)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 2)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1501,6 +1486,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'if'))  # 2
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 8]
                         out = s.unpack(edata)
@@ -1532,10 +1518,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1547,6 +1533,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i2f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 12]
                         out = s.unpack(edata)
@@ -1590,10 +1577,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1604,6 +1591,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'iff'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+12]
 
@@ -1636,10 +1624,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1652,6 +1640,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i4f'))  # 5
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+20]
 
@@ -1701,10 +1690,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1715,6 +1704,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8f'))  # 9
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 36]
 
@@ -1729,7 +1719,6 @@ class OEF(OP2Common):
             elif self.format_code in [2, 3] and self.num_wide == 17: # imag
                 slot = self.cbar_force
 
-                # TODO: vectorize
                 ntotal = 68  # 17*4
                 nelements = ndata // ntotal
 
@@ -1739,41 +1728,66 @@ class OEF(OP2Common):
                     return nelements * self.num_wide * 4
 
                 obj = self.obj
-                s = Struct(b(self._endian + 'i16f'))
-                for i in range(nelements):
-                    edata = data[n:n + 68]
-
-                    out = s.unpack(edata)
-                    (eid_device,
-                     bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
-                     bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
-                    if self.is_debug_file:
-                        self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
-                    eid = eid_device // 10
-                    if is_magnitude_phase:
-                        bm1a = polar_to_real_imag(bm1ar, bm1ai)
-                        bm2a = polar_to_real_imag(bm2ar, bm2ai)
-                        bm1b = polar_to_real_imag(bm1br, bm1bi)
-                        bm2b = polar_to_real_imag(bm2br, bm2bi)
-                        ts1 = polar_to_real_imag(ts1r, ts1i)
-                        ts2 = polar_to_real_imag(ts2r, ts2i)
-                        af = polar_to_real_imag(afr, afi)
-                        trq = polar_to_real_imag(trqr, trqi)
-                    else:
-                        bm1a = complex(bm1ar, bm1ai)
-                        bm2a = complex(bm2ar, bm2ai)
-                        bm1b = complex(bm1br, bm1bi)
-                        bm2b = complex(bm2br, bm2bi)
-                        ts1 = complex(ts1r, ts1i)
-                        ts2 = complex(ts2r, ts2i)
-                        af = complex(afr, afi)
-                        trq = complex(trqr, trqi)
-
-                    #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-                    #print "%s" % (self.get_element_type(self.element_type)), data_in
-                    #eid = obj.add_new_eid(out)
-                    obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
-                    n += ntotal
+                if self.use_vector and is_vectorized:
+                    n = nelements * ntotal
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements
+                    obj._times[obj.itime] = dt
+
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype,
+                                          count=nelements * 17).reshape(nelements, 17)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        obj.element[itotal:itotal2] = eids
+
+                    floats = frombuffer(data, dtype=self.fdtype,
+                                        count=nelements * 17).reshape(nelements, 17)[:, 1:]
+
+                    #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                    isave1 = [0, 1, 2, 3, 4, 5, 6, 7]
+                    isave2 = [8, 9, 10, 11, 12, 13, 14, 15]
+                    real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2)
+                    obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                    obj.itotal = itotal2
+                    obj.ielement = itotal2
+                else:
+                    s = Struct(b(self._endian + 'i16f'))
+                    self._add_unvectorized_result(nelements)
+                    for i in range(nelements):
+                        edata = data[n:n + 68]
+
+                        out = s.unpack(edata)
+                        (eid_device,
+                         bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
+                         bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
+                        if self.is_debug_file:
+                            self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
+                        eid = eid_device // 10
+                        if is_magnitude_phase:
+                            bm1a = polar_to_real_imag(bm1ar, bm1ai)
+                            bm2a = polar_to_real_imag(bm2ar, bm2ai)
+                            bm1b = polar_to_real_imag(bm1br, bm1bi)
+                            bm2b = polar_to_real_imag(bm2br, bm2bi)
+                            ts1 = polar_to_real_imag(ts1r, ts1i)
+                            ts2 = polar_to_real_imag(ts2r, ts2i)
+                            af = polar_to_real_imag(afr, afi)
+                            trq = polar_to_real_imag(trqr, trqi)
+                        else:
+                            bm1a = complex(bm1ar, bm1ai)
+                            bm2a = complex(bm2ar, bm2ai)
+                            bm1b = complex(bm1br, bm1bi)
+                            bm2b = complex(bm2br, bm2bi)
+                            ts1 = complex(ts1r, ts1i)
+                            ts2 = complex(ts2r, ts2i)
+                            af = complex(afr, afi)
+                            trq = complex(trqr, trqi)
+
+                        #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                        #print "%s" % (self.get_element_type(self.element_type)), data_in
+                        #eid = obj.add_new_eid(out)
+                        obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
+                        n += ntotal
             else:
                 msg = self.code_information()
                 return self._not_implemented_or_skip(data, ndata, msg)
@@ -1799,10 +1813,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 8)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 8)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1813,6 +1827,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i7f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+32]
 
@@ -1853,15 +1868,15 @@ class OEF(OP2Common):
                     return nelements * self.num_wide * 4
 
                 obj = self.obj
-                if is_vectorized:
+                if self.use_vector and is_vectorized:
                     n = nelements * 4 * self.num_wide
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[ielement:ielement2] = eids
@@ -1872,6 +1887,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+36]
                         out = s.unpack(edata)
@@ -1898,10 +1914,10 @@ class OEF(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 17)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 17)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1915,6 +1931,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i16f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+68]
                         out = s.unpack(edata)
@@ -2014,7 +2031,7 @@ class OEF(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, numwide_real)
                         # Nastran makes this a 4 for CQUAD4s instead
                         # of 0 like the bilinear stress element...
                         ints[:, 2] = 0
@@ -2025,7 +2042,7 @@ class OEF(OP2Common):
                         obj.element_node[istart:iend, 0] = eids2
                         obj.element_node[istart:iend, 1] = nids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                     results = floats[:, 2:].reshape(nlayers, 9)[:, 1:]
                     #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
                     obj.data[obj.itime, istart:iend, :] = results
@@ -2033,6 +2050,7 @@ class OEF(OP2Common):
                     s1 = Struct(b(self._endian + 'i4si8f'))  # 8+36
                     s2 = Struct(b(self._endian + 'i8f')) # 36
 
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 44]
 
@@ -2072,10 +2090,10 @@ class OEF(OP2Common):
                     ielement2 = obj.ielement + nelements
                     itotal2 = obj.itotal + nelements * nnodes_all
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, numwide_imag)
                         ints[:, 2] = 0
                         ints2 = ints[:, 2:].reshape(nelements * nnodes_all, 17)
 
@@ -2101,6 +2119,7 @@ class OEF(OP2Common):
                     ntotal = 8 + (nnodes + 1) * 68
                     nelements = ndata // ntotal
                     obj = self.obj
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 76]
                         n += 76
@@ -2176,29 +2195,13 @@ class OEF(OP2Common):
             if self.format_code == 1 and self.num_wide == 9:  # real
                 if self.read_mode == 1:
                     return ndata
+                # TODO: the composite failure indices aren't stored yet
+                #    i    8s              i        f
+                #   (eid, failure_theory, ply_id, failure_index_for_ply,
+                #    six, seven, flag, nine)
                 ntotal = 36
                 nelements = ndata // ntotal
-
-                s1 = Struct(b('i8sifffif'))
-                s2 = Struct(b('i8sifffff'))
-                for i in range(nelements):
-                    edata = data[n:n+ntotal]  # 4*9
-                    out = s1.unpack(edata)
-
-                    # i    8s              i        f
-                    (eid, failure_theory, ply_id, failure_index_for_ply,
-                     six, seven, flag, nine,
-                     #failure_index_for_bonding,
-                     #failure_index_for_element,
-                     #flag,
-                     #direct_stress_or_strain,
-                     #interlaminar_stress,
-                     #max_of_fb_fp_for_all_plies
-                    ) = out
-                    if flag != -1:
-                        out = s2.unpack(edata)
-                    #print(out)
-                    n += 36
+                n = nelements * ntotal
 
 
                 ## TODO: add
@@ -2294,10 +2297,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 17)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 17)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2309,6 +2312,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i16f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+68]
 
@@ -2352,10 +2356,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 33)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 33)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 33)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 33)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2376,6 +2380,7 @@ class OEF(OP2Common):
                     #self.create_transient_object(self.cshear_force, ComplexCShearForce)
                     s = Struct(b(self._endian + 'i32f'))
 
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+132]
                         n += ntotal
@@ -2454,10 +2459,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 7)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2468,6 +2473,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -2504,10 +2510,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2518,6 +2524,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+36]
 
@@ -2554,10 +2561,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 15)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 15)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 15)
                         eids = ints[:, 0] // 10
                         nids_a = ints[:, 1]
                         nids_b = ints[:, 8]
@@ -2576,6 +2583,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i i6fi6f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
 
@@ -2593,7 +2601,6 @@ class OEF(OP2Common):
                             nid_b, bm1_b, bm2_b, ts1_b, ts2_b, af_b, trq_b)
                         n += ntotal
             elif self.format_code in [2, 3] and self.num_wide == 27:  # imag
-                # TODO: vectorize
                 ntotal = 108  # 27*4
                 nelements = ndata // ntotal
 
@@ -2623,10 +2630,10 @@ class OEF(OP2Common):
                     # 21     22     23     24     25    26
                     # bm1Br, bm2Br, ts1Br, ts2Br, afBr, trqBr,
                     # bm1Bi, bm2Bi, ts1Bi, ts2Bi, afBi, trqBi
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 27)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 27)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 27)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 27)
                         eids = ints[:, 0] // 10
                         nids_a = ints[:, 1]
                         nids_b = ints[:, 14]
@@ -2648,6 +2655,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i i12f i12f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+108]
                         n += ntotal
@@ -2742,10 +2750,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 10)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 10)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2756,6 +2764,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8s7f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n : n + 40]
                         n += 40
@@ -2787,10 +2796,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 16)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 16)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 16)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 16)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2817,6 +2826,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8s13f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+64]
                         n += 64
@@ -2883,15 +2893,16 @@ class OEF(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
-                    results = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    results = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
 
                     #[fx, fy, fz, mx, my, mz]
                     obj.data[obj.itime, istart:iend, :] = results[:, 1:]
                 else:
                     s = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+28]
                         out = s.unpack(edata)
@@ -2902,7 +2913,6 @@ class OEF(OP2Common):
                         obj.add(dt, eid, fx, fy, fz, mx, my, mz)
                         n += ntotal
             elif self.format_code in [2, 3] and self.num_wide == 13:  # imag
-                # TODO: vectorize
                 ntotal = 52  # 13*4
                 nelements = ndata // ntotal
                 result_name = 'cbush_force'
@@ -2911,37 +2921,61 @@ class OEF(OP2Common):
                 if auto_return:
                     return nelements * self.num_wide * 4
 
-                s = Struct(b(self._endian + 'i12f'))
-
                 obj = self.obj
-                for i in range(nelements):
-                    edata = data[n:n + 52]
+                if self.use_vector and is_vectorized:
+                    n = nelements * ntotal
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements
+                    obj._times[obj.itime] = dt
 
-                    out = s.unpack(edata)
-                    if self.is_debug_file:
-                        self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
-                    (eid_device,
-                     fxr, fyr, fzr, mxr, myr, mzr,
-                     fxi, fyi, fzi, mxi, myi, mzi) = out
-                    eid = eid_device // 10
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype,
+                                          count=nelements * 13).reshape(nelements, 13)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        obj.element[itotal:itotal2] = eids
 
-                    if is_magnitude_phase:
-                        fx = polar_to_real_imag(fxr, fxi)
-                        mx = polar_to_real_imag(mxr, mxi)
-                        fy = polar_to_real_imag(fyr, fyi)
-                        my = polar_to_real_imag(myr, myi)
-                        fz = polar_to_real_imag(fzr, fzi)
-                        mz = polar_to_real_imag(mzr, mzi)
-                    else:
-                        fx = complex(fxr, fxi)
-                        mx = complex(mxr, mxi)
-                        fy = complex(fyr, fyi)
-                        my = complex(myr, myi)
-                        fz = complex(fzr, fzi)
-                        mz = complex(mzr, mzi)
-
-                    obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
-                    n += ntotal
+                    floats = frombuffer(data, dtype=self.fdtype,
+                                        count=nelements * 13).reshape(nelements, 13)[:, 1:]
+
+                    #[fx, fy, fz, mx, my, mz]
+                    isave1 = [0, 1, 2, 3, 4, 5]
+                    isave2 = [6, 7, 8, 9, 10, 11]
+                    real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2)
+                    obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                    obj.itotal = itotal2
+                    obj.ielement = itotal2
+                else:
+                    s = Struct(b(self._endian + 'i12f'))
+                    self._add_unvectorized_result(nelements)
+                    for i in range(nelements):
+                        edata = data[n:n + 52]
+
+                        out = s.unpack(edata)
+                        if self.is_debug_file:
+                            self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
+                        (eid_device,
+                         fxr, fyr, fzr, mxr, myr, mzr,
+                         fxi, fyi, fzi, mxi, myi, mzi) = out
+                        eid = eid_device // 10
+
+                        if is_magnitude_phase:
+                            fx = polar_to_real_imag(fxr, fxi)
+                            mx = polar_to_real_imag(mxr, mxi)
+                            fy = polar_to_real_imag(fyr, fyi)
+                            my = polar_to_real_imag(myr, myi)
+                            fz = polar_to_real_imag(fzr, fzi)
+                            mz = polar_to_real_imag(mzr, mzi)
+                        else:
+                            fx = complex(fxr, fxi)
+                            mx = complex(mxr, mxi)
+                            fy = complex(fyr, fyi)
+                            my = complex(myr, myi)
+                            fz = complex(fzr, fzi)
+                            mz = complex(mzr, mzi)
+
+                        obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
+                        n += ntotal
             #elif self.format_code == 2 and self.num_wide == 7:
                 #self.log.warning(self.code_information())
                 #asdf
@@ -2983,88 +3017,49 @@ class OEF(OP2Common):
                 # real - format_code == 1
                 # random - format_code == 2
 
-                use_new = True
-                if use_new:
-                    #ntotal = (6 + nnodes * 13) * 4 # 6+n*13
-                    ntotal = 24 + 52 * nnodes
-                    nelements = ndata // ntotal
-                    #result_name = 'force_VU_2D'
-                    self._results._found_result(result_name)
-
-
-                    auto_return, is_vectorized = self._create_oes_object4(
-                        nelements, result_name, slot, RealForceVU2DArray)
-                    if auto_return:
-                        self._data_factor = nnodes
-                        return nelements * self.num_wide * 4
-
-                    obj = self.obj
-                    if self.use_vector and is_vectorized and 0:
-                        # self.itime = 0
-                        # self.ielement = 0
-                        # self.itotal = 0
-                        #self.ntimes = 0
-                        #self.nelements = 0
-                        n = nelements * self.num_wide * 4
-
-                        istart = obj.itotal
-                        iend = istart + nelements
-                        obj._times[obj.itime] = dt
-
-                        if obj.itime == 0:
-                            ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
-                            eids = ints[:, 0] // 10
-                            obj.element_node[istart:iend] = eids_nids
-                        results = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                #ntotal = (6 + nnodes * 13) * 4 # 6+n*13
+                ntotal = 24 + 52 * nnodes
+                nelements = ndata // ntotal
+                #result_name = 'force_VU_2D'
+                self._results._found_result(result_name)
 
-                        #[fx, fy, fz, mx, my, mz]
-                        obj.data[obj.itime, istart:iend, :] = results[:, 1:]
-                    else:
-                        # 6+n*13
-                        s1 = Struct(b(self._endian + '3i4s2i')) # 6
-                        s2 = Struct(b(self._endian + 'i3f3i5fi')) # 13
-                        for i in range(nelements):
-                            edata = data[n:n+24]  # 6*4
-                            n += 24
 
-                            out = s1.unpack(edata)
-                            if self.is_debug_file:
-                                self.binary_debug.write('OEF_Force_%s-%s - %s\n' % (
-                                    etype, self.element_type, str(out)))
-                            (eid_device, parent, coord, icord, theta, _) = out
+                auto_return, is_vectorized = self._create_oes_object4(
+                    nelements, result_name, slot, RealForceVU2DArray)
+                if auto_return:
+                    self._data_factor = nnodes
+                    return nelements * self.num_wide * 4
 
-                            eid = eid_device // 10
-                            data_in = [eid, parent, coord, icord, theta]
-
-                            forces = []
-                            for i in range(nnodes):
-                                edata = data[n:n+52]  # 13*4
-                                n += 52
-                                out = s2.unpack(edata)
-                                if self.is_debug_file:
-                                    self.binary_debug.write('%s\n' % (str(out)))
-                                (vugrid, mfx, mfy, mfxy, ai, bi, ci, bmx, bmy,
-                                 bmxy, syz, szx, di) = out
-                                out2 = (vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
-                                obj.add_sort1(dt, eid, parent, coord, icord, theta,
-                                              vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
-                                forces.append(out2)
-                            data_in.append(forces)
-                            #data_in = [vugrid,mfx,mfy,mfxy,a,b,c,bmx,bmy,bmxy,syz,szx,d]
-                            #obj.add_sort1(dt, data_in)
-                else:  # pragma: no cover
-                    if self.read_mode == 1:
-                        return ndata
+                obj = self.obj
+                if self.use_vector and is_vectorized:
+                    n = nelements * ntotal
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements * nnodes
+                    obj._times[obj.itime] = dt
 
-                    # TODO: vectorize
-                    self.create_transient_object(slot, RealForce_VU_2D)
+                    # [vugrid, mfx, mfy, mfxy, ai, bi, ci, bmx, bmy, bmxy, syz, szx, di]
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype, count=nelements * numwide_real
+                                          ).reshape(nelements, numwide_real)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        vugrids = ints[:, 6:].reshape(nelements * nnodes, 13)[:, 0]
+                        obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes)
+                        obj.element_node[itotal:itotal2, 1] = vugrids
 
-                    ntotal = 24 + 52 * nnodes
-                    nelements = ndata // ntotal
-                    obj = self.obj
+                    floats = frombuffer(data, dtype=self.fdtype, count=nelements * numwide_real
+                                        ).reshape(nelements, numwide_real)
+                    floats2 = floats[:, 6:].reshape(nelements * nnodes, 13)
 
-                    s1 = Struct(b(self._endian + '3i4s2i'))
-                    s2 = Struct(b(self._endian + 'i3f3i5fi'))
+                    #[mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, [1, 2, 3, 7, 8, 9, 10, 11]]
+                    obj.itotal = itotal2
+                    obj.ielement += nelements
+                else:
+                    # 6+n*13
+                    s1 = Struct(b(self._endian + '3i4s2i')) # 6
+                    s2 = Struct(b(self._endian + 'i3f3i5fi')) # 13
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+24]  # 6*4
                         n += 24
@@ -3088,161 +3083,56 @@ class OEF(OP2Common):
                             (vugrid, mfx, mfy, mfxy, ai, bi, ci, bmx, bmy,
                              bmxy, syz, szx, di) = out
                             out2 = (vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
+                            obj.add_sort1(dt, eid, parent, coord, icord, theta,
+                                          vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
                             forces.append(out2)
                         data_in.append(forces)
                         #data_in = [vugrid,mfx,mfy,mfxy,a,b,c,bmx,bmy,bmxy,syz,szx,d]
-                        obj.add(nnodes, dt, data_in)
+                        #obj.add_sort1(dt, data_in)
 
             elif self.format_code in [2, 3] and self.num_wide == numwide_imag:  # imag
-                if 0:
-                    #if self.element_type == 64: # CQUAD8
-                        #result_name = 'cquad8_force'
-                        ##gridC = 'CEN/8'
-                    #elif self.element_type == 70:  # CTRIAR
-                        #result_name = 'ctriar_force'
-                        ##gridC = 'CEN/3'
-                    #elif self.element_type == 75:  # CTRIA6
-                        #result_name = 'ctria6_force'
-                        ##gridC = 'CEN/6'
-                    #elif self.element_type == 82: # CQUADR
-                        #result_name = 'cquadr_force'
-                        ##gridC = 'CEN/4'
-                    #elif self.element_type == 144: # CQUAD4-bilinear
-                        ## there's no nead to separate this with centroidal strain
-                        ## because you can only have one in a given OP2
-                        #result_name = 'cquad4_force'
-                        ##gridC = 'CEN/4'
-                    #else:
-                    raise RuntimeError(self.code_information())
-
-                    if self._results.is_not_saved(result_name):
-                        return ndata
-                    self._results._found_result(result_name)
-
-                    ntotal = numwide_imag #6 + 25 * nnodes; nnodes=[3, 4]
-                    nelements = ndata // ntotal
-                    #nlayers = 2 * nelements * nnodes_all  # 2 layers per node
-
-                    auto_return, is_vectorized = self._create_oes_object4(
-                        nlayers, result_name, slot, obj_vector_real)
-                    if auto_return:
-                        self._data_factor = nnodes  # TODO: why is this 10?
-                        return nelements * self.num_wide * 4
-
-                    obj = self.obj
-                    #print('dt=%s, itime=%s' % (obj.itime, dt))
-                    is_vectorized = False
-                    if self.use_vector and is_vectorized:
-                        # self.itime = 0
-                        # self.ielement = 0
-                        # self.itotal = 0
-                        #self.ntimes = 0
-                        #self.nelements = 0
-                        n = nelements * self.num_wide * 4
-
-                        istart = obj.itotal
-                        iend = istart + nlayers
-                        obj._times[obj.itime] = dt
-
-                        if obj.itime == 0:
-                            ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
-                            ints1 = ints[:, 2:].reshape(nlayers//2, 17)[:, 0].reshape(nelements, nnodes_all)
-                            ints1[:, 0] = 0.
-                            nids = ints1.ravel()
-
-                            eids = ints[:, 0] // 10
-                            eids2 = array([eids] * (nnodes_all * 2), dtype='int32').T.ravel()
-                            #nids2 = array([nids, nids], dtype='int32').T.ravel()
-                            #eids2 = vstack([eids] * (nnodes_all * 2)).T.ravel()
-                            nids2 = vstack([nids, nids]).T.ravel()
-                            #eids2 = repeat(eids, 2 * nnodes_all)
-                            # nids2 = repeat(nids, 2)
-                            obj.element_node[istart:iend, 0] = eids2
-                            obj.element_node[istart:iend, 1] = nids2
-                            #assert obj.element_node[:iend, 0].min() > 0, eids2
-                            if obj.nonlinear_factor is not None:
-                                float_mask = np.arange(nelements * numwide_real, dtype=np.int32).reshape(nelements, numwide_real)
-                                float_mask1 = float_mask[:, 2:].reshape(nlayers // 2, 17)[:, 1:].reshape(nlayers, 8)
-                                obj.float_mask = float_mask1
-
-                        if obj.nonlinear_factor is not None:
-                            results = fromstring(data, dtype=self.fdtype)[obj.float_mask]
-                        else:
-                            floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
-                            floats1 = floats[:, 2:].reshape(nlayers // 2, 17)
-                            results = floats1[:, 1:].reshape(nlayers, 8)
-
-                        #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-                        obj.data[obj.itime, istart:iend, :] = results
-                    else:
-                        #if self.is_debug_file:
-                            #self.binary_debug.write('  [cap, element1, element2, ..., cap]\n')
-
-                        n = 0
-                        s1 = Struct(b(self._endian + 'iii4sii'))
-                        s2 = Struct(b(self._endian + 'i3f3i5fi3f3i5fi'))
-                        nelements = ndata // ntotal
-                        for i in range(nelements):
-                            edata = data[n:n+24]  # 6*4
-                            n += 24
+                ntotal = 24 + 100 * nnodes
+                nelements = ndata // ntotal
+                auto_return, is_vectorized = self._create_oes_object4(
+                    nelements, result_name, slot, ComplexForceVU2DArray)
+                if auto_return:
+                    self._data_factor = nnodes
+                    return nelements * self.num_wide * 4
 
-                            out = s1.unpack(edata)
-                            if self.is_debug_file:
-                                self.binary_debug.write('OEF_Force_%s-%s - %s\n' % (
-                                    etype, self.element_type, str(out)))
-                            (eid_device, parent, coord, icord, theta, _) = out
+                obj = self.obj
+                if self.use_vector and is_vectorized:
+                    n = nelements * ntotal
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements * nnodes
+                    obj._times[obj.itime] = dt
 
-                            eid = eid_device // 10
-                            data_in = [eid, parent, coord, icord, theta]
-
-                            forces = []
-                            for i in range(nnodes):
-                                edata = data[n:n+100]  # 13*4
-                                n += 100
-                                out = s2.unpack(edata)
-                                if self.is_debug_file:
-                                    self.binary_debug.write('OEF_Force_%s-%s - %s\n' % (
-                                        etype, self.element_type, str(out)))
-                                [vugrid, mfxr, mfyr, mfxyr, ai, bi, ci, bmxr, bmyr, bmxyr, syzr, szxr, di,
-                                 mfxi, mfyi, mfxyi, ai, bi, ci, bmxi, bmyi, bmxyi, syzi, szxi, di] = out
-
-                                if is_magnitude_phase:
-                                    mfx = polar_to_real_imag(mfxr, mfxi)
-                                    mfy = polar_to_real_imag(mfyr, mfyi)
-                                    mfxy = polar_to_real_imag(mfxyr, mfxyi)
-                                    bmx = polar_to_real_imag(bmxr, bmxi)
-                                    bmy = polar_to_real_imag(bmyr, bmyi)
-                                    bmxy = polar_to_real_imag(bmxyr, bmxyi)
-                                    syz = polar_to_real_imag(syzr, syzi)
-                                    szx = polar_to_real_imag(szxr, szxi)
-                                else:
-                                    mfx = complex(mfxr, mfxi)
-                                    mfy = complex(mfyr, mfyi)
-                                    mfxy = complex(mfxyr, mfxyi)
-                                    bmx = complex(bmxr, bmxi)
-                                    bmy = complex(bmyr, bmyi)
-                                    bmxy = complex(bmxyr, bmxyi)
-                                    syz = complex(syzr, syzi)
-                                    szx = complex(szxr, szxi)
-                                out2 = [vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
-                                forces.append(out2)
-
-                            data_in.append(forces)
-                            #data_in = [vugrid,mfxr,mfyr,mfxyr,bmxr,bmyr,bmxyr,syzr,szxr,
-                                             #mfxi,mfyi,mfxyi,bmxi,bmyi,bmxyi,syzi,szxi]
-                            obj.add(nnodes, dt, data_in)
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype, count=nelements * numwide_imag
+                                          ).reshape(nelements, numwide_imag)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        vugrids = ints[:, 6:].reshape(nelements * nnodes, 25)[:, 0]
+                        obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes)
+                        obj.element_node[itotal:itotal2, 1] = vugrids
+
+                    floats = frombuffer(data, dtype=self.fdtype, count=nelements * numwide_imag
+                                        ).reshape(nelements, numwide_imag)
+                    floats2 = floats[:, 6:].reshape(nelements * nnodes, 25)
+
+                    # [vugrid, mfxr, mfyr, mfxyr, ai, bi, ci, bmxr, bmyr, bmxyr, syzr, szxr, di,
+                    #          mfxi, mfyi, mfxyi, ai, bi, ci, bmxi, bmyi, bmxyi, syzi, szxi, di]
+                    isave1 = [1, 2, 3, 7, 8, 9, 10, 11]
+                    isave2 = [13, 14, 15, 19, 20, 21, 22, 23]
+                    real_imag = apply_mag_phase(floats2, is_magnitude_phase, isave1, isave2)
 
+                    #[mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
+                    obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                    obj.itotal = itotal2
+                    obj.ielement += nelements
                 else:
-                    if self.read_mode == 1:
-                        return ndata
-
-                    # TODO: vectorize
-                    self.create_transient_object(slot, ComplexForce_VU_2D)
-                    obj = self.obj
-                    ntotal = 24 + 100 * nnodes
                     s1 = Struct(b(self._endian + 'iii4sii'))
                     s2 = Struct(b(self._endian + 'i3f3i5fi3f3i5fi'))
-                    nelements = ndata // ntotal
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+24]  # 6*4
                         n += 24
@@ -3252,13 +3142,10 @@ class OEF(OP2Common):
                             self.binary_debug.write('OEF_Force_%s-%s - %s\n' % (
                                 etype, self.element_type, str(out)))
                         (eid_device, parent, coord, icord, theta, _) = out
-
                         eid = eid_device // 10
-                        data_in = [eid, parent, coord, icord, theta]
 
-                        forces = []
                         for i in range(nnodes):
-                            edata = data[n:n+100]  # 13*4
+                            edata = data[n:n+100]  # 25*4
                             n += 100
                             out = s2.unpack(edata)
                             if self.is_debug_file:
@@ -3285,13 +3172,8 @@ class OEF(OP2Common):
                                 bmxy = complex(bmxyr, bmxyi)
                                 syz = complex(syzr, syzi)
                                 szx = complex(szxr, szxi)
-                            out2 = [vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
-                            forces.append(out2)
-
-                        data_in.append(forces)
-                        #data_in = [vugrid,mfxr,mfyr,mfxyr,bmxr,bmyr,bmxyr,syzr,szxr,
-                                         #mfxi,mfyi,mfxyi,bmxi,bmyi,bmxyi,syzi,szxi]
-                        obj.add(nnodes, dt, data_in)
+                            obj.add_sort1(dt, eid, parent, coord, icord, theta,
+                                          vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
             else:
                 msg = self.code_information()
                 return self._not_implemented_or_skip(data, ndata, msg)
@@ -3342,8 +3224,8 @@ class OEF(OP2Common):
                     itotal2 = itotal + nelements * 2
 
                     # 20 values
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, 20)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 20)[:, 4:]
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 20)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 20)[:, 4:]
                     ints2 = ints[:, 4:].reshape(nelements * 2, 8)
                     assert floats.shape[1] == 16, floats.shape
 
@@ -3374,6 +3256,7 @@ class OEF(OP2Common):
                     s1 = Struct(b(self._endian + '3i 4s'))
                     s2 = Struct(b(self._endian + 'i7f'))
                     nnodes = 2
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]  # 8*4
                         n += 16
@@ -3397,7 +3280,7 @@ class OEF(OP2Common):
                             obj._add_sort1(dt, eid, parent, coord, icord, nid, xxb, fx, fy, fz, mx, my, mz)
                         #data_in = [vugrid, posit, forceX, shearY, shearZ, torsion, bendY, bendZ]
             elif self.format_code == 1 and self.num_wide == 32:  # random
-                # TODO: vectorize
+                # there's no random VUBEAM result, so it's skipped
                 return ndata
             elif self.format_code in [2, 3] and self.num_wide == 32:  # imag
                 #TCODE,7 = 1 Real/imaginary or magnitude/phase
@@ -3425,7 +3308,6 @@ class OEF(OP2Common):
                 ntotal = self.num_wide * 4
                 nelements = ndata // ntotal
 
-                # TODO: vectorize
                 auto_return, is_vectorized = self._create_oes_object4(
                     nelements, result_name, slot, ComplexCBeamForceVUArray)
                 if auto_return:
@@ -3447,7 +3329,7 @@ class OEF(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 32)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 32)
 
                         eids = ints[:, 0] // 10
                         eids2 = np.repeat(eids, 2)
@@ -3462,7 +3344,7 @@ class OEF(OP2Common):
                         obj.parent_coord[ielement:ielement2, 1] = parent
                         obj.parent_coord[ielement:ielement2, 1] = coord
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 32)[:, 4:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 32)[:, 4:]
                     assert floats.shape[1] == 28, floats.shape
                     # skipping [form1, form2]
                     floats2 = floats.reshape(nelements*2, 14)
@@ -3478,6 +3360,7 @@ class OEF(OP2Common):
                     s2 = Struct(b(self._endian + 'i13f'))
                     n = 0
                     obj._times[obj.itime] = dt
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]  # 8*4
                         n += 16
@@ -1479,16 +1479,15 @@ class ComplexCBarForceArray(ScalarObject):
                     for ieid, eid in enumerate(self.element):
                         t1 = self.data[itime, ieid, :]
                         t2 = table.data[itime, ieid, :]
-                        (s1a1, s2a1, s3a1, s4a1, axial1, s2a1, s2b1, s2c1, s2d1) = t1
-                        (s1a2, s2a2, s3a2, s4a2, axial2, s2a2, s2b2, s2c2, s2d2) = t2
+                        (bm1a1, bm2a1, bm1b1, bm2b1, ts11, ts21, af1, trq1) = t1
+                        (bm1a2, bm2a2, bm1b2, bm2b2, ts12, ts22, af2, trq2) = t2
                         #d = t1 - t2
-                        if not allclose([s1a1.real, s2a1.real, s3a1.real, s4a1.real, axial1.real, s2a1.real, s2b1.real, s2c1.real, s2d1.real],
-                                        [s1a2.real, s2a2.real, s3a2.real, s4a2.real, axial2.real, s2a2.real, s2b2.real, s2c2.real, s2d2.real], atol=0.0001):
+                        if not allclose(t1, t2, atol=0.0001):
                         #if not np.array_equal(t1, t2):
-                            msg += '%-4s  (%s, %s, %s, %s, %s, %s, %s, %s, %s)\n      (%s, %s, %s, %s, %s, %s, %s, %s, %s)\n' % (
+                            msg += '%-4s  (%s, %s, %s, %s, %s, %s, %s, %s)\n      (%s, %s, %s, %s, %s, %s, %s, %s)\n' % (
                                 eid,
-                                s1a1.real, s2a1.real, s3a1.real, s4a1.real, axial1.real, s2a1.real, s2b1.real, s2c1.real, s2d1.real,
-                                s1a2.real, s2a2.real, s3a2.real, s4a2.real, axial2.real, s2a2.real, s2b2.real, s2c2.real, s2d2.real,
+                                bm1a1, bm2a1, bm1b1, bm2b1, ts11, ts21, af1, trq1,
+                                bm1a2, bm2a2, bm1b2, bm2b2, ts12, ts22, af2, trq2,
                                 )
                             i += 1
                         if i > 10:
@@ -2971,6 +2970,214 @@ class ComplexCBeamForceVUArray(ScalarObject):  # 191-VUBEAM
         return page_num - 1
 
 
+class ComplexForceVU2DArray(ScalarObject):  # 189-VUQUAD,190-VUTRIA
+    """
+    ELTYPE = 189/190 View elements (VUQUAD/VUTRIA)
+    ----------------------------------------------
+    TCODE,7 = 1 Real/imaginary or magnitude/phase
+    7 VUGRID    I  VU grid ID for output grid
+    8 MFX       RS Membrane force x real/mag.
+    9 MFY       RS Membrane force y real/mag.
+    10 MFXY     RS Membrane force xy real/mag.
+    14 BMX      RS Bending moment x real/mag.
+    15 BMY      RS Bending moment y real/mag.
+    16 BMXY     RS Bending moment xy real/mag.
+    17 SYZ      RS Shear yz real/mag.
+    18 SZX      RS Shear zx real/mag.
+    20 MFX      RS Membrane force x imag./phase
+    ...
+    30 SZX      RS Shear zx imag./phase
+    Words 7 through max repeat nnodes times
+    """
+    def __init__(self, data_code, is_sort1, isubcase, dt):
+        ScalarObject.__init__(self, data_code, isubcase, apply_data_code=True)
+        #self.code = [self.format_code, self.sort_code, self.s_code]
+
+        #self.ntimes = 0  # or frequency/mode
+        #self.ntotal = 0
+        self.ielement = 0
+        self.nelements = 0  # result specific
+        self.nnodes = None
+
+        if is_sort1:
+            pass
+        else:
+            raise NotImplementedError('SORT2')
+
+    @property
+    def is_real(self):
+        return False
+
+    @property
+    def is_complex(self):
+        return True
+
+    def _reset_indices(self):
+        self.itotal = 0
+        self.ielement = 0
+
+    def get_headers(self):
+        return ['mfx', 'mfy', 'mfxy', 'bmx', 'bmy', 'bmxy', 'syz', 'szx']
+
+    def build(self):
+        """sizes the vectorized attributes of the ComplexForceVU2DArray"""
+        #print('ntimes=%s nelements=%s ntotal=%s' % (self.ntimes, self.nelements, self.ntotal))
+        if self.is_built:
+            return
+
+        assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
+        assert self.nelements > 0, 'nelements=%s' % self.nelements
+        assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
+
+        if self.element_type == 189:  # VUQUAD
+            nnodes_per_element = 4
+        elif self.element_type == 190:  # VUTRIA
+            nnodes_per_element = 3
+        else:
+            raise NotImplementedError('name=%r type=%s' % (self.element_name, self.element_type))
+
+        self.nnodes = nnodes_per_element
+        self.nelements //= self.ntimes
+        self.itime = 0
+        self.ielement = 0
+        self.itotal = 0
+        self.is_built = True
+
+        dtype = 'float32'
+        if isinstance(self.nonlinear_factor, integer_types):
+            dtype = 'int32'
+        self._times = np.zeros(self.ntimes, dtype=dtype)
+        self.element_node = np.zeros((self.ntotal, 2), dtype='int32')
+
+        #[mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
+        self.data = np.zeros((self.ntimes, self.ntotal, 8), dtype='complex64')
+
+    def __eq__(self, table):
+        assert self.is_sort1 == table.is_sort1
+        self._eq_header(table)
+        if not np.array_equal(self.data, table.data):
+            msg = 'table_name=%r class_name=%s\n' % (self.table_name, self.__class__.__name__)
+            msg += '%s\n' % str(self.code_information())
+            i = 0
+            for itime in range(self.ntimes):
+                for ie, element_nodei in enumerate(self.element_node):
+                    (eid, nid) = element_nodei
+                    t1 = self.data[itime, ie, :]
+                    t2 = table.data[itime, ie, :]
+                    (mfx1, mfy1, mfxy1, bmx1, bmy1, bmxy1, syz1, szx1) = t1
+                    (mfx2, mfy2, mfxy2, bmx2, bmy2, bmxy2, syz2, szx2) = t2
+
+                    if not np.array_equal(t1, t2):
+                        eid_nid1 = '(%s, %s)  ' % (eid, nid)
+                        eid_nid2 = ' ' * len(eid_nid1)
+                        msg += ('%s(%s, %s, %s, %s, %s, %s, %s, %s)\n%s(%s, %s, %s, %s, %s, %s, %s, %s)\n' % (
+                            eid_nid1,
+                            mfx1, mfy1, mfxy1, bmx1, bmy1, bmxy1, syz1, szx1,
+                            eid_nid2,
+                            mfx2, mfy2, mfxy2, bmx2, bmy2, bmxy2, syz2, szx2))
+                        i += 1
+                        if i > 10:
+                            raise ValueError(msg.replace('0j,', '0,').replace('+0j)', ')'))
+                #print(msg)
+                if i > 0:
+                    raise ValueError(msg.replace('0j,', '0,').replace('+0j)', ')'))
+        return True
+
+    def add_sort1(self, dt, eid, parent, coord, icord, theta,
+                  vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx):
+        """unvectorized method for adding SORT1 transient data"""
+        self._times[self.itime] = dt
+        self.element_node[self.itotal, :] = [eid, vugrid]
+        self.data[self.itime, self.itotal, :] = [mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
+        self.itotal += 1
+
+    def get_stats(self, short=False):
+        if not self.is_built:
+            return [
+                '<%s>\n' % self.__class__.__name__,
+                '  ntimes: %i\n' % self.ntimes,
+                '  ntotal: %i\n' % self.ntotal,
+            ]
+
+        nelements = self.nelements
+        ntimes = self.ntimes
+        nnodes = self.nnodes
+        ntotal = self.ntotal
+
+        msg = []
+        if self.nonlinear_factor is not None:  # transient
+            msgi = '  type=%s ntimes=%i nelements=%i nnodes_per_element=%i ntotal=%i\n' % (
+                self.__class__.__name__, ntimes, nelements, nnodes, ntotal)
+            ntimes_word = 'ntimes'
+        else:
+            msgi = '  type=%s nelements=%i nnodes_per_element=%i ntotal=%i\n' % (
+                self.__class__.__name__, nelements, nnodes, ntotal)
+            ntimes_word = '1'
+        msg.append(msgi)
+        headers = self.get_headers()
+        n = len(headers)
+        msg.append('  data: [%s, ntotal, %i] where %i=[%s]\n' % (ntimes_word, n, n,
+                                                                 str(', '.join(headers))))
+        msg.append('  element_node.shape = %s\n' % str(self.element_node.shape).replace('L', ''))
+        msg.append('  data.shape=%s\n' % str(self.data.shape).replace('L', ''))
+        msg.append('  element type: %s\n' % self.element_name)
+        msg += self.get_data_code()
+        return msg
+
+    def write_f06(self, f, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
+        if header is None:
+            header = []
+        if self.element_type == 189:
+            words = '   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D 4 )'
+        else:
+            words = '   T R I A N G U L A R   E L E M E N T S   ( T R I A 3 )'
+        if is_mag_phase:
+            mag_phase = '                                                          (MAGNITUDE/PHASE)\n'
+        else:
+            mag_phase = '                                                          (REAL/IMAGINARY)\n'
+
+        msg_temp = [
+            '          C O M P L E X   F O R C E S   I N   P - V E R S I O N%s\n' % words,
+            mag_phase,
+            '\n'
+            '     VUGRID                - MEMBRANE  FORCES -      - BENDING  MOMENTS -             - TRANSVERSE SHEAR FORCES -\n'
+            '       ID.            FX            FY            FXY MX            MY            MXY             QX            QY\n'
+        ]
+
+        # write the f06
+        ntimes = self.data.shape[0]
+
+        nids = self.element_node[:, 1]
+        for itime in range(ntimes):
+            dt = self._times[itime]
+            header = _eigenvalue_header(self, header, itime, ntimes, dt)
+            f.write(''.join(header + msg_temp))
+
+            #[mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
+            mfx = self.data[itime, :, 0]
+            mfy = self.data[itime, :, 1]
+            mfxy = self.data[itime, :, 2]
+            bmx = self.data[itime, :, 3]
+            bmy = self.data[itime, :, 4]
+            bmxy = self.data[itime, :, 5]
+            syz = self.data[itime, :, 6]
+            szx = self.data[itime, :, 7]
+
+            for nid, mfxi, mfyi, mfxyi, bmxi, bmyi, bmxyi, syzi, szxi in zip(
+                    nids, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx):
+                out = write_imag_floats_13e([mfxi, mfyi, mfxyi, bmxi, bmyi, bmxyi, syzi, szxi],
+                                            is_mag_phase)
+                [mfxri, mfyri, mfxyri, bmxri, bmyri, bmxyri, syzri, szxri,
+                 mfxii, mfyii, mfxyii, bmxii, bmyii, bmxyii, syzii, szxii] = out
+                f.write('   %9i  %-13s %-13s %-13s   %-13s %-13s %-13s  %-13s %s\n'
+                        '              %-13s %-13s %-13s   %-13s %-13s %-13s  %-13s %s\n' % (
+                            nid, mfxri, mfyri, mfxyri, bmxri, bmyri, bmxyri, syzri, szxri,
+                            mfxii, mfyii, mfxyii, bmxii, bmyii, bmxyii, syzii, szxii))
+            f.write(page_stamp % page_num)
+            page_num += 1
+        return page_num - 1
+
+
 class ComplexForce_VU_2D(ScalarObject):  # 189-VUQUAD,190-VUTRIA
     def __init__(self, data_code, is_sort1, isubcase, dt):
         ScalarObject.__init__(self, data_code, isubcase)
@@ -202,7 +202,7 @@ class Real1DHeatFluxArray(ScalarObject):  # 1-ROD, 2-BEAM, 3-TUBE, 10-CONROD, 34
         return page_num - 1
 
 
-class RealHeatFluxVU3DArray(ScalarObject):  # 189-VUQUAD 190-VUTRIA,191-VUBEAM
+class RealHeatFluxVU3DArray(ScalarObject):  # 145-VUHEXA 146-VUPENTA 147-VUTETRA
     def __init__(self, data_code, is_sort1, isubcase, dt):
         self.element_type = None
         self.element_name = None
@@ -280,10 +280,9 @@ class RealHeatFluxVU3DArray(ScalarObject):  # 189-VUQUAD 190-VUTRIA,191-VUBEAM
                 self.element_parent.shape, table.element_parent.shape)
             msg = 'table_name=%r class_name=%s\n' % (self.table_name, self.__class__.__name__)
             msg += '%s\n' % str(self.code_information())
-            msg += 'Eid, Parent, Coord, iCoord\n'
-            for (eid1, parent1, coord1, icord1), (eid2, parent2, coord2, icord2) in zip(self.element_parent, table.element_parent_coord_icord):
-                msg += '(%s, %s, %s, %s) (%s, %s, %s, %s)\n' % (eid1, parent1, coord1, icord1, eid2, parent2, coord2, icord2)
-            print(msg)
+            msg += 'Eid, Parent\n'
+            for (eid1, parent1), (eid2, parent2) in zip(self.element_parent, table.element_parent):
+                msg += '(%s, %s) (%s, %s)\n' % (eid1, parent1, eid2, parent2)
             raise ValueError(msg)
         if not np.array_equal(self.data, table.data):
             msg = 'table_name=%r class_name=%s\n' % (self.table_name, self.__class__.__name__)
@@ -292,7 +291,7 @@ class RealHeatFluxVU3DArray(ScalarObject):  # 189-VUQUAD 190-VUTRIA,191-VUBEAM
             #eids = self.element_node[:, 0]
             #ntotal = self.data.shape[2]
             for itime in range(self.ntimes):
-                vugrids = self.int_data[itime, :, :]
+                vugrids = self.vugrid[itime, :, 0]
                 for j, vugrid in enumerate(vugrids):
                     t1 = self.data[itime, j, :]
                     t2 = table.data[itime, j, :]
@@ -378,9 +377,7 @@ class RealHeatFluxVU3DArray(ScalarObject):  # 189-VUQUAD 190-VUTRIA,191-VUBEAM
             f.write(''.join(header + msg_temp))
 
             # [xgrad, ygrad, zgrad, xflux, yflux, zflux]
-            #nids = self.int_data[itime, :, 0]
-            vugrids = self.int_data[itime, :, 0]
-            print(vugrids)
+            vugrids = self.vugrid[itime, :, 0]
             xgrad = self.data[itime, :, 0]
             ygrad = self.data[itime, :, 1]
             zgrad = self.data[itime, :, 2]
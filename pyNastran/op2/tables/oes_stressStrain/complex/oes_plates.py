@@ -1,5 +1,6 @@
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
+from six import integer_types
 from six.moves import range
 
 import numpy as np
@@ -10,17 +11,13 @@ except ImportError:
     pass
 
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
-from pyNastran.f06.f06_formatting import write_imag_floats_13e, write_float_13e
+from pyNastran.f06.f06_formatting import write_imag_floats_13e, write_float_13e, _eigenvalue_header
 
-class ComplexTriaxStressArray(OES_Object):
+class ComplexTriaxArray(OES_Object):
     def __init__(self, data_code, is_sort1, isubcase, dt):
-        OES_Object.__init__(self, data_code, isubcase, apply_data_code=False)   ## why???
-        self.element_node = None
+        OES_Object.__init__(self, data_code, isubcase, apply_data_code=False)
         #self.code = [self.format_code, self.sort_code, self.s_code]
-
-        #self.ntimes = 0  # or frequency/mode
-        #self.ntotal = 0
-        #self.itime = 0
+        self.ielement = 0
         self.nelements = 0  # result specific
 
         if is_sort1:
@@ -36,49 +33,98 @@ class ComplexTriaxStressArray(OES_Object):
     def is_complex(self):
         return True
 
+    def _reset_indices(self):
+        self.itotal = 0
+        self.ielement = 0
+
+    def get_headers(self):
+        headers = ['radial', 'azimuthal', 'axial', 'shear']
+        return headers
+
     def build(self):
-        """sizes the vectorized attributes of the ComplexPlateArray"""
-        #print('data_code = %s' % self.data_code)
-        if not hasattr(self, 'subtitle'):
-            self.subtitle = self.data_code['subtitle']
+        """sizes the vectorized attributes of the ComplexTriaxArray"""
         if self.is_built:
             return
-        nnodes = self.get_nnodes()
 
-        #self.names = []
-        #self.nelements //= nnodes
-        self.nelements //= self.ntimes
-        #print('element_type=%r ntimes=%s nelements=%s nnodes=%s ntotal=%s subtitle=%s' % (
-            #self.element_type, self.ntimes, self.nelements, nnodes, self.ntotal, self.subtitle))
+        assert self.ntimes > 0, 'ntimes=%s' % self.ntimes
+        assert self.nelements > 0, 'nelements=%s' % self.nelements
+        assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
+        if self.element_type != 53:
+            raise NotImplementedError(self.element_type)
 
-        self.ntotal = self.nelements * nnodes * 2
-        #self.ntotal
+        self.nelements //= self.ntimes
         self.itime = 0
         self.ielement = 0
         self.itotal = 0
         self.is_built = True
-        #print('ntotal=%s ntimes=%s nelements=%s' % (self.ntotal, self.ntimes, self.nelements))
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
-        self._times = zeros(self.ntimes, 'float32')
-        #self.ntotal = self.nelements * nnodes
+        dtype = 'float32'
+        if isinstance(self.nonlinear_factor, integer_types):
+            dtype = 'int32'
+        self._times = zeros(self.ntimes, dtype=dtype)
+        # the centroid (loc=0) + 3 corner points per element
+        self.element_node = zeros((self.ntotal, 2), dtype='int32')
 
-        # TODO: could be more efficient by using nelements for cid
-        self.element_node = zeros((self.ntotal, 2), 'int32')
-        #self.element_cid = zeros((self.nelements, 2), 'int32')
+        #[radial, azimuthal, axial, shear]
+        self.data = zeros((self.ntimes, self.ntotal, 4), dtype='complex64')
 
-        # the number is messed up because of the offset for the element's properties
+    def build_dataframe(self):
+        headers = self.get_headers()
+        column_names, column_values = self._build_dataframe_transient_header()
+        element_node = [self.element_node[:, 0], self.element_node[:, 1]]
+        self.data_frame = pd.Panel(self.data, items=column_values,
+                                   major_axis=element_node, minor_axis=headers).to_frame()
+        self.data_frame.columns.names = column_names
+        self.data_frame.index.names = ['ElementID', 'NodeID', 'Item']
 
-        if not self.nelements * nnodes * 2 == self.ntotal:
-            msg = 'ntimes=%s nelements=%s nnodes=%s ne*nn=%s ntotal=%s' % (self.ntimes,
-                                                                           self.nelements, nnodes,
-                                                                           self.nelements * nnodes,
-                                                                           self.ntotal)
-            raise RuntimeError(msg)
+    def __eq__(self, table):
+        assert self.is_sort1 == table.is_sort1
+        self._eq_header(table)
+        if not np.array_equal(self.element_node, table.element_node):
+            assert self.element_node.shape == table.element_node.shape, 'shape=%s element_node.shape=%s' % (
+                self.element_node.shape, table.element_node.shape)
+            msg = 'table_name=%r class_name=%s\n' % (self.table_name, self.__class__.__name__)
+            msg += '%s\nEid, Nid\n' % str(self.code_information())
+            for (eid1, nid1), (eid2, nid2) in zip(self.element_node, table.element_node):
+                msg += '(%s, %s), (%s, %s)\n' % (eid1, nid1, eid2, nid2)
+            print(msg)
+            raise ValueError(msg)
+        if not np.array_equal(self.data, table.data):
+            msg = 'table_name=%r class_name=%s\n' % (self.table_name, self.__class__.__name__)
+            msg += '%s\n' % str(self.code_information())
+            ntimes = self.data.shape[0]
 
-        self.fiber_curvature = zeros(self.ntotal, 'float32')
-        # [oxx, oyy, txy]
-        self.data = zeros((self.ntimes, self.ntotal, 3), 'complex64')
+            i = 0
+            if self.is_sort1:
+                for itime in range(ntimes):
+                    for ieid, (eid, nid) in enumerate(self.element_node):
+                        t1 = self.data[itime, ieid, :]
+                        t2 = table.data[itime, ieid, :]
+                        if not np.allclose(t1, t2, atol=0.0001):
+                            (radial1, azimuthal1, axial1, shear1) = t1
+                            (radial2, azimuthal2, axial2, shear2) = t2
+                            msg += '(%s, %s)\n  (%s, %s, %s, %s)\n  (%s, %s, %s, %s)\n' % (
+                                eid, nid,
+                                radial1, azimuthal1, axial1, shear1,
+                                radial2, azimuthal2, axial2, shear2)
+                            i += 1
+                        if i > 10:
+                            print(msg)
+                            raise ValueError(msg)
+            else:
+                raise NotImplementedError(self.is_sort2)
+            if i > 0:
+                print(msg)
+                raise ValueError(msg)
+        return True
+
+    def add_sort1(self, dt, eid, loc, rs, azs, As, ss):
+        """unvectorized method for adding SORT1 transient data"""
+        self._times[self.itime] = dt
+        self.element_node[self.itotal, :] = [eid, loc]
+        self.data[self.itime, self.itotal, :] = [rs, azs, As, ss]
+        self.itotal += 1
 
     def get_stats(self, short=False):
         if not self.is_built:
@@ -90,45 +136,94 @@ class ComplexTriaxStressArray(OES_Object):
 
         nelements = self.nelements
         ntimes = self.ntimes
-        nnodes = self.element_node.shape[0]
-        #ntotal = self.ntotal
         msg = []
         if self.nonlinear_factor is not None:  # transient
-            msg.append('  type=%s ntimes=%i nelements=%i nnodes=%i\n'
-                       % (self.__class__.__name__, ntimes, nelements, nnodes))
+            msg.append('  type=%s ntimes=%i nelements=%i\n'
+                       % (self.__class__.__name__, ntimes, nelements))
+            ntimes_word = 'ntimes'
         else:
-            msg.append('  type=%s nelements=%i nnodes=%i\n' % (self.__class__.__name__, nelements, nnodes))
-        msg.append('  eType, cid\n')
-        msg.append('  data: [ntimes, nnodes, 6] where 6=[%s]\n' % str(', '.join(self._get_headers())))
+            msg.append('  type=%s nelements=%i\n'
+                       % (self.__class__.__name__, nelements))
+            ntimes_word = '1'
+        headers = self.get_headers()
+        n = len(headers)
+        msg.append('  data: [%s, ntotal, %i] where %i=[%s]\n' % (ntimes_word, n, n, str(', '.join(headers))))
         msg.append('  element_node.shape = %s\n' % str(self.element_node.shape).replace('L', ''))
         msg.append('  data.shape = %s\n' % str(self.data.shape).replace('L', ''))
-        msg.append('  %s\n  ' % self.element_name)
+        msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
         return msg
 
-    def add_new_eid_sort1(self, dt, eid, node_id, fdr, oxx, oyy, txy):
-        self.add_eid_sort1(dt, eid, node_id, fdr, oxx, oyy, txy)
+    def write_f06(self, f06_file, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
+        if header is None:
+            header = []
+        msg_temp = self.get_f06_header(is_mag_phase)
 
-    def add_sort1(self, dt, eid, loc, rs, azs, As, ss):
-        """unvectorized method for adding SORT1 transient data"""
-        self.add_eid_sort1(dt, eid, loc, rs, azs, As, ss)
+        ntimes = self.data.shape[0]
+        eids = self.element_node[:, 0]
+        nids = self.element_node[:, 1]
+        for itime in range(ntimes):
+            dt = self._times[itime]
+            header = _eigenvalue_header(self, header, itime, ntimes, dt)
+            f06_file.write(''.join(header + msg_temp))
+
+            #[radial, azimuthal, axial, shear]
+            radial = self.data[itime, :, 0]
+            azimuthal = self.data[itime, :, 1]
+            axial = self.data[itime, :, 2]
+            shear = self.data[itime, :, 3]
+            for eid, nid, radiali, azimuthali, axiali, sheari in zip(
+                    eids, nids, radial, azimuthal, axial, shear):
+                [radialr, azimuthalr, axialr, shearr,
+                 radiali, azimuthali, axiali, sheari] = write_imag_floats_13e(
+                     [radiali, azimuthali, axiali, sheari], is_mag_phase)
+                f06_file.write('0%8i   %-8s  %-13s / %-13s  %-13s / %-13s  %-13s / %-13s  %-13s / %s\n' % (
+                    eid, nid, radialr, radiali, azimuthalr, azimuthali,
+                    axialr, axiali, shearr, sheari))
+            f06_file.write(page_stamp % page_num)
+            page_num += 1
+        return page_num - 1
 
-    def add_new_node_sort1(self, dt, eid, gridc, fdr, oxx, oyy, txy):
-        self.add_eid_sort1(dt, eid, gridc, fdr, oxx, oyy, txy)
 
-    def add_eid_sort1(self, dt, eid, loc, rs, azs, As, ss):
-        self._times[self.itime] = dt
-        #print(self.element_types2, element_type, self.element_types2.dtype)
-        #print('itotal=%s dt=%s eid=%s nid=%-5s oxx=%s' % (self.itotal, dt, eid, node_id, oxx))
+class ComplexTriaxStressArray(ComplexTriaxArray, StressObject):
+    def __init__(self, data_code, is_sort1, isubcase, dt):
+        ComplexTriaxArray.__init__(self, data_code, is_sort1, isubcase, dt)
+        StressObject.__init__(self, data_code, isubcase)
+
+    def get_f06_header(self, is_mag_phase=True):
+        if is_mag_phase:
+            mag_phase = '                                                          (MAGNITUDE/PHASE)\n'
+        else:
+            mag_phase = '                                                          (REAL/IMAGINARY)\n'
 
-        # dt, eid, loc, rs, azs, As, ss
+        words = [
+            '                             C O M P L E X   S T R E S S E S   I N   T R I A X 6   E L E M E N T S\n',
+            mag_phase,
+            ' \n',
+            '   ELEMENT  GRID ID              RADIAL                       AZIMUTHAL                    AXIAL                        SHEAR\n',
+        ]
+        return words
+
+
+class ComplexTriaxStrainArray(ComplexTriaxArray, StrainObject):
+    def __init__(self, data_code, is_sort1, isubcase, dt):
+        ComplexTriaxArray.__init__(self, data_code, is_sort1, isubcase, dt)
+        StrainObject.__init__(self, data_code, isubcase)
+
+    def get_f06_header(self, is_mag_phase=True):
+        if is_mag_phase:
+            mag_phase = '                                                          (MAGNITUDE/PHASE)\n'
+        else:
+            mag_phase = '                                                          (REAL/IMAGINARY)\n'
+
+        words = [
+            '                               C O M P L E X   S T R A I N S   I N   T R I A X 6   E L E M E N T S\n',
+            mag_phase,
+            ' \n',
+            '   ELEMENT  GRID ID              RADIAL                       AZIMUTHAL                    AXIAL                        SHEAR\n',
+        ]
+        return words
 
-        assert isinstance(node_id, int), node_id
-        #self.data[self.itime, self.itotal] = [oxx, oyy, txy]
-        #self.element_node[self.itotal, :] = [eid, node_id]  # 0 is center
-        #self.fiber_curvature[self.itotal] = fdr
-        #self.ielement += 1
-        self.itotal += 1
 
 class ComplexPlateArray(OES_Object):
     def __init__(self, data_code, is_sort1, isubcase, dt):
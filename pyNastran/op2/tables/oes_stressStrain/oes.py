@@ -9,7 +9,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
 from struct import Struct
 from six import b
 from six.moves import range
-from numpy import fromstring, radians, sin, cos, vstack, repeat, array
+from numpy import frombuffer, radians, sin, cos, vstack, repeat, array
 import numpy as np
 
 from pyNastran.op2.op2_interface.op2_common import OP2Common, apply_mag_phase
@@ -39,7 +39,8 @@ from pyNastran.op2.tables.oes_stressStrain.complex.oes_beams import ComplexBeamS
 from pyNastran.op2.tables.oes_stressStrain.complex.oes_bush import (ComplexCBushStressArray, ComplexCBushStrainArray)
 from pyNastran.op2.tables.oes_stressStrain.complex.oes_bush1d import ComplexCBush1DStressArray
 from pyNastran.op2.tables.oes_stressStrain.complex.oes_plates import (
-    ComplexPlateStressArray, ComplexPlateStrainArray, ComplexTriaxStressArray)
+    ComplexPlateStressArray, ComplexPlateStrainArray,
+    ComplexTriaxStressArray, ComplexTriaxStrainArray)
 from pyNastran.op2.tables.oes_stressStrain.complex.oes_rods import ComplexRodStressArray, ComplexRodStrainArray
 from pyNastran.op2.tables.oes_stressStrain.complex.oes_shear import ComplexShearStressArray, ComplexShearStrainArray
 from pyNastran.op2.tables.oes_stressStrain.complex.oes_solids import ComplexSolidStressArray, ComplexSolidStrainArray
@@ -657,7 +658,7 @@ class OES(OP2Common):
             (53, 1, 33, b'OES1X1') : ('ctriax_stress', RealTriaxStressArray),
             (53, 1, 33, b'OES1X') : ('ctriax_stress', RealTriaxStressArray),
             (53, 2, 37, b'OES1X') : ('ctriax_stress', ComplexTriaxStressArray),
-            #(53, 3, 37) : ('ctriax_stress', ComplexTriaxStressArray),
+            (53, 3, 37, b'OES1X') : ('ctriax_stress', ComplexTriaxStressArray),
 
             (102, 1, 7, b'OES1X1') : ('cbush_stress', RealBushStressArray),
             (102, 1, 7, b'OES1X') : ('cbush_stress', RealBushStressArray),
@@ -728,8 +729,7 @@ class OES(OP2Common):
             (147, 3, 54, b'OES1X') : ('NA', 'NA'),
 
             # 139-QUAD4FD
-            # self.hyperelastic_cquad4_strain, HyperelasticQuad
-            (139, 1, 30, b'OES1X1') : ('NA', 'NA'),
+            (139, 1, 30, b'OES1X1') : ('hyperelastic_cquad4_stress', HyperelasticQuadArray),
 
             # 189-VUQUAD
             (189, 1, 74, b'OES1X1') : ('NA', 'NA'),
@@ -1018,10 +1018,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1038,6 +1038,7 @@ class OES(OP2Common):
                         self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
                     struct1 = Struct(b(self._endian + 'i4f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = struct1.unpack(edata)
@@ -1063,10 +1064,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1078,6 +1079,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'i4f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)
@@ -1124,7 +1126,6 @@ class OES(OP2Common):
             slot = getattr(self, result_name)
 
             if self.format_code == 1 and self.num_wide == 111:  # real
-                # TODO: vectorize
                 ntotal = 444 # 44 + 10*40  (11 nodes)
 
                 if self.is_stress:
@@ -1143,30 +1144,60 @@ class OES(OP2Common):
 
                 nnodes = 10  # 11-1
                 ntotal = self.num_wide * 4
-                n1 = 44
-                n2 = 40
-                s1 = Struct(b(self._endian + 'ii9f'))
-                s2 = Struct(b(self._endian + 'i9f'))
                 nelements = ndata // ntotal
-                for i in range(nelements):
-                    edata = data[n:n+n1]
-                    n += n1
+                if self.use_vector and is_vectorized:
+                    n = nelements * ntotal
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements * 11
+                    ielement2 = obj.ielement + nelements
 
-                    out = s1.unpack(edata)
-                    eid_device = out[0]
-                    eid = eid_device // 10
-                    if self.is_debug_file:
-                        self.binary_debug.write('CBEAM-2 - eid=%i out=%s\n' % (eid, str(out)))
+                    # chop off eid
+                    floats = frombuffer(data, dtype=self.fdtype,
+                                        count=nelements * 111).reshape(nelements, 111)[:, 1:]
+                    floats2 = floats.reshape(nelements * 11, 10)
+
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype,
+                                          count=nelements * 111).reshape(nelements, 111)
+                        eids = ints[:, 0] // 10
+                        eids2 = array([eids] * 11, dtype='int32').T.ravel()
+                        ints2 = ints[:, 1:].reshape(nelements * 11, 10)
 
-                    #(grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
-                    obj.add_new_eid(dt, eid, out[1:])
+                        assert eids.min() > 0, eids.min()
+                        obj.element_node[itotal:itotal2, 0] = eids2
+                        obj.element_node[itotal:itotal2, 1] = ints2[:, 0]
+                        obj.xxb[itotal:itotal2] = floats2[:, 1]
 
-                    for inode in range(nnodes):
-                        edata = data[n:n+n2]
-                        n += n2
-                        out = s2.unpack(edata)
-                        # (grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
-                        obj.add_sort1(dt, eid, out)
+                    #[sxc, sxd, sxe, sxf, smax, smin, mst, msc]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 2:]
+                    obj.itotal = itotal2
+                    obj.ielement = ielement2
+                else:
+                    n1 = 44
+                    n2 = 40
+                    s1 = Struct(b(self._endian + 'ii9f'))
+                    s2 = Struct(b(self._endian + 'i9f'))
+                    self._add_unvectorized_result(nelements)
+                    for i in range(nelements):
+                        edata = data[n:n+n1]
+                        n += n1
+
+                        out = s1.unpack(edata)
+                        eid_device = out[0]
+                        eid = eid_device // 10
+                        if self.is_debug_file:
+                            self.binary_debug.write('CBEAM-2 - eid=%i out=%s\n' % (eid, str(out)))
+
+                        #(grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
+                        obj.add_new_eid(dt, eid, out[1:])
+
+                        for inode in range(nnodes):
+                            edata = data[n:n+n2]
+                            n += n2
+                            out = s2.unpack(edata)
+                            # (grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
+                            obj.add_sort1(dt, eid, out)
             elif self.format_code in [2, 3] and self.num_wide == 111:  # imag and random?
                 # definitely complex results for MSC Nastran 2016.1
 
@@ -1195,12 +1226,12 @@ class OES(OP2Common):
                     itotal2 = itotal + nelements * 11
 
                     # chop off eid
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 111)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 111)[:, 1:]
                     floats2 = floats.reshape(nelements * 11, 10)
 
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 111)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 111)
                         eids = ints[:, 0] // 10
                         eids2 = array([eids] * 11, dtype='int32').T.ravel()
 
@@ -1228,6 +1259,7 @@ class OES(OP2Common):
                     s1 = Struct(b(self._endian + 'ii9f'))
                     s2 = Struct(b(self._endian + 'i9f'))
 
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+n1]
                         n += n1
@@ -1321,11 +1353,11 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 4)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
                     itime = obj.itime
                     obj._times[itime] = dt
                     if itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 4)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1336,6 +1368,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'i3f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)  # num_wide=5
@@ -1362,10 +1395,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1377,6 +1410,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'i4f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)  # num_wide=5
@@ -1452,10 +1486,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 2)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 2)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 2)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 2)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1466,6 +1500,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'if'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = struct1.unpack(edata)
@@ -1494,10 +1529,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1517,6 +1552,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'i2f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)
@@ -1586,11 +1622,11 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 16)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 16)
                         eids = ints[:, 0] // 10
                         obj.element[ielement:ielement2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 16)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 16)
 
                     #[s1a, s2a, s3a, s4a, axial, smaxa, smina, margin_tension,
                     # s1b, s2b, s3b, s4b,        smaxb, sminb, margin_compression]
@@ -1599,6 +1635,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'i15f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = struct1.unpack(edata)
@@ -1640,10 +1677,10 @@ class OES(OP2Common):
                     itotal2 = itotal + nelements
                     ielement2 = itotal2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 19)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 19)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 19)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 19)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1657,6 +1694,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'i18f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         n += ntotal
@@ -1774,7 +1812,7 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
                         # (eid_device, cid, abcd, nnodes)
-                        ints = fromstring(data, dtype=self.idtype)
+                        ints = frombuffer(data, dtype=self.idtype)
                         try:
                             ints1 = ints.reshape(nelements, numwide_real)
                         except ValueError:
@@ -1803,7 +1841,7 @@ class OES(OP2Common):
                         obj.element_cid[itotal:itotali, 0] = eids
                         obj.element_cid[itotal:itotali, 1] = cids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 4:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 4:]
                     # 1     9    15   2    10   16  3   11  17   8
                     #[oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm]
                     #isave = [1, 9, 15, 2, 10, 16, 3, 11, 17, 8]
@@ -1838,6 +1876,7 @@ class OES(OP2Common):
                         msg += '                                 szz, sxz, s3, c1, c2, c3]\n'
                         self.binary_debug.write(msg)
 
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]
                         out = struct1.unpack(edata)
@@ -1886,7 +1925,6 @@ class OES(OP2Common):
                             n += 84
 
             elif self.format_code in [2, 3] and self.num_wide == numwide_imag:  # complex
-                # TODO: vectorize
                 ntotal = numwide_imag * 4
                 nelements = ndata // ntotal
                 self.ntotal += nelements * nnodes_expected
@@ -1904,11 +1942,11 @@ class OES(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements * nnodes_expected
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     floats1 = floats[:, 4:].reshape(nelements * nnodes_expected, 13)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_imag)
                         ints1 = ints[:, 4:].reshape(nelements * nnodes_expected, 13)
                         eids = ints[:, 0] // 10
                         cids = ints[:, 1]
@@ -1936,6 +1974,7 @@ class OES(OP2Common):
                 else:
                     s1 = Struct(b(self._endian + '2i4si'))
                     s2 = Struct(b(self._endian + 'i12f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]
                         n += 16
@@ -2079,14 +2118,14 @@ class OES(OP2Common):
                     itotal2 = itotal + nelements * nnodes_expected
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype)
+                        ints = frombuffer(data, dtype=self.idtype)
                         ints1 = ints.reshape(nelements, numwide_real)
                         eids = ints1[:, 0] // 10
                         eids = np.vstack([eids, eids]).T.ravel()
                         assert eids.min() > 0, eids.min()
                         obj.element_node[itotal:itotal2, 0] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 1:]
 
                     #fd, sx, sy, txy, angle, major, minor, max_shear
                     floats1 = floats.reshape(nelements * nnodes_expected, 8)
@@ -2096,6 +2135,7 @@ class OES(OP2Common):
                 else:
                     struct1 = Struct(b(self._endian + 'i16f'))
                     cen = 0 # CEN/4
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = struct1.unpack(edata)
@@ -2115,7 +2155,6 @@ class OES(OP2Common):
                                  angle2, major2, minor2, max_shear2)
                         n += ntotal
             elif self.format_code in [2, 3] and self.num_wide == 15:  # imag
-                # TODO: vectorize
                 nnodes = 0  # centroid + 4 corner points
                 ntotal = 4 * (15 * (nnodes + 1))
                 nelements = ndata // ntotal
@@ -2134,11 +2173,11 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 15 * nnodes_all)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15 * nnodes_all)
                     floats1 = floats[:, 1:].reshape(nelements * nnodes_all * 2, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 15 * nnodes_all)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, 15 * nnodes_all)
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
                         ints1 = ints.reshape(nelements * nnodes_all, 15)
@@ -2165,6 +2204,7 @@ class OES(OP2Common):
                     s2 = Struct(b(self._endian + 'i14f'))
 
                     cen = 0 # 'CEN/4'
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+60]  # 4*15=60
                         n += 60
@@ -2268,7 +2308,7 @@ class OES(OP2Common):
 
                     itime = obj.itime
                     if itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 17)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
                         eids = ints[:, 0] // 10
                         #ilayers = ints[:, 1]
                         ints2 = ints[:, 1:].reshape(nlayers, 8)
@@ -2279,7 +2319,7 @@ class OES(OP2Common):
                         #obj.element_node[itotal:iend, 1] = 0
                         #print('obj.element_node\n', obj.element_node)
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 17)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                     floats1 = floats[:, 1:].reshape(nlayers, 8)
                     obj.data[obj.itime, itotal:iend, :] = floats1
                     obj._times[obj.itime] = dt
@@ -2288,6 +2328,7 @@ class OES(OP2Common):
                 else:
                     cen = 0 # 'CEN/3'
                     struct1 = Struct(b(self._endian + 'i16f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)
@@ -2321,11 +2362,11 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 15)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15)
                     floats1 = floats[:, 1:].reshape(nelements * 2, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 15)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, 15)
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
                         ints1 = ints.reshape(nelements, 15)
@@ -2349,6 +2390,7 @@ class OES(OP2Common):
                 else:
                     struct1 = Struct(b(self._endian + 'i14f'))
                     cen = 0 # CEN/3
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)
@@ -2489,7 +2531,7 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, numwide_real)
                         ints1 = ints[:, 2:].reshape(nlayers//2, 17)[:, 0].reshape(nelements, nnodes_all)
                         ints1[:, 0] = 0.
                         nids = ints1.ravel()
@@ -2510,9 +2552,9 @@ class OES(OP2Common):
                             obj.float_mask = float_mask1
 
                     if obj.nonlinear_factor is not None:
-                        results = fromstring(data, dtype=self.fdtype)[obj.float_mask]
+                        results = frombuffer(data, dtype=self.fdtype)[obj.float_mask]
                     else:
-                        floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                        floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                         floats1 = floats[:, 2:].reshape(nlayers // 2, 17)
                         results = floats1[:, 1:].reshape(nlayers, 8)
 
@@ -2537,6 +2579,7 @@ class OES(OP2Common):
                             '  nelements=%i; nnodes=%i # +1 centroid\n' % (ndata, nelements, nnodes))
 
                     grid_center = 0
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+76]
 
@@ -2594,12 +2637,12 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     floats1 = floats[:, 2:].reshape(nelements * nnodes_all, 15)
                     floats2 = floats1[:, 1:].reshape(nelements * nnodes_all * 2, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, numwide_imag)
                         ints[:, 2] = 0  # set center node to 0
                         ints1 = ints[:, 2:].reshape(nelements * nnodes_all, 15)
                         eids = ints[:, 0] // 10
@@ -2623,6 +2666,7 @@ class OES(OP2Common):
                     grid_center = 0
                     s1 = self.struct_2i  # 2
                     s2 = Struct(b(self._endian + 'i14f')) # 15
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         (eid_device, _) = s1.unpack(data[n:n+8])
                         n += 8
@@ -2727,7 +2771,6 @@ class OES(OP2Common):
             #print(self.code_information())
 
             if self.format_code == 1 and self.num_wide == 13 and self.element_type in [88, 90]:  # real
-                # TODO: vectorize
                 # single layered hyperelastic (???) ctria3, cquad4
                 ntotal = 52  # 4*13
                 nelements = ndata // ntotal
@@ -2747,11 +2790,11 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 13)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
                         eids = ints[:, 0] // 10
                         obj.element_node[ielement:ielement2, 0] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 13)
+                    floats = frombuffer(data, dtype=self.fdtype).copy().reshape(nelements, 13)
 
                     #[fiber_distance, oxx, oyy, ozz, txy, exx, eyy, ezz, exy, es, eps, ecs]
                     #print(ints)
@@ -2761,6 +2804,7 @@ class OES(OP2Common):
                     obj.itotal = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'i12f'))  # 1+12=13
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)
@@ -2775,9 +2819,8 @@ class OES(OP2Common):
                             dt, eid, self.element_type, fd1,
                             sx1, sy1, sz1, txy1, es1, eps1, ecs1,
                             ex1, ey1, ez1, exy1)
-                    n += ntotal
+                        n += ntotal
             elif self.format_code == 1 and self.num_wide == 25 and self.element_type in [88, 90]:
-                # TODO: vectorize
                 #     ELEMENT      FIBER                        STRESSES/ TOTAL STRAINS                     EQUIVALENT    EFF. STRAIN     EFF. CREEP
                 #        ID      DISTANCE           X              Y             Z               XY           STRESS    PLASTIC/NLELAST     STRAIN
                 # 0       721  -7.500000E+00   5.262707E+02   2.589492E+02   0.000000E+00  -2.014457E-14   4.557830E+02   5.240113E-02   0.0
@@ -2805,9 +2848,7 @@ class OES(OP2Common):
                     self._data_factor = 2
                     return nelements * self.num_wide * 4
 
-                #return nelements * self.num_wide * 4
                 obj = self.obj
-                is_vectorized = False
                 if self.use_vector and is_vectorized:
                     n = nelements * self.num_wide * 4
 
@@ -2816,39 +2857,31 @@ class OES(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements * 2
                     obj._times[obj.itime] = dt
-                    #print('ielement=%s:%s' % (ielement, ielement2))
-                    #print('itotal=%s:%s' % (itotal, itotal2))
 
                     if obj.itime == 0:
-                        try:
-                            ints = fromstring(data, dtype=self.idtype).reshape(nelements, 25)
-                        except ValueError:
-                            values = fromstring(data, dtype=self.idtype)
-
+                        ints = frombuffer(data, dtype=self.idtype,
+                                          count=nelements * 25).reshape(nelements, 25)
                         eids = ints[:, 0] // 10
-                        #eids2 = vstack([eids, eids]).T.ravel()
-                        #print(eids.tolist())
-                        #sss
-                        obj.element[ielement:ielement2] = eids  # 150
-                         #print(obj.element_node[:10, :])
-                        #aaa
-
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 25)[:, 1:]
-                    floats2 = floats.reshape(nelements * 2, 12)
-                    #print('a', floats2.shape)
-                    #print('b', obj.data[obj.itime, ielement:ielement2, :].shape)
+                        obj.element[ielement:ielement2] = eids
 
-                    #[fiber_distance, oxx, oyy, ozz, txy, exx, eyy, ezz, exy, es, eps, ecs]
-                    #print(ints)
-                    #floats[:, 1] = 0
-                    obj.data[obj.itime, itotal:itotal2, :] = floats.reshape(nelements * 2, 12)
-                    #obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype,
+                                        count=nelements * 25).reshape(nelements, 25)[:, 1:]
+
+                    #[fiber_distance, oxx, oyy, ozz, txy, es, eps, ecs, exx, eyy, ezz, exy]
+                    floats2 = floats.reshape(nelements * 2, 12).copy()
+
+                    # the fiber distance and the undefined z terms can be NaN
+                    zero_columns = floats2[:, [0, 3, 10]]
+                    zero_columns[np.isnan(zero_columns)] = 0.
+                    floats2[:, [0, 3, 10]] = zero_columns
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2
                     obj.ielement = ielement2
                     obj.itotal = itotal2
                 else:
                     #print(len(data))
                     etype = self.element_type
                     struct1 = Struct(b(self._endian + 'i24f')) # 1+24=25
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)
@@ -2941,13 +2974,13 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 11)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11)
                         eids = ints[:, 0] // 10
                         nids = ints[:, 1]
                         obj.element_layer[istart:iend, 0] = eids
                         obj.element_layer[istart:iend, 1] = nids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 11)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
                     #[o1, o2, t12, t1z, t2z, angle, major, minor, ovm]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 2:]
                 else:
@@ -2956,6 +2989,7 @@ class OES(OP2Common):
                     if hasattr(self, 'eid_old'):
                         eid_old = self.eid_old
 
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+44]  # 4*11
                         out = struct1.unpack(edata)
@@ -2975,41 +3009,12 @@ class OES(OP2Common):
                         eid_old = eid
                         n += 44
                     self.eid_old = eid_old
-            elif self.format_code in [2, 3] and self.num_wide == 9:  # TODO: imag? - not done...
-                # TODO: vectorize
-                raise NotImplementedError('imaginary composite stress?')
-                msg = self.code_information()
-                nelements = ndata // ntotal
-                auto_return, is_vectorized = self._create_oes_object4(
-                    nelements, result_name, slot, obj_vector_complex)
-                if auto_return:
-                    return nelements * self.num_wide * 4
-
-                # TODO: this is an OEF result???
-                #    furthermore the actual table is calle dout as
-                #    'i8si4f4s', not 'i8si3fi4s'
-                ntotal = 36
-                nelements = ndata // ntotal
-                s = self.struct_i
-                s2 = Struct(b(self._endian + '8si3fi4s'))
-                s3 = Struct(b(self._endian + '8si4f4s'))
-                for i in range(nelements):
-                    #out = s.unpack(data[n:n + ntotal])
-                    eid_device, = s.unpack(data[n:n+4])
-                    #t, = s.unpack(data[n:n+4])
-
-                    if eid_device > 0:
-                        out = s2.unpack(data[n+4:n+ntotal])
-                    else:
-                        out1 = s2.unpack(data[n+4:n+ntotal])
-                        out = s3.unpack(data[n+4:n+ntotal])
-                    (theory, lamid, fp, fm, fb, fmax, fflag) = out
-
-                    if self.is_debug_file:
-                        self.binary_debug.write('%s-%s - (%s) + %s\n' % (self.element_name, self.element_type, eid_device, str(out)))
-                    obj.add_new_eid(dt, eid, theory, lamid, fp, fm, fb, fmax, fflag)
-                    n += ntotal
-                raise NotImplementedError('this is a really weird case...')
+            elif self.format_code in [2, 3] and self.num_wide == 9:  # imag
+                # There's no complex composite plate result, so there's nothing
+                # to vectorize.  The 9 words also aren't stresses; they're the
+                # failure indices of the OEF composite table ('i8si4f4s').
+                msg = '%s-COMP-imag-numwide=%s' % (self.table_name_str, self.num_wide)
+                return self._not_implemented_or_skip(data, ndata, msg)
             else:
                 #msg = self.code_information()
                 msg = '%s-COMP-random-numwide=%s numwide_real=11 numwide_imag=9' % (
@@ -3050,12 +3055,12 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 33)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 33)
                     floats1 = floats[:, 1:].reshape(nelements * nnodes_all, 8)
 
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 33)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, 33)
                         ints1 = ints[:, 1:].reshape(nelements * nnodes_all, 8)
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
@@ -3072,6 +3077,7 @@ class OES(OP2Common):
                 else:
                     s1 = Struct(b(self._endian + '2i7f'))  # 36
                     s2 = Struct(b(self._endian + 'i7f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         out = s1.unpack(data[n:n + 36])
                         (eid_device, loc, rs, azs, As, ss, maxp, tmax, octs) = out
@@ -3089,54 +3095,41 @@ class OES(OP2Common):
                             obj.add_sort1(dt, eid, loc, rs, azs, As, ss, maxp, tmax, octs)
                             n += 32
             elif self.format_code in [2, 3] and self.num_wide == 37: # imag
-                # TODO: vectorize object
-                #return ndata
-
                 if self.is_stress:
-                    #print('self.element_type', self.element_type)
-                    #print('self.element_name', self.element_name)
-                    #raise NotImplementedError('ComplexTriaxStressArray')
                     obj_vector_complex = ComplexTriaxStressArray
                 else:
-                    raise NotImplementedError('ComplexTriaxStrainArray')
-                    #obj_vector_complex = ComplexTriaxStrainArray
+                    obj_vector_complex = ComplexTriaxStrainArray
 
                 num_wide = 1 + 4 * 9
                 ntotal = num_wide * 4
                 assert num_wide == self.num_wide, num_wide
-                nelements = ndata // ntotal  # (1+8*4)*4 = 33*4 = 132
+                nelements = ndata // ntotal  # (1+9*4)*4 = 37*4 = 148
                 leftover = ndata % ntotal
                 assert leftover == 0, 'ntotal=%s nelements=%s leftover=%s' % (ntotal, nelements, leftover)
 
-                #auto_return, is_vectorized = self._create_oes_object4(
-                    #nelements, result_name, slot, obj_vector_complex)
-
-                if data is None:
-                    return ndata
-                auto_return = False
-                is_vectorized = False
+                auto_return, is_vectorized = self._create_oes_object4(
+                    nelements, result_name, slot, obj_vector_complex)
                 if auto_return:
-                    #self._data_factor = 4
+                    self._data_factor = 4
                     return nelements * self.num_wide * 4
 
                 obj = self.obj
                 nnodes_all = 4
-                if self.use_vector and is_vectorized and 0:
-                    n = nelements * 4 * self.num_wide
+                if self.use_vector and is_vectorized:
+                    n = nelements * ntotal
                     itotal = obj.itotal
                     itotal2 = itotal + nelements * nnodes_all
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, num_wide)
                     floats1 = floats[:, 1:].reshape(nelements * nnodes_all, 9)
 
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, num_wide)
                         ints1 = ints[:, 1:].reshape(nelements * nnodes_all, 9)
                         eids = ints[:, 0] // 10
-                        ints[:, 0] = 0
                         nids = ints1[:, 0]
                         eids2 = np.vstack([eids] * nnodes_all).T.ravel()
                         assert eids.min() > 0, eids.min()
@@ -3145,7 +3138,7 @@ class OES(OP2Common):
 
                     # [loc, rsr, rsi, azsr, azsi, Asr, Asi, ssr, ssi]
                     isave1 = [1, 3, 5, 7]
-                    isave2 = [2, 4, 6, 9]
+                    isave2 = [2, 4, 6, 8]
                     real_imag = apply_mag_phase(floats1, is_magnitude_phase, isave1, isave2)
 
                     obj.data[obj.itime, itotal:itotal2, :] = real_imag
@@ -3155,14 +3148,13 @@ class OES(OP2Common):
                     s1 = Struct(b(self._endian + 'ii8f')) # 10*4 = 40
                     s2 = Struct(b(self._endian + 'i8f'))  #  9*4 = 36
 
-
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         out = s1.unpack(data[n:n + 40])
                         (eid_device, loc, rsr, rsi, azsr, azsi, Asr, Asi, ssr, ssi) = out
                         eid = eid_device // 10
                         if self.is_debug_file:
                             self.binary_debug.write('CTRIAX6-53 eid=%i\n    %s\n' % (eid, str(out)))
-                        print('CTRIAX6-53 eid=%i\n    %s\n' % (eid, str(out)))
 
                         if is_magnitude_phase:
                             rs = polar_to_real_imag(rsr, rsi)
@@ -3174,7 +3166,7 @@ class OES(OP2Common):
                             azs = complex(azsr, azsi)
                             As = complex(Asr, Asi)
                             ss = complex(ssr, ssi)
-                        #obj.add_new_eid(dt, eid, loc, rs, azs, As, ss)
+                        obj.add_sort1(dt, eid, loc, rs, azs, As, ss)
 
                         n += 40
                         for i in range(3):
@@ -3182,8 +3174,6 @@ class OES(OP2Common):
                             (loc, rsr, rsi, azsr, azsi, Asr, Asi, ssr, ssi) = out
                             if self.is_debug_file:
                                 self.binary_debug.write('    %s\n' % (str(out)))
-                            print("eid=%s loc=%s rs=%s azs=%s as=%s ss=%s" % (
-                                eid, loc, rs, azs, As, ss))
 
                             if is_magnitude_phase:
                                 rs = polar_to_real_imag(rsr, rsi)
@@ -3195,8 +3185,8 @@ class OES(OP2Common):
                                 azs = complex(azsr, azsi)
                                 As = complex(Asr, Asi)
                                 ss = complex(ssr, ssi)
-                            #obj.add_sort1(dt, eid, loc, rs, azs, As, ss)
-                            n += 36  # 4*8
+                            obj.add_sort1(dt, eid, loc, rs, azs, As, ss)
+                            n += 36  # 4*9
             else:
                 msg = self.code_information()
                 raise NotImplementedError(msg)
@@ -3234,15 +3224,16 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 7)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                     #[tx, ty, tz, rx, ry, rz]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
                 else:
                     struct1 = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)  # num_wide=7
@@ -3274,10 +3265,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 13)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 13)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -3291,6 +3282,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'i12f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = struct1.unpack(edata)  # num_wide=7
@@ -3356,13 +3348,13 @@ class OES(OP2Common):
                     obj._times[itime] = dt
 
                     if 1: #obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 8)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
                         eids = ints[:, 0] // 10
                         fail = ints[:, 7]
                         obj.element[itotal:itotal2] = eids
                         obj.is_failed[itime, itotal:itotal2, 0] = fail
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 8)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                     #[xxx, fe, ue, ve, ao, ae, ep, xxx]
                     obj.data[itime, itotal:itotal2, :] = floats[:, 1:7]
 
@@ -3370,6 +3362,7 @@ class OES(OP2Common):
                     obj.itotal = itotal2
                 else:
                     struct1 = Struct(b(self._endian + 'i6fi'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 32]
                         out = struct1.unpack(edata)  # num_wide=25
@@ -3383,7 +3376,6 @@ class OES(OP2Common):
                         obj.add_sort1(dt, eid, fe, ue, ve, ao, ae, ep, fail)
                         n += ntotal
             elif self.format_code in [2, 3] and self.num_wide == 9:  # imag
-                # TODO: vectorize object
                 ntotal = 36  # 4*9
                 nelements = ndata // ntotal
 
@@ -3406,11 +3398,11 @@ class OES(OP2Common):
                     obj._times[itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         obj.element[itotal:itotal2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     #[fer, uer, aor, aer,
                     # fei, uei, aoi, aei]
                     isave1 = [1, 3, 5, 7]
@@ -3422,6 +3414,7 @@ class OES(OP2Common):
                     obj.itotal = itotal2
                 else:
                     struct1 = Struct(b(self._endian + 'i8f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
 
@@ -3500,15 +3493,16 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 7)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                     #[axial_stress, equiv_stress, total_strain,
                     # eff_plastic_creep_strain, eff_creep_strain, linear_torsional_stresss]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
                 else:
                     struct1 = Struct(b(self._endian + 'i6f'))  # 1+6=7
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = struct1.unpack(edata)
@@ -3562,12 +3556,12 @@ class OES(OP2Common):
                     ielement2 = obj.ielement + nelements
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[ielement:ielement2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
 
                     #[force, stress]
                     obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
@@ -3575,6 +3569,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     struct1 = Struct(b(self._endian + 'i2f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = struct1.unpack(edata)  # num_wide=3
@@ -3628,16 +3623,17 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 11)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11)
                         eids = ints[:, 0] // 10
                         obj.element[ielement:ielement2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 11)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
                     # skipping [form1, form2]
                     #[cpx, shy, shz, au, shv, shw, slv, slp]
                     obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:9]
                 else:
                     struct1 = Struct(b(self._endian + 'i8f4s4s'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
 
@@ -3689,38 +3685,71 @@ class OES(OP2Common):
                     #self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
 
-                struct1 = Struct(b(self._endian + '2i 4s5f 4s5f 4s5f 4s5f i 4s5f 4s5f 4s5f 4s5f'))  # 2 + 6*8 + 1 = 51
-                for i in range(nelements):  # num_wide=51
-                    edata = data[n:n + 204]
-                    out = struct1.unpack(edata)
+                if self.use_vector and is_vectorized:
+                    n = nelements * ntotal
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements * 8
+                    ielement2 = obj.ielement + nelements
+                    obj._times[obj.itime] = dt
 
-                    if self.is_debug_file:
-                        self.binary_debug.write('BEAMNL-94 - %s\n' % str(out))
-
-                    #gridA, CA, long_CA, eqS_CA, tE_CA, eps_CA, ecs_CA,
-                    #       DA, long_DA, eqS_DA, tE_DA, eps_DA, ecs_DA,
-                    #       EA, long_EA, eqS_EA, tE_EA, eps_EA, ecs_EA,
-                    #       FA, long_FA, eqS_FA, tE_FA, eps_FA, ecs_FA,
-                    #gridB, CB, long_CB, eqS_CB, tE_CB, eps_CB, ecs_CB,
-                    #       DB, long_DB, eqS_DB, tE_DB, eps_DB, ecs_DB,
-                    #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
-                    #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
-                    # A
-                    assert out[3-1] == b'   C', out[3-1]
-                    assert out[9-1] == b'   D', out[9-1]
-                    assert out[15-1] == b'   E', out[15-1]
-                    assert out[21-1] == b'   F', out[21-1]
-
-                    # B
-                    assert out[28-1] == b'   C', out[28-1]
-                    assert out[34-1] == b'   D', out[34-1]
-                    assert out[40-1] == b'   E', out[40-1]
-                    assert out[46-1] == b'   F', out[46-1]
-
-                    eid_device = out[0]
-                    eid = eid_device // 10
-                    obj.add_new_eid_sort1(dt, eid, out)
-                    n += 204
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype,
+                                          count=nelements * 51).reshape(nelements, 51)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+
+                        # stations C, D, E, F at end A and then at end B
+                        grids = np.hstack([repeat(ints[:, [1]], 4, axis=1),
+                                           repeat(ints[:, [26]], 4, axis=1)])
+                        obj.element_node[itotal:itotal2, 0] = repeat(eids, 8)
+                        obj.element_node[itotal:itotal2, 1] = grids.ravel()
+                        obj.element_node[itotal:itotal2, 2] = np.tile(np.arange(8), nelements)
+
+                    # [C, long, eqs, te, eps, ecs] * 4 for end A and for end B
+                    floats = frombuffer(data, dtype=self.fdtype,
+                                        count=nelements * 51).reshape(nelements, 51)
+                    floats_a = floats[:, 2:26].reshape(nelements, 4, 6)
+                    floats_b = floats[:, 27:51].reshape(nelements, 4, 6)
+                    floats2 = np.hstack([floats_a, floats_b])[:, :, 1:].reshape(nelements * 8, 5)
+
+                    #[long, eqs, te, eps, ecs]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2
+                    obj.itotal = itotal2
+                    obj.ielement = ielement2
+                else:
+                    struct1 = Struct(b(self._endian + '2i 4s5f 4s5f 4s5f 4s5f i 4s5f 4s5f 4s5f 4s5f'))  # 2 + 6*8 + 1 = 51
+                    self._add_unvectorized_result(nelements)
+                    for i in range(nelements):  # num_wide=51
+                        edata = data[n:n + 204]
+                        out = struct1.unpack(edata)
+
+                        if self.is_debug_file:
+                            self.binary_debug.write('BEAMNL-94 - %s\n' % str(out))
+
+                        #gridA, CA, long_CA, eqS_CA, tE_CA, eps_CA, ecs_CA,
+                        #       DA, long_DA, eqS_DA, tE_DA, eps_DA, ecs_DA,
+                        #       EA, long_EA, eqS_EA, tE_EA, eps_EA, ecs_EA,
+                        #       FA, long_FA, eqS_FA, tE_FA, eps_FA, ecs_FA,
+                        #gridB, CB, long_CB, eqS_CB, tE_CB, eps_CB, ecs_CB,
+                        #       DB, long_DB, eqS_DB, tE_DB, eps_DB, ecs_DB,
+                        #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
+                        #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
+                        # A
+                        assert out[3-1] == b'   C', out[3-1]
+                        assert out[9-1] == b'   D', out[9-1]
+                        assert out[15-1] == b'   E', out[15-1]
+                        assert out[21-1] == b'   F', out[21-1]
+
+                        # B
+                        assert out[28-1] == b'   C', out[28-1]
+                        assert out[34-1] == b'   D', out[34-1]
+                        assert out[40-1] == b'   E', out[40-1]
+                        assert out[46-1] == b'   F', out[46-1]
+
+                        eid_device = out[0]
+                        eid = eid_device // 10
+                        obj.add_new_eid_sort1(dt, eid, out)
+                        n += 204
 
             elif self.format_code == 1 and self.num_wide == numwide_random:  # random
                 msg = self.code_information()
@@ -3779,31 +3808,33 @@ class OES(OP2Common):
                 #else:
                     #self.create_transient_object(self.nonlinearPlateStrain, NonlinearSolid)
 
-                n = 0
-                s1 = Struct(b(self._endian + 'i4s'))
-                s2 = Struct(b(self._endian + 'i15f'))
+                # the nonlinear solid results aren't stored yet, so they're
+                # only unpacked for the debug file
                 nelements = ndata // ntotal
-                for i in range(nelements):  # 2+16*9 = 146 -> 146*4 = 584
-                    edata = data[n:n+8]
-                    n += 8
+                n = nelements * ntotal
+                if self.is_debug_file:
+                    n = 0
+                    s1 = Struct(b(self._endian + 'i4s'))
+                    s2 = Struct(b(self._endian + 'i15f'))
+                    for i in range(nelements):  # 2+16*9 = 146 -> 146*4 = 584
+                        edata = data[n:n+8]
+                        n += 8
 
-                    out = s1.unpack(edata)
-                    if self.is_debug_file:
+                        out = s1.unpack(edata)
                         self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
-                    (eid_device, ctype) = out
-                    eid = eid_device // 10
+                        (eid_device, ctype) = out
+                        eid = eid_device // 10
 
-                    for i in range(nnodes):
-                        edata = data[n:n+64]
-                        n += 64
-                        out = s2.unpack(edata)
-                        if self.is_debug_file:
+                        for i in range(nnodes):
+                            edata = data[n:n+64]
+                            n += 64
+                            out = s2.unpack(edata)
                             self.binary_debug.write('%s-%sB - %s\n' % (etype, self.element_type, str(out)))
 
-                        assert len(out) == 16
-                        (grid,
-                         sx, sy, sz, sxy, syz, sxz, se, eps, ecs,
-                         ex, ey, ez, exy, eyz, exz) = out
+                            assert len(out) == 16
+                            (grid,
+                             sx, sy, sz, sxy, syz, sxz, se, eps, ecs,
+                             ex, ey, ez, exy, eyz, exz) = out
             else:
                 #msg = self.code_information()
                 msg = "format_code=%s numwide=%s numwide_real=%s numwide_random=%s" % (
@@ -3857,15 +3888,16 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 10)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 10)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                     #[sd, sxc, sxd, sxe, sxf, axial, smax, smin, MS]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
                 else:
                     struct1 = Struct(b(self._endian + 'i9f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = struct1.unpack(edata)
@@ -3885,7 +3917,6 @@ class OES(OP2Common):
             # 140-HEXA8FD, 201-QUAD4FD
             return ndata
         elif self.element_type in [145, 146, 147]:
-            # TODO: vectorize
             if self.read_mode == 1:
                 return ndata
             # 145-VUHEXA  (8 nodes)
@@ -3906,46 +3937,39 @@ class OES(OP2Common):
             else:
                 raise RuntimeError(self.code_information())
 
-            #num_wideA = 2 + 12 * nnodes
-            #ntotal = 8 + 48 * nnodes
-
-            if self.format_code == -1 and self.num_wide == 33: # real
-                # assuming TETRA...
-                # TODO: vectorize
-                numwide_a = 2 + (14 - 2) * nnodes  # 50
-                numwide_b = 2 + (9 - 2) * nnodes  # 30
-                numwide_c = 2 + 13 * nnodes  # 54
-                if self.num_wide == numwide_a:
-                    ntotal = numwide_a * 4
+            numwide_a = 2 + 12 * nnodes  # 50
+            numwide_b = 2 + 7 * nnodes  # 30
+            numwide_c = 2 + 13 * nnodes  # 54
+            if self.format_code == 1 and self.num_wide == numwide_a:  # real
+                # the VU solid results aren't stored yet, so they're
+                # only unpacked for the debug file
+                ntotal = numwide_a * 4
+                nelements = ndata // ntotal
+                n = nelements * ntotal
+                if self.is_debug_file:
+                    n = 0
                     s1 = self.struct_2i
                     s2 = Struct(b(self._endian + 'i11f'))
-                    nelements = ndata // ntotal  # 2+16*9 = 146 -> 146*4 = 584
                     for i in range(nelements):
                         edata = data[n:n+8]
+                        n += 8
                         out = s1.unpack(edata)
-                        (eid_device, parent_id) = out
-                        eid = eid_device // 10
+                        self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
+                        #(eid_device, parent_id) = out
 
                         for i in range(nnodes):
                             edata = data[n:n+48]
+                            n += 48
                             out = s2.unpack(edata)
-                            if self.is_debug_file:
-                                self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
+                            self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
                             assert len(out) == 12
-                            (grid, xnorm, ynorm, znorm, txy, tyz, txz,
-                             prin1, prin2, prin3, smean, vono_roct) = out
-                    return ndata
-                elif self.num_wide == numwide_b:
-                    ntotal = numwide_b * 4
-                    nelements = ndata // ntotal
-                    n = nelements * ntotal
-                elif self.num_wide == numwide_c:
-                    ntotal = numwide_c * 4
-                    nelements = ndata // ntotal
-                    n = nelements * ntotal
-                else:
-                    msg = 'numwide=%s A=%s B=%s C=%s' % (self.num_wide, numwide_a, numwide_b, numwide_c)
-                    raise RuntimeError(self.code_information())
+                            #(grid, xnorm, ynorm, znorm, txy, tyz, txz,
+                             #prin1, prin2, prin3, smean, vono_roct) = out
+            elif self.num_wide in [numwide_b, numwide_c]:
+                # not stored
+                ntotal = self.num_wide * 4
+                nelements = ndata // ntotal
+                n = nelements * ntotal
             else:
                 #raise RuntimeError(self.code_information())
                 msg = self.code_information()
@@ -3953,27 +3977,26 @@ class OES(OP2Common):
 
         elif self.element_type == 139:
             # 139-QUAD4FD
-            if self.read_mode == 1:
-                return ndata
-            if self.format_code == -4 and self.num_wide == 30:
+            if self.format_code == 1 and self.num_wide == 30:
                 if self.is_stress:
-                    self.create_transient_object(self.hyperelastic_cquad4_strain, HyperelasticQuadArray)
-                    result_name = 'hyperelastic_cquad4_strain'
+                    result_name = 'hyperelastic_cquad4_stress'
                 else:
                     msg = 'HyperelasticQuad???'
                     return self._not_implemented_or_skip(data, ndata, msg)
 
+                if self._results.is_not_saved(result_name):
+                    return ndata
                 self._results._found_result(result_name)
                 slot = getattr(self, result_name)
 
-
                 ntotal = 120  # 36+28*3
                 nelements = ndata // ntotal
 
                 auto_return, is_vectorized = self._create_oes_object4(
-                    nelements, result_name, slot, obj_vector_real)
+                    nelements, result_name, slot, HyperelasticQuadArray)
                 if auto_return:
-                    return ndata
+                    self._data_factor = 4
+                    return nelements * self.num_wide * 4
 
                 #if self.is_debug_file:
                     #self.binary_debug.write('  [cap, element1, element2, ..., cap]\n')
@@ -3983,36 +4006,37 @@ class OES(OP2Common):
                 obj = self.obj
 
                 if self.use_vector and is_vectorized:
-                    # self.itime = 0
-                    # self.ielement = 0
-                    # self.itotal = 0
-                    #self.ntimes = 0
-                    #self.nelements = 0
                     n = nelements * self.num_wide * 4
 
-                    istart = obj.itotal
-                    iend = istart + nelements
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements * 4
+                    ielement = obj.ielement
+                    ielement2 = ielement + nelements
                     obj._times[obj.itime] = dt
 
-                    #if obj.itime == 0:
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, 30)
-                    ints2 = ints[:, 2:].reshape(nelements * 7, 7)
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 30)
+                        ints2 = ints[:, 2:].reshape(nelements * 4, 7)
 
-                    #strings = fromstring(data, dtype=???)
-                    eids = ints[:, 0] // 10
-                    nids = ints2[:, 0]
-                    obj.element[istart:iend] = eids
+                        #strings = frombuffer(data, dtype=???)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        obj.element_node[itotal:itotal2, 0] = repeat(eids, 4)
+                        obj.element_node[itotal:itotal2, 1] = ints2[:, 0]
 
                     # dropping off eid and the string word (some kind of Type)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 30)[:, 2:]
-                    floats2 = floats.reshape(nelements * 7, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 30)[:, 2:]
+                    floats2 = floats.reshape(nelements * 4, 7)
                     #[oxx, oyy, txy, angle, majorp, minorp]
-                    obj.data[obj.itime, istart:iend, :] = floats2[:, 1:]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 1:]
+                    obj.itotal = itotal2
+                    obj.ielement = ielement2
                 else:
                     n = 0
                     # (2 + 7*4)*4 = 30*4 = 120
                     s1 = Struct(b(self._endian + 'i4s i6f'))  # 1 + 4+1+6 = 12
                     s2 = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_result(nelements)
                     for i in range(nelements):
                         edata = data[n:n+36]  # 4*9
                         out = s1.unpack(edata)
@@ -4021,16 +4045,16 @@ class OES(OP2Common):
 
                         (eid_device, Type, ID, sx, sy, sxy, angle, smj, smi) = out
                         eid = eid_device // 10
-                        obj._add_new_eid_sort1(dt, [eid, Type, sx, sy, sxy, angle, smj, smi])
+                        obj._add_new_eid_sort1(dt, eid, Type, ID, sx, sy, sxy, angle, smj, smi)
                         n += 36
 
-                        for i in range(3):  # TODO: why is this not 4?
+                        for i in range(3):  # the 2nd-4th gauss points
                             edata = data[n:n + 28]  # 4*7
                             out = s2.unpack(edata)
                             if self.is_debug_file:
                                 self.binary_debug.write('               %s\n' % (str(out)))
                             (ID, sx, sy, sxy, angle, smj, smi) = out
-                            obj._add_sort1(dt, eid, out)
+                            obj._add_sort1(dt, eid, ID, sx, sy, sxy, angle, smj, smi)
                             n += 28
             else:
                 msg = 'numwide=%s' % self.num_wide
@@ -4070,37 +4094,28 @@ class OES(OP2Common):
             numwide_imag = 6 + (33 - 6) * nnodes  # imag???
 
             if self.format_code == 1 and self.num_wide == numwide_real:  # real???
+                # the VUQUAD results aren't stored yet, so they're
+                # only unpacked for the debug file
                 ntotal = numwide_real * 4
-                s2 = Struct(b(self._endian + '3i4s2i'))
-                s3 = Struct(b(self._endian + 'i16f'))
                 nelements = ndata // ntotal
-                for i in range(nelements):
-                    out = s2.unpack(data[n:n + 24])
-                    (eid_device, parent, coord, icord, theta, itype) = out
-                    n += 24
-                    eid = eid_device // 10
-                    edata = data[n:n + 68]
-                    out = s3.unpack(edata)  # len=17*4
-                    n += 68
-
-                    if self.is_debug_file:
+                n = nelements * ntotal
+                if self.is_debug_file:
+                    n = 0
+                    s2 = Struct(b(self._endian + '3i4s2i'))
+                    s3 = Struct(b(self._endian + 'i16f'))
+                    for i in range(nelements):
+                        out = s2.unpack(data[n:n + 24])
+                        #(eid_device, parent, coord, icord, theta, itype) = out
+                        n += 24
                         self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
 
-                    #obj.add_new_node(dt, eid, parent, coord, icord, theta, itype)
-                    #obj.add_new_eid(eType, dt, eid, parent, coord, icord, theta, itype)
-                    for node_id in range(nnodes - 1):  # nodes pts
-                        edata = data[n:n + 68]
-                        n += 68
-                        out = s3.unpack(edata)
-                        if self.is_debug_file:
+                        for node_id in range(nnodes):  # nodes pts
+                            edata = data[n:n + 68]
+                            n += 68
+                            out = s3.unpack(edata)  # len=17*4
                             self.binary_debug.write('              %s\n' % (str(out)))
-
-                        (vuid, dummy, dummy2, msx, msy, mxy, dummy3, dummy4, dummy5,
-                         bcx, bcy, bcxy, tyz, tzx, dummy6, dummy7, dummy8) = out
-                        #obj.add(vuid, dummy, dummy2, msx, msy, mxy,
-                                     #dummy3, dummy4, dummy5,
-                                     #bcx, bcy, bcxy, tyz, tzx,
-                                     #dummy6, dummy7, dummy8)
+                            #(vuid, dummy, dummy2, msx, msy, mxy, dummy3, dummy4, dummy5,
+                             #bcx, bcy, bcxy, tyz, tzx, dummy6, dummy7, dummy8) = out
             elif self.num_wide == numwide_imag:
                 ntotal = numwide_imag * 4
                 nelements = ndata // ntotal
@@ -4210,15 +4225,15 @@ class OES(OP2Common):
                 obj._times[obj.itime] = dt
 
                 if obj.itime == 0:
-                    print(fromstring(data, dtype=self.idtype).size)
+                    print(frombuffer(data, dtype=self.idtype).size)
                     print('nelements=%s numwide=%s' % (nelements, numwide_real))
                     print('ndata=', ndata)
                     print('self.element_name=%s' % self.element_name)
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                     eids = ints[:, 0] // 10
                     obj.element[istart:iend] = eids
 
-                floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                 results = floats[:, 1:]
                 print('results.shape', results.shape)
 
@@ -4289,13 +4304,13 @@ class OES(OP2Common):
                 #obj._times[obj.itime] = dt
 
                 #if obj.itime == 0:
-                    #print(fromstring(data, dtype=self.idtype).size)
+                    #print(frombuffer(data, dtype=self.idtype).size)
                     #print('nelements=%s numwide=%s' % (nelements, numwide_real))
-                    #ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    #ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                     #eids = ints[:, 0] // 10
                     ##obj.element[istart:iend] = eids
 
-                #floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                #floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                 #print('floats[:, 2:].shape', floats[:, 2:].shape)
                 #print('nnelements=%s nnodes=%s numwide//nodes=%s' % (nelements, nnodes, (numwide_real-2) / nnodes))
                 #results = floats[:, 2:].reshape(nelements, nnodes * 6)
@@ -4322,26 +4337,24 @@ class OES(OP2Common):
         assert self.num_wide == 9, "num_wide=%s not 9" % self.num_wide
         ntotal = 36  # 4*9
 
-        n = 0
-        struct1 = Struct(b(self._endian + 'i8si3fi4s'))
+        # the strength ratios aren't stored yet, so they're only unpacked
+        # for the debug file
         nelements = ndata // ntotal
-        #obj = self.obj
-        for i in range(nelements):
-            edata = data[n:n + ntotal]
-            out = struct1.unpack(edata)  # num_wide=9
-            if self.is_debug_file:
+        n = nelements * ntotal
+        if self.is_debug_file:
+            n = 0
+            struct1 = Struct(b(self._endian + 'i8si3fi4s'))
+            for i in range(nelements):
+                edata = data[n:n + ntotal]
+                out = struct1.unpack(edata)  # num_wide=9
                 self.binary_debug.write('CQUAD4-95 - %s\n' % str(out))
-            #eid, failure, ply, failureIndexPly, failureIndexBonding, failureIndexMax, flag
-            # 3,TSAIWU,1,8.5640,0.0,None
-
-            (eid, failure, ply, strength_ratio_ply, failure_index_bonding, strength_ratio_bonding, flag, flag2) = out
-            #strength_ratio_ply
-            #print("eid=%s failure=%r ply=%s failureIndexPly=%s  failure_index_bonding=%s strength_ratio_bonding=%s flag=%s flag2=%s" % (
-            #    eid, failure.strip(), ply, failureIndexPly, failure_index_bonding, strength_ratio_bonding, flag, flag2))
-            print("eid=%s strength_ratio_ply=%g failure_index_bonding=%s strength_ratio_bonding=%s" % (
-                eid, strength_ratio_ply, failure_index_bonding, strength_ratio_bonding))
-            #obj.add_new_eid(element_name, dt, eid, force, stress)
-            n += ntotal
+                #eid, failure, ply, failureIndexPly, failureIndexBonding, failureIndexMax, flag
+                # 3,TSAIWU,1,8.5640,0.0,None
+
+                #(eid, failure, ply, strength_ratio_ply, failure_index_bonding,
+                 #strength_ratio_bonding, flag, flag2) = out
+                n += ntotal
+        return n
 
     def _create_nodes_object(self, nnodes, result_name, slot, obj_vector):
         """same as _create_oes_object4 except it adds to the nnodes parameter"""
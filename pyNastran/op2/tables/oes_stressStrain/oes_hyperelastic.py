@@ -12,15 +12,13 @@ from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 
 class HyperelasticQuadArray(OES_Object):
     def __init__(self, data_code, is_sort1, isubcase, dt):
-        HyperelasticQuad
-        OES_Object.__init__(self, data_code, isubcase, apply_data_code=False)
+        OES_Object.__init__(self, data_code, isubcase, apply_data_code=True)
         #self.code = [self.format_code, self.sort_code, self.s_code]
 
         #self.ntimes = 0  # or frequency/mode
         #self.ntotal = 0
         self.ielement = 0
         self.nelements = 0  # result specific
-        self.nnodes = None
 
         if is_sort1:
             pass
@@ -31,9 +29,11 @@ class HyperelasticQuadArray(OES_Object):
         else:
             raise NotImplementedError('SORT2')
 
+    @property
     def is_real(self):
         return True
 
+    @property
     def is_complex(self):
         return False
 
@@ -67,24 +67,9 @@ class HyperelasticQuadArray(OES_Object):
         assert self.ntotal > 0, 'ntotal=%s' % self.ntotal
         #self.names = []
 
-        #if self.element_type in [33, 74]:
-            #nnodes_per_element = 1
-        #elif self.element_type == 144:
-            #nnodes_per_element = 5
-        #elif self.element_type == 64:  # CQUAD8
-            #nnodes_per_element = 5
-        #elif self.element_type == 82:  # CQUADR
-            #nnodes_per_element = 5
-        #elif self.element_type == 70:  # CTRIAR
-            #nnodes_per_element = 4
-        #elif self.element_type == 75:  # CTRIA6
-            #nnodes_per_element = 4
-        #else:
-        raise NotImplementedError('name=%r type=%s' % (self.element_name, self.element_type))
+        if self.element_type != 139:
+            raise NotImplementedError('name=%r type=%s' % (self.element_name, self.element_type))
 
-        #print('nnodes_per_element[%s, %s] = %s' % (self.isubcase, self.element_type, nnodes_per_element))
-        #self.nnodes = nnodes_per_element
-        #self.nelements //= nnodes_per_element
         self.nelements //= self.ntimes
         self.itime = 0
         self.ielement = 0
@@ -99,7 +84,9 @@ class HyperelasticQuadArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        #self.element_node = np.zeros((self.ntotal, 2), dtype='int32')
+
+        # the 4 gauss points of each element; [eid, gauss_id]
+        self.element_node = np.zeros((self.ntotal, 2), dtype='int32')
 
         #self.Type[eid] = Type
         #self.oxx[dt] = {eid: [oxx]}
@@ -151,15 +138,14 @@ class HyperelasticQuadArray(OES_Object):
                     (eid, nid) = e
                     t1 = self.data[itime, ie, :]
                     t2 = table.data[itime, ie, :]
-                    (fiber_dist1, oxx1, oyy1, txy1, angle1, majorP1, minorP1, ovm1) = t1
-                    (fiber_dist2, oxx2, oyy2, txy2, angle2, majorP2, minorP2, ovm2) = t2
+                    (oxx1, oyy1, txy1, angle1, majorP1, minorP1) = t1
+                    (oxx2, oyy2, txy2, angle2, majorP2, minorP2) = t2
 
-                    # vm stress can be NaN for some reason...
-                    if not np.array_equal(t1[:-1], t2[:-1]):
-                        msg += '(%s, %s)    (%s, %s, %s, %s, %s, %s, %s, %s)  (%s, %s, %s, %s, %s, %s, %s, %s)\n' % (
+                    if not np.array_equal(t1, t2):
+                        msg += '(%s, %s)    (%s, %s, %s, %s, %s, %s)  (%s, %s, %s, %s, %s, %s)\n' % (
                             eid, nid,
-                            fiber_dist1, oxx1, oyy1, txy1, angle1, majorP1, minorP1, ovm1,
-                            fiber_dist2, oxx2, oyy2, txy2, angle2, majorP2, minorP2, ovm2)
+                            oxx1, oyy1, txy1, angle1, majorP1, minorP1,
+                            oxx2, oyy2, txy2, angle2, majorP2, minorP2)
                         i += 1
                         if i > 10:
                             print(msg)
@@ -173,12 +159,12 @@ class HyperelasticQuadArray(OES_Object):
         #self._add_new_eid_sort1(dt, eid, node_id, fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm)
 
 
-    def _add_new_eid_sort1(self, dt, eid, Type, oxx, oyy, txy, angle, majorP, minorP):
+    def _add_new_eid_sort1(self, dt, eid, Type, ID, oxx, oyy, txy, angle, majorP, minorP):
         assert isinstance(eid, ints), eid
-        assert isinstance(node_id, ints), node_id
+        assert isinstance(ID, ints), ID
         self._times[self.itime] = dt
         #assert self.itotal == 0, oxx
-        self.element_node[self.itotal, :] = [eid, node_id]
+        self.element_node[self.itotal, :] = [eid, ID]
         self.data[self.itime, self.itotal, :] = [oxx, oyy, txy, angle, majorP, minorP]
         self.itotal += 1
         self.ielement += 1
@@ -196,8 +182,8 @@ class HyperelasticQuadArray(OES_Object):
 
     def _add_sort1(self, dt, eid, ID, oxx, oyy, txy, angle, majorP, minorP):
         assert eid is not None, eid
-        assert isinstance(node_id, ints), node_id
-        self.element_node[self.itotal, :] = [eid, node_id]
+        assert isinstance(ID, ints), ID
+        self.element_node[self.itotal, :] = [eid, ID]
         self.data[self.itime, self.itotal, :] = [oxx, oyy, txy, angle, majorP, minorP]
         self.itotal += 1
 
@@ -209,21 +195,19 @@ class HyperelasticQuadArray(OES_Object):
                 '  ntotal: %i\n' % self.ntotal,
             ]
 
-        nelements = self.nelements
         ntimes = self.ntimes
-        nnodes = self.nnodes
         ntotal = self.ntotal
-        nlayers = 2
-        nelements = self.ntotal // self.nnodes // 2
+        ngauss = 4
+        nelements = self.ntotal // ngauss
 
         msg = []
         if self.nonlinear_factor is not None:  # transient
-            msgi = '  type=%s ntimes=%i nelements=%i nnodes_per_element=%i nlayers=%i ntotal=%i\n' % (
-                self.__class__.__name__, ntimes, nelements, nnodes, nlayers, ntotal)
+            msgi = '  type=%s ntimes=%i nelements=%i ngauss_per_element=%i ntotal=%i\n' % (
+                self.__class__.__name__, ntimes, nelements, ngauss, ntotal)
             ntimes_word = 'ntimes'
         else:
-            msgi = '  type=%s nelements=%i nnodes_per_element=%i nlayers=%i ntotal=%i\n' % (
-                self.__class__.__name__, nelements, nnodes, nlayers, ntotal)
+            msgi = '  type=%s nelements=%i ngauss_per_element=%i ntotal=%i\n' % (
+                self.__class__.__name__, nelements, ngauss, ntotal)
             ntimes_word = '1'
         msg.append(msgi)
         headers = self.get_headers()
@@ -288,11 +272,11 @@ class HyperelasticQuadArray(OES_Object):
 
                 if i == 1:
                     gauss = 'GAUS'  # TODO: update
-                    f.write('0%8i %8s  %8i  %13E.6  %13E.6  %13E.6  %13E.6  %13E.6  %13E.6\n' % (
-                        eid, gauss, 1, oxxi, oyyi, txyi, angle, major, minor))
+                    f.write('0%8i %8s  %8i  %-13s  %-13s  %-13s  %8.4f    %-13s  %s\n' % (
+                        eid, gauss, nid, oxxi, oyyi, txyi, anglei, major, minor))
                 else:
-                    f.write(' %8s %8s  %8i  %13E.6  %13E.6  %13E.6  %13E.6  %13E.6  %13E.6\n' % (
-                        '', '', i, oxxi, oyyi, txyi, angle, major, minor))
+                    f.write(' %8s %8s  %8i  %-13s  %-13s  %-13s  %8.4f    %-13s  %s\n' % (
+                        '', '', nid, oxxi, oyyi, txyi, anglei, major, minor))
 
             f.write(page_stamp % page_num)
             page_num += 1
@@ -0,0 +1,404 @@
+"""
+Defines the OP2 read benchmark that is used by ``test_op2 --benchmark``:
+ - create_synthetic_op2(op2_filename, template_op2_filename,
+                        scale=100, nsubcases=2, ntimes=10)
+ - benchmark_op2(op2_filename, json_filename=None, log=None)
+ - run_benchmark(template_op2_filename, scale=100, nsubcases=2, ntimes=10,
+                 json_filename=None, log=None)
+ - get_peak_rss_mb()
+
+The synthetic OP2 is built from the result tables of a template OP2
+(e.g., models/sol_101_elements/transient_solid_shell_bar.op2), so every
+element type that the template has is benchmarked.  Each table 4 record
+is tiled ``scale`` times (with the node/element ids offset), and the
+first time step is repeated ``ntimes`` times for each of ``nsubcases``
+subcases.
+"""
+from __future__ import print_function, division
+import os
+import sys
+import json
+import time
+from struct import Struct
+
+import numpy as np
+
+import pyNastran
+from pyNastran.op2.op2 import OP2
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # windows
+    resource = None
+
+#: the result tables that are copied to the synthetic OP2
+RESULT_TABLE_PREFIXES = (b'OUG', b'OQG', b'OPG', b'OQMG', b'OGPFB',
+                         b'OEF', b'OES', b'OSTR', b'ONR')
+
+#: the analysis codes that store a float (e.g., time, freq) in word 5 of table 3
+FLOAT_ANALYSIS_CODES = [5, 6, 10]
+
+
+def create_synthetic_op2(op2_filename, template_op2_filename,
+                         scale=100, nsubcases=2, ntimes=10):
+    """
+    Writes a large OP2 using the result tables of a smaller OP2
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to write
+    template_op2_filename : str
+        the OP2 to take the result tables from
+    scale : int; default=100
+        the number of copies of each node/element
+    nsubcases : int; default=2
+        the number of subcases to write
+    ntimes : int; default=10
+        the number of time steps per subcase;
+        static results are only written once per subcase
+
+    Returns
+    -------
+    nbytes : int
+        the size of the OP2
+
+    The geometry tables are not written.  The table 4 records are
+    written as a single block, so they're larger than what Nastran
+    writes, but they're read the same way.
+    """
+    with open(template_op2_filename, 'rb') as op2_file:
+        template_data = op2_file.read()
+    endian, records = _split_records(template_data)
+    header, tables = _get_template_tables(records, endian)
+
+    itype = endian + 'i4'
+    with open(op2_filename, 'wb') as op2_file:
+        op2_file.write(header)
+        for table_name, header_record, name_record, subtables in tables:
+            _write_table_header(op2_file, endian, table_name, header_record, name_record)
+
+            table4s = [_tile_table4(table3, table4, scale, itype)
+                       for table3, table4 in subtables]
+            analysis_code = np.frombuffer(subtables[0][0], dtype=itype)[0] // 10
+            ntimesi = ntimes if analysis_code != 1 else 1
+
+            itable = -3
+            for isubcase in range(1, nsubcases + 1):
+                for itime in range(ntimesi):
+                    for (table3, unused_table4), table4 in zip(subtables, table4s):
+                        table3 = _update_table3(table3, isubcase, itime, itype)
+                        _write_markers(op2_file, endian, [itable, 1, 0])
+                        _write_record(op2_file, endian, table3)
+                        _write_markers(op2_file, endian, [itable - 1, 1, 0])
+                        _write_record(op2_file, endian, table4)
+                        itable -= 2
+            _write_markers(op2_file, endian, [itable, 1, 0, 0])
+        _write_markers(op2_file, endian, [0])
+    return os.path.getsize(op2_filename)
+
+
+def _write_markers(op2_file, endian, markers):
+    """writes the (4, marker, 4) records"""
+    marker_struct = Struct(endian + '3i')
+    for marker in markers:
+        op2_file.write(marker_struct.pack(4, marker, 4))
+
+
+def _write_record(op2_file, endian, data):
+    """writes a Fortran record and the marker with its length"""
+    int_struct = Struct(endian + 'i')
+    nbytes = len(data)
+    _write_markers(op2_file, endian, [nbytes // 4])
+    op2_file.write(int_struct.pack(nbytes))
+    op2_file.write(data)
+    op2_file.write(int_struct.pack(nbytes))
+
+
+def _write_table_header(op2_file, endian, table_name, header_record, name_record):
+    """writes the table name and the table -1/-2 records"""
+    _write_record(op2_file, endian, table_name)
+    _write_markers(op2_file, endian, [-1])
+    _write_record(op2_file, endian, header_record)
+    _write_markers(op2_file, endian, [-2, 1, 0])
+    _write_record(op2_file, endian, name_record)
+
+
+def _split_records(data):
+    """splits an OP2 into its Fortran records"""
+    endian = '<'
+    if Struct('<i').unpack(data[:4])[0] != 4:
+        endian = '>'
+    int_struct = Struct(endian + 'i')
+
+    records = []
+    n = 0
+    ndata = len(data)
+    while n < ndata:
+        nbytes, = int_struct.unpack(data[n:n+4])
+        records.append(data[n+4:n+4+nbytes])
+        n += nbytes + 8
+    return endian, records
+
+
+def _get_template_tables(records, endian):
+    """
+    Gets the result tables from the Fortran records of an OP2
+
+    Returns
+    -------
+    header : bytes
+        the OP2 header (e.g., the date, NX8.5)
+    tables : List[(table_name, header_record, name_record, subtables)]
+        the result tables;
+        subtables is the list of (table3, table4) records for the
+        first time step of the first subcase of the table
+    """
+    int_struct = Struct(endian + 'i')
+    itype = endian + 'i4'
+
+    def get_int(i):
+        return int_struct.unpack(records[i])[0] if len(records[i]) == 4 else None
+
+    # the header ends with the first 0 marker
+    i = 0
+    while get_int(i) != 0:
+        i += 1
+    i += 1
+    header = b''.join(int_struct.pack(len(record)) + record + int_struct.pack(len(record))
+                      for record in records[:i])
+
+    tables = []
+    nrecords = len(records)
+    while i < nrecords and get_int(i) == 2:
+        table_name = records[i + 1]
+        i += 3  # [2], table_name, [-1]
+
+        record_blocks = []
+        while i < nrecords:
+            # a table is a series of [-isubtable, 1, 0] markers
+            # followed by a record (that may be split into blocks)
+            blocks = []
+            while get_int(i) is not None and get_int(i) > 0:
+                blocks.append(records[i + 1])
+                i += 2
+            record_blocks.append(b''.join(blocks))
+            if get_int(i) == 0:
+                i += 1
+                break
+            i += 3
+        else:
+            break
+
+        header_record, name_record = record_blocks[:2]
+        subtables = record_blocks[2:-1] if record_blocks[-1] == b'' else record_blocks[2:]
+        if not table_name.startswith(RESULT_TABLE_PREFIXES) or len(subtables) < 2:
+            continue
+
+        pairs = []
+        for table3, table4 in zip(subtables[::2], subtables[1::2]):
+            if len(table3) != 584:
+                pairs = []
+                break
+            ints = np.frombuffer(table3, dtype=itype)
+            sort_code = ints[1] // 1000
+            num_wide = ints[9]
+            if sort_code & 2 or len(table4) % (4 * num_wide):
+                # SORT2 results are stored by node/element, so they
+                # can't be tiled
+                continue
+            # only the first time step of the first subcase is used
+            if pairs and tuple(ints[3:5]) != first_key:
+                break
+            if not pairs:
+                first_key = tuple(ints[3:5])
+            pairs.append((table3, table4))
+
+        if pairs:
+            tables.append((table_name, header_record, name_record, pairs))
+    return header, tables
+
+
+def _tile_table4(table3, table4, scale, itype):
+    """
+    Copies the rows of a table 4 record ``scale`` times and offsets
+    the node/element id (the first word of each row)
+    """
+    num_wide = np.frombuffer(table3, dtype=itype)[9]
+    ints = np.frombuffer(table4, dtype=itype).reshape(-1, num_wide)
+    ids_device = ints[:, 0]
+    ids = ids_device // 10
+    device_code = ids_device % 10
+    offset = ids.max()
+
+    tiled = np.tile(ints, (scale, 1))
+    icopy = np.repeat(np.arange(scale, dtype=ids.dtype), len(ids))
+    tiled[:, 0] = (np.tile(ids, scale) + icopy * offset) * 10 + np.tile(device_code, scale)
+    return tiled.tobytes()
+
+
+def _update_table3(table3, isubcase, itime, itype):
+    """sets the subcase id and the time/mode/freq on the table 3 record"""
+    ints = np.frombuffer(table3, dtype=itype).copy()
+    analysis_code = ints[0] // 10
+    ints[3] = isubcase
+    if analysis_code in FLOAT_ANALYSIS_CODES:
+        floats = ints.view(itype.replace('i', 'f'))
+        floats[4] = 0.01 * itime
+    elif analysis_code != 1:
+        # mode number
+        ints[4] = itime + 1
+    return ints.tobytes()
+
+
+def get_peak_rss_mb():
+    """
+    Gets the peak resident set size of the process in MB;
+    None if it's not available (e.g., Windows)
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        # bytes
+        return max_rss / 1024. ** 2
+    # KB
+    return max_rss / 1024.
+
+
+def _get_mb_per_sec(nbytes, dt):
+    """gets the throughput"""
+    if dt <= 0.:
+        return None
+    return nbytes / 1024. ** 2 / dt
+
+
+def benchmark_op2(op2_filename, json_filename=None, log=None):
+    """
+    Reads an OP2 and times each table
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to read
+    json_filename : str; default=None
+        writes the report to a JSON file
+    log : Log(); default=None
+        a logging object
+
+    Returns
+    -------
+    report : dict
+        the timings; the per-table throughput (MB/s) uses the bytes
+        in the table and the time on both passes;
+        the per-table4_parser stats are from ``read_op2(..., profile=True)``
+
+    The peak RSS is for the process, so it includes anything that
+    was loaded before the OP2.
+    """
+    model = OP2(debug=False, log=log)
+    time0 = time.time()
+    model.read_op2(op2_filename, build_dataframe=False, profile=True)
+    total_time = time.time() - time0
+    nbytes = os.path.getsize(op2_filename)
+    profile = model.op2_profile.to_dict()
+
+    tables = []
+    for table_name, stats in sorted(profile['tables'].items()):
+        dt = stats['pass1_time'] + stats['pass2_time']
+        table = dict(stats)
+        table['table_name'] = table_name
+        table['time'] = dt
+        table['mb_per_sec'] = _get_mb_per_sec(stats['nbytes'], dt)
+        tables.append(table)
+
+    report = {
+        'op2_filename' : os.path.abspath(op2_filename),
+        'pyNastran_version' : pyNastran.__version__,
+        'python_version' : '%s.%s.%s' % sys.version_info[:3],
+        'numpy_version' : np.__version__,
+        'nbytes' : nbytes,
+        'time' : total_time,
+        'pass1_time' : profile['pass1_time'],
+        'pass2_time' : profile['pass2_time'],
+        'mb_per_sec' : _get_mb_per_sec(nbytes, total_time),
+        'peak_rss_mb' : get_peak_rss_mb(),
+        'tables' : tables,
+        'parsers' : profile['parsers'],
+    }
+    if json_filename is not None:
+        with open(json_filename, 'w') as json_file:
+            json.dump(report, json_file, indent=2, sort_keys=True)
+    return report
+
+
+def get_benchmark_summary(report):
+    """gets a printable summary of the report from ``benchmark_op2``"""
+    msg = 'op2_filename = %r\n' % report['op2_filename']
+    msg += '  size = %.2f MB; time = %.3f sec (pass1=%.3f, pass2=%.3f); %s MB/s\n' % (
+        report['nbytes'] / 1024. ** 2, report['time'],
+        report['pass1_time'], report['pass2_time'], _fmt(report['mb_per_sec']))
+    msg += '  peak RSS = %s MB\n' % _fmt(report['peak_rss_mb'])
+    msg += '  %-8s %7s %10s %10s %10s %10s\n' % (
+        'table', 'ntables', 'MB', 'pass1', 'pass2', 'MB/s')
+    for table in report['tables']:
+        msg += '  %-8s %7i %10.3f %10.4f %10.4f %10s\n' % (
+            table['table_name'], table['ntables'], table['nbytes'] / 1024. ** 2,
+            table['pass1_time'], table['pass2_time'], _fmt(table['mb_per_sec']))
+    return msg
+
+
+def _fmt(value):
+    """formats an optional float"""
+    return 'N/A' if value is None else '%.1f' % value
+
+
+def run_benchmark(template_op2_filename, scale=100, nsubcases=2, ntimes=10,
+                  json_filename=None, log=None):
+    """
+    Creates a synthetic OP2 from a template and benchmarks it
+
+    Parameters
+    ----------
+    template_op2_filename : str
+        the OP2 to take the result tables from
+    scale : int; default=100
+        the number of copies of each node/element
+    nsubcases : int; default=2
+        the number of subcases to write
+    ntimes : int; default=10
+        the number of time steps per subcase
+    json_filename : str; default=None -> fem.benchmark.json
+        the JSON file to write the report to
+    log : Log(); default=None
+        a logging object
+
+    Returns
+    -------
+    report : dict
+        see ``benchmark_op2``; the synthetic OP2 parameters are
+        stored under 'synthetic'
+    """
+    base = os.path.splitext(template_op2_filename)[0]
+    op2_filename = base + '.benchmark.op2'
+    if json_filename is None:
+        json_filename = base + '.benchmark.json'
+
+    create_synthetic_op2(op2_filename, template_op2_filename,
+                         scale=scale, nsubcases=nsubcases, ntimes=ntimes)
+    try:
+        report = benchmark_op2(op2_filename, log=log)
+    finally:
+        os.remove(op2_filename)
+
+    report['synthetic'] = {
+        'template_op2_filename' : os.path.abspath(template_op2_filename),
+        'scale' : scale,
+        'nsubcases' : nsubcases,
+        'ntimes' : ntimes,
+    }
+    with open(json_filename, 'w') as json_file:
+        json.dump(report, json_file, indent=2, sort_keys=True)
+    print(get_benchmark_summary(report))
+    return report
@@ -1,9 +1,11 @@
 from __future__ import print_function
 import os
+import json
+import threading
 import unittest
 #import warnings
 
-from six import iteritems
+from six import iteritems, itervalues, StringIO
 import numpy as np
 try:
     import pandas
@@ -20,10 +22,13 @@ import pyNastran
 from pyNastran.utils.log import get_logger
 
 from pyNastran.bdf.bdf import BDF
-from pyNastran.op2.op2 import OP2, FatalError, read_op2
+from pyNastran.op2.op2 import OP2, FatalError, read_op2, iter_op2_results
 from pyNastran.op2.op2_interface.op2_common import get_scode_word
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
 from pyNastran.op2.test.test_op2 import run_op2
+from pyNastran.op2.test.benchmark_op2 import (
+    create_synthetic_op2, benchmark_op2,
+    _split_records, _get_template_tables, _write_markers, _write_record, _write_table_header)
 
 from pyNastran.bdf.test.bdf_unit_tests import Tester
 #from pyNastran.op2.tables.oef_forces.oef_force_objects import (
@@ -332,6 +337,339 @@ class TestOP2(Tester):
         op2.write_f06(f06_filename)
         os.remove(f06_filename)
 
+    def test_table_index(self):
+        """tests the read_mode=1 table index is used to skip tables"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False)
+        table_names = [table[0] for table in op2._table_index]
+        self.assertIn(b'OUGV1', table_names)
+        is_pass2 = {table[0] : table[3] for table in op2._table_index}
+        self.assertTrue(is_pass2[b'OUGV1'])
+        self.assertFalse(is_pass2[b'GEOM1S'])
+        self.assertEqual(len(op2.displacements), 1)
+        self.assertEqual(len(op2._record_lengths), 0)
+
+        # subcase 2 doesn't exist, so there's nothing to do on the 2nd pass
+        op2 = read_op2(op2_filename, subcases=[2], debug=False)
+        self.assertFalse(any(table[3] for table in op2._table_index))
+        self.assertEqual(len(op2.displacements), 0)
+
+    def test_backend_mmap(self):
+        """tests the memory mapped reader gives the same results as the file reader"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False)
+        op2_mmap = read_op2(op2_filename, debug=False, backend='mmap')
+        self.assertEqual(op2_mmap.backend, 'mmap')
+        self.assertIsNone(op2_mmap._data_view)
+        self.assertEqual(op2.get_op2_stats(), op2_mmap.get_op2_stats())
+        assert op2 == op2_mmap
+
+        with self.assertRaises(RuntimeError):
+            OP2(debug=False, backend='cat')
+
+    def test_lazy(self):
+        """tests the results are only read when they're accessed"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        index_filename = os.path.join(MODEL_PATH, 'sol_101_elements',
+                                      'static_solid_shell_bar.test_op2.idx')
+        if os.path.exists(index_filename):
+            os.remove(index_filename)
+
+        op2 = read_op2(op2_filename, debug=False)
+        op2_lazy = read_op2(op2_filename, debug=False, lazy=True,
+                            index_filename=index_filename)
+        assert os.path.exists(index_filename)
+        self.assertEqual(len(op2_lazy._lazy_loaded), 0)
+
+        disp = op2_lazy.displacements[1]
+        self.assertEqual(op2_lazy._lazy_loaded, set([(b'OUGV1', 1)]))
+        assert np.array_equal(op2.displacements[1].data, disp.data)
+
+        # the sizing pass is loaded from the index
+        op2_lazy = read_op2(op2_filename, debug=False, lazy=True,
+                            index_filename=index_filename)
+        for result_type in op2.get_table_types():
+            result = getattr(op2, result_type)
+            result_lazy = getattr(op2_lazy, result_type)
+            if not isinstance(result, dict):
+                continue
+            self.assertEqual(sorted(result.keys()), sorted(result_lazy.keys()))
+            for key, obj in iteritems(result):
+                obj_lazy = result_lazy[key]
+                if hasattr(obj, 'data'):
+                    assert np.array_equal(obj.data, obj_lazy.data), result_type
+        os.remove(index_filename)
+
+        with self.assertRaises(RuntimeError):
+            read_op2(op2_filename, debug=False, index_filename=index_filename)
+
+    def test_nworkers(self):
+        """tests the parallel reader gives the same results as the serial reader"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False)
+        op2_parallel = read_op2(op2_filename, debug=False, nworkers=2)
+        self.assertEqual(op2.get_op2_stats(), op2_parallel.get_op2_stats())
+        assert op2 == op2_parallel
+
+        with self.assertRaises(RuntimeError):
+            read_op2(op2_filename, debug=False, nworkers=2, lazy=True)
+
+    def test_iter_op2_results(self):
+        """tests the results can be streamed one time step at a time"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False)
+        disp = op2.displacements[1]
+
+        itime = 0
+        for isubcase, result_type, time, ids, data in iter_op2_results(
+                op2_filename, tables=['OUGV1'], debug=False):
+            self.assertEqual(isubcase, 1)
+            self.assertEqual(result_type, 'displacements')
+            self.assertEqual(time, disp._times[itime])
+            assert np.array_equal(ids, disp.node_gridtype)
+            assert np.array_equal(data, disp.data[itime, :, :])
+            itime += 1
+        self.assertEqual(itime, disp.ntimes)
+
+        # stop early; the filling pass is stopped too
+        nthreads = threading.active_count()
+        results = iter_op2_results(op2_filename, debug=False)
+        next(results)
+        results.close()
+        self.assertEqual(threading.active_count(), nthreads)
+
+    def test_load_hdf5(self):
+        """tests the results can be reloaded from export_to_hdf5"""
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'transient_solid_shell_bar.op2')
+        h5_filename = os.path.join(folder, 'transient_solid_shell_bar.test_op2.h5')
+        op2 = read_op2(op2_filename, debug=False)
+        # the bytes in data_code are reloaded as bytes
+        op2.ctetra_stress[1].table_name = b'OES1X1'
+        op2.ctetra_stress[1].data_code['table_name'] = b'OES1X1'
+        op2.export_to_hdf5(h5_filename)
+
+        op2b = OP2(debug=False)
+        op2b.load_hdf5(h5_filename, lazy=True)
+        disp = op2.displacements[1]
+        dispb = dict.__getitem__(op2b.displacements, 1)
+        assert not hasattr(dispb, 'data')
+        dispb = op2b.displacements[1]
+        assert np.array_equal(disp.data, dispb.data)
+        assert np.array_equal(disp._times, dispb._times)
+        assert np.array_equal(disp.node_gridtype, dispb.node_gridtype)
+        self.assertEqual(dispb.data_code['table_name'], 'OUGV1')
+        self.assertEqual(op2b.ctetra_stress[1].data_code['table_name'], b'OES1X1')
+        self.assertEqual(op2b.ctetra_stress[1].table_name, b'OES1X1')
+        for isubcase, stress in iteritems(op2.ctetra_stress):
+            assert np.array_equal(stress.data, op2b.ctetra_stress[isubcase].data)
+
+        op2c = OP2(debug=False)
+        op2c.load_hdf5(h5_filename, subcases=[1], result_types=['displacements'],
+                       lazy=False)
+        self.assertEqual(list(op2c.displacements.keys()), [1])
+        self.assertEqual(len(op2c.ctetra_stress), 0)
+        assert np.array_equal(disp.data, op2c.displacements[1].data)
+        os.remove(h5_filename)
+
+    def test_vectorization_report(self):
+        """tests the nonlinear/beam OES results use the vectorized readers"""
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2')
+        op2 = read_op2(op2_filename, debug=False)
+        self.assertEqual(len(op2._unvectorized_results), 0)
+        assert 'all OES/OEF results' in op2.get_vectorization_report()
+
+        op2_nv = OP2(debug=False)
+        op2_nv.use_vector = False
+        op2_nv.read_op2(op2_filename)
+        self.assertEqual(len(op2_nv._unvectorized_results), 0)
+        for result_name in ['cbeam_stress', 'nonlinear_cbeam_stress', 'nonlinear_cquad4_stress']:
+            results = getattr(op2, result_name)
+            assert len(results), result_name
+            for key, result in iteritems(results):
+                assert np.array_equal(result.data, getattr(op2_nv, result_name)[key].data), result_name
+
+    def test_profile(self):
+        """tests read_op2(..., profile=True)"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False)
+        assert op2.op2_profile is None
+
+        op2 = read_op2(op2_filename, debug=False, profile=True)
+        report = op2.op2_profile.to_dict()
+        assert report['pass1_time'] > 0. and report['pass2_time'] > 0.
+        ntable_bytes = sum(stats['nbytes'] for stats in report['tables'].values())
+        assert 0.99 * os.path.getsize(op2_filename) < ntable_bytes < os.path.getsize(op2_filename)
+
+        parsers = {(stats['table_name'], stats['parser']) : stats for stats in report['parsers']}
+        stats = parsers[('OES1X1', '_read_oes1_4')]
+        assert stats['nrecords'] > 0 and stats['nbytes'] > 0
+        self.assertEqual(stats['nvectorized'], stats['nrecords'])
+        self.assertEqual(stats['nscalar'], 0)
+        narrays = stats['narrays']
+        assert narrays > 0 and stats['array_nbytes'] > 0
+        assert 'OES1X1' in op2.op2_profile.get_summary()
+
+        op2_nv = OP2(debug=False)
+        op2_nv.use_vector = False
+        op2_nv.read_op2(op2_filename, profile=True)
+        report = op2_nv.op2_profile.to_dict()
+        parsers = {(stats['table_name'], stats['parser']) : stats for stats in report['parsers']}
+        stats = parsers[('OES1X1', '_read_oes1_4')]
+        self.assertEqual(stats['nvectorized'], 0)
+        self.assertEqual(stats['nscalar'], stats['nrecords'])
+        self.assertEqual(stats['narrays'], narrays)
+
+    def test_benchmark(self):
+        """tests the synthetic OP2 and the benchmark report"""
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        template_op2_filename = os.path.join(folder, 'transient_solid_shell_bar.op2')
+        op2_filename = os.path.join(folder, 'transient_solid_shell_bar.benchmark.op2')
+        json_filename = os.path.join(folder, 'transient_solid_shell_bar.benchmark.json')
+        create_synthetic_op2(op2_filename, template_op2_filename,
+                             scale=3, nsubcases=2, ntimes=2)
+
+        template = read_op2(template_op2_filename, debug=False)
+        op2 = read_op2(op2_filename, debug=False)
+        self.assertEqual(sorted(op2.displacements.keys()), [1, 2])
+        for result_name in ['displacements', 'cbar_force', 'ctetra_stress', 'cquad4_strain']:
+            result0 = getattr(template, result_name)[1]
+            result = getattr(op2, result_name)[2]
+            nrows = result0.data.shape[1]
+            self.assertEqual(result.data.shape[1], 3 * nrows)
+            assert np.array_equal(result.data[0, :nrows, :], result0.data[0, :, :]), result_name
+            assert np.array_equal(result.data[0, 2*nrows:, :], result0.data[0, :, :]), result_name
+
+        report = benchmark_op2(op2_filename, json_filename=json_filename)
+        os.remove(op2_filename)
+        table_names = [table['table_name'] for table in report['tables']]
+        self.assertEqual(table_names, ['OEF1X', 'OES1X1', 'OGPFB1', 'OPG1',
+                                       'OQG1', 'OSTR1X', 'OUGV1'])
+        assert report['pass1_time'] > 0. and report['pass2_time'] > 0.
+        # the header isn't part of a table
+        ntable_bytes = sum(table['nbytes'] for table in report['tables'])
+        assert 0.99 * report['nbytes'] < ntable_bytes < report['nbytes']
+        with open(json_filename, 'r') as json_file:
+            self.assertEqual(json.load(json_file)['nbytes'], report['nbytes'])
+        os.remove(json_filename)
+
+    def test_oes_ctriax6_complex(self):
+        """tests the vectorized complex CTRIAX6 stress/strain reader"""
+        template_op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'freq_solid_shell_bar.op2')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'ctriax6.synthetic.op2')
+
+        # eid, (loc, rs, azs, As, ss, rp, azp, ap, sp) * 4
+        data = np.random.RandomState(0).rand(5, 37).astype('float32') * 100.
+        ints = data.view('int32')
+        ints[:, 0] = np.arange(101, 106) * 10 + 1
+        ints[:, 1::9] = np.arange(4) + 10 * np.arange(5)[:, np.newaxis]
+        for table_name, result_name in [(b'OES1X', 'ctriax_stress'), (b'OSTR1X', 'ctriax_strain')]:
+            for format_code in [2, 3]:
+                _write_element_op2(op2_filename, template_op2_filename, table_name,
+                                   53, 37, format_code, data.tobytes())
+                result = self._check_vector_scalar(op2_filename, result_name,
+                                                   ['element_node', 'data'])
+                result.write_f06(StringIO(), header=['', '', ''],
+                                 is_mag_phase=format_code == 3)
+        os.remove(op2_filename)
+
+    def test_oes_quad4fd(self):
+        """tests the vectorized CQUAD4FD (hyperelastic) stress reader"""
+        template_op2_filename = os.path.join(MODEL_PATH, 'elements', 'static_elements.op2')
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'quad4fd.synthetic.op2')
+
+        # eid, 'GAUS', (gauss_id, oxx, oyy, txy, angle, majorp, minorp) * 4
+        data = np.random.RandomState(0).rand(5, 30).astype('float32') * 100.
+        ints = data.view('int32')
+        ints[:, 0] = np.arange(101, 106) * 10 + 1
+        ints[:, 1] = np.frombuffer(b'GAUS', dtype='int32')[0]
+        ints[:, 2::7] = np.arange(1, 5)
+        _write_element_op2(op2_filename, template_op2_filename, b'OES1X1',
+                           139, 30, 1, data.tobytes())
+        result = self._check_vector_scalar(op2_filename, 'hyperelastic_cquad4_stress',
+                                           ['element_node', 'data'])
+        result.write_f06(StringIO(), header=['', '', ''])
+        os.remove(op2_filename)
+
+    def test_oef_vu2d(self):
+        """tests the vectorized real/complex VUQUAD/VUTRIA force readers"""
+        for template_op2_filename, ncols, format_codes, int_cols in [
+                (os.path.join(MODEL_PATH, 'elements', 'static_elements.op2'),
+                 13, [1], [0, 4, 5, 6, 12]),
+                (os.path.join(MODEL_PATH, 'sol_101_elements', 'freq_solid_shell_bar.op2'),
+                 25, [2, 3], [0, 4, 5, 6, 12, 16, 17, 18, 24]),]:
+            op2_filename = template_op2_filename[:-4] + '.vu2d.op2'
+            for element_type, nnodes, result_name in [(189, 4, 'vuquad_force'),
+                                                      (190, 3, 'vutria_force')]:
+                # eid, parent, coord, icord, theta, itype, (vugrid, ...) * nnodes
+                num_wide = 6 + ncols * nnodes
+                data = np.random.RandomState(0).rand(3, num_wide).astype('float32') * 100.
+                ints = data.view('int32')
+                ints[:, 0] = np.arange(101, 104) * 10 + 1
+                ints[:, 1] = np.arange(5, 8)
+                ints[:, 2:6] = 0
+                for inode in range(nnodes):
+                    i0 = 6 + ncols * inode
+                    ints[:, i0 + np.array(int_cols)] = 0
+                    ints[:, i0] = 1000 * np.arange(3) + inode + 1
+                for format_code in format_codes:
+                    _write_element_op2(op2_filename, template_op2_filename, b'OEF1X',
+                                       element_type, num_wide, format_code, data.tobytes())
+                    result = self._check_vector_scalar(op2_filename, result_name,
+                                                       ['element_node', 'data'])
+                    if format_code > 1:
+                        # the real VUQUAD/VUTRIA f06 writer isn't supported
+                        result.write_f06(StringIO(), header=['', '', ''],
+                                         is_mag_phase=format_code == 3)
+            os.remove(op2_filename)
+
+    def test_oef_thermal_vu3d(self):
+        """tests the vectorized VUPENTA/VUTETRA/VUHEXA heat flux reader"""
+        template_op2_filename = os.path.join(MODEL_PATH, 'thermal', 'thermal_test_153.op2')
+        op2_filename = os.path.join(MODEL_PATH, 'thermal', 'vu3d.synthetic.op2')
+        for element_type, nnodes in [(145, 8), (146, 6), (147, 4)]:
+            # eid, parent, (vugrid, xgrad, ygrad, zgrad, xflux, yflux, zflux) * nnodes
+            num_wide = 2 + 7 * nnodes
+            data = np.random.RandomState(0).rand(3, num_wide).astype('float32') * 100.
+            ints = data.view('int32')
+            ints[:, 0] = np.arange(101, 104) * 10 + 1
+            ints[:, 1] = np.arange(5, 8)
+            ints[:, 2::7] = 1000 * np.arange(3)[:, np.newaxis] + np.arange(1, nnodes + 1)
+            _write_element_op2(op2_filename, template_op2_filename, b'OEF1X',
+                               element_type, num_wide, 1, data.tobytes())
+            result = self._check_vector_scalar(op2_filename, 'thermalLoad_VU_3D',
+                                               ['element_parent', 'vugrid', 'data'])
+            result.write_f06(StringIO(), header=['', '', ''])
+        os.remove(op2_filename)
+
+    def _check_vector_scalar(self, op2_filename, result_name, array_names):
+        """
+        Reads an OP2 with and without the vectorized readers and compares
+        the result; the floats are compared with a tolerance because the
+        magnitude/phase conversion is done in float32 by the vectorized
+        readers
+        """
+        op2 = read_op2(op2_filename, debug=False)
+        self.assertEqual(len(op2._unvectorized_results), 0)
+        op2_nv = OP2(debug=False)
+        op2_nv.use_vector = False
+        op2_nv.read_op2(op2_filename)
+
+        results = getattr(op2, result_name)
+        self.assertEqual(len(results), 1, result_name)
+        result = next(itervalues(results))
+        result_nv = next(itervalues(getattr(op2_nv, result_name)))
+        for array_name in array_names:
+            array = getattr(result, array_name)
+            array_nv = getattr(result_nv, array_name)
+            assert array.size > 0, array_name
+            if array.dtype.kind in 'fc':
+                assert np.allclose(array, array_nv, atol=1e-4), array_name
+            else:
+                assert np.array_equal(array, array_nv), array_name
+        result.get_stats()
+        return result
+
     def test_op2_solid_bending_01(self):
         folder = os.path.join(MODEL_PATH, 'solid_bending')
         op2_filename = os.path.join(folder, 'solid_bending.op2')
@@ -1600,6 +1938,37 @@ class TestOP2(Tester):
         op2 = read_op2_geom(op2_filename, debug=False)
 
 
+def _write_element_op2(op2_filename, template_op2_filename, table_name,
+                       element_type, num_wide, format_code, table4):
+    """
+    Writes an OP2 with a single table 4 record using the table 3 record
+    of ``table_name`` in the template OP2 with a different element type,
+    format code, and num_wide
+    """
+    with open(template_op2_filename, 'rb') as op2_file:
+        endian, records = _split_records(op2_file.read())
+    header, tables = _get_template_tables(records, endian)
+    for table_namei, header_record, name_record, subtables in tables:
+        if table_namei.strip() == table_name:
+            break
+    else:  # pragma: no cover
+        raise RuntimeError('table_name=%r is not in %r' % (table_name, template_op2_filename))
+
+    table3 = np.frombuffer(subtables[0][0], dtype=endian + 'i4').copy()
+    table3[2] = element_type
+    table3[8] = format_code
+    table3[9] = num_wide
+    with open(op2_filename, 'wb') as op2_file:
+        op2_file.write(header)
+        _write_table_header(op2_file, endian, table_namei, header_record, name_record)
+        _write_markers(op2_file, endian, [-3, 1, 0])
+        _write_record(op2_file, endian, table3.tobytes())
+        _write_markers(op2_file, endian, [-4, 1, 0])
+        _write_record(op2_file, endian, table4)
+        _write_markers(op2_file, endian, [-5, 1, 0, 0])
+        _write_markers(op2_file, endian, [0])
+
+
 if __name__ == '__main__':  # pragma: no cover
     ON_RTD = os.environ.get('READTHEDOCS', None) == 'True'
     if not ON_RTD:
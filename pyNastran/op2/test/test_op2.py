@@ -532,6 +532,7 @@ def get_test_op2_data():
     while '  ' in line1:
         line1 = line1.replace('  ', ' ')
     msg += line1
+    msg += "  test_op2 --benchmark [--scale <n>] [--nsubcases <n>] [--ntimes <n>] OP2_FILENAME\n"
     msg += "  test_op2 -h | --help\n"
     msg += "  test_op2 -v | --version\n"
     msg += "\n"
@@ -557,6 +558,13 @@ def get_test_op2_data():
     msg += "  -w, --is_sort2         Sets the F06 transient to SORT2\n"
     msg += "  -x <arg>, --exclude    Exclude specific results\n"
     msg += "  --nx                   Assume NX Nastran\n"
+    msg += "\n"
+    msg += "Benchmark:\n"
+    msg += "  --benchmark            Times the reading of a large OP2 that is built from the\n"
+    msg += "                         results in OP2_FILENAME; writes fem.benchmark.json\n"
+    msg += "  --scale <n>            The number of copies of each node/element [default: 100]\n"
+    msg += "  --nsubcases <n>        The number of subcases [default: 2]\n"
+    msg += "  --ntimes <n>           The number of time steps per subcase [default: 10]\n"
 
     if not is_release:
         msg += "\n"
@@ -599,7 +607,15 @@ def main():
 
     time0 = time.time()
 
-    if data['--profile']:
+    if data['--benchmark']:
+        from pyNastran.op2.test.benchmark_op2 import run_benchmark
+        run_benchmark(
+            data['OP2_FILENAME'],
+            scale=int(data['--scale']),
+            nsubcases=int(data['--nsubcases']),
+            ntimes=int(data['--ntimes']),
+        )
+    elif data['--profile']:
         import pstats
 
         import cProfile